@@ -45,7 +45,8 @@ def _load_config() -> dict:
             logger.warning("PyYAML is unavailable; cannot parse %s", path)
             return {}
         try:
-            data = yaml.safe_load(text) or {}
+            # The libyaml loader parses trading.yaml about ten times faster than the pure-Python one.
+            data = yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}
         except Exception as exc:
             logger.warning("Failed parsing YAML configuration %s: %s", path, exc)
             return {}
@@ -157,10 +158,52 @@ AI_CONFIG = {
         'model': _cfg('ai.anthropic.model', 'claude-sonnet-4-5'),
         'max_tokens': _as_int(_cfg('ai.anthropic.max_tokens', 2000), 2000),
         'temperature': _as_float(_cfg('ai.anthropic.temperature', 0.2), 0.2),
+        'fast_model': _cfg('ai.anthropic.fast_model', 'claude-haiku-4-5'),
+        'fast_confidence_threshold': _as_float(_cfg('ai.anthropic.fast_confidence_threshold', 0.85), 0.85),
+        'fast_max_tokens': _as_int(_cfg('ai.anthropic.fast_max_tokens', 140), 140),
     },
     'google': {
         'model': _cfg('ai.google.model', 'gemini-3-pro-preview'),
         'temperature': _as_float(_cfg('ai.google.temperature', 0.2), 0.2),
+        'fast_model': _cfg('ai.google.fast_model', 'gemini-2.5-flash'),
+        'fast_confidence_threshold': _as_float(_cfg('ai.google.fast_confidence_threshold', 0.85), 0.85),
+        'fast_max_tokens': _as_int(_cfg('ai.google.fast_max_tokens', 140), 140),
+    },
+    'router': {
+        'enabled': _as_bool(_cfg('ai.router.enabled', False), False),
+        'deadline_seconds': _as_float(_cfg('ai.router.deadline_seconds', 20), 20.0),
+        'ewma_alpha': _as_float(_cfg('ai.router.ewma_alpha', 0.3), 0.3),
+        'max_error_rate': _as_float(_cfg('ai.router.max_error_rate', 0.5), 0.5),
+        'retry_after_seconds': _as_float(_cfg('ai.router.retry_after_seconds', 30), 30.0),
+    },
+    'streaming': {
+        'enabled': _as_bool(_cfg('ai.streaming.enabled', False), False),
+    },
+    'cassette': {
+        'mode': str(_cfg('ai.cassette.mode', 'off') or 'off').lower(),
+        'path': _cfg('ai.cassette.path', ''),
+        'speed': _as_float(_cfg('ai.cassette.speed', 1.0), 1.0),
+    },
+    'message_window': {
+        'enabled': _as_bool(_cfg('ai.message_window.enabled', False), False),
+        'max_tokens': _as_int(_cfg('ai.message_window.max_tokens', 400), 400),
+        'context_sentences': _as_int(_cfg('ai.message_window.context_sentences', 1), 1),
+    },
+    'rate_limits': {
+        'enabled': _as_bool(_cfg('ai.rate_limits.enabled', False), False),
+        'acquire_timeout_seconds': _as_float(_cfg('ai.rate_limits.acquire_timeout_seconds', 30), 30.0),
+        'providers': {
+            name: {
+                'requests_per_minute': _as_float(_cfg(f'ai.rate_limits.{name}.requests_per_minute'), defaults[0]),
+                'tokens_per_minute': _as_float(_cfg(f'ai.rate_limits.{name}.tokens_per_minute'), defaults[1]),
+                'max_concurrency': _as_int(_cfg(f'ai.rate_limits.{name}.max_concurrency'), defaults[2]),
+            }
+            for name, defaults in (
+                ('openai', (500.0, 200000.0, 8)),
+                ('anthropic', (50.0, 40000.0, 4)),
+                ('google', (60.0, 100000.0, 4)),
+            )
+        },
     },
 }
 
@@ -230,6 +273,99 @@ TRADING_CONFIG = {
     ),
 }
 
+POSITION_CACHE_CONFIG = {
+    'enabled': _as_bool(_cfg('trading.position_cache.enabled', False), False),
+    'reconcile_interval_seconds': _as_float(_cfg('trading.position_cache.reconcile_interval_seconds', 300), 300.0),
+    'fill_poll_interval_seconds': _as_float(_cfg('trading.position_cache.fill_poll_interval_seconds', 5), 5.0),
+}
+
+# Logging settings
+LOGGING_CONFIG = {
+    'format': str(_cfg('logging.format', 'text') or 'text').strip().lower(),
+}
+
+# Notification settings (webhook URLs are secrets: prefer the env vars)
+NOTIFICATIONS_CONFIG = {
+    'async_delivery': _as_bool(_cfg('notifications.async_delivery', False), False),
+    'queue_size': _as_int(_cfg('notifications.queue_size', 256), 256),
+    'max_batch': _as_int(_cfg('notifications.max_batch', 20), 20),
+    'retries': _as_int(_cfg('notifications.retries', 3), 3),
+    'retry_backoff_seconds': _as_float(_cfg('notifications.retry_backoff_seconds', 1.0), 1.0),
+    'sinks': {
+        'console': _as_bool(_cfg('notifications.sinks.console', True), True),
+        'file_path': _cfg('notifications.sinks.file_path', ''),
+        'discord_webhook_url': (
+            os.getenv('NOTIFY_DISCORD_WEBHOOK_URL') or _cfg('notifications.sinks.discord_webhook_url', '')
+        ),
+        'webhook_url': os.getenv('NOTIFY_WEBHOOK_URL') or _cfg('notifications.sinks.webhook_url', ''),
+        'timeout_seconds': _as_float(_cfg('notifications.sinks.timeout_seconds', 5), 5.0),
+    },
+}
+
+# Picks-log settings
+PICKS_LOG_CONFIG = {
+    'background_writer': {
+        'enabled': _as_bool(_cfg('picks_log.background_writer.enabled', False), False),
+        'batch_size': _as_int(_cfg('picks_log.background_writer.batch_size', 64), 64),
+        'flush_interval_seconds': _as_float(_cfg('picks_log.background_writer.flush_interval_seconds', 0.5), 0.5),
+        'fsync': str(_cfg('picks_log.background_writer.fsync', 'batch') or 'batch').strip().lower(),
+        'fsync_interval_seconds': _as_float(_cfg('picks_log.background_writer.fsync_interval_seconds', 5), 5.0),
+    },
+    'segments': {
+        'enabled': _as_bool(_cfg('picks_log.segments.enabled', False), False),
+        'directory': _cfg('picks_log.segments.directory', ''),
+        'compression': str(_cfg('picks_log.segments.compression', 'gzip') or 'gzip').strip().lower(),
+        'block_size_kb': _as_int(_cfg('picks_log.segments.block_size_kb', 256), 256),
+    },
+}
+
+# Observability settings
+METRICS_CONFIG = {
+    'enabled': _as_bool(_cfg('observability.metrics.enabled', False), False),
+    'host': str(_cfg('observability.metrics.host', '127.0.0.1') or '127.0.0.1').strip(),
+    'port': _as_int(_cfg('observability.metrics.port', 9464), 9464),
+    'event_loop_lag_interval_seconds': _as_float(
+        _cfg('observability.metrics.event_loop_lag_interval_seconds', 0.5), 0.5
+    ),
+}
+
+PROFILING_CONFIG = {
+    'enabled': _as_bool(_cfg('observability.profiling.enabled', False), False),
+    'signal_toggle': _as_bool(_cfg('observability.profiling.signal_toggle', False), False),
+    'threshold_ms': _as_float(_cfg('observability.profiling.threshold_ms', 1000), 1000.0),
+    'directory': _cfg('observability.profiling.directory', ''),
+    'top': _as_int(_cfg('observability.profiling.top', 40), 40),
+}
+
+TRACING_CONFIG = {
+    'enabled': _as_bool(_cfg('observability.tracing.enabled', False), False),
+    'path': _cfg('observability.tracing.path', ''),
+    'service_name': str(_cfg('observability.tracing.service_name', 'discord-stock-monitor') or 'discord-stock-monitor'),
+}
+
+# Market-data settings
+SYMBOL_MASTER_CONFIG = {
+    'enabled': _as_bool(_cfg('market_data.symbol_master.enabled', False), False),
+    'path': _cfg('market_data.symbol_master.path', ''),
+}
+
+OPTIONS_CHAIN_CONFIG = {
+    'enabled': _as_bool(_cfg('market_data.options_chain.enabled', False), False),
+    'provider': str(_cfg('market_data.options_chain.provider', 'yahoo')).strip().lower() or 'yahoo',
+    'refresh_interval_seconds': _as_float(_cfg('market_data.options_chain.refresh_interval_seconds', 300), 300.0),
+    'expiry_list_ttl_seconds': _as_float(_cfg('market_data.options_chain.expiry_list_ttl_seconds', 3600), 3600.0),
+    'recent_ticker_ttl_seconds': _as_float(_cfg('market_data.options_chain.recent_ticker_ttl_seconds', 21600), 21600.0),
+    'max_expiries': _as_int(_cfg('market_data.options_chain.max_expiries', 8), 8),
+    'tick_seconds': _as_float(_cfg('market_data.options_chain.tick_seconds', 5), 5.0),
+    'max_fetches_per_tick': _as_int(_cfg('market_data.options_chain.max_fetches_per_tick', 2), 2),
+    'prompt_min_dte': _as_int(_cfg('market_data.options_chain.prompt_min_dte', 0), 0),
+    'prompt_max_dte': _as_int(_cfg('market_data.options_chain.prompt_max_dte', 120), 120),
+    'prompt_strikes_per_expiry': _as_int(_cfg('market_data.options_chain.prompt_strikes_per_expiry', 4), 4),
+    'lotto_max_dte': _as_int(_cfg('market_data.options_chain.lotto_max_dte', 30), 30),
+    'prompt_max_tokens': _as_int(_cfg('market_data.options_chain.prompt_max_tokens', 600), 600),
+    'risk_free_rate': _as_float(_cfg('market_data.options_chain.risk_free_rate', 0.0), 0.0),
+}
+
 # Validate required settings
 def validate_config():
     """Validate that required configuration is present"""
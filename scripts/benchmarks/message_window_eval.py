@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Evaluate message windowing on the real-message fixtures: token savings vs. retained trade evidence."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from src.utils.message_window import relevance_score, split_sentences, window_message
+from tests.data.stocktalk_real_messages import MESSAGE_FIXTURES, MessageFixture
+
+
+ARTIFACTS_DIR = Path("artifacts") / "benchmarks"
+REPORT_PATH = ARTIFACTS_DIR / "message_window_eval.json"
+DEFAULT_BUDGETS = (150, 250, 400, 600)
+# Sentences scoring at least this carry the trade itself (verb + ticker/weight/price/option).
+KEY_SENTENCE_SCORE = 6
+
+
+def _ticker_retained(ticker: str, text: str) -> bool:
+    forms = (rf"\${ticker}\b", rf"\b{ticker}\b", r"\b" + "-".join(ticker) + r"\b")
+    return any(re.search(form, text) for form in forms)
+
+
+def _evaluate_fixture(fixture: MessageFixture, budget: int, context_sentences: int) -> Dict[str, object]:
+    window = window_message(fixture.text, max_tokens=budget, context_sentences=context_sentences)
+    key_sentences = [s for s in split_sentences(fixture.text) if relevance_score(s) >= KEY_SENTENCE_SCORE]
+    kept_key = [s for s in key_sentences if s in window.text]
+    tickers_kept = [t for t in sorted(fixture.expected_tickers) if _ticker_retained(t, window.text)]
+    retained = len(tickers_kept) == len(fixture.expected_tickers) and len(kept_key) == len(key_sentences)
+    return {
+        "scenario_id": fixture.scenario_id,
+        "original_tokens": window.original_tokens,
+        "windowed_tokens": window.windowed_tokens,
+        "kept_sentences": window.kept_sentences,
+        "total_sentences": window.total_sentences,
+        "tickers_expected": len(fixture.expected_tickers),
+        "tickers_kept": len(tickers_kept),
+        "key_sentences": len(key_sentences),
+        "key_sentences_kept": len(kept_key),
+        "evidence_retained": retained,
+    }
+
+
+def _evaluate_budget(fixtures: Sequence[MessageFixture], budget: int, context_sentences: int) -> Dict[str, object]:
+    rows = [_evaluate_fixture(fixture, budget, context_sentences) for fixture in fixtures]
+    original = sum(row["original_tokens"] for row in rows)
+    windowed = sum(row["windowed_tokens"] for row in rows)
+    tickers_expected = sum(row["tickers_expected"] for row in rows)
+    key_sentences = sum(row["key_sentences"] for row in rows)
+    return {
+        "max_tokens": budget,
+        "context_sentences": context_sentences,
+        "original_tokens": original,
+        "windowed_tokens": windowed,
+        "token_savings": round(1 - windowed / max(1, original), 3),
+        "ticker_recall": round(sum(row["tickers_kept"] for row in rows) / max(1, tickers_expected), 3),
+        "key_sentence_recall": round(sum(row["key_sentences_kept"] for row in rows) / max(1, key_sentences), 3),
+        "fixtures_retained": sum(1 for row in rows if row["evidence_retained"]),
+        "fixtures": rows,
+    }
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--budget", type=int, action="append", dest="budgets", help="max_tokens to try (repeatable)")
+    parser.add_argument("--context-sentences", type=int, default=1)
+    parser.add_argument("--output", type=Path, default=REPORT_PATH)
+    return parser
+
+
+def main() -> int:
+    args = _parser().parse_args()
+    fixtures = list(MESSAGE_FIXTURES.values())
+    results: List[Dict[str, object]] = [
+        _evaluate_budget(fixtures, budget, args.context_sentences) for budget in (args.budgets or DEFAULT_BUDGETS)
+    ]
+
+    print(f"{'max_tok':>7} {'orig_tok':>8} {'win_tok':>7} {'savings':>7} {'ticker_rc':>9} {'key_rc':>6} {'retained':>8}")
+    for row in results:
+        print(
+            f"{row['max_tokens']:>7} {row['original_tokens']:>8} {row['windowed_tokens']:>7} {row['token_savings']:>7} "
+            f"{row['ticker_recall']:>9} {row['key_sentence_recall']:>6} {row['fixtures_retained']:>4}/{len(fixtures)}"
+        )
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps({"generated_at": datetime.now(timezone.utc).isoformat(), "results": results}, indent=2),
+        encoding="utf-8",
+    )
+    print(f"Report written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Benchmark {{OPTIONS_CHAIN}} token counts: full chain vs budgeted slice, across chain sizes."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from src.market_data.options.chain_format import (
+    DEFAULT_OPTIONS_CHAIN_MAX_TOKENS,
+    options_chain_legend,
+    render_option_chain_slices,
+)
+from src.market_data.options.chain_slicer import OptionChainSliceConfig, slice_option_chains
+from src.market_data.options.contracts import OptionChainSide, OptionChainSnapshot
+from src.utils.token_estimate import estimate_tokens
+
+
+ARTIFACTS_DIR = Path("artifacts") / "benchmarks"
+REPORT_PATH = ARTIFACTS_DIR / "option_chain_prompt_tokens.json"
+AS_OF = date(2026, 3, 2)
+SPOT = 100.0
+
+
+def _synthetic_side(strikes: np.ndarray, rng: np.random.Generator, prefix: str) -> OptionChainSide:
+    intrinsic = np.abs(SPOT - strikes) * 0.1
+    bids = np.round(np.maximum(0.01, 5.0 - intrinsic + rng.random(strikes.shape[0])), 2)
+    asks = np.round(bids + 0.05 + rng.random(strikes.shape[0]) * 0.2, 2)
+    return OptionChainSide(
+        contract_symbols=np.asarray([f"{prefix}{int(strike * 1000):08d}" for strike in strikes], dtype=object),
+        strikes=strikes,
+        bids=bids,
+        asks=asks,
+        last_prices=np.round((bids + asks) / 2.0, 2),
+        volumes=rng.integers(0, 5000, strikes.shape[0]).astype(float),
+        open_interest=rng.integers(0, 20000, strikes.shape[0]).astype(float),
+        implied_volatility=np.round(0.2 + rng.random(strikes.shape[0]) * 0.6, 4),
+    )
+
+
+def _synthetic_chains(expiry_count: int, strikes_per_expiry: int, seed: int) -> List[OptionChainSnapshot]:
+    rng = np.random.default_rng(seed)
+    strikes = np.round(np.linspace(SPOT * 0.5, SPOT * 1.5, strikes_per_expiry), 1)
+    snapshots = []
+    for index in range(expiry_count):
+        expiry = AS_OF + timedelta(days=7 * (index + 1))
+        snapshots.append(
+            OptionChainSnapshot(
+                underlying="BENCH",
+                expiry=expiry,
+                fetched_at=datetime(2026, 3, 2, 15, 0, tzinfo=timezone.utc),
+                underlying_price=SPOT,
+                calls=_synthetic_side(strikes, rng, "BENCHC"),
+                puts=_synthetic_side(strikes, rng, "BENCHP"),
+            )
+        )
+    return snapshots
+
+
+def _full_chain_text(snapshots: List[OptionChainSnapshot]) -> str:
+    """Every contract in the same row format the slice uses, with no selection or budget."""
+    config = OptionChainSliceConfig(max_dte=10_000, strikes_per_expiry=1_000_000)
+    full_slice = slice_option_chains("BENCH", snapshots, as_of=AS_OF, config=config)
+    return render_option_chain_slices([full_slice], max_tokens=sys.maxsize, slice_config=config)
+
+
+def _measure(expiry_count: int, strikes_per_expiry: int, max_tokens: int, repeats: int) -> Dict[str, object]:
+    snapshots = _synthetic_chains(expiry_count, strikes_per_expiry, seed=expiry_count * 1000 + strikes_per_expiry)
+    full_text = _full_chain_text(snapshots)
+
+    started = time.perf_counter()
+    for _ in range(repeats):
+        chain_slice = slice_option_chains("BENCH", snapshots, as_of=AS_OF)
+        sliced_text = render_option_chain_slices([chain_slice], max_tokens=max_tokens)
+    elapsed_ms = (time.perf_counter() - started) * 1000.0 / repeats
+
+    return {
+        "expiries": expiry_count,
+        "strikes_per_expiry": strikes_per_expiry,
+        "contracts": sum(snapshot.contract_count for snapshot in snapshots),
+        "full_tokens": estimate_tokens(full_text),
+        "sliced_tokens": estimate_tokens(sliced_text),
+        "slice_and_render_ms": round(elapsed_ms, 3),
+    }
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-tokens", type=int, default=DEFAULT_OPTIONS_CHAIN_MAX_TOKENS)
+    parser.add_argument("--expiries", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--strikes", type=int, nargs="+", default=[20, 80, 250])
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--output", type=Path, default=REPORT_PATH)
+    return parser
+
+
+def main() -> int:
+    args = _parser().parse_args()
+    rows = [
+        _measure(expiry_count, strike_count, args.max_tokens, max(1, args.repeats))
+        for expiry_count in args.expiries
+        for strike_count in args.strikes
+    ]
+
+    print(f"{'expiries':>8} {'strikes':>8} {'contracts':>9} {'full_tok':>9} {'slice_tok':>9} {'ms':>8}")
+    for row in rows:
+        print(
+            f"{row['expiries']:>8} {row['strikes_per_expiry']:>8} {row['contracts']:>9} "
+            f"{row['full_tokens']:>9} {row['sliced_tokens']:>9} {row['slice_and_render_ms']:>8}"
+        )
+
+    over_budget = [row for row in rows if row["sliced_tokens"] > args.max_tokens]
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps(
+            {
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+                "max_tokens": args.max_tokens,
+                "legend_tokens": estimate_tokens(options_chain_legend(OptionChainSliceConfig().lotto_max_dte)),
+                "results": rows,
+            },
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    print(f"Report written to {args.output}")
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
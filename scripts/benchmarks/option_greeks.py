@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Benchmark vectorized greeks and implied-vol solving on synthetic chains of 1k-10k contracts."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+from src.market_data.options.greeks import black_scholes_greeks, black_scholes_price, implied_volatility
+
+
+ARTIFACTS_DIR = Path("artifacts") / "benchmarks"
+REPORT_PATH = ARTIFACTS_DIR / "option_greeks.json"
+SPOT = 100.0
+RATE = 0.04
+
+
+def _synthetic_contracts(count: int, seed: int) -> Dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    strikes = np.round(rng.uniform(0.6, 1.4, count) * SPOT * 2) / 2
+    years = rng.integers(1, 365, count) / 365.0
+    vols = rng.uniform(0.15, 1.2, count)
+    is_call = rng.random(count) < 0.5
+    prices = black_scholes_price(SPOT, strikes, years, vols, is_call, RATE)
+    return {"strikes": strikes, "years": years, "vols": vols, "is_call": is_call, "prices": prices}
+
+
+def _best_ms(action, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - started)
+    return round(best * 1000.0, 3)
+
+
+def _measure(count: int, repeats: int) -> Dict[str, object]:
+    contracts = _synthetic_contracts(count, seed=count)
+    strikes, years, vols, is_call, prices = (
+        contracts["strikes"],
+        contracts["years"],
+        contracts["vols"],
+        contracts["is_call"],
+        contracts["prices"],
+    )
+
+    solved = implied_volatility(prices, SPOT, strikes, years, is_call, RATE)
+    # Rows whose time value is below float/CDF precision cannot pin down a vol.
+    well_posed = np.isfinite(solved) & (black_scholes_greeks(SPOT, strikes, years, vols, is_call, RATE).vega > 1e-4)
+    errors = np.abs(solved[well_posed] - vols[well_posed])
+
+    return {
+        "contracts": count,
+        "greeks_ms": _best_ms(lambda: black_scholes_greeks(SPOT, strikes, years, vols, is_call, RATE), repeats),
+        "implied_vol_ms": _best_ms(lambda: implied_volatility(prices, SPOT, strikes, years, is_call, RATE), repeats),
+        "solved_fraction": round(float(np.isfinite(solved).mean()), 4),
+        "max_abs_iv_error": float(errors.max()) if errors.size else None,
+    }
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 2_500, 5_000, 10_000])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--output", type=Path, default=REPORT_PATH)
+    return parser
+
+
+def main() -> int:
+    args = _parser().parse_args()
+    rows = [_measure(size, max(1, args.repeats)) for size in args.sizes]
+
+    print(f"{'contracts':>9} {'greeks_ms':>10} {'iv_ms':>8} {'solved':>7} {'max_iv_err':>11}")
+    for row in rows:
+        error = row["max_abs_iv_error"]
+        print(
+            f"{row['contracts']:>9} {row['greeks_ms']:>10} {row['implied_vol_ms']:>8} "
+            f"{row['solved_fraction']:>7} {error if error is None else f'{error:.2e}':>11}"
+        )
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps({"generated_at": datetime.now(timezone.utc).isoformat(), "results": rows}, indent=2),
+        encoding="utf-8",
+    )
+    print(f"Report written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
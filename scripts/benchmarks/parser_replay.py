@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""Replay the real-message fixtures through AIParser against recorded responses: CPU per stage, simulated wall time, throughput."""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import statistics
+import time
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from scripts.benchmarks.replay_clients import RecordedResponder, ReplayCall, build_replay_client
+from src.ai_parser import AIParser
+from src.providers.rate_limits import PRIORITY_BACKFILL
+from tests.data.stocktalk_real_messages import MESSAGE_FIXTURES
+
+
+ARTIFACTS_DIR = Path("artifacts") / "benchmarks"
+REPORT_PATH = ARTIFACTS_DIR / "parser_replay.json"
+DEFAULT_PROVIDERS = ("openai", "anthropic", "google")
+DEFAULT_CONCURRENCY = (1, 2, 4, 8, 16)
+# Parser methods timed as stages; time in a nested stage is charged to it, not its caller.
+STAGES = {
+    "fast_path": "_try_fast_path",
+    "fast_prompt": "_render_fast_prompt",
+    "full_prompt": "_build_prompt",
+    "full_request": "_request_full_parse_completion",
+    "coerce": "_coerce_result",
+}
+
+# A message as alternating CPU and network segments: ("cpu" | "net", seconds).
+Segments = List[Tuple[str, float]]
+
+
+class StageTimer:
+    """Exclusive process-CPU time per stage for wrapped parser methods."""
+
+    def __init__(self):
+        self.totals: Dict[str, float] = {stage: 0.0 for stage in STAGES}
+        self._stack: List[List[float]] = []
+
+    def reset(self) -> None:
+        self.totals = {stage: 0.0 for stage in STAGES}
+
+    def wrap(self, stage: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        def timed(*args, **kwargs):
+            frame = [time.process_time(), 0.0]
+            self._stack.append(frame)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._stack.pop()
+                elapsed = time.process_time() - frame[0]
+                self.totals[stage] += elapsed - frame[1]
+                if self._stack:
+                    self._stack[-1][1] += elapsed
+
+        return timed
+
+
+def _replay_parser(provider: str, responder: RecordedResponder, timer: StageTimer) -> AIParser:
+    parser = AIParser()
+    parser.provider = provider
+    parser.router = None
+    parser.rate_limiter = None
+    parser.config = {**parser.config, "streaming": {"enabled": False}}
+    fast_model = parser._fast_stage_model(provider)
+    parser.client = build_replay_client(responder, model_name=fast_model)
+    for stage, name in STAGES.items():
+        setattr(parser, name, timer.wrap(stage, getattr(parser, name)))
+    return parser
+
+
+def _segments(total_cpu: float, calls: Sequence[ReplayCall]) -> Segments:
+    segments: Segments = []
+    cpu_done = 0.0
+    for call in calls:
+        segments.append(("cpu", max(0.0, call.cpu_offset_seconds - cpu_done)))
+        segments.append(("net", call.latency_seconds))
+        cpu_done = call.cpu_offset_seconds
+    segments.append(("cpu", max(0.0, total_cpu - cpu_done)))
+    return segments
+
+
+def simulate_throughput(jobs: Sequence[Segments], concurrency: int) -> Dict[str, float]:
+    """
+    Discrete-event run of `jobs` on `concurrency` workers sharing one interpreter: CPU
+    segments are serialized FIFO (the GIL), network waits overlap freely.
+    """
+    pending = deque(enumerate(jobs))
+    events: List[Tuple[float, int, int, int]] = []  # (time, seq, job, next segment)
+    started: Dict[int, float] = {}
+    latencies: List[float] = []
+    cpu_free_at = 0.0
+    seq = 0
+    makespan = 0.0
+
+    def start_next(now: float) -> None:
+        nonlocal seq
+        if pending:
+            job_id, _ = pending.popleft()
+            started[job_id] = now
+            heapq.heappush(events, (now, seq, job_id, 0))
+            seq += 1
+
+    for _ in range(min(concurrency, len(jobs))):
+        start_next(0.0)
+
+    while events:
+        now, _, job_id, index = heapq.heappop(events)
+        segments = jobs[job_id]
+        if index == len(segments):
+            latencies.append(now - started[job_id])
+            makespan = max(makespan, now)
+            start_next(now)
+            continue
+        kind, seconds = segments[index]
+        if kind == "cpu":
+            begin = max(now, cpu_free_at)
+            cpu_free_at = begin + seconds
+            done = cpu_free_at
+        else:
+            done = now + seconds
+        heapq.heappush(events, (done, seq, job_id, index + 1))
+        seq += 1
+
+    return {
+        "concurrency": concurrency,
+        "messages_per_second": round(len(jobs) / makespan, 2) if makespan else 0.0,
+        "message_p95_ms": round(_percentile(latencies, 95) * 1e3, 1),
+    }
+
+
+def _percentile(values: Sequence[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def _replay_provider(provider: str, iterations: int, seed: int, concurrency: Sequence[int]) -> Dict[str, Any]:
+    responder = RecordedResponder(provider, seed=seed)
+    timer = StageTimer()
+    parser = _replay_parser(provider, responder, timer)
+    fixtures = list(MESSAGE_FIXTURES.values())
+
+    # One untimed pass warms template, regex and pydantic caches.
+    for fixture in fixtures:
+        responder.begin(fixture)
+        parser.parse_message(fixture.text, fixture.author, priority=PRIORITY_BACKFILL)
+    timer.reset()
+
+    jobs: List[Segments] = []
+    cpu_seconds: List[float] = []
+    wall_seconds: List[float] = []
+    statuses: Dict[str, int] = {}
+    calls = {"fast": 0, "full": 0}
+    for _ in range(iterations):
+        for fixture in fixtures:
+            responder.begin(fixture)
+            started = time.process_time()
+            result = parser.parse_message(fixture.text, fixture.author, priority=PRIORITY_BACKFILL)
+            cpu = time.process_time() - started
+            net = sum(call.latency_seconds for call in responder.calls)
+            cpu_seconds.append(cpu)
+            wall_seconds.append(cpu + net)
+            jobs.append(_segments(cpu, responder.calls))
+            statuses[result.meta.status] = statuses.get(result.meta.status, 0) + 1
+            for call in responder.calls:
+                calls[call.stage] += 1
+
+    messages = len(cpu_seconds)
+    stage_us = {stage: round(total / messages * 1e6, 1) for stage, total in timer.totals.items()}
+    stage_us["other"] = round(max(0.0, sum(cpu_seconds) / messages * 1e6 - sum(stage_us.values())), 1)
+    return {
+        "provider": provider,
+        "messages": messages,
+        "statuses": dict(sorted(statuses.items())),
+        "provider_calls": calls,
+        "cpu_us_per_message": round(statistics.fmean(cpu_seconds) * 1e6, 1),
+        "cpu_us_per_stage": stage_us,
+        "simulated_wall_ms": {
+            "p50": round(_percentile(wall_seconds, 50) * 1e3, 1),
+            "p95": round(_percentile(wall_seconds, 95) * 1e3, 1),
+            "p99": round(_percentile(wall_seconds, 99) * 1e3, 1),
+        },
+        "throughput": [simulate_throughput(jobs, level) for level in concurrency],
+    }
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--provider", action="append", dest="providers", choices=DEFAULT_PROVIDERS)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, action="append", help="worker count to simulate (repeatable)")
+    parser.add_argument("--seed", type=int, default=7, help="latency sampling seed; keep fixed to compare commits")
+    parser.add_argument("--output", type=Path, default=REPORT_PATH)
+    return parser
+
+
+def main() -> int:
+    args = _parser().parse_args()
+    concurrency = args.concurrency or DEFAULT_CONCURRENCY
+    results = [
+        _replay_provider(provider, args.iterations, args.seed, concurrency)
+        for provider in (args.providers or DEFAULT_PROVIDERS)
+    ]
+
+    print(f"{'provider':<10} {'cpu_us':>8} {'wall_p50':>8} {'wall_p95':>8} {'wall_p99':>8}  msgs/s @ concurrency")
+    for row in results:
+        wall = row["simulated_wall_ms"]
+        throughput = " ".join(f"{level['concurrency']}:{level['messages_per_second']}" for level in row["throughput"])
+        print(
+            f"{row['provider']:<10} {row['cpu_us_per_message']:>8} {wall['p50']:>8} {wall['p95']:>8} "
+            f"{wall['p99']:>8}  {throughput}"
+        )
+    for row in results:
+        stages = " ".join(f"{stage}={us}" for stage, us in row["cpu_us_per_stage"].items())
+        print(f"{row['provider']:<10} cpu_us/stage: {stages}")
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps(
+            {
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+                "iterations": args.iterations,
+                "seed": args.seed,
+                "results": results,
+            },
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    print(f"Report written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Measure CPU per message from provider JSON to picks-log line: legacy dict round trips vs. the typed path."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from scripts.benchmarks.recorded_responses import recorded_full_response
+from src.ai_parser import AIParser
+from src.models.parser_models import CONTRACT_VERSION, ParsedMessage, ParsedSignal, ParserMeta
+from tests.data.stocktalk_real_messages import MESSAGE_FIXTURES, MessageFixture
+
+
+ARTIFACTS_DIR = Path("artifacts") / "benchmarks"
+REPORT_PATH = ARTIFACTS_DIR / "parser_result_cpu.json"
+
+
+def _source(fixture: MessageFixture) -> Dict[str, Any]:
+    return {"author": fixture.author, "channel_id": "1", "message_id": None, "message_text": fixture.text}
+
+
+def _log_line(fixture: MessageFixture, payload: Dict[str, Any]) -> str:
+    return json.dumps({"timestamp": "2026-01-01T00:00:00", "author": fixture.author, "ai_parsed_signals": payload})
+
+
+def _legacy_path(parser: AIParser, fixture: MessageFixture, response_text: str) -> str:
+    """The former pipeline: dump per signal, validate+dump the envelope, re-validate+dump in the client."""
+    payload = json.loads(response_text)
+    signals: List[Dict[str, Any]] = []
+    for signal in payload["signals"]:
+        vehicles = parser._normalize_vehicles(signal.get("vehicles"), str(signal.get("action") or "NONE"))
+        signals.append(ParsedSignal.model_validate({**signal, "vehicles": [v.model_dump() for v in vehicles]}).model_dump())
+    result = ParsedMessage(
+        contract_version=CONTRACT_VERSION,
+        source=_source(fixture),
+        signals=signals,
+        meta=ParserMeta(status="ok" if signals else "no_action", provider="benchmark"),
+    ).model_dump()
+    parsed_payload = ParsedMessage.model_validate(result).model_dump()
+    json.dumps(parsed_payload, indent=2)  # the unguarded debug log
+    return _log_line(fixture, parsed_payload)
+
+
+def _typed_path(parser: AIParser, fixture: MessageFixture, response_text: str) -> str:
+    parsed = parser._coerce_result(json.loads(response_text), source=_source(fixture), provider="benchmark")
+    return _log_line(fixture, parsed.model_dump())
+
+
+def _cpu_micros(run: Callable[[], str], iterations: int) -> float:
+    started = time.process_time()
+    for _ in range(iterations):
+        run()
+    return (time.process_time() - started) / iterations * 1e6
+
+
+def _measure(iterations: int) -> List[Dict[str, Any]]:
+    parser = AIParser()
+    rows: List[Dict[str, Any]] = []
+    for fixture in MESSAGE_FIXTURES.values():
+        response_text = recorded_full_response(fixture)
+        if _legacy_path(parser, fixture, response_text) != _typed_path(parser, fixture, response_text):
+            raise AssertionError(f"{fixture.scenario_id}: typed path changed the logged contract")
+        legacy = _cpu_micros(lambda: _legacy_path(parser, fixture, response_text), iterations)
+        typed = _cpu_micros(lambda: _typed_path(parser, fixture, response_text), iterations)
+        rows.append(
+            {
+                "scenario_id": fixture.scenario_id,
+                "signals": len(fixture.expected_tickers) if fixture.should_pick else 0,
+                "legacy_cpu_us": round(legacy, 1),
+                "typed_cpu_us": round(typed, 1),
+                "speedup": round(legacy / typed, 2) if typed else None,
+            }
+        )
+    return rows
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--output", type=Path, default=REPORT_PATH)
+    return parser
+
+
+def main() -> int:
+    args = _parser().parse_args()
+    rows = _measure(args.iterations)
+
+    print(f"{'scenario':<34} {'signals':>7} {'legacy_us':>9} {'typed_us':>9} {'speedup':>7}")
+    for row in rows:
+        print(
+            f"{row['scenario_id']:<34} {row['signals']:>7} {row['legacy_cpu_us']:>9} "
+            f"{row['typed_cpu_us']:>9} {row['speedup']:>7}"
+        )
+    legacy_total = sum(row["legacy_cpu_us"] for row in rows)
+    typed_total = sum(row["typed_cpu_us"] for row in rows)
+    print(f"{'mean per message':<34} {'':>7} {legacy_total / len(rows):>9.1f} {typed_total / len(rows):>9.1f}")
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps(
+            {"generated_at": datetime.now(timezone.utc).isoformat(), "iterations": args.iterations, "results": rows},
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    print(f"Report written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
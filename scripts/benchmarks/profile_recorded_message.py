@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Profile AIParser on a message recorded in the picks log, answering provider calls with its recorded parse."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+from src.ai_parser import AIParser
+from src.observability import MessageProfiler
+from src.picks_log import PicksLogQuery
+from src.providers.rate_limits import PRIORITY_BACKFILL
+from src.utils.paths import PICKS_LOG_PATH
+
+
+ARTIFACTS_DIR = Path("artifacts") / "profiles"
+
+# Fast-stage answer that sends every replayed message on to the full parse, so both
+# prompt renders, JSON cleanup and contract coercion are exercised.
+AMBIGUOUS_FAST_RESPONSE = {
+    "status": "ambiguous",
+    "confidence": 0.5,
+    "primary_ticker": None,
+    "vehicle_hint": "unknown",
+    "action": "NONE",
+    "evidence_text": "",
+    "sizing_text": "unspecified",
+}
+
+
+def recorded_entries(path: Path, query: PicksLogQuery) -> Iterator[Dict[str, Any]]:
+    """Picks-log entries with message text that match `query` (any one signal for signal filters)."""
+    with path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(entry, dict) or not entry.get("message") or not query.matches_entry(entry):
+                continue
+            signals = _recorded_signals(entry)
+            if query.filters_signals and not any(query.matches_signal(signal) for signal in signals):
+                continue
+            yield entry
+
+
+def _recorded_signals(entry: Mapping[str, Any]) -> List[Mapping[str, Any]]:
+    parsed = entry.get("ai_parsed_signals")
+    signals = parsed.get("signals") if isinstance(parsed, Mapping) else None
+    return [signal for signal in signals if isinstance(signal, Mapping)] if isinstance(signals, list) else []
+
+
+def recorded_openai_client(entry: Mapping[str, Any]) -> Any:
+    """OpenAI-shaped client returning the entry's recorded signals as the full-parse response."""
+    full_response = json.dumps({"signals": _recorded_signals(entry)})
+
+    def create(**kwargs):
+        schema_name = kwargs["response_format"]["json_schema"]["name"]
+        content = json.dumps(AMBIGUOUS_FAST_RESPONSE) if schema_name.endswith("_fast_contract") else full_response
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=None)
+
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+def replay_parser(entry: Mapping[str, Any]) -> AIParser:
+    parser = AIParser()
+    parser.provider = "openai"
+    parser.router = None
+    parser.rate_limiter = None
+    parser.cassette = None
+    parser.config = {**parser.config, "streaming": {"enabled": False}}
+    parser.client = recorded_openai_client(entry)
+    return parser
+
+
+def profile_entry(entry: Mapping[str, Any], iterations: int, output_dir: Path, top: int) -> MessageProfiler:
+    parser = replay_parser(entry)
+    text, author = str(entry["message"]), str(entry.get("author") or "replay")
+    # One unprofiled pass warms template, regex and pydantic caches.
+    parser.parse_message(text, author, priority=PRIORITY_BACKFILL)
+    profiler = MessageProfiler(output_dir, threshold_seconds=0.0, enabled=True, top=top)
+    with profiler.profile(f"replay-{author}-x{iterations}"):
+        for _ in range(iterations):
+            parser.parse_message(text, author, priority=PRIORITY_BACKFILL)
+    return profiler
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", nargs="?", type=Path, default=PICKS_LOG_PATH, help="flat picks-log JSONL file")
+    parser.add_argument("--ticker", action="append", default=[])
+    parser.add_argument("--author", action="append", default=[])
+    parser.add_argument("--index", type=int, default=-1, help="which matching entry to replay (default: the latest)")
+    parser.add_argument("--iterations", type=int, default=50, help="parses inside one profile")
+    parser.add_argument("--top", type=int, default=40, help="functions listed, by cumulative time")
+    parser.add_argument("--output-dir", type=Path, default=ARTIFACTS_DIR)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parser().parse_args(argv)
+    if not args.path.exists():
+        print(f"No picks log at {args.path}", file=sys.stderr)
+        return 2
+    entries = list(recorded_entries(args.path, PicksLogQuery.build(tickers=args.ticker, authors=args.author)))
+    try:
+        entry = entries[args.index]
+    except IndexError:
+        print(f"{len(entries)} matching entries; --index {args.index} is out of range", file=sys.stderr)
+        return 2
+
+    profiler = profile_entry(entry, max(1, args.iterations), args.output_dir, args.top)
+    print(f"Replayed {entry.get('timestamp')} by {entry.get('author')}: {str(entry['message'])[:80]!r}")
+    print(profiler.last_path.with_suffix(".txt").read_text(encoding="utf-8"))
+    print(f"Profile written to {profiler.last_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
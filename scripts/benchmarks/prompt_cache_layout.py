@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Report how much of the full-parse prompt is a cacheable static prefix across messages."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+from src.ai_parser import AIParser
+from src.utils.token_estimate import estimate_tokens
+
+
+ARTIFACTS_DIR = Path("artifacts") / "benchmarks"
+REPORT_PATH = ARTIFACTS_DIR / "prompt_cache_layout.json"
+# Anthropic ignores cache_control on prefixes shorter than this (Sonnet/Opus tier).
+ANTHROPIC_MIN_CACHEABLE_TOKENS = 1024
+SAMPLE_MESSAGES = (
+    "New position: Apple $AAPL - 3% weight @ $190 avg on shares",
+    "Added $PANL $7.5C for May, small spot only.",
+    "Trimming half of $NVDA here into strength, keeping the rest.",
+    "PORTFOLIO UPDATE: 20-21%: $ENS* (Shares + $115C Mar '26)",
+)
+
+
+def _measure(parser: AIParser, messages: List[str]) -> Dict[str, object]:
+    prompts = [parser._render_prompt(message, "benchmark") for message in messages]
+    prefixes = {prompt.static_prefix for prompt in prompts}
+    prefix_tokens = estimate_tokens(prompts[0].static_prefix)
+    suffix_tokens = [estimate_tokens(prompt.dynamic_suffix) for prompt in prompts]
+    total_tokens = [prefix_tokens + tokens for tokens in suffix_tokens]
+    return {
+        "messages": len(prompts),
+        "prefix_identical": len(prefixes) == 1,
+        "prefix_tokens": prefix_tokens,
+        "suffix_tokens": suffix_tokens,
+        "cacheable_share": round(prefix_tokens / max(1, max(total_tokens)), 3),
+        "anthropic_cache_eligible": prefix_tokens >= ANTHROPIC_MIN_CACHEABLE_TOKENS,
+    }
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--message", action="append", dest="messages", help="Message text (repeatable)")
+    parser.add_argument("--output", type=Path, default=REPORT_PATH)
+    return parser
+
+
+def main() -> int:
+    args = _parser().parse_args()
+    messages = list(args.messages or SAMPLE_MESSAGES)
+    result = _measure(AIParser(), messages)
+
+    print(f"{'prefix_tok':>10} {'suffix_tok(max)':>15} {'cacheable':>9} {'identical':>9} {'anthropic':>9}")
+    print(
+        f"{result['prefix_tokens']:>10} {max(result['suffix_tokens']):>15} {result['cacheable_share']:>9} "
+        f"{str(result['prefix_identical']):>9} {str(result['anthropic_cache_eligible']):>9}"
+    )
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps({"generated_at": datetime.now(timezone.utc).isoformat(), "result": result}, indent=2),
+        encoding="utf-8",
+    )
+    print(f"Report written to {args.output}")
+    return 0 if result["prefix_identical"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,70 @@
+"""Recorded provider responses for the real-message fixtures, shared by the offline parser benchmarks."""
+
+from __future__ import annotations
+
+import json
+
+from tests.data.stocktalk_real_messages import MessageFixture
+
+
+def recorded_full_response(fixture: MessageFixture) -> str:
+    """Full-contract response of the shape providers return for this fixture."""
+    if not fixture.should_pick:
+        return json.dumps({"signals": []})
+    return json.dumps(
+        {
+            "signals": [
+                {
+                    "ticker": ticker,
+                    "action": "BUY",
+                    "confidence": 0.9,
+                    "reasoning": fixture.text[:160],
+                    "weight_percent": 4.5,
+                    "urgency": "MEDIUM",
+                    "sentiment": "BULLISH",
+                    "is_actionable": True,
+                    "vehicles": [
+                        {"type": "STOCK", "enabled": True, "intent": "EXECUTE", "side": "BUY"},
+                        {"type": "OPTION", "enabled": True, "intent": "WATCH", "side": "BUY", "option_type": "CALL", "strike": 12.5},
+                    ],
+                }
+                for ticker in sorted(fixture.expected_tickers)
+            ]
+        }
+    )
+
+
+def recorded_fast_response(fixture: MessageFixture) -> dict:
+    """
+    Fast-stage triage: short frozen alerts resolve confidently, no-action messages are
+    dismissed, and long essays come back ambiguous so they take the full parse.
+    """
+    if not fixture.should_pick:
+        return {
+            "status": "no_action",
+            "confidence": 0.95,
+            "primary_ticker": None,
+            "vehicle_hint": "unknown",
+            "action": "NONE",
+            "evidence_text": "",
+            "sizing_text": "unspecified",
+        }
+    if fixture.family == "frozen":
+        return {
+            "status": "actionable",
+            "confidence": 0.92,
+            "primary_ticker": sorted(fixture.expected_tickers)[0],
+            "vehicle_hint": "stock",
+            "action": "BUY",
+            "evidence_text": fixture.text[:80],
+            "sizing_text": "unspecified",
+        }
+    return {
+        "status": "ambiguous",
+        "confidence": 0.5,
+        "primary_ticker": None,
+        "vehicle_hint": "unknown",
+        "action": "NONE",
+        "evidence_text": "",
+        "sizing_text": "unspecified",
+    }
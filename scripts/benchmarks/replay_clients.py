@@ -0,0 +1,125 @@
+"""SDK-shaped provider clients that answer from recorded responses and sample simulated latency."""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+from scripts.benchmarks.recorded_responses import recorded_fast_response, recorded_full_response
+from src.utils.token_estimate import estimate_tokens
+from tests.data.stocktalk_real_messages import MessageFixture
+
+
+FAST_STAGE = "fast"
+FULL_STAGE = "full"
+
+
+@dataclass(frozen=True)
+class LatencyModel:
+    """Lognormal time-to-first-token plus output tokens at a fixed decode rate."""
+
+    ttft_seconds: float
+    ttft_sigma: float
+    output_tokens_per_second: float
+
+    def sample(self, rng: random.Random, output_tokens: int) -> float:
+        ttft = self.ttft_seconds * math.exp(rng.gauss(0.0, self.ttft_sigma))
+        return ttft + output_tokens / self.output_tokens_per_second
+
+
+# (provider, stage) -> model; medians for the default models in config/trading.yaml.
+DEFAULT_LATENCY_MODELS: Dict[Tuple[str, str], LatencyModel] = {
+    ("openai", FAST_STAGE): LatencyModel(0.35, 0.35, 160.0),
+    ("openai", FULL_STAGE): LatencyModel(0.60, 0.40, 90.0),
+    ("anthropic", FAST_STAGE): LatencyModel(0.45, 0.35, 130.0),
+    ("anthropic", FULL_STAGE): LatencyModel(0.90, 0.45, 65.0),
+    ("google", FAST_STAGE): LatencyModel(0.40, 0.35, 180.0),
+    ("google", FULL_STAGE): LatencyModel(1.20, 0.50, 70.0),
+}
+
+
+@dataclass(frozen=True)
+class ReplayCall:
+    provider: str
+    stage: str
+    output_tokens: int
+    latency_seconds: float
+    # Parser CPU spent on the message before this call went out.
+    cpu_offset_seconds: float
+
+
+class RecordedResponder:
+    """Serves the current fixture's recorded responses and logs a simulated latency per call."""
+
+    def __init__(
+        self,
+        provider: str,
+        seed: int = 0,
+        latency_models: Optional[Dict[Tuple[str, str], LatencyModel]] = None,
+    ):
+        self.provider = provider
+        self.calls: List[ReplayCall] = []
+        self._rng = random.Random(seed)
+        self._models = latency_models or DEFAULT_LATENCY_MODELS
+        self._fixture: Optional[MessageFixture] = None
+        self._started_cpu = 0.0
+
+    def begin(self, fixture: MessageFixture) -> None:
+        self._fixture = fixture
+        self.calls = []
+        self._started_cpu = time.process_time()
+
+    def respond(self, stage: str) -> Any:
+        cpu_offset = time.process_time() - self._started_cpu
+        if self._fixture is None:
+            raise RuntimeError("RecordedResponder.begin(fixture) must be called before replaying")
+        if stage == FAST_STAGE:
+            payload: Any = recorded_fast_response(self._fixture)
+            text = json.dumps(payload)
+        else:
+            text = recorded_full_response(self._fixture)
+            payload = text
+        output_tokens = estimate_tokens(text)
+        latency = self._models[(self.provider, stage)].sample(self._rng, output_tokens)
+        self.calls.append(ReplayCall(self.provider, stage, output_tokens, latency, cpu_offset))
+        return payload
+
+
+def build_replay_client(responder: RecordedResponder, model_name: str = "") -> Any:
+    """Client with the SDK surface the parser's provider wrappers call for `responder.provider`."""
+    provider = responder.provider
+    if provider == "openai":
+        def create(**kwargs):
+            schema_name = kwargs["response_format"]["json_schema"]["name"]
+            stage = FAST_STAGE if schema_name.endswith("_fast_contract") else FULL_STAGE
+            payload = responder.respond(stage)
+            content = payload if isinstance(payload, str) else json.dumps(payload)
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=None)
+
+        return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+    if provider == "anthropic":
+        def create(**kwargs):
+            if kwargs.get("tools"):
+                tool_input = responder.respond(FAST_STAGE)
+                block = SimpleNamespace(type="tool_use", name=kwargs["tools"][0]["name"], input=tool_input)
+            else:
+                block = SimpleNamespace(type="text", text=responder.respond(FULL_STAGE))
+            return SimpleNamespace(content=[block], usage=None)
+
+        return SimpleNamespace(messages=SimpleNamespace(create=create))
+
+    if provider == "google":
+        def generate_content(prompt, generation_config=None):
+            payload = responder.respond(FAST_STAGE if generation_config else FULL_STAGE)
+            return SimpleNamespace(text=payload if isinstance(payload, str) else json.dumps(payload), usage_metadata=None)
+
+        # Bound to the fast model so the parser reuses this client instead of building a real one.
+        return SimpleNamespace(generate_content=generate_content, model_name=model_name)
+
+    raise ValueError(f"No replay client for provider: {provider}")
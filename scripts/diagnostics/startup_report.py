@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Break down the import time of the service entry point by package, from a fresh interpreter."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import List, Optional
+
+from src.observability.startup import group_import_time, measure_import_time
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default="src.main", help="module to import (default: src.main)")
+    parser.add_argument("--top", type=int, default=15, help="packages and modules listed")
+    parser.add_argument("--runs", type=int, default=3, help="imports measured; the fastest run is reported")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parser().parse_args(argv)
+    try:
+        runs = [measure_import_time(args.module) for _ in range(max(1, args.runs))]
+    except RuntimeError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+    # The first run warms the OS file cache and bytecode; the fastest is the steady restart cost.
+    timings = min(runs, key=lambda run: sum(timing.self_us for timing in run))
+    total_us = sum(timing.self_us for timing in timings)
+    print(f"import {args.module}: {total_us / 1000:.1f} ms across {len(timings)} modules")
+
+    print("\nBy package (self time):")
+    for package, self_us in list(group_import_time(timings).items())[: args.top]:
+        print(f"  {package:<40} {self_us / 1000:8.1f} ms  {100 * self_us / max(total_us, 1):5.1f}%")
+
+    print("\nSlowest modules (cumulative):")
+    slowest = sorted(timings, key=lambda timing: timing.cumulative_us, reverse=True)[: args.top]
+    for timing in slowest:
+        print(f"  {timing.module:<40} {timing.cumulative_us / 1000:8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
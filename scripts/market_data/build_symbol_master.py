@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Build the memory-mapped symbol master from Nasdaq Trader listings or a broker CSV export."""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import time
+from pathlib import Path
+
+from config.settings import SYMBOL_MASTER_CONFIG
+from src.market_data.symbols import SymbolMaster, read_symbol_listing, write_symbol_master
+from src.market_data.symbols.symbol_master import DEFAULT_SYMBOL_MASTER_PATH
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "listings",
+        nargs="+",
+        type=Path,
+        help="nasdaqlisted.txt / otherlisted.txt (pipe-delimited) or CSV with symbol[,instrument_id][,tick_size]",
+    )
+    parser.add_argument("--output", type=Path, default=None, help="defaults to market_data.symbol_master.path")
+    return parser
+
+
+def main() -> int:
+    args = _parser().parse_args()
+    output = args.output or Path(SYMBOL_MASTER_CONFIG.get("path") or DEFAULT_SYMBOL_MASTER_PATH)
+    records = itertools.chain.from_iterable(read_symbol_listing(path) for path in args.listings)
+    count = write_symbol_master(records, output)
+
+    started = time.perf_counter()
+    master = SymbolMaster(output)
+    opened_ms = (time.perf_counter() - started) * 1e3
+    master.close()
+    print(f"Wrote {count} symbols to {output} ({output.stat().st_size} bytes, opens in {opened_ms:.2f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
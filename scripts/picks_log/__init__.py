@@ -0,0 +1 @@
+"""Picks-log maintenance and query scripts."""
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Append new picks-log entries to the SQLite analytics tables (messages, signals, vehicles)."""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from config.settings import PICKS_LOG_CONFIG
+from src.picks_log import PicksLogExporter, picks_log_files, picks_log_location
+from src.utils.paths import DATA_DIR, PICKS_LOG_PATH
+
+
+DEFAULT_PICKS_LOG = picks_log_location(PICKS_LOG_CONFIG, DATA_DIR / "picks_log", PICKS_LOG_PATH)
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        help=f"picks-log JSONL files or segment directories (default: {DEFAULT_PICKS_LOG})",
+    )
+    parser.add_argument("--database", type=Path, default=DATA_DIR / "picks_log.sqlite")
+    parser.add_argument("--batch-size", type=int, default=5000, help="lines per transaction")
+    return parser
+
+
+def main() -> int:
+    args = _parser().parse_args()
+    with PicksLogExporter(args.database, batch_size=args.batch_size) as exporter:
+        for source in args.paths or [DEFAULT_PICKS_LOG]:
+            for path in picks_log_files(source, include_unmerged=False):
+                started = time.perf_counter()
+                result = exporter.export(path)
+                elapsed = time.perf_counter() - started
+                print(
+                    f"{path}: bytes {result.start_offset}-{result.end_offset}, {result.messages} messages, "
+                    f"{result.signals} signals, {result.vehicles} vehicles, {result.skipped} skipped "
+                    f"in {elapsed:.2f}s{' (restarted)' if result.restarted else ''}"
+                )
+    print(f"Database: {args.database}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
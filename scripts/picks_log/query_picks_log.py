@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Filter the picks log and print the requested fields as JSON lines (or a count)."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from config.settings import PICKS_LOG_CONFIG
+from src.picks_log import QUERY_FIELDS, PicksLogQuery, QueryStats, picks_log_location, query_picks_log
+from src.utils.paths import DATA_DIR, PICKS_LOG_PATH
+
+
+DEFAULT_PICKS_LOG = picks_log_location(PICKS_LOG_CONFIG, DATA_DIR / "picks_log", PICKS_LOG_PATH)
+
+
+def _csv(value: str) -> list:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        help=f"picks-log JSONL files or segment directories (default: {DEFAULT_PICKS_LOG})",
+    )
+    parser.add_argument("--ticker", action="append", default=[], help="repeatable or comma-separated")
+    parser.add_argument("--action", action="append", default=[], help="BUY, SELL, HOLD, ...")
+    parser.add_argument("--min-confidence", type=float, default=None)
+    parser.add_argument("--max-confidence", type=float, default=None)
+    parser.add_argument("--provider", action="append", default=[])
+    parser.add_argument("--status", action="append", default=[])
+    parser.add_argument("--author", action="append", default=[])
+    parser.add_argument(
+        "--fields", type=_csv, default=None, help=f"comma-separated subset of: {', '.join(QUERY_FIELDS)}"
+    )
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--count", action="store_true", help="print only the number of matching rows")
+    parser.add_argument("--stats", action="store_true", help="report lines scanned/prefiltered/decoded on stderr")
+    return parser
+
+
+def main() -> int:
+    args = _parser().parse_args()
+    query = PicksLogQuery.build(
+        tickers=[t for value in args.ticker for t in _csv(value)],
+        actions=[a for value in args.action for a in _csv(value)],
+        min_confidence=args.min_confidence,
+        max_confidence=args.max_confidence,
+        providers=[p for value in args.provider for p in _csv(value)],
+        statuses=[s for value in args.status for s in _csv(value)],
+        authors=args.author,
+    )
+    stats = QueryStats()
+    started = time.perf_counter()
+    try:
+        paths = args.paths or [DEFAULT_PICKS_LOG]
+        rows = query_picks_log(paths, query, fields=args.fields, limit=args.limit, stats=stats)
+    except ValueError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+
+    if args.count:
+        print(sum(1 for _ in rows))
+    else:
+        for row in rows:
+            sys.stdout.write(json.dumps(row) + "\n")
+
+    if args.stats:
+        elapsed_ms = (time.perf_counter() - started) * 1e3
+        print(
+            f"{stats.lines} lines, {stats.prefiltered} skipped by prefilter, {stats.decoded} decoded, "
+            f"{stats.rows} rows in {elapsed_ms:.1f} ms",
+            file=sys.stderr,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,7 +1,9 @@
 import json
 import re
+import time
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from pydantic import ValidationError
 from pytz import timezone
@@ -12,24 +14,65 @@ from config.settings import (
     ANTHROPIC_API_KEY,
     GOOGLE_API_KEY,
     OPENAI_API_KEY,
+    OPTIONS_CHAIN_CONFIG,
     get_account_constraints,
     get_analyst_for_channel,
 )
+from src.market_data.options.chain_format import EMPTY_OPTIONS_CHAIN_TEXT, render_option_chain_slices
+from src.market_data.symbols.symbol_master import SymbolMaster
+from src.observability.metrics import REGISTRY
+from src.observability.tracing import TRACER, current_span
 from src.models.parser_models import (
     CONTRACT_VERSION,
     ParsedMessage,
     ParsedSignal,
     ParsedVehicle,
     ParserMeta,
+    ParserSource,
 )
-from src.providers.openai.parser_client import request_fast_parser_completion
+from src.providers.cassette import ProviderCassette
 from src.providers.client_factory import build_provider_client
-from src.providers.parser_dispatch import UnsupportedProviderError, request_provider_completion
+from src.providers.parser_dispatch import (
+    UnsupportedProviderError,
+    request_provider_completion,
+    request_provider_fast_completion,
+    stream_provider_completion,
+)
+from src.providers.prompt_layout import PROMPT_CACHE_BREAKPOINT, PromptInput, PromptParts
+from src.providers.provider_health import ProviderHealth
+from src.providers.provider_router import AttemptGuard, ProviderRoute, ProviderRouter
+from src.providers.rate_limits import PRIORITY_LIVE, ProviderRateLimiter, RateLimits
+from src.providers.streaming import EarlySignal, consume_stream
 from src.utils.logger import setup_logger
-from src.utils.paths import resolve_prompt_path
+from src.utils.message_window import DEFAULT_MESSAGE_MAX_TOKENS, window_message
+from src.utils.paths import DATA_DIR, resolve_prompt_path
+from src.utils.token_estimate import estimate_tokens
+from src.utils.ticker_mentions import extract_cashtag_tickers
+
+if TYPE_CHECKING:  # the chain store and slicer load numpy; they are needed only with the options cache on
+    from src.market_data.options.chain_slicer import OptionChainSliceConfig
+    from src.market_data.options.chain_store import OptionChainStore
 
 logger = setup_logger("ai_parser")
 
+PARSER_STAGE_SECONDS = REGISTRY.histogram("parser_stage_seconds", "Time spent in each parser stage", ["stage"])
+PARSER_MESSAGES = REGISTRY.counter("parser_messages_total", "Parsed messages by result status", ["status"])
+PARSER_FAST_PATH = REGISTRY.counter(
+    "parser_fast_path_total", "Fast-path attempts; hit = answered without the full parse", ["result"]
+)
+PROVIDER_REQUEST_SECONDS = REGISTRY.histogram(
+    "provider_request_seconds", "Provider completion latency, including streaming", ["provider", "stage"]
+)
+PROVIDER_REQUEST_ERRORS = REGISTRY.counter(
+    "provider_request_errors_total", "Provider completions that raised", ["provider", "stage"]
+)
+
+
+@contextmanager
+def _stage(stage: str) -> Iterator[None]:
+    with TRACER.span(f"parser.{stage}"), PARSER_STAGE_SECONDS.time(stage=stage):
+        yield
+
 
 IMMUTABLE_CONTRACT_INSTRUCTION = f"""
 # IMMUTABLE RESPONSE CONTRACT (DO NOT DEVIATE)
@@ -67,15 +110,26 @@ Rules:
 - `confidence` means parser certainty that ticker/action extraction is correct (NOT analyst conviction).
 - Never add or rename top-level keys.
 """.strip()
+RESPONSE_CONTRACT_PLACEHOLDER = "{{RESPONSE_CONTRACT}}"
 
 
 class AIParser:
     """AI-powered parser that normalizes output to a strict, predictable contract."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        options_chain_store: Optional["OptionChainStore"] = None,
+        symbol_master: Optional[SymbolMaster] = None,
+    ):
         self.client = None
         self.provider = None
+        self.router: Optional[ProviderRouter] = None
+        self._fast_clients: Dict[str, Any] = {}
         self.config = AI_CONFIG
+        self.rate_limiter = _build_rate_limiter(self.config)
+        self.cassette = _build_cassette(self.config)
+        self.options_chain_store = options_chain_store
+        self.symbol_master = symbol_master
         self.prompt_template = self._load_prompt_template()
         self.fast_prompt_template = self._load_fast_prompt_template()
 
@@ -83,6 +137,8 @@ class AIParser:
 
         if not self.client:
             logger.warning("No AI provider available")
+        else:
+            self._init_router()
 
     def parse(
         self,
@@ -90,9 +146,58 @@ class AIParser:
         author_name: str,
         channel_id: Optional[int] = None,
         trading_account: Optional[Any] = None,
+        priority: int = PRIORITY_LIVE,
+        on_early_signal: Optional[Callable[[EarlySignal], None]] = None,
     ) -> Dict[str, Any]:
-        """Parse a message into the canonical parser contract."""
+        """Parse a message into the canonical parser contract as a plain dict (see `parse_message`)."""
+        return self.parse_message(
+            message_text,
+            author_name,
+            channel_id=channel_id,
+            trading_account=trading_account,
+            priority=priority,
+            on_early_signal=on_early_signal,
+        ).model_dump()
+
+    def parse_message(
+        self,
+        message_text: str,
+        author_name: str,
+        channel_id: Optional[int] = None,
+        trading_account: Optional[Any] = None,
+        priority: int = PRIORITY_LIVE,
+        on_early_signal: Optional[Callable[[EarlySignal], None]] = None,
+    ) -> ParsedMessage:
+        """
+        Parse a message into the canonical parser contract.
+
+        Provider output is validated once, per signal and vehicle; the envelope around
+        it is trusted and built without re-validation, so callers get a typed result
+        they can serialize exactly once.
+
+        `priority` orders rate-limit queues. With `ai.streaming.enabled`, `on_early_signal`
+        fires mid-stream once the first signal's ticker, action and stock side are known;
+        the returned contract is still built from the complete response.
+        """
+        started = time.perf_counter()
+        with TRACER.span("parser.parse", provider=self.provider, author=author_name) as span:
+            result = self._parse_message(
+                message_text, author_name, channel_id, trading_account, priority, on_early_signal
+            )
+            span.set_attributes(status=result.meta.status, signals=len(result.signals))
+        PARSER_STAGE_SECONDS.observe(time.perf_counter() - started, stage="total")
+        PARSER_MESSAGES.inc(status=result.meta.status)
+        return result
 
+    def _parse_message(
+        self,
+        message_text: str,
+        author_name: str,
+        channel_id: Optional[int],
+        trading_account: Optional[Any],
+        priority: int,
+        on_early_signal: Optional[Callable[[EarlySignal], None]],
+    ) -> ParsedMessage:
         source = {
             "author": str(author_name) if author_name is not None else None,
             "channel_id": str(channel_id) if channel_id is not None else None,
@@ -106,28 +211,38 @@ class AIParser:
 
         response_text = ""
         try:
-            fast_path_result = self._try_openai_fast_path(
-                message_text=message_text,
-                source=source,
-            )
+            with _stage("fast_path"):
+                fast_path_result = self._try_fast_path(
+                    message_text=message_text,
+                    source=source,
+                    priority=priority,
+                )
             if fast_path_result is not None:
                 return fast_path_result
 
-            prompt = self._build_prompt(
-                message_text=message_text,
-                author_name=author_name,
-                channel_id=channel_id,
-                trading_account=trading_account,
-            )
+            with _stage("prompt"):
+                prompt = self._build_prompt(
+                    message_text=message_text,
+                    author_name=author_name,
+                    channel_id=channel_id,
+                    trading_account=trading_account,
+                )
 
             if not prompt.strip():
                 logger.warning("Prompt template is empty")
                 return self._empty_result(status="empty_prompt", source=source)
 
-            response_text = self._request_full_parse_completion(prompt)
-            cleaned = self._clean_json(response_text)
-            payload = json.loads(cleaned)
-            return self._coerce_result(payload, source=source)
+            with _stage("full_request"):
+                response_text, provider, early_signals = self._request_full_parse_completion(
+                    prompt, priority, on_early_signal
+                )
+            with _stage("coerce"):
+                cleaned = self._clean_json(response_text)
+                payload = json.loads(cleaned)
+                result = self._coerce_result(payload, source=source, provider=provider)
+            if early_signals:
+                self._reconcile_early_signal(result, early_signals[-1])
+            return result
         except UnsupportedProviderError:
             logger.error("AI provider is not set on initialized client")
             return self._empty_result(status="unknown_provider", source=source)
@@ -138,15 +253,27 @@ class AIParser:
             logger.error("AI parsing error: %s", exc)
             return self._empty_result(status="provider_error", error=str(exc), source=source)
 
-    def _empty_result(self, status: str, source: Dict[str, Any], error: Optional[str] = None) -> Dict[str, Any]:
-        return ParsedMessage(
+    def _empty_result(self, status: str, source: Dict[str, Any], error: Optional[str] = None) -> ParsedMessage:
+        return self._build_result([], status=status, source=source, provider=self.provider, error=error)
+
+    def _build_result(
+        self,
+        signals: List[ParsedSignal],
+        status: str,
+        source: Dict[str, Any],
+        provider: Optional[str],
+        error: Optional[str] = None,
+        warnings: Optional[List[str]] = None,
+    ) -> ParsedMessage:
+        # Signals are already validated and the envelope fields are ours, so skip validation.
+        return ParsedMessage.model_construct(
             contract_version=CONTRACT_VERSION,
-            source=source,
-            signals=[],
-            meta=ParserMeta(status=status, provider=self.provider, error=error),
-        ).model_dump()
+            source=ParserSource.model_construct(**source),
+            signals=signals,
+            meta=ParserMeta.model_construct(status=status, provider=provider, error=error, warnings=warnings or []),
+        )
 
-    def _coerce_result(self, payload: Any, source: Dict[str, Any]) -> Dict[str, Any]:
+    def _coerce_result(self, payload: Any, source: Dict[str, Any], provider: Optional[str] = None) -> ParsedMessage:
         signal_payloads: List[Dict[str, Any]] = []
         warnings: List[str] = []
 
@@ -162,45 +289,69 @@ class AIParser:
         elif isinstance(payload, list):
             signal_payloads = [s for s in payload if isinstance(s, dict)]
 
-        normalized_signals: List[Dict[str, Any]] = []
+        normalized_signals: List[ParsedSignal] = []
         for signal in signal_payloads:
             normalized = self._normalize_signal(signal)
             if normalized:
-                normalized_signals.append(normalized.model_dump())
+                normalized_signals.append(normalized)
 
         status = "ok" if normalized_signals else "no_action"
-        result = ParsedMessage(
-            contract_version=CONTRACT_VERSION,
+        return self._build_result(
+            normalized_signals,
+            status=status,
             source=source,
-            signals=normalized_signals,
-            meta=ParserMeta(status=status, provider=self.provider, error=None, warnings=warnings),
+            provider=provider or self.provider,
+            warnings=warnings,
         )
-        return result.model_dump()
 
-    def _try_openai_fast_path(self, message_text: str, source: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        if (self.provider or "").lower().strip() != "openai":
+    def _try_fast_path(
+        self,
+        message_text: str,
+        source: Dict[str, Any],
+        priority: int = PRIORITY_LIVE,
+    ) -> Optional[ParsedMessage]:
+        provider = (self.provider or "").lower().strip()
+        model = self._fast_stage_model(provider)
+        if not model:
             return None
-
-        openai_config = self.config.get("openai", {}) if isinstance(self.config, dict) else {}
-
-        max_tokens = int(openai_config.get("fast_max_tokens", 140) or 140)
-        confidence_threshold = float(openai_config.get("fast_confidence_threshold", 0.85) or 0.85)
+        result = self._run_fast_path(provider, model, message_text, source, priority)
+        outcome = "miss" if result is None else "hit"
+        PARSER_FAST_PATH.inc(result=outcome)
+        current_span().set_attribute("fast_path", outcome)
+        return result
+
+    def _run_fast_path(
+        self, provider: str, model: str, message_text: str, source: Dict[str, Any], priority: int
+    ) -> Optional[ParsedMessage]:
+        provider_config = self.config.get(provider, {}) if isinstance(self.config, dict) else {}
+        max_tokens = int(provider_config.get("fast_max_tokens", 140) or 140)
+        confidence_threshold = float(provider_config.get("fast_confidence_threshold", 0.85) or 0.85)
         prompt = self._render_fast_prompt(message_text)
         if not prompt.strip():
             logger.warning("Fast prompt template is empty; skipping fast-path")
             return None
 
         try:
-            response_text = request_fast_parser_completion(
-                client=self.client,
-                model=openai_config["model"],
-                prompt=prompt,
-                max_tokens=max_tokens,
-                temperature=0.0,
-            )
+            with self._rate_limit_lease(provider, model, prompt, max_tokens, priority), self._timed_request(
+                provider, model, "fast"
+            ):
+                response_text = self._cassette_complete(
+                    provider,
+                    model,
+                    "fast",
+                    prompt,
+                    lambda: request_provider_fast_completion(
+                        provider=provider,
+                        client=self._fast_client(provider, model),
+                        model=model,
+                        prompt=prompt,
+                        max_tokens=max_tokens,
+                        temperature=0.0,
+                    ),
+                )
             fast_payload = json.loads(self._clean_json(response_text))
         except Exception as exc:
-            logger.warning("OpenAI fast-path failed; falling back to full parse: %s", exc)
+            logger.warning("%s fast-path failed; falling back to full parse: %s", provider.title(), exc)
             return None
 
         if not isinstance(fast_payload, dict):
@@ -242,37 +393,201 @@ class AIParser:
         }
         return self._coerce_result({"signals": [signal]}, source=source)
 
-    def _request_full_parse_completion(self, prompt: str) -> str:
-        if (self.provider or "").lower().strip() != "openai":
-            return request_provider_completion(
-                provider=self.provider,
-                client=self.client,
-                config=self.config,
-                prompt=prompt,
+    def _request_full_parse_completion(
+        self,
+        prompt: PromptParts,
+        priority: int = PRIORITY_LIVE,
+        on_early_signal: Optional[Callable[[EarlySignal], None]] = None,
+    ) -> Tuple[str, Optional[str], List[EarlySignal]]:
+        """
+        Return the completion text, the provider that produced it, and the early
+        signals streamed by that same attempt. Each routed attempt records into its
+        own list through a callback the router silences once it abandons the attempt.
+        """
+        if self.router is None:
+            early_signals: List[EarlySignal] = []
+            text = self._request_provider_full_parse(
+                self.provider, self.client, prompt, priority, _early_signal_recorder(early_signals, on_early_signal)
             )
+            return text, self.provider, early_signals
 
-        openai_config = self.config.get("openai", {}) if isinstance(self.config, dict) else {}
-        fallback_model = str(openai_config.get("fallback_model") or openai_config.get("model") or "").strip()
-        fallback_max_tokens = int(openai_config.get("fallback_max_tokens", openai_config.get("max_tokens", 1800)) or 1800)
-        fallback_temperature = float(
-            openai_config.get("fallback_temperature", openai_config.get("temperature", 0.0)) or 0.0
-        )
+        signals_by_route: Dict[ProviderRoute, List[EarlySignal]] = {}
 
-        return request_provider_completion(
-            provider=self.provider,
-            client=self.client,
-            config=self.config,
-            prompt=prompt,
-            model_override=fallback_model or None,
-            max_tokens_override=fallback_max_tokens,
-            temperature_override=fallback_temperature,
+        def request(route: ProviderRoute, guard: AttemptGuard) -> str:
+            route_signals = signals_by_route.setdefault(route, [])
+            recorder = guard.guard(_early_signal_recorder(route_signals, on_early_signal))
+            return self._request_provider_full_parse(route.provider, route.client, prompt, priority, recorder)
+
+        completed = self.router.complete_guarded(request)
+        return completed.text, completed.route.provider, signals_by_route.get(completed.route, [])
+
+    def _request_provider_full_parse(
+        self,
+        provider: Optional[str],
+        client: Any,
+        prompt: PromptParts,
+        priority: int = PRIORITY_LIVE,
+        on_early_signal: Optional[Callable[[EarlySignal], None]] = None,
+    ) -> str:
+        request_kwargs: Dict[str, Any] = {}
+        if (provider or "").lower().strip() == "openai":
+            openai_config = self.config.get("openai", {}) if isinstance(self.config, dict) else {}
+            fallback_model = self._full_parse_model("openai")
+            request_kwargs = {
+                "model_override": fallback_model or None,
+                "max_tokens_override": int(
+                    openai_config.get("fallback_max_tokens", openai_config.get("max_tokens", 1800)) or 1800
+                ),
+                "temperature_override": float(
+                    openai_config.get("fallback_temperature", openai_config.get("temperature", 0.0)) or 0.0
+                ),
+            }
+
+        normalized_provider = (provider or "").lower().strip()
+        model = self._full_parse_model(normalized_provider)
+        with self._timed_request(normalized_provider, model, "full"):
+            return self._request_full_parse_text(
+                normalized_provider, model, provider, client, prompt, priority, on_early_signal, request_kwargs
+            )
+
+    def _request_full_parse_text(
+        self,
+        normalized_provider: str,
+        model: str,
+        provider: Optional[str],
+        client: Any,
+        prompt: PromptParts,
+        priority: int,
+        on_early_signal: Optional[Callable[[EarlySignal], None]],
+        request_kwargs: Dict[str, Any],
+    ) -> str:
+        if not self._streaming_enabled():
+            return self._cassette_complete(
+                normalized_provider,
+                model,
+                "full",
+                prompt,
+                lambda: request_provider_completion(
+                    provider=provider,
+                    client=client,
+                    config=self.config,
+                    prompt=prompt,
+                    rate_limiter=self.rate_limiter,
+                    priority=priority,
+                    **request_kwargs,
+                ),
+            )
+
+        chunks = self._cassette_stream(
+            normalized_provider,
+            model,
+            "full",
+            prompt,
+            lambda: stream_provider_completion(
+                provider=provider,
+                client=client,
+                config=self.config,
+                prompt=prompt,
+                rate_limiter=self.rate_limiter,
+                priority=priority,
+                **request_kwargs,
+            ),
         )
+        return consume_stream(chunks, on_early_signal).text
+
+    @contextmanager
+    def _timed_request(self, provider: str, model: str, stage: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            with TRACER.span("provider.request", provider=provider, model=model, stage=stage):
+                yield
+        except Exception:
+            PROVIDER_REQUEST_ERRORS.inc(provider=provider or "unknown", stage=stage)
+            raise
+        finally:
+            PROVIDER_REQUEST_SECONDS.observe(time.perf_counter() - started, provider=provider or "unknown", stage=stage)
+
+    def _cassette_complete(
+        self, provider: str, model: str, stage: str, prompt: PromptInput, call: Callable[[], str]
+    ) -> str:
+        if self.cassette is None:
+            return call()
+        return self.cassette.complete(provider, model, stage, prompt, call)
+
+    def _cassette_stream(
+        self, provider: str, model: str, stage: str, prompt: PromptInput, call: Callable[[], Iterator[str]]
+    ) -> Iterator[str]:
+        if self.cassette is None:
+            return call()
+        return self.cassette.stream(provider, model, stage, prompt, call)
+
+    def _streaming_enabled(self) -> bool:
+        streaming_config = self.config.get("streaming", {}) if isinstance(self.config, dict) else {}
+        return bool(streaming_config.get("enabled"))
+
+    def _reconcile_early_signal(self, result: ParsedMessage, early: EarlySignal) -> None:
+        """Flag an early signal the final contract contradicts; prepared work for it goes unused."""
+        first = result.signals[0] if result.signals else None
+        if first is not None:
+            stock_sides = {vehicle.side for vehicle in first.vehicles if vehicle.type == "STOCK"}
+            if first.ticker == early.ticker and first.action == early.action and early.side in stock_sides:
+                return
+        warning = f"early_signal_mismatch: streamed {early.action} {early.ticker} (stock {early.side})"
+        logger.warning("%s; final parse differs", warning)
+        result.meta.warnings.append(warning)
+
+    def _rate_limit_lease(self, provider: str, model: str, prompt: str, max_tokens: int, priority: int):
+        if self.rate_limiter is None:
+            return nullcontext()
+        return self.rate_limiter.lease(provider, model, tokens=estimate_tokens(prompt) + max_tokens, priority=priority)
+
+    def _fast_stage_model(self, provider: str) -> str:
+        """OpenAI's primary `model` is its fast stage; other providers opt in with `fast_model`."""
+        provider_config = self.config.get(provider, {}) if isinstance(self.config, dict) else {}
+        if provider == "openai":
+            return str(provider_config.get("model") or "").strip()
+        return str(provider_config.get("fast_model") or "").strip()
+
+    def _fast_client(self, provider: str, model: str) -> Any:
+        """Gemini clients are bound to one model, so its fast stage gets a client of its own."""
+        if provider != "google" or getattr(self.client, "model_name", None) in (model, f"models/{model}"):
+            return self.client
+        if provider not in self._fast_clients:
+            self._fast_clients[provider] = self._build_client(provider, model=model) or self.client
+        return self._fast_clients[provider]
+
+    def _full_parse_model(self, provider: str) -> str:
+        provider_config = self.config.get(provider, {}) if isinstance(self.config, dict) else {}
+        if provider == "openai":
+            return str(provider_config.get("fallback_model") or provider_config.get("model") or "").strip()
+        return str(provider_config.get("model") or "").strip()
 
     def _render_fast_prompt(self, message_text: str) -> str:
         prompt = self.fast_prompt_template or ""
-        prompt = prompt.replace("{{MESSAGE_TEXT}}", str(message_text))
+        prompt = prompt.replace("{{MESSAGE_TEXT}}", self._prompt_message_text(message_text))
         return self._clear_remaining_placeholders(prompt)
 
+    def _prompt_message_text(self, message_text: str) -> str:
+        """Message text for `{{MESSAGE_TEXT}}`; long essays are windowed when `ai.message_window` is on."""
+        text = str(message_text)
+        window_config = self.config.get("message_window", {}) if isinstance(self.config, dict) else {}
+        if not window_config.get("enabled"):
+            return text
+        window = window_message(
+            text,
+            max_tokens=int(window_config.get("max_tokens") or DEFAULT_MESSAGE_MAX_TOKENS),
+            context_sentences=int(window_config.get("context_sentences", 1)),
+        )
+        if window.windowed:
+            logger.debug(
+                "Windowed message text %d -> %d tokens (%d/%d sentences kept)",
+                window.original_tokens,
+                window.windowed_tokens,
+                window.kept_sentences,
+                window.total_sentences,
+            )
+        return window.text
+
     def _normalize_fast_confidence(self, value: Any) -> float:
         try:
             parsed = float(value)
@@ -292,6 +607,9 @@ class AIParser:
         text = str(value).upper().replace("$", "").strip()
         if not text:
             return None
+        if self.symbol_master is not None:
+            # Unlisted guesses send the message to the full parse instead of a broker lookup.
+            return self.symbol_master.canonicalize(text)
         if "-" in text:
             compact = text.replace("-", "")
             if compact.isalnum():
@@ -402,7 +720,14 @@ class AIParser:
         vehicles = self._normalize_vehicles(raw_vehicles, action)
 
         payload = dict(signal)
-        payload["vehicles"] = [v.model_dump() for v in vehicles]
+        if self.symbol_master is not None:
+            listed = self.symbol_master.canonicalize(signal.get("ticker"))
+            if listed is None:
+                logger.warning("Dropping signal for unlisted ticker %r", signal.get("ticker"))
+                return None
+            payload["ticker"] = listed
+        # Validated vehicle instances are kept as-is instead of dumped and validated again.
+        payload["vehicles"] = vehicles
 
         if "is_actionable" not in payload:
             payload["is_actionable"] = action in {"BUY", "SELL", "HOLD"}
@@ -465,7 +790,7 @@ class AIParser:
         author_name: str,
         channel_id: Optional[int] = None,
         trading_account: Optional[Any] = None,
-    ) -> str:
+    ) -> PromptParts:
         if trading_account is not None:
             return self._render_prompt_with_account(
                 message_text=message_text,
@@ -481,7 +806,27 @@ class AIParser:
     def _append_contract_instruction(self, prompt: str) -> str:
         return f"{prompt.rstrip()}\n\n{IMMUTABLE_CONTRACT_INSTRUCTION}\n"
 
-    def _render_prompt(self, message_text: str, author_name: str, channel_id: Optional[int] = None) -> str:
+    def _layout_prompt(self, prompt: str) -> PromptParts:
+        """
+        Split a rendered template at its cache breakpoint into a stable prefix and a per-message suffix.
+
+        The contract goes at `{{RESPONSE_CONTRACT}}` inside the prefix (or ends it); templates
+        without a breakpoint keep the legacy layout with the contract appended last.
+        """
+        prefix, marker, suffix = prompt.partition(PROMPT_CACHE_BREAKPOINT)
+        if not marker:
+            prompt = self._clear_remaining_placeholders(prompt.replace(RESPONSE_CONTRACT_PLACEHOLDER, ""))
+            return PromptParts(static_prefix="", dynamic_suffix=self._append_contract_instruction(prompt))
+
+        if RESPONSE_CONTRACT_PLACEHOLDER in prefix:
+            prefix = prefix.replace(RESPONSE_CONTRACT_PLACEHOLDER, IMMUTABLE_CONTRACT_INSTRUCTION)
+        else:
+            prefix = self._append_contract_instruction(prefix)
+        prefix = self._clear_remaining_placeholders(prefix)
+        suffix = self._clear_remaining_placeholders(suffix)
+        return PromptParts(static_prefix=f"{prefix.rstrip()}\n\n", dynamic_suffix=f"{suffix.strip()}\n")
+
+    def _render_prompt(self, message_text: str, author_name: str, channel_id: Optional[int] = None) -> PromptParts:
         prompt = self.prompt_template or ""
         eastern = timezone("US/Eastern")
         current_time = datetime.now(eastern).strftime("%Y-%m-%d %H:%M:%S %Z")
@@ -493,7 +838,7 @@ class AIParser:
 
         prompt = prompt.replace("{{CURRENT_TIME}}", current_time)
         prompt = prompt.replace("{{AUTHOR_NAME}}", str(author_name))
-        prompt = prompt.replace("{{MESSAGE_TEXT}}", str(message_text))
+        prompt = prompt.replace("{{MESSAGE_TEXT}}", self._prompt_message_text(message_text))
         prompt = prompt.replace("{{ACCOUNT_BALANCE}}", "N/A")
         prompt = prompt.replace("{{DAY_BUYING_POWER}}", "N/A")
         prompt = prompt.replace("{{OVERNIGHT_BUYING_POWER}}", "N/A")
@@ -504,11 +849,32 @@ class AIParser:
         prompt = prompt.replace("{{MARGIN_EQUITY_PERCENTAGE}}", "N/A")
         prompt = prompt.replace("{{ANALYST_NAME}}", analyst_name)
         prompt = prompt.replace("{{ANALYST_PREFERENCES}}", analyst_prefs)
-        prompt = prompt.replace("{{OPTIONS_CHAIN}}", "N/A")
+        prompt = prompt.replace("{{OPTIONS_CHAIN}}", self._render_options_chain(message_text))
         prompt = prompt.replace("{{ACCOUNT_CONSTRAINTS}}", account_constraints)
         prompt = prompt.replace("{{EXTRA_IMPORTANT_DETAILS}}", trading_notice)
-        prompt = self._clear_remaining_placeholders(prompt)
-        return self._append_contract_instruction(prompt)
+        return self._layout_prompt(prompt)
+
+    def _render_options_chain(self, message_text: str) -> str:
+        if self.options_chain_store is None:
+            return EMPTY_OPTIONS_CHAIN_TEXT
+
+        tickers = extract_cashtag_tickers(message_text)
+        if not tickers:
+            return EMPTY_OPTIONS_CHAIN_TEXT
+
+        from src.market_data.options.chain_slicer import slice_option_chains
+
+        # Mentioned tickers join the background refresh set; this read never blocks on the network.
+        self.options_chain_store.mark_seen(tickers)
+        as_of = self.options_chain_store.today()
+        slice_config = _options_chain_slice_config()
+        slices = [
+            slice_option_chains(ticker, self.options_chain_store.get_chains(ticker), as_of=as_of, config=slice_config)
+            for ticker in tickers
+        ]
+        return render_option_chain_slices(
+            slices, max_tokens=OPTIONS_CHAIN_CONFIG["prompt_max_tokens"], slice_config=slice_config
+        )
 
     def _require(self, d: dict, key: str):
         if key not in d:
@@ -527,7 +893,7 @@ class AIParser:
         author_name: str,
         channel_id: Optional[int] = None,
         trading_account: Optional[Any] = None,
-    ) -> str:
+    ) -> PromptParts:
         template = self.prompt_template or ""
 
         analyst_rules = get_analyst_for_channel(channel_id) if channel_id else None
@@ -553,17 +919,16 @@ class AIParser:
         current_time = datetime.now(eastern).strftime("%Y-%m-%d %H:%M:%S %Z")
         prompt = prompt.replace("{{CURRENT_TIME}}", current_time)
         prompt = prompt.replace("{{AUTHOR_NAME}}", str(author_name))
-        prompt = prompt.replace("{{MESSAGE_TEXT}}", str(message_text))
+        prompt = prompt.replace("{{MESSAGE_TEXT}}", self._prompt_message_text(message_text))
         prompt = prompt.replace("{{ACCOUNT_BALANCE}}", f"{net_liquidation_value:,.2f}")
         prompt = prompt.replace("{{MARGIN_POWER}}", f"{margin_power:,.2f}")
         prompt = prompt.replace("{{CASH_POWER}}", f"{cash_power:,.2f}")
         prompt = prompt.replace("{{MARGIN_EQUITY_PERCENTAGE}}", f"{margin_equity_percentage:,.2f}")
         prompt = prompt.replace("{{ANALYST_NAME}}", analyst_name)
         prompt = prompt.replace("{{ANALYST_PREFERENCES}}", analyst_prefs)
-        prompt = prompt.replace("{{OPTIONS_CHAIN}}", "")
+        prompt = prompt.replace("{{OPTIONS_CHAIN}}", self._render_options_chain(message_text))
         prompt = prompt.replace("{{ACCOUNT_CONSTRAINTS}}", account_constraints)
-        prompt = self._clear_remaining_placeholders(prompt)
-        return self._append_contract_instruction(prompt)
+        return self._layout_prompt(prompt)
 
     def _load_prompt_template(self) -> str:
         path = self.config.get("prompt_file") if isinstance(self.config, dict) else None
@@ -596,6 +961,10 @@ class AIParser:
             logger.info("AI provider disabled via config (ai.provider=none)")
             return
 
+        if self._replaying_cassette():
+            self._init_cassette_replay(provider)
+            return
+
         if provider in ("", "auto"):
             provider = None
 
@@ -606,6 +975,21 @@ class AIParser:
         else:
             self._init_first_available()
 
+    def _replaying_cassette(self) -> bool:
+        return self.cassette is not None and self.cassette.mode == "replay"
+
+    def _init_cassette_replay(self, provider: str):
+        """Replay needs no SDK client or key; the cassette stands in for it and answers every call."""
+        if provider in ("", "auto"):
+            recorded = self.cassette.providers
+            provider = recorded[0] if recorded else ""
+        if not provider:
+            logger.warning("Cassette %s has no recordings to replay", self.cassette.path)
+            return
+        self.client = self.cassette
+        self.provider = provider
+        logger.info("Replaying %s parser completions from cassette %s", provider, self.cassette.path)
+
     def _init_first_available(self):
         for name in ("anthropic", "openai", "google"):
             if self._provider_key_available(name):
@@ -623,31 +1007,115 @@ class AIParser:
         return False
 
     def _try_init_provider(self, provider: str):
+        client = self._build_client(provider)
+        if client is None:
+            return
+
+        self.client = client
+        self.provider = provider
+
+        if provider == "anthropic":
+            logger.info("Using Anthropic for AI parsing")
+        elif provider == "openai":
+            logger.info("Using OpenAI for AI parsing")
+        elif provider == "google":
+            logger.info("Using Google Gemini for AI parsing")
+
+    def _build_client(
+        self, provider: str, model: Optional[str] = None, timeout_seconds: Optional[float] = None
+    ) -> Optional[Any]:
         try:
-            client = build_provider_client(
+            return build_provider_client(
                 provider=provider,
                 config=self.config,
                 anthropic_api_key=ANTHROPIC_API_KEY,
                 openai_api_key=OPENAI_API_KEY,
                 google_api_key=GOOGLE_API_KEY,
+                model=model,
+                timeout_seconds=timeout_seconds,
             )
-            if client is None:
-                return
-
-            self.client = client
-            self.provider = provider
-
-            if provider == "anthropic":
-                logger.info("Using Anthropic for AI parsing")
-            elif provider == "openai":
-                logger.info("Using OpenAI for AI parsing")
-            elif provider == "google":
-                logger.info("Using Google Gemini for AI parsing")
         except Exception as exc:
             logger.warning("%s initialization failed: %s", provider.title(), exc)
+            return None
+
+    def _init_router(self):
+        router_config = self.config.get("router", {}) if isinstance(self.config, dict) else {}
+        if not router_config.get("enabled") or self._replaying_cassette():
+            return
+
+        # Route clients time out at the deadline so an attempt the router abandons
+        # ends with its SDK call instead of running on for the SDK default.
+        deadline = router_config.get("deadline_seconds")
+        primary_client = self._build_client(self.provider, timeout_seconds=deadline) or self.client
+        routes = [ProviderRoute(self.provider, self._full_parse_model(self.provider), primary_client)]
+        for name in ("anthropic", "openai", "google"):
+            if name == self.provider or not self._provider_key_available(name):
+                continue
+            client = self._build_client(name, timeout_seconds=deadline)
+            if client is not None:
+                routes.append(ProviderRoute(name, self._full_parse_model(name), client))
+
+        health = ProviderHealth(
+            alpha=router_config.get("ewma_alpha", 0.3),
+            max_error_rate=router_config.get("max_error_rate", 0.5),
+            retry_after_seconds=router_config.get("retry_after_seconds", 30.0),
+        )
+        self.router = ProviderRouter(routes, health=health, deadline_seconds=router_config.get("deadline_seconds"))
+        logger.info("Provider router enabled across: %s", ", ".join(route.provider for route in routes))
 
     def _clean_json(self, text: str) -> str:
         if text.startswith("```"):
             text = re.sub(r"^```(?:json)?\\n", "", text)
             text = re.sub(r"\\n```$", "", text)
         return text.strip()
+
+
+def _early_signal_recorder(
+    early_signals: List[EarlySignal], on_early_signal: Optional[Callable[[EarlySignal], None]]
+) -> Callable[[EarlySignal], None]:
+    def record(signal: EarlySignal) -> None:
+        early_signals.append(signal)
+        if on_early_signal is not None:
+            on_early_signal(signal)
+
+    return record
+
+
+def _options_chain_slice_config() -> "OptionChainSliceConfig":
+    from src.market_data.options.chain_slicer import OptionChainSliceConfig
+
+    return OptionChainSliceConfig(
+        min_dte=OPTIONS_CHAIN_CONFIG["prompt_min_dte"],
+        max_dte=OPTIONS_CHAIN_CONFIG["prompt_max_dte"],
+        strikes_per_expiry=OPTIONS_CHAIN_CONFIG["prompt_strikes_per_expiry"],
+        lotto_max_dte=OPTIONS_CHAIN_CONFIG["lotto_max_dte"],
+        risk_free_rate=OPTIONS_CHAIN_CONFIG["risk_free_rate"],
+    )
+
+
+def _build_rate_limiter(config: Dict[str, Any]) -> Optional[ProviderRateLimiter]:
+    rate_config = config.get("rate_limits", {}) if isinstance(config, dict) else {}
+    if not rate_config.get("enabled"):
+        return None
+    limits = {
+        name: RateLimits(
+            requests_per_minute=values.get("requests_per_minute"),
+            tokens_per_minute=values.get("tokens_per_minute"),
+            max_concurrency=values.get("max_concurrency"),
+        )
+        for name, values in (rate_config.get("providers") or {}).items()
+    }
+    return ProviderRateLimiter(limits, acquire_timeout_seconds=rate_config.get("acquire_timeout_seconds"))
+
+
+def _build_cassette(config: Dict[str, Any]) -> Optional[ProviderCassette]:
+    cassette_config = config.get("cassette", {}) if isinstance(config, dict) else {}
+    mode = str(cassette_config.get("mode") or "off").lower().strip()
+    if mode == "off":
+        return None
+    path = cassette_config.get("path") or DATA_DIR / "cassettes" / "parser.jsonl"
+    try:
+        return ProviderCassette(path, mode=mode, speed=float(cassette_config.get("speed", 1.0)))
+    except (OSError, ValueError) as exc:
+        logger.error("Provider cassette disabled: %s", exc)
+        return None
@@ -2,19 +2,33 @@
 
 from typing import Optional
 
-from src.brokerages.ports import MarketDataPort, StockOrderBrokerPort
+from src.brokerages.ports import MarketDataPort, PositionBookPort, StockOrderBrokerPort
 from src.trading.contracts import OrderResult, StockOrder
 
 
 class CompositeTradingBroker:
-    """Compose distinct execution and quote providers into one broker port."""
+    """
+    Compose distinct execution and quote providers into one broker port.
+
+    `get_stock_positions` and `get_order_fill` exist only when the execution
+    broker provides them, so capability checks see what it really supports.
+    """
 
     def __init__(self, execution_broker: StockOrderBrokerPort, quote_provider: MarketDataPort):
         self._execution_broker = execution_broker
         self._quote_provider = quote_provider
+        for capability in ("get_stock_positions", "get_order_fill"):
+            reader = getattr(execution_broker, capability, None)
+            if callable(reader):
+                setattr(self, capability, reader)
 
     def place_stock_order(self, order: StockOrder, weighting: Optional[float] = None) -> OrderResult:
         return self._execution_broker.place_stock_order(order, weighting=weighting)
 
     def get_limit_reference_price(self, symbol: str, side: str) -> Optional[float]:
         return self._quote_provider.get_limit_reference_price(symbol, side)
+
+    def attach_position_book(self, book: Optional[PositionBookPort]) -> None:
+        attach = getattr(self._execution_broker, "attach_position_book", None)
+        if attach is not None:
+            attach(book)
@@ -11,10 +11,8 @@ from src.brokerages.provider_registry import (
     resolve_quote_provider_name,
     validate_provider_split,
 )
-from src.brokerages.webull import WebullBroker
-from src.market_data.yahoo import YahooQuoteProvider
+from src.utils.lazy_imports import import_lazily
 from src.utils.logger import setup_logger
-from src.webull_trader import WebullTrader
 
 
 logger = setup_logger("broker_factory")
@@ -83,7 +81,9 @@ def _build_quote_provider(
     execution_runtime: BrokerRuntime,
 ) -> MarketDataPort:
     if quote_provider == "yahoo":
-        return YahooQuoteProvider()
+        # Provider adapters are imported once config selects them: the Webull SDK and
+        # the Yahoo/numpy stack dominate cold-start import time otherwise.
+        return import_lazily("src.market_data.yahoo.quote_provider", "YahooQuoteProvider")()
     if quote_provider == "webull":
         if execution_provider == "webull":
             return execution_runtime.broker
@@ -108,7 +108,7 @@ def _build_webull_runtime(trading_config: Dict[str, Any], webull_config: Dict[st
         )
 
     logger.info("Initializing Webull trader adapter.")
-    trader = WebullTrader(
+    trader = import_lazily("src.webull_trader", "WebullTrader")(
         app_key=app_key,
         app_secret=app_secret,
         paper_trade=paper_trade,
@@ -121,6 +121,6 @@ def _build_webull_runtime(trading_config: Dict[str, Any], webull_config: Dict[st
         return None
 
     return BrokerRuntime(
-        broker=WebullBroker(trader),
+        broker=import_lazily("src.brokerages.webull.broker", "WebullBroker")(trader),
         trading_account=trader,
     )
@@ -1,8 +1,8 @@
 """Broker ports used by trading execution."""
 
-from typing import Optional, Protocol
+from typing import Dict, Optional, Protocol
 
-from src.trading.contracts import OrderResult, StockOrder
+from src.trading.contracts import OrderFill, OrderResult, StockOrder
 
 
 class StockOrderBrokerPort(Protocol):
@@ -21,3 +21,30 @@ class MarketDataPort(Protocol):
 
 class TradingBrokerPort(StockOrderBrokerPort, MarketDataPort, Protocol):
     """Composed broker contract for stock execution flow."""
+
+
+# Stock orders go out in whole shares, so a holding below one share cannot be sold.
+MIN_SELLABLE_QUANTITY = 1.0
+
+
+class PositionBookPort(Protocol):
+    """In-memory held quantities read during sizing; submitted orders count once the broker reports fills."""
+
+    def quantity(self, symbol: str) -> Optional[float]:
+        ...
+
+    def record_order(self, order_id: str, symbol: str, side: str, quantity: float) -> None:
+        ...
+
+
+class PositionSourcePort(Protocol):
+    """Broker position snapshots, order fill state, and the hook that lets sizing consult a position book."""
+
+    def get_stock_positions(self) -> Dict[str, float]:
+        ...
+
+    def get_order_fill(self, order_id: str) -> Optional[OrderFill]:
+        ...
+
+    def attach_position_book(self, book: Optional[PositionBookPort]) -> None:
+        ...
@@ -1,10 +1,11 @@
 """Webull brokerage adapter for runtime order execution."""
 
-from typing import Optional
+from typing import Dict, Optional
 
+from src.brokerages.ports import PositionBookPort
 from src.brokerages.webull.quote_service import resolve_limit_reference_price
-from src.brokerages.webull.mapper import to_order_result, to_webull_stock_order
-from src.trading.contracts import OrderResult, StockOrder
+from src.brokerages.webull.mapper import to_order_fill, to_order_result, to_stock_positions, to_webull_stock_order
+from src.trading.contracts import OrderFill, OrderResult, StockOrder
 from src.webull_trader import WebullTrader
 
 
@@ -21,3 +22,12 @@ class WebullBroker:
 
     def get_limit_reference_price(self, symbol: str, side: str) -> Optional[float]:
         return resolve_limit_reference_price(self._trader, symbol, side)
+
+    def get_stock_positions(self) -> Dict[str, float]:
+        return to_stock_positions(self._trader.get_account_positions())
+
+    def get_order_fill(self, order_id: str) -> Optional[OrderFill]:
+        return to_order_fill(order_id, self._trader.get_order_detail(order_id))
+
+    def attach_position_book(self, book: Optional[PositionBookPort]) -> None:
+        self._trader.position_book = book
@@ -1,6 +1,7 @@
 """Mapping between canonical trading contracts and Webull request/response shapes."""
 
-from typing import Any, Dict, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 
 from src.models.webull_models import (
     OrderSide as WebullOrderSide,
@@ -9,7 +10,7 @@ from src.models.webull_models import (
     TimeInForce as WebullTimeInForce,
     TradingSession as WebullTradingSession,
 )
-from src.trading.contracts import OrderType, OrderResult, StockOrder
+from src.trading.contracts import OrderFill, OrderType, OrderResult, StockOrder
 
 
 def to_webull_stock_order(order: StockOrder) -> StockOrderRequest:
@@ -39,6 +40,89 @@ def to_order_result(payload: Any) -> OrderResult:
     )
 
 
+def to_stock_positions(payload: Any) -> Dict[str, float]:
+    """Sum signed share quantities per symbol from a Webull account-position payload."""
+    positions: Dict[str, float] = {}
+    for item in _position_items(payload):
+        instrument_type = str(item.get("instrument_type") or item.get("category") or "").upper()
+        if instrument_type and instrument_type not in {"EQUITY", "STOCK", "US_STOCK", "ETF"}:
+            continue
+        symbol = str(item.get("symbol") or item.get("ticker") or "").strip().upper()
+        quantity = _to_float(_first_present(item, ("quantity", "qty", "position", "total_quantity")))
+        if not symbol or quantity is None:
+            continue
+        if str(item.get("position_side") or "").upper() == "SHORT":
+            quantity = -abs(quantity)
+        positions[symbol] = positions.get(symbol, 0.0) + quantity
+    return positions
+
+
+_FINAL_ORDER_STATUSES = {"FILLED", "CANCELLED", "CANCELED", "REJECTED", "FAILED", "EXPIRED"}
+
+
+def to_order_fill(order_id: str, payload: Any) -> Optional[OrderFill]:
+    """Cumulative fill state from a Webull order-detail payload; None when it carries no order."""
+    item = _order_item(payload)
+    if item is None:
+        return None
+    status = str(_first_present(item, ("order_status", "status")) or "").upper()
+    filled = _to_float(_first_present(item, ("filled_qty", "filled_quantity", "cum_qty")))
+    if filled is None:
+        filled = _to_float(_first_present(item, ("qty", "quantity"))) if status == "FILLED" else 0.0
+    return OrderFill(
+        order_id=str(order_id),
+        filled_quantity=abs(filled or 0.0),
+        final=status in _FINAL_ORDER_STATUSES,
+        filled_at=_to_epoch_seconds(_first_present(item, ("filled_time", "last_filled_time"))),
+    )
+
+
+def _order_item(payload: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(payload, list):
+        return _order_item(payload[0]) if payload else None
+    if not isinstance(payload, dict):
+        return None
+    for key in ("orders", "items", "data"):
+        if key in payload:
+            return _order_item(payload[key])
+    return payload if any(key in payload for key in ("order_status", "status", "filled_qty")) else None
+
+
+def _to_epoch_seconds(value: Any) -> Optional[float]:
+    """Webull reports times as epoch milliseconds or ISO-8601 strings."""
+    number = _to_float(value)
+    if number is not None:
+        return number / 1000.0 if number > 1e11 else number
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _position_items(payload: Any) -> List[Dict[str, Any]]:
+    if isinstance(payload, list):
+        return [item for item in payload if isinstance(item, dict)]
+    if isinstance(payload, dict):
+        for key in ("holdings", "positions", "data", "items"):
+            if key in payload:
+                return _position_items(payload[key])
+    return []
+
+
+def _first_present(item: Dict[str, Any], keys) -> Any:
+    for key in keys:
+        if item.get(key) not in (None, ""):
+            return item[key]
+    return None
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
 def _extract_order_id(payload: Dict[str, Any]) -> Optional[str]:
     for key in ("order_id", "orderId", "id"):
         value = payload.get(key)
@@ -1,12 +1,22 @@
 """Webull market-data resolution for executable limit prices."""
 
-from typing import Any, Dict, Iterable, List, Optional, Protocol
+import time
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Tuple
 
+from src.observability.metrics import REGISTRY
+from src.observability.tracing import TRACER
 from src.utils.logger import setup_logger
 
 
 logger = setup_logger("webull_quote_service")
 
+QUOTE_SOURCE = REGISTRY.counter(
+    "quote_source_total", "Which quote source produced the limit reference price", ["provider", "source"]
+)
+QUOTE_RESOLVE_SECONDS = REGISTRY.histogram(
+    "quote_resolve_seconds", "Time to resolve a limit reference price", ["provider"]
+)
+
 _QUOTE_PERMISSION_MARKERS = (
     "insufficient permission",
     "subscribe to stock quotes",
@@ -34,9 +44,24 @@ def resolve_limit_reference_price(trader: WebullQuoteClient, symbol: str, side:
     if normalized_side not in {"BUY", "SELL"}:
         raise ValueError(f"Unsupported order side for quote resolution: {side}")
 
+    started = time.perf_counter()
+    source = "error"
+    with TRACER.span("quote.resolve", provider="webull", symbol=symbol, side=normalized_side) as span:
+        try:
+            price, source = _resolve_with_source(trader, symbol, normalized_side)
+            if price is None:
+                source = "none"
+            return price
+        finally:
+            span.set_attribute("quote_source", source)
+            QUOTE_RESOLVE_SECONDS.observe(time.perf_counter() - started, provider="webull")
+            QUOTE_SOURCE.inc(provider="webull", source=source)
+
+
+def _resolve_with_source(trader: WebullQuoteClient, symbol: str, normalized_side: str) -> Tuple[Optional[float], str]:
     quote_ref = _resolve_from_quotes(trader, symbol, normalized_side)
     if quote_ref is not None:
-        return quote_ref
+        return quote_ref, "l1"
 
     try:
         snapshot_quote = trader.get_current_stock_quote(symbol)
@@ -48,16 +73,16 @@ def resolve_limit_reference_price(trader: WebullQuoteClient, symbol: str, side:
             "falling back to instrument last_price.",
             symbol,
         )
-        return _instrument_reference_price(trader, symbol, normalized_side)
+        return _instrument_reference_price(trader, symbol, normalized_side), "instrument"
 
     if snapshot_quote is not None:
-        return float(snapshot_quote)
+        return float(snapshot_quote), "snapshot"
 
     logger.warning(
         "Snapshot quote returned no price for %s; falling back to instrument last_price.",
         symbol,
     )
-    return _instrument_reference_price(trader, symbol, normalized_side)
+    return _instrument_reference_price(trader, symbol, normalized_side), "instrument"
 
 
 def _resolve_from_quotes(trader: WebullQuoteClient, symbol: str, side: str) -> Optional[float]:
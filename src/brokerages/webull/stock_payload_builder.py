@@ -2,6 +2,7 @@
 
 from typing import Any, Callable, Dict, List, Mapping, Optional
 
+from src.brokerages.ports import MIN_SELLABLE_QUANTITY
 from src.models.webull_models import AccountBalanceResponse, OrderType, StockOrderRequest
 
 
@@ -17,6 +18,7 @@ class WebullStockPayloadBuilder:
         get_buying_power: Callable[..., Optional[float]],
         get_current_stock_quote: Callable[[str], Optional[float]],
         enforce_margin_buffer: Callable[[Optional[AccountBalanceResponse], float], None],
+        get_held_quantity: Optional[Callable[[str], Optional[float]]] = None,
     ):
         self._client_order_id_factory = client_order_id_factory
         self._get_instrument = get_instrument
@@ -24,6 +26,7 @@ class WebullStockPayloadBuilder:
         self._get_buying_power = get_buying_power
         self._get_current_stock_quote = get_current_stock_quote
         self._enforce_margin_buffer = enforce_margin_buffer
+        self._get_held_quantity = get_held_quantity
 
     def build(
         self,
@@ -44,7 +47,7 @@ class WebullStockPayloadBuilder:
             notional_dollar_amount=notional_dollar_amount,
             weighting=weighting,
         )
-        qty = normalize_stock_quantity(quantity)
+        qty = normalize_stock_quantity(self._cap_sell_to_holdings(order, quantity))
 
         payload: Dict[str, Any] = {
             "client_order_id": self._client_order_id_factory(),
@@ -99,6 +102,17 @@ class WebullStockPayloadBuilder:
 
         return float(order.quantity)
 
+    def _cap_sell_to_holdings(self, order: StockOrderRequest, quantity: float) -> float:
+        """Never size a SELL above the shares the position book says we hold."""
+        if self._get_held_quantity is None or _enum_value(order.side) != "SELL":
+            return quantity
+        held = self._get_held_quantity(order.symbol)
+        if held is None:
+            return quantity
+        if held < MIN_SELLABLE_QUANTITY:
+            raise ValueError(f"No {order.symbol} shares held to sell")
+        return min(float(quantity), float(held))
+
 
 def normalize_stock_quantity(quantity: float) -> int:
     """
@@ -163,3 +177,7 @@ def _read_positive_limit_price(limit_price: Optional[float]) -> Optional[float]:
     if parsed <= 0:
         return None
     return parsed
+
+
+def _enum_value(value: Any) -> str:
+    return str(getattr(value, "value", value or "")).upper().strip()
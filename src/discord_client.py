@@ -1,21 +1,46 @@
-import discord
-import json
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
 from typing import Any, Optional
 
 from pydantic import ValidationError
 from src.ai_parser import AIParser
 from src.brokerages.ports import TradingBrokerPort
-from src.brokerages.webull import WebullBroker
+from src.market_data.options.runtime import build_option_chain_runtime
+from src.market_data.symbols import load_symbol_master
 from src.models.parser_models import CONTRACT_VERSION, ParsedMessage, ParsedSignal
+from src.notifications import build_notification_dispatcher
 from src.notifier import Notifier
+from src.observability import (
+    TRACER,
+    bind_context,
+    build_message_profiler,
+    build_metrics_server,
+    monitor_event_loop_lag,
+)
+from src.picks_log import append_entries, build_picks_log_writer, build_segmented_picks_log
 from src.trading.contracts import OrderSide, StockOrder
 from src.trading.orders import StockOrderExecutionPlanner, StockOrderExecutor
-from src.utils.logger import setup_logger
+from src.trading.positions import build_position_runtime
+from src.utils.logger import LazyJson, setup_logger
 from src.utils.logging_format import format_startup_status, format_pick_summary
-from src.utils.paths import PICKS_LOG_PATH
-from config.settings import DISCORD_TOKEN, CHANNEL_ID, TRADING_CONFIG
+from src.utils.paths import DATA_DIR, PICKS_LOG_PATH
+from src.providers.streaming import EarlySignal
+from config.settings import (
+    AI_CONFIG,
+    CHANNEL_ID,
+    DISCORD_TOKEN,
+    METRICS_CONFIG,
+    NOTIFICATIONS_CONFIG,
+    OPTIONS_CHAIN_CONFIG,
+    PICKS_LOG_CONFIG,
+    POSITION_CACHE_CONFIG,
+    PROFILING_CONFIG,
+    SYMBOL_MASTER_CONFIG,
+    TRADING_CONFIG,
+)
 
 logger = setup_logger('discord_client')
 
@@ -38,17 +63,41 @@ class StockMonitorClient:
     ):
         self.trader = trader
         self.trading_account = trading_account or trader
-        self.parser = AIParser()
-        self.notifier = Notifier()
+        self.options_chain_runtime = build_option_chain_runtime(OPTIONS_CHAIN_CONFIG)
+        self.parser = AIParser(
+            options_chain_store=self.options_chain_runtime.store if self.options_chain_runtime else None,
+            symbol_master=load_symbol_master(SYMBOL_MASTER_CONFIG),
+        )
+        self.notifier = Notifier(build_notification_dispatcher(NOTIFICATIONS_CONFIG))
+        self.picks_log_store = build_segmented_picks_log(PICKS_LOG_CONFIG, DATA_DIR / "picks_log")
+        self.picks_log_writer = build_picks_log_writer(PICKS_LOG_CONFIG, self.picks_log_store or PICKS_LOG_PATH)
+        self.metrics_server = build_metrics_server(METRICS_CONFIG)
+        self.message_profiler = build_message_profiler(PROFILING_CONFIG, DATA_DIR / "profiles")
+        self._event_loop_lag_task = None
         self.order_executor = None
+        self.position_runtime = None
+        self._preparation_pool = None
 
         resolved_broker = broker
         if resolved_broker is None and trader is not None:
+            from src.brokerages.webull.broker import WebullBroker
+
             resolved_broker = WebullBroker(trader)
 
         if resolved_broker is not None:
+            self.position_runtime = build_position_runtime(POSITION_CACHE_CONFIG, resolved_broker)
             planner = StockOrderExecutionPlanner(TRADING_CONFIG)
-            self.order_executor = StockOrderExecutor(resolved_broker, planner)
+            self.order_executor = StockOrderExecutor(
+                resolved_broker,
+                planner,
+                positions=self.position_runtime.cache if self.position_runtime else None,
+            )
+            if AI_CONFIG.get("streaming", {}).get("enabled"):
+                self._preparation_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="order-prep")
+
+        # discord.py (with aiohttp) is the largest import at startup; loading it here
+        # lets config validation and broker login fail fast without paying for it.
+        import discord
 
         self._patch_pending_payments()
         
@@ -67,6 +116,19 @@ class StockMonitorClient:
     
     async def on_ready(self):
         """Called when Discord client is ready"""
+        if self.options_chain_runtime:
+            self.options_chain_runtime.start()
+        if self.position_runtime:
+            # The initial load is a blocking broker fetch; keep it off the event loop.
+            await asyncio.get_running_loop().run_in_executor(None, self.position_runtime.start)
+        if self.picks_log_writer:
+            self.picks_log_writer.start()
+        if self.metrics_server:
+            self.metrics_server.start()
+            if self._event_loop_lag_task is None:
+                self._event_loop_lag_task = self.client.loop.create_task(
+                    monitor_event_loop_lag(METRICS_CONFIG["event_loop_lag_interval_seconds"])
+                )
         logger.info("="*60)
         logger.info("Discord stock monitor active.")
         logger.info("="*60)
@@ -100,35 +162,55 @@ class StockMonitorClient:
         if len(content) < 3:
             logger.debug("Ignoring short message")
             return
-        
-        logger.info(f"New message from {message.author.name}")
-        logger.debug(f"Message content: {message.content[:100]}...")
+
+        with TRACER.trace(
+            "discord.message",
+            message_id=getattr(message, "id", None),
+            channel_id=message.channel.id,
+            author=message.author.name,
+        ), self._profile_message(message):
+            self._process_message(message)
+
+    def _profile_message(self, message):
+        if not self.message_profiler:
+            return nullcontext()
+        return self.message_profiler.profile(f"message-{getattr(message, 'id', None) or message.author.name}")
+
+    def _process_message(self, message) -> None:
+        logger.info("New message from %s", message.author.name)
+        logger.debug("Message content: %s...", message.content[:100])
         
         logger.info("AI analyzing message.")
-        parsed = self.parser.parse(message.content, message.author.name, message.channel.id, self.trading_account)
-        if not isinstance(parsed, dict):
-            logger.warning("Parser returned unexpected type: %s", type(parsed).__name__)
-            return
-
-        try:
-            parsed_message = ParsedMessage.model_validate(parsed)
-        except ValidationError as exc:
-            logger.warning("Parser returned invalid payload: %s", exc)
+        parsed = self.parser.parse_message(
+            message.content,
+            message.author.name,
+            message.channel.id,
+            self.trading_account,
+            on_early_signal=self._prepare_early_signal if self._preparation_pool else None,
+        )
+        parsed_message = self._coerce_parsed_message(parsed)
+        if parsed_message is None:
             return
 
         signal_objs = parsed_message.signals
-        parsed_payload = parsed_message.model_dump()
+        # The typed result drives execution; this dump is the one serialization shared by
+        # the summary, the notifier and the picks log.
+        parsed_payload = parsed_message.model_dump() if signal_objs else None
 
         if signal_objs:
-            logger.info(f"Detected {len(signal_objs)} signal(s).")
-            logger.debug("Picks details: %s", json.dumps(parsed_payload, indent=2))
+            logger.info("Detected %d signal(s).", len(signal_objs))
+            if self.options_chain_runtime:
+                self.options_chain_runtime.store.mark_seen(signal.ticker for signal in signal_objs)
+            logger.debug("Picks details: %s", LazyJson(parsed_payload, indent=2))
             logger.info(format_pick_summary(parsed_payload))
 
             # Send notifications
-            self.notifier.notify(parsed_payload, message.author.name)
+            with TRACER.span("message.notify"):
+                self.notifier.notify(parsed_payload, message.author.name)
 
             # Log parsed signals
-            self._log_signals(message, parsed_payload)
+            with TRACER.span("message.picks_log"):
+                self._log_signals(message, parsed_payload)
 
             # Execute trades if executor available
             if self.order_executor:
@@ -157,6 +239,31 @@ class StockMonitorClient:
         else:
             logger.info("No actionable signals detected.")
 
+    def _coerce_parsed_message(self, parsed: Any) -> Optional[ParsedMessage]:
+        """Typed parser results pass through; plain contract dicts are validated once here."""
+        if isinstance(parsed, ParsedMessage):
+            return parsed
+        if not isinstance(parsed, dict):
+            logger.warning("Parser returned unexpected type: %s", type(parsed).__name__)
+            return None
+        try:
+            return ParsedMessage.model_validate(parsed)
+        except ValidationError as exc:
+            logger.warning("Parser returned invalid payload: %s", exc)
+            return None
+
+    def _prepare_early_signal(self, signal: EarlySignal) -> None:
+        """Prefetch the quote for a streamed signal off the parser thread; execution reuses it if fresh."""
+        if not self._preparation_pool or not self.order_executor:
+            return
+        self._preparation_pool.submit(bind_context(self._run_preparation), signal)
+
+    def _run_preparation(self, signal: EarlySignal) -> None:
+        try:
+            self.order_executor.prepare(signal.ticker, signal.side)
+        except Exception as exc:
+            logger.warning("Early preparation for %s %s failed: %s", signal.side, signal.ticker, exc)
+
     def _signal_to_stock_order(self, signal: ParsedSignal):
         stock_vehicle = None
         for vehicle in signal.vehicles:
@@ -201,10 +308,15 @@ class StockMonitorClient:
             "ai_parsed_signals": parsed_message,
         }
 
-        PICKS_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with PICKS_LOG_PATH.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        if self.picks_log_writer:
+            self.picks_log_writer.write(log_entry)
+            return
 
+        if self.picks_log_store:
+            self.picks_log_store.append([log_entry])
+            return
+
+        append_entries(PICKS_LOG_PATH, [log_entry])
         logger.debug("Pick logged to %s", PICKS_LOG_PATH)
     
     async def read_channel_history(self, limit=10):
@@ -225,7 +337,7 @@ class StockMonitorClient:
 
         channel = self.client.get_channel(CHANNEL_ID)
         if not channel:
-            logger.error(f"Channel {CHANNEL_ID} not found")
+            logger.error("Channel %s not found", CHANNEL_ID)
             return messages
         
         try:
@@ -237,16 +349,32 @@ class StockMonitorClient:
                     'message_id': msg.id
                 })
             
-            logger.info(f"Read {len(messages)} messages from channel history")
+            logger.info("Read %d messages from channel history", len(messages))
             return messages
             
         except Exception as e:
-            logger.error(f"Error reading channel history: {e}")
+            logger.error("Error reading channel history: %s", e)
             return messages
     
     def run(self):
         """Start the Discord client"""
-        self.client.run(DISCORD_TOKEN)
+        try:
+            self.client.run(DISCORD_TOKEN)
+        finally:
+            if self.options_chain_runtime:
+                self.options_chain_runtime.stop()
+            if self.position_runtime:
+                self.position_runtime.stop()
+            if self.picks_log_writer:
+                self.picks_log_writer.close()
+            elif self.picks_log_store:
+                self.picks_log_store.close()
+            self.notifier.close()
+            if self.metrics_server:
+                self.metrics_server.stop()
+            TRACER.close()
+            if self._preparation_pool:
+                self._preparation_pool.shutdown(wait=False, cancel_futures=True)
 
     def _patch_pending_payments(self):
         """
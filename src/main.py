@@ -4,19 +4,28 @@ Main entry point for Discord Stock Monitor
 """
 
 import sys
+import time
+
+IMPORT_STARTED = time.perf_counter()
 
 from src.brokerages import create_broker_runtime
 from src.discord_client import StockMonitorClient
+from src.observability import StartupProfiler, configure_tracing
 from config.settings import (
+    LOGGING_CONFIG,
     PUBLIC_CONFIG,
+    TRACING_CONFIG,
     validate_config,
     TRADING_CONFIG,
     WEBULL_CONFIG,
 )
-from src.utils.logger import setup_logger
+from src.utils.logger import configure_logging, setup_logger
+from src.utils.paths import DATA_DIR
 from src.utils.logging_format import format_mode_summary
 
 logger = setup_logger('main')
+STARTUP = StartupProfiler(started_at=IMPORT_STARTED)
+STARTUP.mark("imports + settings")
 
 def print_banner():
     """Print application banner"""
@@ -30,15 +39,19 @@ def print_banner():
 def main():
     """Main application entry point"""
     print_banner()
+    with STARTUP.phase("logging + tracing"):
+        configure_logging(LOGGING_CONFIG)
+        configure_tracing(TRACING_CONFIG, DATA_DIR / "traces.jsonl")
     
     # Validate configuration
     logger.info("Validating configuration.")
-    config_errors = validate_config()
+    with STARTUP.phase("config validation"):
+        config_errors = validate_config()
     
     if config_errors:
         logger.error("Configuration errors found:")
         for error in config_errors:
-            logger.error(f"  - {error}")
+            logger.error("  - %s", error)
         logger.error("\nPlease check your .env file and try again.")
         sys.exit(1)
     
@@ -48,11 +61,12 @@ def main():
     broker_runtime = None
     if TRADING_CONFIG['auto_trade']:
         try:
-            broker_runtime = create_broker_runtime(
-                trading_config=TRADING_CONFIG,
-                webull_config=WEBULL_CONFIG,
-                public_config=PUBLIC_CONFIG,
-            )
+            with STARTUP.phase("broker runtime"):
+                broker_runtime = create_broker_runtime(
+                    trading_config=TRADING_CONFIG,
+                    webull_config=WEBULL_CONFIG,
+                    public_config=PUBLIC_CONFIG,
+                )
         except Exception as exc:
             logger.error("Failed to initialize broker runtime: %s", exc)
             sys.exit(1)
@@ -61,17 +75,19 @@ def main():
     
     # Initialize and run Discord client
     logger.info("Starting Discord monitor.")
-    client = StockMonitorClient(
-        broker=broker_runtime.broker if broker_runtime else None,
-        trading_account=broker_runtime.trading_account if broker_runtime else None,
-    )
+    with STARTUP.phase("discord client"):
+        client = StockMonitorClient(
+            broker=broker_runtime.broker if broker_runtime else None,
+            trading_account=broker_runtime.trading_account if broker_runtime else None,
+        )
+    STARTUP.log()
     
     try:
         client.run()
     except KeyboardInterrupt:
         logger.info("Shutting down gracefully.")
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         sys.exit(1)
 
 if __name__ == '__main__':
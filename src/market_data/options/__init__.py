@@ -0,0 +1,38 @@
+"""Options-chain contracts, cache, and runtime wiring."""
+
+from src.utils.lazy_imports import lazy_exports
+
+
+__all__ = [
+    "OptionChainKey",
+    "OptionChainRuntime",
+    "OptionChainSide",
+    "OptionChainSlice",
+    "OptionChainSliceConfig",
+    "OptionChainSnapshot",
+    "OptionChainStore",
+    "OptionContractMatch",
+    "OptionContractResolver",
+    "build_option_chain_runtime",
+    "format_option_symbol",
+    "slice_option_chains",
+]
+
+# Submodules load on first access; the slicer, store and contracts pull in numpy.
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "OptionChainKey": "src.market_data.options.contracts",
+        "OptionChainRuntime": "src.market_data.options.runtime",
+        "OptionChainSide": "src.market_data.options.contracts",
+        "OptionChainSlice": "src.market_data.options.chain_slicer",
+        "OptionChainSliceConfig": "src.market_data.options.chain_slicer",
+        "OptionChainSnapshot": "src.market_data.options.contracts",
+        "OptionChainStore": "src.market_data.options.chain_store",
+        "OptionContractMatch": "src.market_data.options.contract_resolver",
+        "OptionContractResolver": "src.market_data.options.contract_resolver",
+        "build_option_chain_runtime": "src.market_data.options.runtime",
+        "format_option_symbol": "src.market_data.options.symbols",
+        "slice_option_chains": "src.market_data.options.chain_slicer",
+    },
+)
@@ -0,0 +1,123 @@
+"""Dense, token-budgeted rendering of option-chain slices for the parser prompt."""
+
+import math
+from typing import TYPE_CHECKING, List, Optional, Sequence
+
+from src.utils.token_estimate import estimate_tokens
+
+if TYPE_CHECKING:  # the slicer loads numpy; the parser imports this module even with the chain cache off
+    from src.market_data.options.chain_slicer import OptionChainSlice, OptionChainSliceConfig
+
+
+EMPTY_OPTIONS_CHAIN_TEXT = "N/A"
+DEFAULT_OPTIONS_CHAIN_MAX_TOKENS = 600
+
+
+def options_chain_legend(lotto_max_dte: int) -> str:
+    return f"cols: type|strike|bid|ask|mid|spread|iv|delta|oi|flag (L=lotto: <{int(lotto_max_dte)} DTE nearest ATM)"
+
+
+def render_option_chain_slices(
+    slices: Sequence["OptionChainSlice"],
+    max_tokens: int = DEFAULT_OPTIONS_CHAIN_MAX_TOKENS,
+    slice_config: Optional["OptionChainSliceConfig"] = None,
+) -> str:
+    """
+    Render slices as pipe-delimited rows grouped by expiry, within `max_tokens`.
+
+    The budget is split evenly across underlyings; inside each, rows are admitted
+    in slice priority order so the lotto and at-the-money rows survive trimming.
+    The legend states the lotto cutoff of `slice_config`, the config the slices
+    were cut with (the slicer defaults when omitted).
+    """
+    populated = [chain_slice for chain_slice in slices if len(chain_slice)]
+    if not populated:
+        return EMPTY_OPTIONS_CHAIN_TEXT
+
+    if slice_config is None:
+        from src.market_data.options.chain_slicer import OptionChainSliceConfig
+
+        slice_config = OptionChainSliceConfig()
+    legend = options_chain_legend(slice_config.lotto_max_dte)
+    remaining = int(max_tokens) - estimate_tokens(legend)
+    if remaining <= 0:
+        return EMPTY_OPTIONS_CHAIN_TEXT
+    share = remaining // len(populated)
+
+    blocks = [_render_slice(chain_slice, share) for chain_slice in populated]
+    blocks = [block for block in blocks if block]
+    if not blocks:
+        return EMPTY_OPTIONS_CHAIN_TEXT
+    return "\n".join([legend, *blocks])
+
+
+def _render_slice(chain_slice: "OptionChainSlice", budget: int) -> Optional[str]:
+    header = f"{chain_slice.underlying} spot={_format_number(chain_slice.underlying_price)}"
+    used = estimate_tokens(header)
+    if used >= budget:
+        return None
+
+    selected: List[int] = []
+    expiry_headers = {}
+    for row in chain_slice.priority.argsort(kind="stable"):
+        expiry = chain_slice.expiries[row]
+        cost = estimate_tokens(_row_text(chain_slice, row))
+        if expiry not in expiry_headers:
+            expiry_header = _expiry_header(chain_slice, row)
+            cost += estimate_tokens(expiry_header)
+        if used + cost > budget:
+            break
+        if expiry not in expiry_headers:
+            expiry_headers[expiry] = expiry_header
+        selected.append(int(row))
+        used += cost
+
+    if not selected:
+        return None
+
+    lines = [header]
+    current_expiry = None
+    for row in sorted(selected):
+        expiry = chain_slice.expiries[row]
+        if expiry != current_expiry:
+            lines.append(expiry_headers[expiry])
+            current_expiry = expiry
+        lines.append(_row_text(chain_slice, row))
+    return "\n".join(lines)
+
+
+def _expiry_header(chain_slice: "OptionChainSlice", row: int) -> str:
+    return f"exp {chain_slice.expiries[row]} dte={int(chain_slice.dte[row])}"
+
+
+def _row_text(chain_slice: "OptionChainSlice", row: int) -> str:
+    return "|".join(
+        (
+            str(chain_slice.option_codes[row]),
+            _format_number(chain_slice.strikes[row]),
+            _format_number(chain_slice.bids[row]),
+            _format_number(chain_slice.asks[row]),
+            _format_number(chain_slice.mids[row]),
+            _format_number(chain_slice.spreads[row]),
+            _format_number(chain_slice.implied_volatility[row]),
+            _format_number(chain_slice.deltas[row]),
+            _format_count(chain_slice.open_interest[row]),
+            "L" if chain_slice.lotto[row] else "",
+        )
+    )
+
+
+def _format_number(value) -> str:
+    if value is None:
+        return "-"
+    numeric = float(value)
+    if math.isnan(numeric):
+        return "-"
+    return f"{round(numeric, 2):g}"
+
+
+def _format_count(value) -> str:
+    numeric = float(value)
+    if math.isnan(numeric):
+        return "-"
+    return str(int(numeric))
@@ -0,0 +1,239 @@
+"""Vectorized selection of the prompt-relevant slice of cached option chains."""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional, Sequence
+
+import numpy as np
+
+from src.market_data.options.contracts import OptionChainSide, OptionChainSnapshot
+from src.market_data.options.greeks import (
+    DAYS_PER_YEAR,
+    MIN_YEARS_TO_EXPIRY,
+    black_scholes_greeks,
+    mid_implied_volatility,
+    quote_mid_prices,
+    quoted_mask,
+)
+
+
+CALL_CODE = "C"
+PUT_CODE = "P"
+
+
+@dataclass(frozen=True)
+class OptionChainSliceConfig:
+    """Selection knobs; `lotto_max_dte` mirrors the analyst "<30 DTE, nearest ATM" rule."""
+
+    min_dte: int = 0
+    max_dte: int = 120
+    strikes_per_expiry: int = 4
+    lotto_max_dte: int = 30
+    risk_free_rate: float = 0.0
+
+
+@dataclass(frozen=True)
+class OptionChainSlice:
+    """
+    Selected contracts for one underlying as parallel arrays.
+
+    `priority` ranks rows for budget trimming (0 = keep first): lotto candidates,
+    then strikes by closeness to the money, nearer expiries breaking ties.
+    """
+
+    underlying: str
+    underlying_price: Optional[float]
+    expiries: np.ndarray
+    dte: np.ndarray
+    option_codes: np.ndarray
+    strikes: np.ndarray
+    bids: np.ndarray
+    asks: np.ndarray
+    mids: np.ndarray
+    spreads: np.ndarray
+    implied_volatility: np.ndarray
+    deltas: np.ndarray
+    open_interest: np.ndarray
+    lotto: np.ndarray
+    priority: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.strikes.shape[0])
+
+
+def slice_option_chains(
+    underlying: str,
+    snapshots: Sequence[OptionChainSnapshot],
+    *,
+    as_of: date,
+    config: Optional[OptionChainSliceConfig] = None,
+) -> OptionChainSlice:
+    """Filter by DTE, keep strikes nearest the money per expiry/side, and flag lotto picks."""
+    config = config or OptionChainSliceConfig()
+    in_window = [
+        snapshot
+        for snapshot in snapshots
+        if config.min_dte <= (snapshot.expiry - as_of).days <= config.max_dte
+    ]
+    columns = _stack_columns(in_window, as_of)
+    spot = _spot_price(in_window, columns["strikes"])
+    row_count = columns["strikes"].shape[0]
+    if row_count == 0 or spot is None:
+        return _empty_slice(underlying, spot)
+
+    distance = np.abs(columns["strikes"] - spot)
+    groups = columns["expiry_index"] * 2 + (columns["option_codes"] == PUT_CODE)
+    ranks = _rank_within_groups(groups, distance)
+
+    bids = columns["bids"]
+    asks = columns["asks"]
+    mids = quote_mid_prices(bids, asks, columns["last_prices"])
+    spreads = np.where(quoted_mask(bids, asks), asks - bids, np.nan)
+
+    lotto = _lotto_mask(columns["dte"], columns["option_codes"], distance, mids, config.lotto_max_dte)
+    keep = (ranks < max(1, config.strikes_per_expiry)) | lotto
+    kept = np.flatnonzero(keep)
+
+    # Rows stay in display order (expiry, side, strike); priority carries the trim order.
+    kept = kept[np.lexsort((columns["strikes"][kept], groups[kept]))]
+    trim_order = np.lexsort((columns["dte"][kept], ranks[kept], ~lotto[kept]))
+    priority = np.empty(kept.shape[0], dtype=np.int64)
+    priority[trim_order] = np.arange(kept.shape[0])
+    vols, deltas = _kept_vols_and_deltas(columns, kept, mids[kept], spot, config.risk_free_rate)
+
+    return OptionChainSlice(
+        underlying=underlying,
+        underlying_price=spot,
+        expiries=columns["expiries"][kept],
+        dte=columns["dte"][kept],
+        option_codes=columns["option_codes"][kept],
+        strikes=columns["strikes"][kept],
+        bids=bids[kept],
+        asks=asks[kept],
+        mids=mids[kept],
+        spreads=spreads[kept],
+        implied_volatility=vols,
+        deltas=deltas,
+        open_interest=columns["open_interest"][kept],
+        lotto=lotto[kept],
+        priority=priority,
+    )
+
+
+def _stack_columns(snapshots: Sequence[OptionChainSnapshot], as_of: date) -> dict:
+    parts = {
+        "expiries": [],
+        "expiry_index": [],
+        "dte": [],
+        "option_codes": [],
+        "strikes": [],
+        "bids": [],
+        "asks": [],
+        "last_prices": [],
+        "implied_volatility": [],
+        "open_interest": [],
+    }
+    for index, snapshot in enumerate(sorted(snapshots, key=lambda item: item.expiry)):
+        for code, side in ((CALL_CODE, snapshot.calls), (PUT_CODE, snapshot.puts)):
+            _append_side(parts, side, code, index, snapshot.expiry, (snapshot.expiry - as_of).days)
+
+    if not parts["strikes"]:
+        return {
+            "expiries": np.empty(0, dtype="datetime64[D]"),
+            "expiry_index": np.empty(0, dtype=np.int64),
+            "dte": np.empty(0, dtype=np.int64),
+            "option_codes": np.empty(0, dtype="<U1"),
+            **{
+                name: np.empty(0, dtype=float)
+                for name in ("strikes", "bids", "asks", "last_prices", "implied_volatility", "open_interest")
+            },
+        }
+    return {name: np.concatenate(values) for name, values in parts.items()}
+
+
+def _append_side(parts: dict, side: OptionChainSide, code: str, index: int, expiry: date, dte: int) -> None:
+    size = len(side)
+    if size == 0:
+        return
+    parts["expiries"].append(np.full(size, np.datetime64(expiry, "D")))
+    parts["expiry_index"].append(np.full(size, index, dtype=np.int64))
+    parts["dte"].append(np.full(size, dte, dtype=np.int64))
+    parts["option_codes"].append(np.full(size, code, dtype="<U1"))
+    parts["strikes"].append(np.asarray(side.strikes, dtype=float))
+    parts["bids"].append(np.asarray(side.bids, dtype=float))
+    parts["asks"].append(np.asarray(side.asks, dtype=float))
+    parts["last_prices"].append(np.asarray(side.last_prices, dtype=float))
+    parts["implied_volatility"].append(np.asarray(side.implied_volatility, dtype=float))
+    parts["open_interest"].append(np.asarray(side.open_interest, dtype=float))
+
+
+def _spot_price(snapshots: Sequence[OptionChainSnapshot], strikes: np.ndarray) -> Optional[float]:
+    for snapshot in sorted(snapshots, key=lambda item: item.fetched_at, reverse=True):
+        if snapshot.underlying_price is not None and snapshot.underlying_price > 0:
+            return float(snapshot.underlying_price)
+    finite = strikes[np.isfinite(strikes)]
+    if finite.size == 0:
+        return None
+    # No quote on any snapshot: center on the middle listed strike instead.
+    return float(np.median(finite))
+
+
+def _kept_vols_and_deltas(columns: dict, kept: np.ndarray, mids: np.ndarray, spot: float, rate: float):
+    """Solve IV from mids for kept rows only (source IV as fallback) and derive delta."""
+    strikes = columns["strikes"][kept]
+    years = np.maximum(columns["dte"][kept] / DAYS_PER_YEAR, MIN_YEARS_TO_EXPIRY)
+    is_call = columns["option_codes"][kept] == CALL_CODE
+    source_iv = columns["implied_volatility"][kept]
+
+    vols = mid_implied_volatility(mids, spot, strikes, years, is_call, source_iv, rate)
+    deltas = black_scholes_greeks(spot, strikes, years, vols, is_call, rate).delta
+    return vols, deltas
+
+
+def _rank_within_groups(groups: np.ndarray, distance: np.ndarray) -> np.ndarray:
+    order = np.lexsort((distance, groups))
+    sorted_groups = groups[order]
+    starts = np.flatnonzero(np.r_[True, sorted_groups[1:] != sorted_groups[:-1]])
+    counts = np.diff(np.r_[starts, sorted_groups.shape[0]])
+    ranks = np.empty(groups.shape[0], dtype=np.int64)
+    ranks[order] = np.arange(groups.shape[0]) - np.repeat(starts, counts)
+    return ranks
+
+
+def _lotto_mask(
+    dte: np.ndarray,
+    option_codes: np.ndarray,
+    distance: np.ndarray,
+    mids: np.ndarray,
+    lotto_max_dte: int,
+) -> np.ndarray:
+    mask = np.zeros(dte.shape[0], dtype=bool)
+    eligible = (dte < lotto_max_dte) & np.isfinite(mids)
+    for code in (CALL_CODE, PUT_CODE):
+        candidates = np.flatnonzero(eligible & (option_codes == code))
+        if candidates.size == 0:
+            continue
+        best = candidates[np.lexsort((dte[candidates], distance[candidates]))[0]]
+        mask[best] = True
+    return mask
+
+
+def _empty_slice(underlying: str, spot: Optional[float]) -> OptionChainSlice:
+    floats = np.empty(0, dtype=float)
+    return OptionChainSlice(
+        underlying=underlying,
+        underlying_price=spot,
+        expiries=np.empty(0, dtype="datetime64[D]"),
+        dte=np.empty(0, dtype=np.int64),
+        option_codes=np.empty(0, dtype="<U1"),
+        strikes=floats,
+        bids=floats,
+        asks=floats,
+        mids=floats,
+        spreads=floats,
+        implied_volatility=floats,
+        deltas=floats,
+        open_interest=floats,
+        lotto=np.empty(0, dtype=bool),
+        priority=np.empty(0, dtype=np.int64),
+    )
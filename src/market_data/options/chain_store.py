@@ -0,0 +1,185 @@
+"""In-memory options-chain store with incremental background refresh."""
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.market_data.options.contracts import OptionChainKey, OptionChainSnapshot
+from src.market_data.options.ports import OptionChainSourcePort
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("option_chain_store")
+
+
+@dataclass
+class _ExpiryListing:
+    expiries: List[date]
+    refreshed_at: float
+
+
+class OptionChainStore:
+    """
+    Cache chains keyed by (underlying, expiry) for recently seen tickers.
+
+    Reads never touch the network. `refresh_due` performs a bounded number of
+    source fetches per call, always picking the missing or stalest entries first,
+    so a background loop keeps the cache warm one expiry at a time.
+    """
+
+    def __init__(
+        self,
+        source: OptionChainSourcePort,
+        *,
+        refresh_interval_seconds: float = 300.0,
+        expiry_list_ttl_seconds: float = 3600.0,
+        recent_ticker_ttl_seconds: float = 21600.0,
+        max_expiries: int = 8,
+        clock: Optional[Callable[[], float]] = None,
+        today_provider: Optional[Callable[[], date]] = None,
+    ):
+        self._source = source
+        self._refresh_interval_seconds = max(0.0, float(refresh_interval_seconds))
+        self._expiry_list_ttl_seconds = max(0.0, float(expiry_list_ttl_seconds))
+        self._recent_ticker_ttl_seconds = max(0.0, float(recent_ticker_ttl_seconds))
+        self._max_expiries = max(1, int(max_expiries))
+        self._clock = clock or time.monotonic
+        self._today_provider = today_provider or date.today
+
+        self._lock = threading.Lock()
+        self._last_seen: Dict[str, float] = {}
+        self._listings: Dict[str, _ExpiryListing] = {}
+        self._chains: Dict[OptionChainKey, OptionChainSnapshot] = {}
+        self._chain_refreshed_at: Dict[OptionChainKey, float] = {}
+
+    def today(self) -> date:
+        return self._today_provider()
+
+    def mark_seen(self, symbols: Iterable[str]) -> None:
+        now = self._clock()
+        with self._lock:
+            for symbol in symbols:
+                normalized = _normalize_symbol(symbol)
+                if normalized:
+                    self._last_seen[normalized] = now
+
+    def recent_underlyings(self) -> List[str]:
+        with self._lock:
+            return sorted(self._recent_underlyings_locked(self._clock()))
+
+    def get_chain(self, underlying: str, expiry: date) -> Optional[OptionChainSnapshot]:
+        with self._lock:
+            return self._chains.get((_normalize_symbol(underlying), expiry))
+
+    def get_chains(self, underlying: str) -> List[OptionChainSnapshot]:
+        """Return cached chains for `underlying` ordered by expiry (memory only)."""
+        normalized = _normalize_symbol(underlying)
+        today = self._today_provider()
+        with self._lock:
+            snapshots = [
+                snapshot
+                for (symbol, expiry), snapshot in self._chains.items()
+                if symbol == normalized and expiry >= today
+            ]
+        return sorted(snapshots, key=lambda snapshot: snapshot.expiry)
+
+    def refresh_due(self, max_fetches: int = 1) -> int:
+        """Refresh up to `max_fetches` missing/stale listings or chains; return fetch count."""
+        fetches = 0
+        self._evict_inactive()
+
+        for symbol in self._listings_due():
+            if fetches >= max_fetches:
+                return fetches
+            self._refresh_listing(symbol)
+            fetches += 1
+
+        for key in self._chains_due():
+            if fetches >= max_fetches:
+                break
+            self._refresh_chain(key)
+            fetches += 1
+        return fetches
+
+    def _recent_underlyings_locked(self, now: float) -> List[str]:
+        return [
+            symbol
+            for symbol, seen_at in self._last_seen.items()
+            if now - seen_at <= self._recent_ticker_ttl_seconds
+        ]
+
+    def _evict_inactive(self) -> None:
+        now = self._clock()
+        today = self._today_provider()
+        with self._lock:
+            active = set(self._recent_underlyings_locked(now))
+            for symbol in [symbol for symbol in self._last_seen if symbol not in active]:
+                del self._last_seen[symbol]
+                self._listings.pop(symbol, None)
+            for key in [key for key in self._chains if key[0] not in active or key[1] < today]:
+                del self._chains[key]
+                self._chain_refreshed_at.pop(key, None)
+
+    def _listings_due(self) -> List[str]:
+        now = self._clock()
+        with self._lock:
+            due: List[Tuple[float, str]] = []
+            for symbol in self._recent_underlyings_locked(now):
+                listing = self._listings.get(symbol)
+                if listing is None:
+                    due.append((float("-inf"), symbol))
+                elif now - listing.refreshed_at >= self._expiry_list_ttl_seconds:
+                    due.append((listing.refreshed_at, symbol))
+        return [symbol for _, symbol in sorted(due)]
+
+    def _chains_due(self) -> List[OptionChainKey]:
+        now = self._clock()
+        today = self._today_provider()
+        with self._lock:
+            due: List[Tuple[float, OptionChainKey]] = []
+            for symbol in self._recent_underlyings_locked(now):
+                listing = self._listings.get(symbol)
+                if listing is None:
+                    continue
+                tracked = [expiry for expiry in listing.expiries if expiry >= today][: self._max_expiries]
+                for expiry in tracked:
+                    key = (symbol, expiry)
+                    refreshed_at = self._chain_refreshed_at.get(key)
+                    if refreshed_at is None:
+                        due.append((float("-inf"), key))
+                    elif now - refreshed_at >= self._refresh_interval_seconds:
+                        due.append((refreshed_at, key))
+        return [key for _, key in sorted(due)]
+
+    def _refresh_listing(self, symbol: str) -> None:
+        try:
+            expiries = sorted(self._source.list_expiries(symbol))
+        except Exception as exc:
+            logger.warning("Option expiry listing failed for %s: %s", symbol, exc)
+            expiries = None
+
+        with self._lock:
+            if expiries is None:
+                previous = self._listings.get(symbol)
+                expiries = previous.expiries if previous else []
+            self._listings[symbol] = _ExpiryListing(expiries=expiries, refreshed_at=self._clock())
+
+    def _refresh_chain(self, key: OptionChainKey) -> None:
+        symbol, expiry = key
+        try:
+            snapshot = self._source.fetch_chain(symbol, expiry)
+        except Exception as exc:
+            logger.warning("Option chain fetch failed for %s %s: %s", symbol, expiry.isoformat(), exc)
+            snapshot = None
+
+        with self._lock:
+            # Stamp failures too so one broken expiry backs off for a full interval.
+            self._chain_refreshed_at[key] = self._clock()
+            if snapshot is not None:
+                self._chains[key] = snapshot
+
+
+def _normalize_symbol(symbol: str) -> str:
+    return str(symbol or "").strip().upper().replace("$", "")
@@ -0,0 +1,207 @@
+"""Resolve loose parsed option vehicles to listed contracts in the cached chain."""
+
+import threading
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.market_data.options.chain_store import OptionChainStore
+from src.market_data.options.contracts import OptionChainSide, OptionChainSnapshot
+from src.market_data.options.expiry_text import parse_expiry_text
+from src.market_data.options.symbols import format_option_symbol, option_code
+
+
+# A stated day resolves to a listed expiry at most this many days away (holiday shifts).
+EXACT_EXPIRY_TOLERANCE_DAYS = 3
+_OPTION_TYPES = {"C": "CALL", "P": "PUT"}
+
+
+@dataclass(frozen=True)
+class OptionContractMatch:
+    """
+    Listed contract chosen for a loose request, plus why it might be wrong.
+
+    `ambiguities` is empty for a clean match; otherwise it names each guess made:
+    expiry_not_listed, multiple_expiries, strike_not_listed, strike_tie, strike_inferred.
+    """
+
+    underlying: str
+    option_type: str
+    expiry: date
+    strike: float
+    symbol: str
+    requested_expiry: Optional[str]
+    requested_strike: Optional[float]
+    expiry_candidates: Tuple[date, ...]
+    strike_distance: float
+    ambiguities: Tuple[str, ...]
+
+    @property
+    def ambiguous(self) -> bool:
+        return bool(self.ambiguities)
+
+
+class OptionContractIndex:
+    """Sorted expiry ordinals and per-(expiry, side) strike lists for bisect lookups."""
+
+    def __init__(self, underlying: str, snapshots: Sequence[OptionChainSnapshot]):
+        ordered = sorted(snapshots, key=lambda snapshot: snapshot.expiry)
+        self.underlying = underlying
+        self.expiries: List[date] = [snapshot.expiry for snapshot in ordered]
+        self._ordinals: List[int] = [expiry.toordinal() for expiry in self.expiries]
+        self._sides: Dict[Tuple[date, str], List[float]] = {}
+        self.underlying_price: Optional[float] = None
+        latest_fetch: Optional[datetime] = None
+
+        for snapshot in ordered:
+            self._sides[(snapshot.expiry, "C")] = _strike_list(snapshot.calls)
+            self._sides[(snapshot.expiry, "P")] = _strike_list(snapshot.puts)
+            if snapshot.underlying_price and (latest_fetch is None or snapshot.fetched_at > latest_fetch):
+                self.underlying_price = float(snapshot.underlying_price)
+                latest_fetch = snapshot.fetched_at
+
+    def resolve(
+        self,
+        option_type: Any,
+        strike: Optional[float],
+        expiry: Optional[str],
+        as_of: date,
+    ) -> Optional[OptionContractMatch]:
+        try:
+            code = option_code(option_type)
+        except ValueError:
+            return None
+
+        picked = self._pick_expiry(expiry, as_of)
+        if picked is None:
+            return None
+        chosen_expiry, candidates, ambiguities = picked
+
+        strikes = self._sides.get((chosen_expiry, code), [])
+        reference = strike if strike is not None else self.underlying_price
+        if not strikes or reference is None:
+            return None
+
+        position, tied = _nearest_index(strikes, float(reference))
+        chosen_strike = strikes[position]
+        distance = abs(chosen_strike - float(reference))
+        if strike is None:
+            ambiguities.append("strike_inferred")
+        elif distance > 1e-9:
+            ambiguities.append("strike_not_listed")
+        if tied:
+            ambiguities.append("strike_tie")
+
+        return OptionContractMatch(
+            underlying=self.underlying,
+            option_type=_OPTION_TYPES[code],
+            expiry=chosen_expiry,
+            strike=chosen_strike,
+            symbol=format_option_symbol(self.underlying, chosen_expiry, code, chosen_strike),
+            requested_expiry=expiry,
+            requested_strike=strike,
+            expiry_candidates=candidates,
+            strike_distance=distance if strike is not None else 0.0,
+            ambiguities=tuple(ambiguities),
+        )
+
+    def _pick_expiry(
+        self,
+        expiry_text: Optional[str],
+        as_of: date,
+    ) -> Optional[Tuple[date, Tuple[date, ...], List[str]]]:
+        window = parse_expiry_text(expiry_text, as_of)
+        if window is None:
+            # No usable expiry: take the nearest listed one and say so.
+            low = bisect_left(self._ordinals, as_of.toordinal())
+            candidates = tuple(self.expiries[low:])
+            if not candidates:
+                return None
+            return candidates[0], candidates, ["multiple_expiries"] if len(candidates) > 1 else []
+
+        start, end = window.start, window.end
+        if window.exact:
+            start = date.fromordinal(start.toordinal() - EXACT_EXPIRY_TOLERANCE_DAYS)
+            end = date.fromordinal(end.toordinal() + EXACT_EXPIRY_TOLERANCE_DAYS)
+        low = bisect_left(self._ordinals, max(start, as_of).toordinal())
+        high = bisect_right(self._ordinals, end.toordinal())
+        if low >= high:
+            return None
+
+        position, _ = _nearest_index(self._ordinals, window.target.toordinal(), low, high)
+        chosen = self.expiries[position]
+        candidates = tuple(self.expiries[low:high])
+        ambiguities: List[str] = []
+        if window.exact and chosen != window.target:
+            ambiguities.append("expiry_not_listed")
+        elif not window.exact and len(candidates) > 1 and abs((chosen - window.target).days) > 1:
+            # Month-only text is unambiguous when the standard monthly is listed.
+            ambiguities.append("multiple_expiries")
+        return chosen, candidates, ambiguities
+
+
+class OptionContractResolver:
+    """Build and reuse per-underlying indexes over the chain store's cached snapshots."""
+
+    def __init__(self, store: OptionChainStore):
+        self._store = store
+        self._lock = threading.Lock()
+        self._indexes: Dict[str, Tuple[tuple, OptionContractIndex]] = {}
+
+    def resolve(
+        self,
+        underlying: str,
+        *,
+        option_type: Any,
+        strike: Optional[float],
+        expiry: Optional[str],
+    ) -> Optional[OptionContractMatch]:
+        """Return the nearest listed contract, or None when the chain cannot answer."""
+        normalized = str(underlying or "").strip().upper().replace("$", "")
+        index = self._index_for(normalized)
+        if index is None:
+            return None
+        return index.resolve(option_type, strike, expiry, self._store.today())
+
+    def resolve_vehicle(self, underlying: str, vehicle: Any) -> Optional[OptionContractMatch]:
+        return self.resolve(
+            underlying,
+            option_type=getattr(vehicle, "option_type", None),
+            strike=getattr(vehicle, "strike", None),
+            expiry=getattr(vehicle, "expiry", None),
+        )
+
+    def _index_for(self, underlying: str) -> Optional[OptionContractIndex]:
+        snapshots = self._store.get_chains(underlying)
+        if not snapshots:
+            return None
+        # Snapshots are replaced on refresh, so identity + fetch time detects staleness.
+        signature = tuple((snapshot.expiry, snapshot.fetched_at, id(snapshot)) for snapshot in snapshots)
+        with self._lock:
+            cached = self._indexes.get(underlying)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+        index = OptionContractIndex(underlying, snapshots)
+        with self._lock:
+            self._indexes[underlying] = (signature, index)
+        return index
+
+
+def _strike_list(side: OptionChainSide) -> List[float]:
+    return [float(strike) for strike in side.strikes]
+
+
+def _nearest_index(values: Sequence[float], target: float, low: int = 0, high: Optional[int] = None) -> Tuple[int, bool]:
+    """Bisect for the value closest to `target` in values[low:high]; ties pick the lower one."""
+    high = len(values) if high is None else high
+    position = bisect_left(values, target, low, high)
+    if position == low:
+        return low, False
+    if position == high:
+        return high - 1, False
+    below = target - values[position - 1]
+    above = values[position] - target
+    if above < below:
+        return position, False
+    return position - 1, abs(above - below) < 1e-9 and above > 0
@@ -0,0 +1,61 @@
+"""In-memory options-chain contracts shared by chain sources and consumers."""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+OptionChainKey = Tuple[str, date]
+
+
+@dataclass(frozen=True)
+class OptionChainSide:
+    """Column arrays for one side (calls or puts) of one expiry, sorted by strike."""
+
+    contract_symbols: np.ndarray
+    strikes: np.ndarray
+    bids: np.ndarray
+    asks: np.ndarray
+    last_prices: np.ndarray
+    volumes: np.ndarray
+    open_interest: np.ndarray
+    implied_volatility: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.strikes.shape[0])
+
+    @classmethod
+    def empty(cls) -> "OptionChainSide":
+        floats = np.empty(0, dtype=float)
+        return cls(
+            contract_symbols=np.empty(0, dtype=object),
+            strikes=floats,
+            bids=floats,
+            asks=floats,
+            last_prices=floats,
+            volumes=floats,
+            open_interest=floats,
+            implied_volatility=floats,
+        )
+
+
+@dataclass(frozen=True)
+class OptionChainSnapshot:
+    """One underlying/expiry chain as fetched from a source at `fetched_at`."""
+
+    underlying: str
+    expiry: date
+    fetched_at: datetime
+    underlying_price: Optional[float]
+    calls: OptionChainSide
+    puts: OptionChainSide
+
+    @property
+    def key(self) -> OptionChainKey:
+        return (self.underlying, self.expiry)
+
+    @property
+    def contract_count(self) -> int:
+        return len(self.calls) + len(self.puts)
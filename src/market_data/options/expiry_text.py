@@ -0,0 +1,112 @@
+"""Parse the loose expiry phrases analysts write ("May", "Jan '27", "3/21")."""
+
+import calendar
+import re
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Optional
+
+
+_MONTHS = {name.lower(): index for index, name in enumerate(calendar.month_abbr) if name}
+_MONTH_PATTERN = "|".join(_MONTHS)
+
+_ISO_PATTERN = re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2})$")
+_NUMERIC_PATTERN = re.compile(r"^(\d{1,2})/(\d{1,2})(?:/(\d{2}|\d{4}))?$")
+_MONTH_FIRST_PATTERN = re.compile(
+    rf"^({_MONTH_PATTERN})[a-z]*\.?"
+    r"(?:\s*(\d{1,2})(?:st|nd|rd|th)?(?!\d))?"
+    r",?(?:\s*(?:'(\d{2})|(\d{4})))?$"
+)
+_DAY_FIRST_PATTERN = re.compile(rf"^(\d{{1,2}})(?:st|nd|rd|th)?\s+({_MONTH_PATTERN})[a-z]*\.?(?:,?\s*(\d{{4}}))?$")
+_NOISE_PATTERN = re.compile(r"\b(?:exp(?:iry|iration|ires)?|for|the)\b[:\s]*")
+
+
+@dataclass(frozen=True)
+class ExpiryWindow:
+    """Listed expiries in [start, end] match; `target` is the preferred date within it."""
+
+    start: date
+    end: date
+    target: date
+    exact: bool
+
+
+def parse_expiry_text(text: Optional[str], as_of: date) -> Optional[ExpiryWindow]:
+    """
+    Turn free-form expiry text into a date window, or None when unrecognized.
+
+    Month-only text targets that month's standard third-Friday expiry. A missing
+    year resolves to the first occurrence whose window ends on or after `as_of`.
+    """
+    normalized = _NOISE_PATTERN.sub("", str(text or "").strip().lower()).strip()
+    normalized = re.sub(r"\s+", " ", normalized.replace("’", "'"))
+    if not normalized:
+        return None
+
+    match = _ISO_PATTERN.match(normalized)
+    if match:
+        return _exact_window(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+
+    match = _NUMERIC_PATTERN.match(normalized)
+    if match:
+        return _day_window(int(match.group(1)), int(match.group(2)), _year(match.group(3)), as_of)
+
+    match = _MONTH_FIRST_PATTERN.match(normalized)
+    if match:
+        month = _MONTHS[match.group(1)]
+        year = _year(match.group(3) or match.group(4))
+        if match.group(2):
+            return _day_window(month, int(match.group(2)), year, as_of)
+        return _month_window(month, year, as_of)
+
+    match = _DAY_FIRST_PATTERN.match(normalized)
+    if match:
+        return _day_window(_MONTHS[match.group(2)], int(match.group(1)), _year(match.group(3)), as_of)
+    return None
+
+
+def third_friday(year: int, month: int) -> date:
+    first = date(year, month, 1)
+    first_friday = first + timedelta(days=(calendar.FRIDAY - first.weekday()) % 7)
+    return first_friday + timedelta(days=14)
+
+
+def _year(raw: Optional[str]) -> Optional[int]:
+    if not raw:
+        return None
+    value = int(raw)
+    return value + 2000 if value < 100 else value
+
+
+def _exact_window(year: int, month: int, day: int) -> Optional[ExpiryWindow]:
+    try:
+        target = date(year, month, day)
+    except ValueError:
+        return None
+    return ExpiryWindow(start=target, end=target, target=target, exact=True)
+
+
+def _day_window(month: int, day: int, year: Optional[int], as_of: date) -> Optional[ExpiryWindow]:
+    if year is not None:
+        return _exact_window(year, month, day)
+    for candidate_year in (as_of.year, as_of.year + 1):
+        window = _exact_window(candidate_year, month, day)
+        if window is not None and window.end >= as_of:
+            return window
+    return None
+
+
+def _month_window(month: int, year: Optional[int], as_of: date) -> Optional[ExpiryWindow]:
+    if not 1 <= month <= 12:
+        return None
+    years = (year,) if year is not None else (as_of.year, as_of.year + 1)
+    for candidate_year in years:
+        end = date(candidate_year, month, calendar.monthrange(candidate_year, month)[1])
+        if year is not None or end >= as_of:
+            return ExpiryWindow(
+                start=date(candidate_year, month, 1),
+                end=end,
+                target=third_friday(candidate_year, month),
+                exact=False,
+            )
+    return None
@@ -0,0 +1,218 @@
+"""Vectorized Black-Scholes pricing, greeks, and implied volatility over chain arrays."""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+import numpy as np
+
+from src.market_data.options.contracts import OptionChainSide, OptionChainSnapshot
+
+
+DAYS_PER_YEAR = 365.0
+# Expiry-day contracts still carry a few trading hours of time value.
+MIN_YEARS_TO_EXPIRY = 0.25 / DAYS_PER_YEAR
+IV_LOWER_BOUND = 1e-4
+IV_UPPER_BOUND = 5.0
+
+_SQRT_2PI = np.sqrt(2.0 * np.pi)
+# Abramowitz & Stegun 26.2.17 coefficients (absolute error < 7.5e-8).
+_CDF_P = 0.2316419
+_CDF_B = (0.319381530, -0.356563782, 1.781477937, -1.821255978, 1.330274429)
+
+
+@dataclass(frozen=True)
+class OptionGreeks:
+    """Per-contract greeks; theta is per calendar day and vega per 1.00 vol point."""
+
+    delta: np.ndarray
+    gamma: np.ndarray
+    theta: np.ndarray
+    vega: np.ndarray
+
+
+@dataclass(frozen=True)
+class ChainGreeks:
+    """Calls then puts of one snapshot, with mid-implied vol and greeks aligned by row."""
+
+    option_codes: np.ndarray
+    strikes: np.ndarray
+    mids: np.ndarray
+    implied_volatility: np.ndarray
+    greeks: OptionGreeks
+
+    def __len__(self) -> int:
+        return int(self.strikes.shape[0])
+
+
+def norm_pdf(x: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * np.square(x)) / _SQRT_2PI
+
+
+def norm_cdf(x: np.ndarray) -> np.ndarray:
+    x = np.asarray(x, dtype=float)
+    t = 1.0 / (1.0 + _CDF_P * np.abs(x))
+    polynomial = t * (_CDF_B[0] + t * (_CDF_B[1] + t * (_CDF_B[2] + t * (_CDF_B[3] + t * _CDF_B[4]))))
+    upper_tail = norm_pdf(x) * polynomial
+    return np.where(x >= 0, 1.0 - upper_tail, upper_tail)
+
+
+def black_scholes_price(spot, strikes, years, vols, is_call, rate: float = 0.0, dividend_yield: float = 0.0) -> np.ndarray:
+    spot, strikes, years, vols, is_call = _broadcast(spot, strikes, years, vols, is_call=is_call)
+    d1, d2 = _d1_d2(spot, strikes, years, vols, rate, dividend_yield)
+    spot_leg = spot * np.exp(-dividend_yield * years)
+    strike_leg = strikes * np.exp(-rate * years)
+    call = spot_leg * norm_cdf(d1) - strike_leg * norm_cdf(d2)
+    put = strike_leg * norm_cdf(-d2) - spot_leg * norm_cdf(-d1)
+    return np.where(is_call, call, put)
+
+
+def black_scholes_greeks(spot, strikes, years, vols, is_call, rate: float = 0.0, dividend_yield: float = 0.0) -> OptionGreeks:
+    spot, strikes, years, vols, is_call = _broadcast(spot, strikes, years, vols, is_call=is_call)
+    d1, d2 = _d1_d2(spot, strikes, years, vols, rate, dividend_yield)
+    sqrt_years = np.sqrt(years)
+    spot_discount = np.exp(-dividend_yield * years)
+    strike_discount = np.exp(-rate * years)
+    pdf_d1 = norm_pdf(d1)
+
+    delta = np.where(is_call, spot_discount * norm_cdf(d1), spot_discount * (norm_cdf(d1) - 1.0))
+    gamma = spot_discount * pdf_d1 / (spot * vols * sqrt_years)
+    vega = spot * spot_discount * pdf_d1 * sqrt_years / 100.0
+
+    decay = -spot * spot_discount * pdf_d1 * vols / (2.0 * sqrt_years)
+    call_carry = dividend_yield * spot * spot_discount * norm_cdf(d1) - rate * strikes * strike_discount * norm_cdf(d2)
+    put_carry = rate * strikes * strike_discount * norm_cdf(-d2) - dividend_yield * spot * spot_discount * norm_cdf(-d1)
+    theta = (decay + np.where(is_call, call_carry, put_carry)) / DAYS_PER_YEAR
+
+    return OptionGreeks(delta=delta, gamma=gamma, theta=theta, vega=vega)
+
+
+def implied_volatility(
+    prices,
+    spot,
+    strikes,
+    years,
+    is_call,
+    rate: float = 0.0,
+    dividend_yield: float = 0.0,
+    *,
+    tolerance: float = 1e-6,
+    max_iterations: int = 60,
+) -> np.ndarray:
+    """
+    Solve Black-Scholes IV for every row at once.
+
+    Each row keeps a [low, high] bracket; a Newton step is taken when it lands inside
+    the bracket and bisection otherwise (the Brent-style safeguard), so deep ITM/OTM
+    rows with vanishing vega still converge. Prices outside no-arbitrage bounds give NaN.
+    """
+    prices, spot, strikes, years, is_call = _broadcast(prices, spot, strikes, years, is_call=is_call)
+    spot_leg = spot * np.exp(-dividend_yield * years)
+    strike_leg = strikes * np.exp(-rate * years)
+    intrinsic = np.where(is_call, np.maximum(spot_leg - strike_leg, 0.0), np.maximum(strike_leg - spot_leg, 0.0))
+    ceiling = np.where(is_call, spot_leg, strike_leg)
+    solvable = np.isfinite(prices) & (prices > intrinsic) & (prices < ceiling)
+
+    low = np.full(prices.shape, IV_LOWER_BOUND)
+    high = np.full(prices.shape, IV_UPPER_BOUND)
+    vols = _initial_vol_guess(prices, spot, strikes, years)
+    active = solvable.copy()
+
+    for _ in range(max(1, max_iterations)):
+        if not active.any():
+            break
+        rows = np.flatnonzero(active)
+        sigma = vols[rows]
+        model = black_scholes_price(spot[rows], strikes[rows], years[rows], sigma, is_call[rows], rate, dividend_yield)
+        error = model - prices[rows]
+
+        converged = np.abs(error) < tolerance
+        too_high = error > 0
+        high[rows] = np.where(too_high, sigma, high[rows])
+        low[rows] = np.where(too_high, low[rows], sigma)
+
+        d1, _ = _d1_d2(spot[rows], strikes[rows], years[rows], sigma, rate, dividend_yield)
+        raw_vega = spot_leg[rows] * norm_pdf(d1) * np.sqrt(years[rows])
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            newton = sigma - error / raw_vega
+        in_bracket = np.isfinite(newton) & (newton > low[rows]) & (newton < high[rows])
+        stepped = np.where(in_bracket, newton, 0.5 * (low[rows] + high[rows]))
+
+        vols[rows] = np.where(converged, sigma, stepped)
+        active[rows[converged | (high[rows] - low[rows] < tolerance)]] = False
+
+    return np.where(solvable, vols, np.nan)
+
+
+def compute_chain_greeks(
+    snapshot: OptionChainSnapshot,
+    *,
+    as_of: date,
+    rate: float = 0.0,
+    dividend_yield: float = 0.0,
+) -> Optional[ChainGreeks]:
+    """IV from quote mids (falling back to the source IV) and greeks for a whole snapshot."""
+    if snapshot.underlying_price is None or snapshot.contract_count == 0:
+        return None
+
+    option_codes = np.concatenate(
+        [np.full(len(snapshot.calls), "C", dtype="<U1"), np.full(len(snapshot.puts), "P", dtype="<U1")]
+    )
+    strikes = np.concatenate([snapshot.calls.strikes, snapshot.puts.strikes]).astype(float)
+    mids = np.concatenate([_side_mids(snapshot.calls), _side_mids(snapshot.puts)])
+    source_iv = np.concatenate([snapshot.calls.implied_volatility, snapshot.puts.implied_volatility]).astype(float)
+    is_call = option_codes == "C"
+    years = years_to_expiry(snapshot.expiry, as_of)
+    spot = float(snapshot.underlying_price)
+
+    vols = mid_implied_volatility(mids, spot, strikes, years, is_call, source_iv, rate, dividend_yield)
+    greeks = black_scholes_greeks(spot, strikes, years, vols, is_call, rate, dividend_yield)
+    return ChainGreeks(option_codes=option_codes, strikes=strikes, mids=mids, implied_volatility=vols, greeks=greeks)
+
+
+def mid_implied_volatility(mids, spot, strikes, years, is_call, source_iv, rate: float = 0.0, dividend_yield: float = 0.0) -> np.ndarray:
+    """IV solved from quote mids, falling back to the source-reported IV where unsolvable."""
+    solved = implied_volatility(mids, spot, strikes, years, is_call, rate, dividend_yield)
+    source_iv = np.asarray(source_iv, dtype=float)
+    usable_source = np.isfinite(source_iv) & (source_iv > IV_LOWER_BOUND)
+    return np.where(np.isfinite(solved), solved, np.where(usable_source, source_iv, np.nan))
+
+
+def quoted_mask(bids: np.ndarray, asks: np.ndarray) -> np.ndarray:
+    return np.isfinite(bids) & np.isfinite(asks) & (bids > 0) & (asks >= bids)
+
+
+def quote_mid_prices(bids: np.ndarray, asks: np.ndarray, last_prices: np.ndarray) -> np.ndarray:
+    """Bid/ask midpoint where both sides quote, otherwise the last trade, otherwise NaN."""
+    traded = np.isfinite(last_prices) & (last_prices > 0)
+    return np.where(quoted_mask(bids, asks), (bids + asks) / 2.0, np.where(traded, last_prices, np.nan))
+
+
+def _side_mids(side: OptionChainSide) -> np.ndarray:
+    return quote_mid_prices(
+        np.asarray(side.bids, dtype=float),
+        np.asarray(side.asks, dtype=float),
+        np.asarray(side.last_prices, dtype=float),
+    )
+
+
+def years_to_expiry(expiry: date, as_of: date) -> float:
+    return max((expiry - as_of).days / DAYS_PER_YEAR, MIN_YEARS_TO_EXPIRY)
+
+
+def _broadcast(*values, is_call):
+    return np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in values), np.asarray(is_call, dtype=bool))
+
+
+def _d1_d2(spot, strikes, years, vols, rate, dividend_yield):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vol_sqrt_years = vols * np.sqrt(years)
+        d1 = (np.log(spot / strikes) + (rate - dividend_yield + 0.5 * np.square(vols)) * years) / vol_sqrt_years
+    return d1, d1 - vol_sqrt_years
+
+
+def _initial_vol_guess(prices, spot, strikes, years) -> np.ndarray:
+    # Brenner-Subrahmanyam ATM approximation, clipped into the solver bracket.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        guess = np.sqrt(2.0 * np.pi / years) * prices / np.sqrt(spot * strikes)
+    return np.clip(np.nan_to_num(guess, nan=0.5), 0.05, 2.0)
@@ -0,0 +1,16 @@
+"""Ports implemented by options-chain market-data sources."""
+
+from datetime import date
+from typing import List, Protocol
+
+from src.market_data.options.contracts import OptionChainSnapshot
+
+
+class OptionChainSourcePort(Protocol):
+    """Chain operations required by the options-chain store."""
+
+    def list_expiries(self, symbol: str) -> List[date]:
+        ...
+
+    def fetch_chain(self, symbol: str, expiry: date) -> OptionChainSnapshot:
+        ...
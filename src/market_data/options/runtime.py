@@ -0,0 +1,61 @@
+"""Options-chain runtime wiring from config."""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from src.utils.logger import setup_logger
+from src.utils.periodic_task import PeriodicTask
+
+if TYPE_CHECKING:  # the store and its contracts load numpy; import them only when the cache is enabled
+    from src.market_data.options.chain_store import OptionChainStore
+    from src.market_data.options.ports import OptionChainSourcePort
+
+
+logger = setup_logger("option_chain_runtime")
+
+
+@dataclass
+class OptionChainRuntime:
+    store: "OptionChainStore"
+    refresher: PeriodicTask
+
+    def start(self) -> None:
+        self.refresher.start()
+
+    def stop(self) -> None:
+        self.refresher.stop()
+
+
+def build_option_chain_runtime(
+    options_chain_config: Dict[str, Any],
+    source: Optional["OptionChainSourcePort"] = None,
+) -> Optional[OptionChainRuntime]:
+    if not bool(options_chain_config.get("enabled", False)):
+        return None
+    from src.market_data.options.chain_store import OptionChainStore
+
+    resolved_source = source or _build_source(str(options_chain_config.get("provider") or "yahoo"))
+    store = OptionChainStore(
+        resolved_source,
+        refresh_interval_seconds=float(options_chain_config.get("refresh_interval_seconds", 300.0)),
+        expiry_list_ttl_seconds=float(options_chain_config.get("expiry_list_ttl_seconds", 3600.0)),
+        recent_ticker_ttl_seconds=float(options_chain_config.get("recent_ticker_ttl_seconds", 21600.0)),
+        max_expiries=int(options_chain_config.get("max_expiries", 8)),
+    )
+    max_fetches = int(options_chain_config.get("max_fetches_per_tick", 2))
+    refresher = PeriodicTask(
+        name="option-chain-refresh",
+        interval_seconds=float(options_chain_config.get("tick_seconds", 5.0)),
+        action=lambda: store.refresh_due(max_fetches=max_fetches),
+    )
+    logger.info("Options-chain cache enabled (provider=%s).", options_chain_config.get("provider", "yahoo"))
+    return OptionChainRuntime(store=store, refresher=refresher)
+
+
+def _build_source(provider: str) -> "OptionChainSourcePort":
+    normalized = provider.strip().lower()
+    if normalized == "yahoo":
+        from src.market_data.yahoo.option_chain_provider import YahooOptionChainProvider
+
+        return YahooOptionChainProvider()
+    raise ValueError(f"Unsupported options-chain provider '{provider}'")
@@ -0,0 +1,19 @@
+"""OCC-style option symbol formatting shared by resolvers and brokers."""
+
+from datetime import date
+
+
+def option_code(option_type: str) -> str:
+    """Map CALL/PUT (or C/P, or an OptionType enum) to the single-letter OCC code."""
+    normalized = str(getattr(option_type, "value", option_type) or "").strip().upper()
+    if normalized in {"C", "CALL"}:
+        return "C"
+    if normalized in {"P", "PUT"}:
+        return "P"
+    raise ValueError(f"Unsupported option type: {option_type!r}")
+
+
+def format_option_symbol(underlying: str, expiry: date, option_type: str, strike: float) -> str:
+    """Format an unpadded OCC symbol, e.g. AAPL260320C00200000."""
+    strike_thousandths = int(round(float(strike) * 1000))
+    return f"{underlying.upper()}{expiry:%y%m%d}{option_code(option_type)}{strike_thousandths:08d}"
@@ -0,0 +1,21 @@
+"""Listed-symbol master: memory-mapped ticker validation and canonicalization."""
+
+from src.market_data.symbols.listings import read_symbol_listing
+from src.market_data.symbols.symbol_master import (
+    SymbolMaster,
+    SymbolRecord,
+    canonical_symbol,
+    load_symbol_master,
+    symbol_lookup_key,
+    write_symbol_master,
+)
+
+__all__ = [
+    "SymbolMaster",
+    "SymbolRecord",
+    "canonical_symbol",
+    "load_symbol_master",
+    "read_symbol_listing",
+    "symbol_lookup_key",
+    "write_symbol_master",
+]
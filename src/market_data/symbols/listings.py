@@ -0,0 +1,33 @@
+"""Readers for symbol listing files the symbol master is built from."""
+
+import csv
+from pathlib import Path
+from typing import Iterator, Union
+
+from src.market_data.symbols.symbol_master import DEFAULT_TICK_SIZE, SymbolRecord
+
+
+# Symbol column per listing header: Nasdaq Trader's nasdaqlisted.txt / otherlisted.txt, or a broker export.
+_SYMBOL_COLUMNS = ("Symbol", "ACT Symbol", "symbol")
+
+
+def read_symbol_listing(path: Union[str, Path]) -> Iterator[SymbolRecord]:
+    """
+    Yield records from a pipe-delimited Nasdaq Trader listing or a CSV export with
+    `symbol[,instrument_id][,tick_size]` columns. Test issues and footer rows are skipped.
+    """
+    path = Path(path)
+    with path.open("r", encoding="utf-8", newline="") as f:
+        header = f.readline()
+        delimiter = "|" if "|" in header else ","
+        f.seek(0)
+        for row in csv.DictReader(f, delimiter=delimiter):
+            symbol = next((row[column] for column in _SYMBOL_COLUMNS if row.get(column)), "").strip()
+            if not symbol or symbol.startswith("File Creation Time") or row.get("Test Issue") == "Y":
+                continue
+            tick_size = (row.get("tick_size") or "").strip()
+            yield SymbolRecord(
+                symbol=symbol,
+                instrument_id=(row.get("instrument_id") or "").strip() or None,
+                tick_size=float(tick_size) if tick_size else DEFAULT_TICK_SIZE,
+            )
@@ -0,0 +1,169 @@
+"""Memory-mapped master of listed symbols for broker-free ticker validation and canonicalization."""
+
+import mmap
+import os
+import re
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional, Union
+
+from src.utils.logger import setup_logger
+from src.utils.paths import DATA_DIR
+
+
+logger = setup_logger("symbol_master")
+
+_MAGIC = b"SYMM"
+_VERSION = 1
+# magic, version, record size, record count
+_HEADER = struct.Struct("<4sHHI")
+# lookup key, canonical symbol, instrument id, tick size; keys sorted bytewise.
+_RECORD = struct.Struct("<12s12s24sd")
+_KEY_WIDTH = 12
+_SYMBOL_WIDTH = 12
+_INSTRUMENT_ID_WIDTH = 24
+DEFAULT_TICK_SIZE = 0.01
+DEFAULT_SYMBOL_MASTER_PATH = DATA_DIR / "symbol_master.bin"
+_NON_ALNUM = re.compile(r"[^A-Z0-9]")
+_CLASS_SEPARATORS = re.compile(r"[-/ =]")
+
+
+@dataclass(frozen=True)
+class SymbolRecord:
+    symbol: str
+    instrument_id: Optional[str] = None
+    tick_size: float = DEFAULT_TICK_SIZE
+
+
+def symbol_lookup_key(ticker: Any) -> str:
+    """Share-class punctuation is dropped, so BRK.B, BRK-B, BRK/B and BRKB share a key."""
+    return _NON_ALNUM.sub("", str(ticker or "").upper())
+
+
+def canonical_symbol(symbol: str) -> str:
+    """Listed form with `.` as the share-class separator (BRK-B -> BRK.B)."""
+    return _CLASS_SEPARATORS.sub(".", str(symbol).upper().replace("$", "").strip())
+
+
+def write_symbol_master(records: Iterable[SymbolRecord], path: Union[str, Path]) -> int:
+    """
+    Write `records` sorted by lookup key and return how many were kept.
+
+    The file is replaced atomically, so processes that already mapped the old
+    master keep reading it until they reopen.
+    """
+    by_key: Dict[bytes, SymbolRecord] = {}
+    for record in records:
+        key = symbol_lookup_key(record.symbol)
+        symbol = canonical_symbol(record.symbol)
+        instrument_id = str(record.instrument_id or "")
+        if not key or len(key) > _KEY_WIDTH or len(symbol) > _SYMBOL_WIDTH or len(instrument_id) > _INSTRUMENT_ID_WIDTH:
+            logger.warning("Skipping symbol that does not fit the master layout: %r", record.symbol)
+            continue
+        encoded = key.encode("ascii")
+        if encoded in by_key:
+            logger.warning("Duplicate symbol key %s (%s, %s); keeping the first", key, by_key[encoded].symbol, symbol)
+            continue
+        by_key[encoded] = SymbolRecord(symbol, instrument_id or None, float(record.tick_size or DEFAULT_TICK_SIZE))
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with tmp_path.open("wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, _RECORD.size, len(by_key)))
+        for key in sorted(by_key):
+            record = by_key[key]
+            f.write(
+                _RECORD.pack(
+                    key,
+                    record.symbol.encode("ascii"),
+                    (record.instrument_id or "").encode("ascii"),
+                    record.tick_size,
+                )
+            )
+    os.replace(tmp_path, path)
+    return len(by_key)
+
+
+class SymbolMaster:
+    """
+    Read-only view over a symbol master file.
+
+    The file is memory-mapped, so opening costs one header read and the pages are
+    shared through the OS cache by every process mapping it. Lookups binary-search
+    fixed-width records in place without decoding the file.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < _HEADER.size:
+            self.close()
+            raise ValueError(f"Symbol master is truncated: {self.path}")
+        magic, version, record_size, count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or version != _VERSION or record_size != _RECORD.size:
+            self.close()
+            raise ValueError(f"Unsupported symbol master format: {self.path}")
+        if len(self._mmap) < _HEADER.size + count * record_size:
+            self.close()
+            raise ValueError(f"Symbol master is truncated: {self.path}")
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, ticker: Any) -> bool:
+        return self._find(symbol_lookup_key(ticker)) is not None
+
+    def lookup(self, ticker: Any) -> Optional[SymbolRecord]:
+        offset = self._find(symbol_lookup_key(ticker))
+        if offset is None:
+            return None
+        _, symbol, instrument_id, tick_size = _RECORD.unpack_from(self._mmap, offset)
+        return SymbolRecord(
+            symbol=symbol.rstrip(b"\0").decode("ascii"),
+            instrument_id=instrument_id.rstrip(b"\0").decode("ascii") or None,
+            tick_size=tick_size,
+        )
+
+    def canonicalize(self, ticker: Any) -> Optional[str]:
+        """Listed symbol for `ticker`, or None when it is not listed."""
+        record = self.lookup(ticker)
+        return record.symbol if record else None
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def _find(self, key: str) -> Optional[int]:
+        if not key or len(key) > _KEY_WIDTH:
+            return None
+        target = key.encode("ascii").ljust(_KEY_WIDTH, b"\0")
+        data = self._mmap
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            offset = _HEADER.size + middle * _RECORD.size
+            probe = data[offset : offset + _KEY_WIDTH]
+            if probe < target:
+                low = middle + 1
+            elif probe > target:
+                high = middle
+            else:
+                return offset
+        return None
+
+
+def load_symbol_master(config: Mapping[str, Any]) -> Optional[SymbolMaster]:
+    """Open the configured master, or None when disabled or unreadable (validation is then skipped)."""
+    if not config.get("enabled"):
+        return None
+    path = config.get("path") or DEFAULT_SYMBOL_MASTER_PATH
+    try:
+        master = SymbolMaster(path)
+    except (OSError, TypeError, ValueError) as exc:
+        logger.warning("Symbol master disabled: %s", exc)
+        return None
+    logger.info("Loaded symbol master %s (%d symbols)", master.path, len(master))
+    return master
@@ -1,5 +1,14 @@
 """Yahoo market-data contracts and adapters."""
 
-from src.market_data.yahoo.quote_provider import YahooQuoteProvider
+from src.utils.lazy_imports import lazy_exports
 
-__all__ = ["YahooQuoteProvider"]
+
+__all__ = ["YahooOptionChainProvider", "YahooQuoteProvider"]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "YahooOptionChainProvider": "src.market_data.yahoo.option_chain_provider",
+        "YahooQuoteProvider": "src.market_data.yahoo.quote_provider",
+    },
+)
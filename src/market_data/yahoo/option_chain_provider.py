@@ -0,0 +1,123 @@
+"""Yahoo options-chain adapter producing column-array chain snapshots."""
+
+from collections.abc import Mapping
+from datetime import date, datetime, timezone
+from typing import Any, Callable, List, Optional
+
+import numpy as np
+
+from src.market_data.options.contracts import OptionChainSide, OptionChainSnapshot
+from src.market_data.yahoo.ticker_factory import build_default_ticker_factory
+
+
+_FLOAT_COLUMNS = {
+    "strikes": "strike",
+    "bids": "bid",
+    "asks": "ask",
+    "last_prices": "lastPrice",
+    "volumes": "volume",
+    "open_interest": "openInterest",
+    "implied_volatility": "impliedVolatility",
+}
+
+
+class YahooOptionChainProvider:
+    """Fetch option expiries and per-expiry chains from yfinance tickers."""
+
+    def __init__(
+        self,
+        ticker_factory: Optional[Callable[[str], Any]] = None,
+        now_provider: Optional[Callable[[], datetime]] = None,
+    ):
+        self._ticker_factory = ticker_factory or build_default_ticker_factory("market_data.options_chain.provider=yahoo")
+        self._now_provider = now_provider or (lambda: datetime.now(timezone.utc))
+
+    def list_expiries(self, symbol: str) -> List[date]:
+        ticker = self._ticker_factory(_normalize_symbol(symbol))
+        expiries: List[date] = []
+        for raw in getattr(ticker, "options", None) or ():
+            try:
+                expiries.append(date.fromisoformat(str(raw)))
+            except ValueError:
+                continue
+        return sorted(expiries)
+
+    def fetch_chain(self, symbol: str, expiry: date) -> OptionChainSnapshot:
+        normalized_symbol = _normalize_symbol(symbol)
+        ticker = self._ticker_factory(normalized_symbol)
+        chain = ticker.option_chain(expiry.isoformat())
+        return OptionChainSnapshot(
+            underlying=normalized_symbol,
+            expiry=expiry,
+            fetched_at=self._now_provider(),
+            underlying_price=_underlying_price(getattr(chain, "underlying", None)),
+            calls=_side_from_table(getattr(chain, "calls", None)),
+            puts=_side_from_table(getattr(chain, "puts", None)),
+        )
+
+
+def _side_from_table(table: Any) -> OptionChainSide:
+    row_count = _row_count(table)
+    if row_count == 0:
+        return OptionChainSide.empty()
+
+    columns = {str(column) for column in getattr(table, "columns", ())}
+    arrays = {
+        field: _float_column(table, column, columns, row_count)
+        for field, column in _FLOAT_COLUMNS.items()
+    }
+    if "contractSymbol" in columns:
+        symbols = np.asarray([str(value) for value in table["contractSymbol"]], dtype=object)
+    else:
+        symbols = np.full(row_count, "", dtype=object)
+
+    order = np.argsort(arrays["strikes"], kind="stable")
+    return OptionChainSide(
+        contract_symbols=symbols[order],
+        **{field: values[order] for field, values in arrays.items()},
+    )
+
+
+def _float_column(table: Any, column: str, columns: set, row_count: int) -> np.ndarray:
+    if column not in columns:
+        return np.full(row_count, np.nan)
+    values = list(table[column])
+    try:
+        return np.asarray(values, dtype=float)
+    except (TypeError, ValueError):
+        return np.asarray([_to_float(value) for value in values], dtype=float)
+
+
+def _row_count(table: Any) -> int:
+    if table is None:
+        return 0
+    try:
+        return int(len(table))
+    except TypeError:
+        return 0
+
+
+def _underlying_price(payload: Any) -> Optional[float]:
+    if not isinstance(payload, Mapping):
+        return None
+    for key in ("regularMarketPrice", "currentPrice", "previousClose"):
+        value = _to_float(payload.get(key))
+        if not np.isnan(value) and value > 0:
+            return value
+    return None
+
+
+def _to_float(value: Any) -> float:
+    if value in (None, "", "null"):
+        return float("nan")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def _normalize_symbol(symbol: str) -> str:
+    normalized = str(symbol or "").strip().upper().replace("$", "")
+    if not normalized:
+        raise ValueError("Option chain symbol is required")
+    return normalized
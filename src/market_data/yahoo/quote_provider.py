@@ -1,48 +1,61 @@
 """Yahoo quote provider adapter for executable stock limit references."""
 
+import time
 from collections.abc import Mapping
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, Tuple
 
+from src.market_data.yahoo.ticker_factory import build_default_ticker_factory
+from src.observability.metrics import REGISTRY
+from src.observability.tracing import TRACER
 from src.utils.logger import setup_logger
 
 
 logger = setup_logger("yahoo_quote_provider")
 
+QUOTE_SOURCE = REGISTRY.counter(
+    "quote_source_total", "Which quote source produced the limit reference price", ["provider", "source"]
+)
+QUOTE_RESOLVE_SECONDS = REGISTRY.histogram(
+    "quote_resolve_seconds", "Time to resolve a limit reference price", ["provider"]
+)
+
 
 class YahooQuoteProvider:
     """Resolve side-aware executable quote references from Yahoo payloads."""
 
     def __init__(self, ticker_factory: Optional[Callable[[str], Any]] = None):
-        self._ticker_factory = ticker_factory or _build_default_ticker_factory()
+        self._ticker_factory = ticker_factory or build_default_ticker_factory("trading.quote_provider=yahoo")
 
     def get_limit_reference_price(self, symbol: str, side: str) -> Optional[float]:
         normalized_symbol = _normalize_symbol(symbol)
         normalized_side = _normalize_side(side)
 
+        started = time.perf_counter()
+        source = "error"
+        with TRACER.span("quote.resolve", provider="yahoo", symbol=normalized_symbol, side=normalized_side) as span:
+            try:
+                price, source = self._resolve(normalized_symbol, normalized_side)
+                return price
+            finally:
+                span.set_attribute("quote_source", source)
+                QUOTE_RESOLVE_SECONDS.observe(time.perf_counter() - started, provider="yahoo")
+                QUOTE_SOURCE.inc(provider="yahoo", source=source)
+
+    def _resolve(self, normalized_symbol: str, normalized_side: str) -> Tuple[Optional[float], str]:
         try:
             ticker = self._ticker_factory(normalized_symbol)
         except Exception as exc:
             logger.warning("Failed to create Yahoo ticker client for %s: %s", normalized_symbol, exc)
-            return None
+            return None, "error"
 
         fast_info = _as_mapping(getattr(ticker, "fast_info", None))
         price = _pick_side_reference_price(fast_info, normalized_side)
         if price is not None:
-            return price
+            return price, "fast_info"
 
         info = _as_mapping(getattr(ticker, "info", None))
-        return _pick_side_reference_price(info, normalized_side)
-
-
-def _build_default_ticker_factory() -> Callable[[str], Any]:
-    try:
-        import yfinance as yf
-    except Exception as exc:
-        raise RuntimeError(
-            "yfinance is required when trading.quote_provider=yahoo"
-        ) from exc
-
-    return yf.Ticker
+        price = _pick_side_reference_price(info, normalized_side)
+        return price, "info" if price is not None else "none"
 
 
 def _normalize_symbol(symbol: str) -> str:
@@ -0,0 +1,12 @@
+"""Shared yfinance ticker-factory construction for Yahoo adapters."""
+
+from typing import Any, Callable
+
+
+def build_default_ticker_factory(requirement_hint: str) -> Callable[[str], Any]:
+    try:
+        import yfinance as yf
+    except Exception as exc:
+        raise RuntimeError(f"yfinance is required when {requirement_hint}") from exc
+
+    return yf.Ticker
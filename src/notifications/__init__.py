@@ -0,0 +1,33 @@
+"""Signal notifications: pluggable sinks fed asynchronously so delivery never delays trading."""
+
+from src.notifications.dispatcher import (
+    NotificationDispatcher,
+    SinkWorker,
+    build_notification_dispatcher,
+    build_notification_sinks,
+)
+from src.notifications.sinks import (
+    ConsoleSink,
+    DiscordWebhookSink,
+    FileSink,
+    Notification,
+    NotificationDeliveryError,
+    NotificationSink,
+    WebhookSink,
+    render_console_text,
+)
+
+__all__ = [
+    "ConsoleSink",
+    "DiscordWebhookSink",
+    "FileSink",
+    "Notification",
+    "NotificationDeliveryError",
+    "NotificationDispatcher",
+    "NotificationSink",
+    "SinkWorker",
+    "WebhookSink",
+    "build_notification_dispatcher",
+    "build_notification_sinks",
+    "render_console_text",
+]
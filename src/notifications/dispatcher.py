@@ -0,0 +1,186 @@
+"""Fan-out of notifications to sinks, each on its own queue and thread."""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional, Sequence
+
+from src.observability.metrics import REGISTRY
+from src.notifications.sinks import (
+    ConsoleSink,
+    DiscordWebhookSink,
+    FileSink,
+    Notification,
+    NotificationDeliveryError,
+    NotificationSink,
+    WebhookSink,
+)
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("notifications")
+
+QUEUE_DEPTH = REGISTRY.gauge("queue_depth", "Items waiting in an in-process queue", ["queue"])
+
+
+class SinkWorker:
+    """
+    Deliver notifications to one sink from a daemon thread.
+
+    `submit` never blocks: the queue holds at most `queue_size` notifications and
+    drops the oldest when full. Everything queued while the sink is busy is
+    coalesced into the next delivery (up to `max_batch`, repeats of the same
+    author and calls collapsed). Failed deliveries are retried `retries` times
+    with exponential backoff from `retry_backoff_seconds`, unless the error is
+    not retryable.
+    """
+
+    def __init__(
+        self,
+        sink: NotificationSink,
+        *,
+        queue_size: int = 256,
+        max_batch: int = 20,
+        retries: int = 3,
+        retry_backoff_seconds: float = 1.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.sink = sink
+        self._queue: Deque[Notification] = deque(maxlen=max(1, int(queue_size)))
+        QUEUE_DEPTH.set_function(self._queue.__len__, queue=f"notify_{sink.name}")
+        self._max_batch = max(1, int(max_batch))
+        self._retries = max(0, int(retries))
+        self._retry_backoff_seconds = max(0.0, float(retry_backoff_seconds))
+        self._sleep = sleep
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closing = False
+        self._busy = False
+        self.delivered = 0
+        self.dropped = 0
+        self.failed = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def submit(self, notification: Notification) -> None:
+        with self._condition:
+            if self._closing:
+                return
+            if len(self._queue) == self._queue.maxlen:
+                self.dropped += 1
+                logger.warning("Notification queue for %s is full; dropping the oldest", self.sink.name)
+            self._queue.append(notification)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=f"notify-{self.sink.name}", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until everything submitted so far has been delivered or given up on."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._queue or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+
+    def _next_batch(self) -> Optional[List[Notification]]:
+        with self._condition:
+            while not self._queue and not self._closing:
+                self._condition.wait()
+            if not self._queue:
+                return None
+            batch: Dict[Any, Notification] = {}
+            while self._queue and len(batch) < self._max_batch:
+                notification = self._queue.popleft()
+                batch.setdefault(notification.key, notification)
+            self._busy = True
+            return list(batch.values())
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            try:
+                self._deliver(batch)
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def _deliver(self, batch: List[Notification]) -> None:
+        for attempt in range(self._retries + 1):
+            try:
+                self.sink.deliver(batch)
+                self.delivered += len(batch)
+                return
+            except Exception as exc:
+                retryable = not isinstance(exc, NotificationDeliveryError) or exc.retryable
+                if not retryable or attempt == self._retries:
+                    self.failed += len(batch)
+                    logger.error("Dropping %d notification(s) for %s: %s", len(batch), self.sink.name, exc)
+                    return
+                delay = self._retry_backoff_seconds * (2 ** attempt)
+                logger.warning("Notification delivery to %s failed (%s); retrying in %.1fs", self.sink.name, exc, delay)
+                self._sleep(delay)
+
+
+class NotificationDispatcher:
+    """Hands each notification to every sink's worker and returns immediately."""
+
+    def __init__(self, workers: Sequence[SinkWorker]):
+        self.workers = list(workers)
+
+    def publish(self, notification: Notification) -> None:
+        for worker in self.workers:
+            worker.submit(notification)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        return all(worker.flush(timeout) for worker in self.workers)
+
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        for worker in self.workers:
+            worker.close(timeout)
+
+
+def build_notification_sinks(config: Mapping[str, Any]) -> List[NotificationSink]:
+    sink_config: Dict[str, Any] = dict(config.get("sinks") or {})
+    timeout = float(sink_config.get("timeout_seconds", 5.0))
+    sinks: List[NotificationSink] = []
+    if sink_config.get("console", True):
+        sinks.append(ConsoleSink())
+    if sink_config.get("file_path"):
+        sinks.append(FileSink(sink_config["file_path"]))
+    if sink_config.get("discord_webhook_url"):
+        sinks.append(DiscordWebhookSink(sink_config["discord_webhook_url"], timeout=timeout))
+    if sink_config.get("webhook_url"):
+        sinks.append(WebhookSink(sink_config["webhook_url"], timeout=timeout))
+    return sinks
+
+
+def build_notification_dispatcher(config: Mapping[str, Any]) -> Optional[NotificationDispatcher]:
+    if not config.get("async_delivery"):
+        return None
+    workers = [
+        SinkWorker(
+            sink,
+            queue_size=int(config.get("queue_size", 256)),
+            max_batch=int(config.get("max_batch", 20)),
+            retries=int(config.get("retries", 3)),
+            retry_backoff_seconds=float(config.get("retry_backoff_seconds", 1.0)),
+        )
+        for sink in build_notification_sinks(config)
+    ]
+    return NotificationDispatcher(workers)
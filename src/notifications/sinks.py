@@ -0,0 +1,160 @@
+"""Notification sinks: where a batch of signal notifications gets delivered."""
+
+import json
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Protocol, Sequence, Tuple, Union
+
+from src.picks_log import append_entries
+
+DISCORD_MESSAGE_LIMIT = 2000
+
+
+class NotificationDeliveryError(Exception):
+    """A sink failed to deliver; `retryable` is False for errors a retry cannot fix (e.g. HTTP 4xx)."""
+
+    def __init__(self, message: str, *, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+@dataclass(frozen=True)
+class Notification:
+    author: str
+    signals: Tuple[Dict[str, Any], ...]
+    created_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def from_parsed(cls, parsed_message: Mapping[str, Any], author: str) -> "Notification":
+        signals = parsed_message.get("signals") if isinstance(parsed_message, Mapping) else None
+        return cls(author=str(author), signals=tuple(s for s in signals or () if isinstance(s, Mapping)))
+
+    @property
+    def key(self) -> Tuple[Any, ...]:
+        """Identity for coalescing: the same author repeating the same calls."""
+        return (self.author,) + tuple((s.get("ticker"), s.get("action")) for s in self.signals)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"author": self.author, "created_at": self.created_at, "signals": list(self.signals)}
+
+
+class NotificationSink(Protocol):
+    name: str
+
+    def deliver(self, notifications: Sequence[Notification]) -> None: ...
+
+
+def render_console_text(parsed_message: Mapping[str, Any], author: str) -> str:
+    signals = parsed_message.get("signals", []) if isinstance(parsed_message, dict) else []
+    lines = ["", "=" * 60, f"📊 STOCK SIGNAL DETECTED from {author}", "=" * 60]
+    for i, signal in enumerate(signals, 1):
+        lines += [
+            "",
+            f"Signal #{i}:",
+            f"  Ticker: {signal.get('ticker')}",
+            f"  Action: {signal.get('action')}",
+            f"  Confidence: {float(signal.get('confidence', 0.0))*100:.1f}%",
+        ]
+        if signal.get("weight_percent") is not None:
+            lines.append(f"  Weight: {signal.get('weight_percent')}%")
+        lines += [
+            f"  Urgency: {signal.get('urgency')}",
+            f"  Sentiment: {signal.get('sentiment')}",
+            f"  Reasoning: {signal.get('reasoning')}",
+        ]
+        vehicles = signal.get("vehicles") or []
+        if vehicles:
+            vehicle_types = [v.get("type") for v in vehicles if isinstance(v, dict)]
+            lines.append(f"  Vehicles: {', '.join([v for v in vehicle_types if v])}")
+    lines += ["=" * 60, ""]
+    return "\n".join(lines)
+
+
+def render_summary_line(notification: Notification) -> str:
+    calls = ", ".join(
+        f"{s.get('action')} {s.get('ticker')} ({float(s.get('confidence') or 0.0) * 100:.0f}%)"
+        for s in notification.signals
+    )
+    return f"📊 {notification.author}: {calls or 'no signals'}"
+
+
+def post_json(url: str, payload: Any, *, timeout: float, headers: Optional[Mapping[str, str]] = None) -> None:
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload, default=str).encode("utf-8"),
+        headers={"Content-Type": "application/json", "User-Agent": "stocktalk-notifier", **(headers or {})},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+    except urllib.error.HTTPError as exc:
+        retryable = exc.code == 429 or exc.code >= 500
+        raise NotificationDeliveryError(f"HTTP {exc.code} from {url}", retryable=retryable) from exc
+    except (urllib.error.URLError, OSError) as exc:
+        raise NotificationDeliveryError(f"Failed to reach {url}: {exc}") from exc
+
+
+class ConsoleSink:
+    name = "console"
+
+    def deliver(self, notifications: Sequence[Notification]) -> None:
+        print("\n".join(render_console_text(n.to_dict(), n.author) for n in notifications))
+
+
+class FileSink:
+    """Appends one JSON line per notification under the picks-log file lock."""
+
+    name = "file"
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    def deliver(self, notifications: Sequence[Notification]) -> None:
+        append_entries(self.path, [n.to_dict() for n in notifications])
+
+
+class WebhookSink:
+    """POSTs `{"notifications": [...]}` for each coalesced batch to a generic HTTP endpoint."""
+
+    name = "webhook"
+
+    def __init__(self, url: str, *, timeout: float = 5.0, headers: Optional[Mapping[str, str]] = None):
+        self.url = url
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+
+    def deliver(self, notifications: Sequence[Notification]) -> None:
+        payload = {"notifications": [n.to_dict() for n in notifications]}
+        post_json(self.url, payload, timeout=self.timeout, headers=self.headers)
+
+
+class DiscordWebhookSink:
+    """Posts a one-line summary per notification, packed into as few Discord messages as the length limit allows."""
+
+    name = "discord_webhook"
+
+    def __init__(self, url: str, *, timeout: float = 5.0):
+        self.url = url
+        self.timeout = timeout
+
+    def deliver(self, notifications: Sequence[Notification]) -> None:
+        for content in self._messages([render_summary_line(n) for n in notifications]):
+            post_json(self.url, {"content": content}, timeout=self.timeout)
+
+    @staticmethod
+    def _messages(lines: List[str]) -> List[str]:
+        messages: List[str] = []
+        current = ""
+        for line in lines:
+            line = line[:DISCORD_MESSAGE_LIMIT]
+            if current and len(current) + 1 + len(line) > DISCORD_MESSAGE_LIMIT:
+                messages.append(current)
+                current = ""
+            current = f"{current}\n{line}" if current else line
+        if current:
+            messages.append(current)
+        return messages
@@ -0,0 +1,57 @@
+"""Runtime observability: metrics and their Prometheus endpoint, per-message tracing and profiling, startup timing."""
+
+from src.observability.metrics import REGISTRY, Counter, Gauge, Histogram, MetricsRegistry
+from src.observability.metrics_server import MetricsServer, build_metrics_server, monitor_event_loop_lag
+from src.observability.profiling import (
+    MessageProfiler,
+    build_message_profiler,
+    format_profile,
+    install_profiling_signal,
+)
+from src.observability.startup import (
+    ImportTiming,
+    StartupProfiler,
+    group_import_time,
+    measure_import_time,
+    parse_importtime,
+)
+from src.observability.tracing import (
+    NOOP_SPAN,
+    TRACER,
+    FileSpanExporter,
+    Span,
+    SpanExporter,
+    Tracer,
+    bind_context,
+    configure_tracing,
+    current_span,
+)
+
+__all__ = [
+    "Counter",
+    "FileSpanExporter",
+    "Gauge",
+    "Histogram",
+    "ImportTiming",
+    "MessageProfiler",
+    "MetricsRegistry",
+    "MetricsServer",
+    "NOOP_SPAN",
+    "REGISTRY",
+    "Span",
+    "SpanExporter",
+    "StartupProfiler",
+    "TRACER",
+    "Tracer",
+    "bind_context",
+    "build_message_profiler",
+    "build_metrics_server",
+    "configure_tracing",
+    "current_span",
+    "format_profile",
+    "group_import_time",
+    "install_profiling_signal",
+    "measure_import_time",
+    "monitor_event_loop_lag",
+    "parse_importtime",
+]
@@ -0,0 +1,89 @@
+"""Local HTTP endpoint serving the metrics registry, plus the asyncio event-loop lag probe."""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Mapping, Optional
+
+from src.observability.metrics import REGISTRY, MetricsRegistry
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("metrics_server")
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+EVENT_LOOP_LAG = REGISTRY.histogram(
+    "event_loop_lag_seconds",
+    "How late the asyncio event loop woke a periodic probe",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+EVENT_LOOP_LAG_LAST = REGISTRY.gauge("event_loop_lag_last_seconds", "Most recent event-loop lag sample")
+
+
+class MetricsServer:
+    """Serves `GET /metrics` from a daemon thread; every other path is 404."""
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY, host: str = "127.0.0.1", port: int = 9464):
+        self.registry = registry
+        registry_ref = registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry_ref.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, int(port)), Handler)
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="metrics-server", daemon=True)
+        self._thread.start()
+        logger.info("Serving metrics at %s", self.address)
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread = None
+
+
+async def monitor_event_loop_lag(interval_seconds: float = 0.5) -> None:
+    """Sleep `interval_seconds` forever, recording how much later than asked the loop woke us."""
+    interval_seconds = max(0.001, float(interval_seconds))
+    while True:
+        started = time.perf_counter()
+        await asyncio.sleep(interval_seconds)
+        lag = max(0.0, time.perf_counter() - started - interval_seconds)
+        EVENT_LOOP_LAG.observe(lag)
+        EVENT_LOOP_LAG_LAST.set(lag)
+
+
+def build_metrics_server(config: Mapping[str, Any]) -> Optional[MetricsServer]:
+    if not config.get("enabled"):
+        return None
+    try:
+        return MetricsServer(REGISTRY, str(config.get("host") or "127.0.0.1"), int(config.get("port", 9464)))
+    except OSError as exc:
+        logger.error("Metrics endpoint disabled: cannot bind %s:%s: %s", config.get("host"), config.get("port"), exc)
+        return None
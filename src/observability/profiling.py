@@ -0,0 +1,125 @@
+"""On-demand per-message profiling, switched on by config, env or signal."""
+
+import cProfile
+import io
+import os
+import pstats
+import re
+import signal
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterator, Mapping, Optional, Union
+
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("profiling")
+
+PROFILE_ENV_VAR = "PROFILE_MESSAGES"
+
+
+class MessageProfiler:
+    """
+    Run each `profile()` block under cProfile while enabled, keeping the profile only
+    when the block took at least `threshold_seconds`.
+
+    Kept profiles land in `output_dir` as a `.prof` file (for pstats or snakeviz)
+    plus a `.txt` with the top `top` functions by cumulative time. cProfile sees
+    the calling thread only, so provider calls made on router threads show up as
+    time waiting on their futures. Blocks that start while another is being
+    profiled run unprofiled.
+    """
+
+    def __init__(
+        self,
+        output_dir: Union[str, Path],
+        threshold_seconds: float = 1.0,
+        enabled: bool = False,
+        top: int = 40,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.output_dir = Path(output_dir)
+        self.threshold_seconds = max(0.0, float(threshold_seconds))
+        self.enabled = bool(enabled)
+        self.top = max(1, int(top))
+        self.last_path: Optional[Path] = None
+        self._clock = clock
+        self._busy = threading.Lock()
+
+    def toggle(self) -> bool:
+        self.enabled = not self.enabled
+        logger.info("Message profiling %s", "enabled" if self.enabled else "disabled")
+        return self.enabled
+
+    @contextmanager
+    def profile(self, label: str) -> Iterator[None]:
+        if not self.enabled or not self._busy.acquire(blocking=False):
+            yield
+            return
+        profiler = cProfile.Profile()
+        started = self._clock()
+        try:
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+            elapsed = self._clock() - started
+            if elapsed >= self.threshold_seconds:
+                self.last_path = self._dump(profiler, label, elapsed)
+        finally:
+            self._busy.release()
+
+    def _dump(self, profiler: cProfile.Profile, label: str, elapsed: float) -> Path:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        safe_label = re.sub(r"[^A-Za-z0-9_.-]+", "_", label).strip("_") or "message"
+        path = self.output_dir / f"{stamp}-{safe_label}-{int(elapsed * 1000)}ms.prof"
+        profiler.dump_stats(str(path))
+        path.with_suffix(".txt").write_text(format_profile(profiler, self.top), encoding="utf-8")
+        logger.warning("%s took %.0f ms; profile written to %s", label, elapsed * 1000, path)
+        return path
+
+
+def format_profile(profile: Any, top: int = 40, sort: str = "cumulative") -> str:
+    stream = io.StringIO()
+    pstats.Stats(profile, stream=stream).strip_dirs().sort_stats(sort).print_stats(top)
+    return stream.getvalue()
+
+
+def install_profiling_signal(profiler: MessageProfiler, signal_name: str = "SIGUSR2") -> bool:
+    """Toggle `profiler` on each `signal_name`; False where the platform or thread cannot install it."""
+    signum = getattr(signal, signal_name, None)
+    if signum is None:
+        return False
+    try:
+        signal.signal(signum, lambda *_: profiler.toggle())
+    except ValueError:  # not the main thread
+        return False
+    logger.info("Send %s to toggle message profiling (pid %d)", signal_name, os.getpid())
+    return True
+
+
+def build_message_profiler(config: Mapping[str, Any], default_directory: Path) -> Optional[MessageProfiler]:
+    """
+    A profiler when profiling is enabled in config or `PROFILE_MESSAGES`, or may be
+    toggled later by signal; `PROFILE_MESSAGES=0` forces it off at start.
+    """
+    env_value = str(os.getenv(PROFILE_ENV_VAR, "")).strip().lower()
+    enabled = bool(config.get("enabled"))
+    if env_value:
+        enabled = env_value in {"1", "true", "yes", "on"}
+    if not enabled and not config.get("signal_toggle"):
+        return None
+    profiler = MessageProfiler(
+        config.get("directory") or default_directory,
+        threshold_seconds=float(config.get("threshold_ms", 1000)) / 1000.0,
+        enabled=enabled,
+        top=int(config.get("top", 40)),
+    )
+    if config.get("signal_toggle"):
+        install_profiling_signal(profiler)
+    return profiler
@@ -0,0 +1,113 @@
+"""Startup timing: per-phase wall time in-process and `-X importtime` breakdowns by package."""
+
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.utils.lazy_imports import lazy_import_seconds
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("startup")
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+class StartupProfiler:
+    """
+    Wall time of each named startup phase, measured from `started_at`.
+
+    `report()` lists the phases in order, then the modules loaded through
+    `src.utils.lazy_imports` (their time is already inside whichever phase
+    first needed them).
+    """
+
+    def __init__(self, started_at: Optional[float] = None, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self.started_at = clock() if started_at is None else started_at
+        self._last = self.started_at
+        self.phases: List[Tuple[str, float]] = []
+
+    def mark(self, name: str) -> float:
+        """Close phase `name` as everything since the previous mark (or `started_at`)."""
+        now = self._clock()
+        elapsed, self._last = now - self._last, now
+        self.phases.append((name, elapsed))
+        return elapsed
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        self._last = self._clock()
+        try:
+            yield
+        finally:
+            self.mark(name)
+
+    @property
+    def total_seconds(self) -> float:
+        return self._last - self.started_at
+
+    def report(self) -> str:
+        lines = [f"Startup took {self.total_seconds * 1000:.0f} ms:"]
+        lines.extend(f"  {name:<24} {seconds * 1000:8.1f} ms" for name, seconds in self.phases)
+        lazy = lazy_import_seconds()
+        if lazy:
+            lines.append("  lazily imported:")
+            lines.extend(f"    {module:<40} {seconds * 1000:8.1f} ms" for module, seconds in lazy.items())
+        return "\n".join(lines)
+
+    def log(self) -> None:
+        logger.info("%s", self.report())
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> List[ImportTiming]:
+    """Rows of `python -X importtime` output, in the order the interpreter printed them."""
+    timings = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            timings.append(ImportTiming(module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return timings
+
+
+def group_import_time(
+    timings: Sequence[ImportTiming], own_packages: Sequence[str] = ("src", "config")
+) -> Dict[str, int]:
+    """
+    Self time in microseconds summed per top-level package, largest first. Modules
+    under `own_packages` are grouped one level deeper (`src.ai_parser`, `src.trading`).
+    """
+    totals: Dict[str, int] = defaultdict(int)
+    for timing in timings:
+        parts = timing.module.split(".")
+        key = ".".join(parts[:2]) if parts[0] in own_packages else parts[0]
+        totals[key] += timing.self_us
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def measure_import_time(module: str, python: str = sys.executable) -> List[ImportTiming]:
+    """Import `module` in a fresh interpreter under `-X importtime` and parse the result."""
+    completed = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if completed.returncode != 0:
+        last_line = (completed.stderr.strip().splitlines() or ["no output"])[-1]
+        raise RuntimeError(f"importing {module} failed: {last_line}")
+    return parse_importtime(completed.stderr)
@@ -0,0 +1,268 @@
+"""Per-message tracing: nested spans in a contextvar, exported as OTLP-JSON lines."""
+
+import contextvars
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Protocol, Sequence, Union
+
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("tracing")
+
+_CURRENT_SPAN: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("current_span", default=None)
+
+
+class Span:
+    """One timed operation; `parent_span_id` is empty for the root of a trace."""
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_span_id",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "status",
+        "status_message",
+    )
+
+    def __init__(
+        self, name: str, trace_id: str, parent_span_id: str = "", attributes: Optional[Dict[str, Any]] = None
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = parent_span_id
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes: Dict[str, Any] = {key: value for key, value in (attributes or {}).items() if value is not None}
+        self.status = "unset"
+        self.status_message = ""
+
+    @property
+    def recording(self) -> bool:
+        return True
+
+    @property
+    def duration_seconds(self) -> float:
+        return max(0, (self.end_ns or time.time_ns()) - self.start_ns) / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if value is not None:
+            self.attributes[key] = value
+
+    def set_attributes(self, **attributes: Any) -> None:
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+
+    def record_error(self, exc: BaseException) -> None:
+        self.status = "error"
+        self.status_message = f"{type(exc).__name__}: {exc}"
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span: Dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": _otlp_attributes(self.attributes),
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.status != "unset":
+            span["status"] = {"code": 2 if self.status == "error" else 1, "message": self.status_message}
+        return span
+
+
+class _NoopSpan:
+    """Stand-in yielded while tracing is off, so call sites never branch on it."""
+
+    recording = False
+    attributes: Dict[str, Any] = {}
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, **attributes: Any) -> None:
+        pass
+
+    def record_error(self, exc: BaseException) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class SpanExporter(Protocol):
+    def export(self, spans: Sequence[Span]) -> None:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class FileSpanExporter:
+    """
+    Append each finished trace as one OTLP/JSON `ExportTraceServiceRequest` per line,
+    the layout the OpenTelemetry collector's file exporter writes and its file receiver reads.
+    """
+
+    def __init__(self, path: Union[str, Path], service_name: str = "discord-stock-monitor"):
+        self.path = Path(path)
+        self.service_name = service_name
+        self._lock = threading.Lock()
+        self._file = None
+
+    def export(self, spans: Sequence[Span]) -> None:
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": _otlp_attributes({"service.name": self.service_name})},
+                    "scopeSpans": [
+                        {"scope": {"name": "src.observability.tracing"}, "spans": [span.to_otlp() for span in spans]}
+                    ],
+                }
+            ]
+        }
+        line = json.dumps(payload, separators=(",", ":")) + "\n"
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+            self._file = None
+
+
+class Tracer:
+    """
+    Open spans with `span()`; the first span in a context starts a new trace and
+    later ones nest under the current span. A trace is exported in one batch when
+    its root span ends; spans still open in worker threads at that point are
+    exported on their own when they finish. With no exporter every span is a no-op.
+    """
+
+    def __init__(self, exporter: Optional[SpanExporter] = None):
+        self.exporter = exporter
+        self._lock = threading.Lock()
+        self._pending: Dict[str, List[Span]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Union[Span, _NoopSpan]]:
+        if self.exporter is None:
+            yield NOOP_SPAN
+            return
+        parent = _CURRENT_SPAN.get()
+        if parent is None:
+            span = Span(name, os.urandom(16).hex(), attributes=attributes)
+            with self._lock:
+                self._pending[span.trace_id] = []
+        else:
+            span = Span(name, parent.trace_id, parent.span_id, attributes)
+        token = _CURRENT_SPAN.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.record_error(exc)
+            raise
+        finally:
+            _CURRENT_SPAN.reset(token)
+            span.end_ns = time.time_ns()
+            self._finish(span)
+
+    @contextmanager
+    def trace(self, name: str, **attributes: Any) -> Iterator[Union[Span, _NoopSpan]]:
+        """Like `span`, but always the root of a fresh trace (one per inbound message)."""
+        token = _CURRENT_SPAN.set(None)
+        try:
+            with self.span(name, **attributes) as span:
+                yield span
+        finally:
+            _CURRENT_SPAN.reset(token)
+
+    def close(self) -> None:
+        exporter, self.exporter = self.exporter, None
+        if exporter is None:
+            return
+        with self._lock:
+            leftovers = [span for spans in self._pending.values() for span in spans]
+            self._pending.clear()
+        if leftovers:
+            exporter.export(leftovers)
+        exporter.close()
+
+    def _finish(self, span: Span) -> None:
+        with self._lock:
+            if not span.parent_span_id:
+                batch = self._pending.pop(span.trace_id, []) + [span]
+            elif span.trace_id in self._pending:
+                self._pending[span.trace_id].append(span)
+                return
+            else:
+                batch = [span]
+        exporter = self.exporter
+        if exporter is None:
+            return
+        try:
+            exporter.export(batch)
+        except Exception as exc:
+            logger.warning("Dropping %d span(s): export failed: %s", len(batch), exc)
+
+
+TRACER = Tracer()
+
+
+def current_span() -> Union[Span, _NoopSpan]:
+    return _CURRENT_SPAN.get() or NOOP_SPAN
+
+
+def bind_context(function: Callable[..., Any]) -> Callable[..., Any]:
+    """Carry the caller's trace context into `function` when it runs on another thread."""
+    context = contextvars.copy_context()
+
+    def run(*args: Any, **kwargs: Any) -> Any:
+        return context.run(function, *args, **kwargs)
+
+    return run
+
+
+def configure_tracing(config: Mapping[str, Any], default_path: Union[str, Path]) -> Optional[FileSpanExporter]:
+    """Point the shared tracer at a file exporter when `enabled`; spans stay no-ops otherwise."""
+    if not config.get("enabled"):
+        return None
+    service_name = str(config.get("service_name") or "discord-stock-monitor")
+    exporter = FileSpanExporter(config.get("path") or default_path, service_name)
+    TRACER.exporter = exporter
+    logger.info("Writing traces to %s", exporter.path)
+    return exporter
+
+
+def _otlp_attributes(attributes: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
@@ -0,0 +1,24 @@
+"""Picks-log storage: the JSONL record of every parsed alert."""
+
+from src.picks_log.export import ExportResult, PicksLogExporter, export_picks_log
+from src.picks_log.query import QUERY_FIELDS, PicksLogQuery, QueryStats, query_picks_log
+from src.picks_log.segments import SegmentedPicksLog, build_segmented_picks_log, picks_log_files, picks_log_location
+from src.picks_log.writer import JsonlPicksLog, PicksLogWriter, append_entries, build_picks_log_writer
+
+__all__ = [
+    "ExportResult",
+    "JsonlPicksLog",
+    "PicksLogExporter",
+    "PicksLogQuery",
+    "PicksLogWriter",
+    "QUERY_FIELDS",
+    "QueryStats",
+    "SegmentedPicksLog",
+    "append_entries",
+    "build_picks_log_writer",
+    "build_segmented_picks_log",
+    "export_picks_log",
+    "picks_log_files",
+    "picks_log_location",
+    "query_picks_log",
+]
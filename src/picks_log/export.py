@@ -0,0 +1,270 @@
+"""Incremental export of the picks log into indexed SQLite tables for analysis."""
+
+import json
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+from pydantic import ValidationError
+
+from src.models.parser_models import ParsedMessage
+from src.picks_log.segments import open_segment, segment_size
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("picks_log_export")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS export_state (
+    source TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL,
+    exported_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    timestamp TEXT,
+    day TEXT,
+    author TEXT,
+    message TEXT,
+    message_url TEXT,
+    contract_version TEXT,
+    status TEXT,
+    provider TEXT,
+    error TEXT,
+    warnings TEXT,
+    UNIQUE (source, offset)
+);
+CREATE TABLE IF NOT EXISTS signals (
+    id INTEGER PRIMARY KEY,
+    message_id INTEGER NOT NULL REFERENCES messages (id),
+    position INTEGER NOT NULL,
+    ticker TEXT NOT NULL,
+    action TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    reasoning TEXT,
+    weight_percent REAL,
+    urgency TEXT,
+    sentiment TEXT,
+    is_actionable INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS vehicles (
+    id INTEGER PRIMARY KEY,
+    signal_id INTEGER NOT NULL REFERENCES signals (id),
+    position INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    enabled INTEGER NOT NULL,
+    intent TEXT NOT NULL,
+    side TEXT NOT NULL,
+    option_type TEXT,
+    strike REAL,
+    expiry TEXT,
+    quantity_hint REAL
+);
+CREATE INDEX IF NOT EXISTS messages_day ON messages (day);
+CREATE INDEX IF NOT EXISTS messages_author ON messages (author);
+CREATE INDEX IF NOT EXISTS messages_provider_status ON messages (provider, status);
+CREATE INDEX IF NOT EXISTS signals_message ON signals (message_id);
+CREATE INDEX IF NOT EXISTS signals_ticker_action ON signals (ticker, action);
+CREATE INDEX IF NOT EXISTS vehicles_signal ON vehicles (signal_id);
+CREATE VIEW IF NOT EXISTS signal_facts AS
+SELECT m.timestamp, m.day, m.author, m.provider, m.status,
+       s.id AS signal_id, s.ticker, s.action, s.confidence, s.urgency, s.sentiment, s.is_actionable, s.weight_percent
+FROM signals s JOIN messages m ON m.id = s.message_id;
+"""
+
+
+@dataclass(frozen=True)
+class ExportResult:
+    source: str
+    start_offset: int
+    end_offset: int
+    messages: int
+    signals: int
+    vehicles: int
+    skipped: int
+    restarted: bool = False
+
+
+def _iter_lines(path: Path, offset: int) -> Iterator[Tuple[int, bytes]]:
+    """(offset, line) for complete lines from `offset`; a partial last line is left for the next run."""
+    with open_segment(path) as f:
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                return
+            yield offset, line
+            offset += len(line)
+
+
+class PicksLogExporter:
+    """
+    Flatten picks-log entries into `messages` → `signals` → `vehicles` tables.
+
+    Each run resumes from the byte offset recorded for the source file and stops
+    at its last complete line. Rows and the new offset commit in one transaction
+    per batch, so an interrupted run never exports a line twice. A source that
+    shrank (rotated or rewritten) is re-exported from the start. A daily segment
+    is tracked under its plain name with uncompressed offsets, so compressing it
+    on close does not export it again. Entries are typed
+    through `ParsedMessage`; ones that fail validation are counted and skipped.
+    The `signal_facts` view joins signals to their messages for `pandas.read_sql`.
+    """
+
+    def __init__(self, database: Union[str, Path], *, batch_size: int = 5000):
+        self.database = Path(database)
+        self.database.parent.mkdir(parents=True, exist_ok=True)
+        self._batch_size = max(1, int(batch_size))
+        self._conn = sqlite3.connect(str(self.database))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "PicksLogExporter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def offset(self, source: Union[str, Path]) -> int:
+        row = self._conn.execute("SELECT offset FROM export_state WHERE source = ?", (self._key(source),)).fetchone()
+        return int(row[0]) if row else 0
+
+    def export(self, source: Union[str, Path]) -> ExportResult:
+        path = Path(source)
+        key = self._key(path)
+        start = self.offset(path)
+        size = segment_size(path) if path.exists() else 0
+        restarted = size < start
+        if restarted:
+            logger.warning("Picks log %s shrank below exported offset %d; re-exporting from the start", key, start)
+            self._forget(key)
+            start = 0
+
+        counts = {"messages": 0, "signals": 0, "vehicles": 0, "skipped": 0}
+        end = start
+        batch: List[Tuple[int, Dict[str, Any]]] = []
+        if size > start:
+            for line_offset, line in _iter_lines(path, start):
+                end = line_offset + len(line)
+                entry = self._decode(line)
+                if entry is None:
+                    counts["skipped"] += 1
+                else:
+                    batch.append((line_offset, entry))
+                if len(batch) >= self._batch_size:
+                    self._write_batch(key, batch, end, counts)
+                    batch = []
+        if end > start:
+            self._write_batch(key, batch, end, counts)
+        if counts["skipped"]:
+            logger.warning("Skipped %d picks-log lines that failed to decode or validate", counts["skipped"])
+        return ExportResult(source=key, start_offset=start, end_offset=end, restarted=restarted, **counts)
+
+    @staticmethod
+    def _key(source: Union[str, Path]) -> str:
+        path = Path(source).resolve()
+        return str(path.with_suffix("") if path.suffix == ".gz" else path)
+
+    @staticmethod
+    def _decode(line: bytes) -> Optional[Dict[str, Any]]:
+        try:
+            entry = json.loads(line)
+            parsed = ParsedMessage.model_validate(entry.get("ai_parsed_signals") or {})
+        except (ValueError, AttributeError, ValidationError):
+            return None
+        return {"entry": entry, "parsed": parsed}
+
+    def _forget(self, key: str) -> None:
+        with self._conn:
+            message_ids = "SELECT id FROM messages WHERE source = ?"
+            signal_ids = f"SELECT id FROM signals WHERE message_id IN ({message_ids})"
+            self._conn.execute(f"DELETE FROM vehicles WHERE signal_id IN ({signal_ids})", (key,))
+            self._conn.execute(f"DELETE FROM signals WHERE message_id IN ({message_ids})", (key,))
+            self._conn.execute("DELETE FROM messages WHERE source = ?", (key,))
+            self._conn.execute("DELETE FROM export_state WHERE source = ?", (key,))
+
+    def _write_batch(
+        self, key: str, batch: List[Tuple[int, Dict[str, Any]]], end: int, counts: Dict[str, int]
+    ) -> None:
+        with self._conn:
+            for line_offset, item in batch:
+                self._insert(key, line_offset, item["entry"], item["parsed"], counts)
+            self._conn.execute(
+                "INSERT INTO export_state (source, offset) VALUES (?, ?) "
+                "ON CONFLICT (source) DO UPDATE SET offset = excluded.offset, exported_at = CURRENT_TIMESTAMP",
+                (key, end),
+            )
+
+    def _insert(
+        self, key: str, line_offset: int, entry: Mapping[str, Any], parsed: ParsedMessage, counts: Dict[str, int]
+    ) -> None:
+        timestamp = entry.get("timestamp")
+        cursor = self._conn.execute(
+            "INSERT INTO messages (source, offset, timestamp, day, author, message, message_url, contract_version, "
+            "status, provider, error, warnings) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                line_offset,
+                timestamp,
+                str(timestamp)[:10] if timestamp else None,
+                entry.get("author"),
+                entry.get("message"),
+                entry.get("message_url"),
+                parsed.contract_version,
+                parsed.meta.status,
+                parsed.meta.provider,
+                parsed.meta.error,
+                json.dumps(parsed.meta.warnings) if parsed.meta.warnings else None,
+            ),
+        )
+        message_id = cursor.lastrowid
+        counts["messages"] += 1
+        for position, signal in enumerate(parsed.signals):
+            cursor = self._conn.execute(
+                "INSERT INTO signals (message_id, position, ticker, action, confidence, reasoning, weight_percent, "
+                "urgency, sentiment, is_actionable) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    message_id,
+                    position,
+                    signal.ticker,
+                    signal.action,
+                    signal.confidence,
+                    signal.reasoning,
+                    signal.weight_percent,
+                    signal.urgency,
+                    signal.sentiment,
+                    int(signal.is_actionable),
+                ),
+            )
+            signal_id = cursor.lastrowid
+            counts["signals"] += 1
+            self._conn.executemany(
+                "INSERT INTO vehicles (signal_id, position, type, enabled, intent, side, option_type, strike, expiry, "
+                "quantity_hint) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        signal_id,
+                        vehicle_position,
+                        vehicle.type,
+                        int(vehicle.enabled),
+                        vehicle.intent,
+                        vehicle.side,
+                        vehicle.option_type,
+                        vehicle.strike,
+                        vehicle.expiry,
+                        vehicle.quantity_hint,
+                    )
+                    for vehicle_position, vehicle in enumerate(signal.vehicles)
+                ],
+            )
+            counts["vehicles"] += len(signal.vehicles)
+
+
+def export_picks_log(source: Union[str, Path], database: Union[str, Path], **kwargs: Any) -> ExportResult:
+    with PicksLogExporter(database, **kwargs) as exporter:
+        return exporter.export(source)
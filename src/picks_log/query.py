@@ -0,0 +1,275 @@
+"""Lazy filtered scans of the picks log: the flat file or a directory of daily segments."""
+
+import json
+import mmap
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from src.picks_log.segments import open_segment, picks_log_files
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("picks_log_query")
+
+ENTRY_FIELDS = ("timestamp", "author", "message", "message_url")
+META_FIELDS = ("status", "provider", "error", "warnings")
+SIGNAL_FIELDS = (
+    "ticker",
+    "action",
+    "confidence",
+    "reasoning",
+    "weight_percent",
+    "urgency",
+    "sentiment",
+    "is_actionable",
+    "vehicles",
+)
+QUERY_FIELDS = ENTRY_FIELDS + META_FIELDS + SIGNAL_FIELDS
+
+
+def _upper(values: Iterable[str]) -> FrozenSet[str]:
+    return frozenset(str(value).strip().upper() for value in values if str(value).strip())
+
+
+def _lower(values: Iterable[str]) -> FrozenSet[str]:
+    return frozenset(str(value).strip().lower() for value in values if str(value).strip())
+
+
+@dataclass(frozen=True)
+class PicksLogQuery:
+    """
+    Filters for `query_picks_log`; empty sets and `None` bounds match everything.
+
+    Ticker, action and confidence must hold for the same signal. Tickers and
+    actions compare upper-case, providers and statuses lower-case, as the parser
+    writes them; the byte prefilter relies on that casing.
+    """
+
+    tickers: FrozenSet[str] = frozenset()
+    actions: FrozenSet[str] = frozenset()
+    min_confidence: Optional[float] = None
+    max_confidence: Optional[float] = None
+    providers: FrozenSet[str] = frozenset()
+    statuses: FrozenSet[str] = frozenset()
+    authors: FrozenSet[str] = frozenset()
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        tickers: Iterable[str] = (),
+        actions: Iterable[str] = (),
+        min_confidence: Optional[float] = None,
+        max_confidence: Optional[float] = None,
+        providers: Iterable[str] = (),
+        statuses: Iterable[str] = (),
+        authors: Iterable[str] = (),
+    ) -> "PicksLogQuery":
+        return cls(
+            tickers=_upper(tickers),
+            actions=_upper(actions),
+            min_confidence=min_confidence,
+            max_confidence=max_confidence,
+            providers=_lower(providers),
+            statuses=_lower(statuses),
+            authors=frozenset(str(author) for author in authors),
+        )
+
+    @property
+    def filters_signals(self) -> bool:
+        return bool(self.tickers or self.actions) or self.min_confidence is not None or self.max_confidence is not None
+
+    def needles(self) -> List[Tuple[bytes, ...]]:
+        """Byte strings a matching line must contain: at least one from each group."""
+        groups = []
+        for values in (self.tickers, self.actions, self.providers, self.statuses, self.authors):
+            if values:
+                groups.append(tuple(json.dumps(value).encode("utf-8") for value in sorted(values)))
+        return groups
+
+    def matches_entry(self, entry: Mapping[str, Any]) -> bool:
+        meta = _meta(entry)
+        if self.providers and str(meta.get("provider") or "").lower() not in self.providers:
+            return False
+        if self.statuses and str(meta.get("status") or "").lower() not in self.statuses:
+            return False
+        if self.authors and str(entry.get("author")) not in self.authors:
+            return False
+        return True
+
+    def matches_signal(self, signal: Mapping[str, Any]) -> bool:
+        if self.tickers and str(signal.get("ticker") or "").upper() not in self.tickers:
+            return False
+        if self.actions and str(signal.get("action") or "").upper() not in self.actions:
+            return False
+        if self.min_confidence is not None or self.max_confidence is not None:
+            try:
+                confidence = float(signal.get("confidence"))
+            except (TypeError, ValueError):
+                return False
+            if self.min_confidence is not None and confidence < self.min_confidence:
+                return False
+            if self.max_confidence is not None and confidence > self.max_confidence:
+                return False
+        return True
+
+
+@dataclass
+class QueryStats:
+    lines: int = 0
+    prefiltered: int = 0
+    decoded: int = 0
+    malformed: int = 0
+    rows: int = 0
+    files: List[str] = field(default_factory=list)
+
+
+def _parsed(entry: Mapping[str, Any]) -> Mapping[str, Any]:
+    parsed = entry.get("ai_parsed_signals")
+    return parsed if isinstance(parsed, Mapping) else {}
+
+
+def _meta(entry: Mapping[str, Any]) -> Mapping[str, Any]:
+    meta = _parsed(entry).get("meta")
+    return meta if isinstance(meta, Mapping) else {}
+
+
+def iter_line_spans(mm: mmap.mmap) -> Iterator[Tuple[int, int]]:
+    """(start, end) of every complete line in `mm`, newline excluded."""
+    start = 0
+    size = len(mm)
+    while start < size:
+        end = mm.find(b"\n", start)
+        if end == -1:
+            return  # partial last line: a writer is mid-append
+        if end > start:
+            yield start, end
+        start = end + 1
+
+
+def _candidate_lines(
+    mm: mmap.mmap, needles: Sequence[Tuple[bytes, ...]], stats: QueryStats
+) -> Iterator[bytes]:
+    for start, end in iter_line_spans(mm):
+        stats.lines += 1
+        if all(any(mm.find(needle, start, end) != -1 for needle in group) for group in needles):
+            yield mm[start:end]
+        else:
+            stats.prefiltered += 1
+
+
+def _candidate_segment_lines(path: Path, needles: Sequence[Tuple[bytes, ...]], stats: QueryStats) -> Iterator[bytes]:
+    """Like `_candidate_lines` for a compressed segment, streamed through gzip instead of mapped."""
+    with open_segment(path) as f:
+        for line in f:
+            if not line.endswith(b"\n") or not line.strip():
+                continue
+            stats.lines += 1
+            if all(any(needle in line for needle in group) for group in needles):
+                yield line
+            else:
+                stats.prefiltered += 1
+
+
+def _decoded(lines: Iterable[bytes], stats: QueryStats) -> Iterator[Dict[str, Any]]:
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            stats.malformed += 1
+            continue
+        stats.decoded += 1
+        if isinstance(entry, dict):
+            yield entry
+
+
+def _rows(entries: Iterable[Mapping[str, Any]], query: PicksLogQuery) -> Iterator[Dict[str, Any]]:
+    for entry in entries:
+        if not query.matches_entry(entry):
+            continue
+        base = {name: entry.get(name) for name in ENTRY_FIELDS}
+        meta = _meta(entry)
+        base.update({name: meta.get(name) for name in META_FIELDS})
+        signals = _parsed(entry).get("signals")
+        signals = [s for s in signals if isinstance(s, Mapping)] if isinstance(signals, list) else []
+        if not signals and not query.filters_signals:
+            yield dict(base, **{name: None for name in SIGNAL_FIELDS})
+        for signal in signals:
+            if query.matches_signal(signal):
+                yield dict(base, **{name: signal.get(name) for name in SIGNAL_FIELDS})
+
+
+def _project(rows: Iterable[Dict[str, Any]], fields: Optional[Sequence[str]]) -> Iterator[Dict[str, Any]]:
+    if not fields:
+        yield from rows
+        return
+    for row in rows:
+        yield {name: row.get(name) for name in fields}
+
+
+def query_picks_log(
+    paths: Union[str, Path, Sequence[Union[str, Path]]],
+    query: PicksLogQuery = PicksLogQuery(),
+    *,
+    fields: Optional[Sequence[str]] = None,
+    limit: Optional[int] = None,
+    stats: Optional[QueryStats] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream one row per matching signal from memory-mapped picks-log files.
+
+    A directory in `paths` stands for its daily segments in day order; plain ones
+    are mapped like the flat log, `.gz` ones are inflated as a stream. Lines are
+    pulled lazily: a line lacking any byte string the filters require
+    is skipped without being copied or decoded. Rows carry `QUERY_FIELDS`, or only
+    `fields` when given. A partial trailing line (a concurrent append) is ignored.
+    """
+    unknown = [name for name in fields or () if name not in QUERY_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown picks-log fields: {', '.join(unknown)}")
+    if isinstance(paths, (str, Path)):
+        paths = [paths]
+    return _query([Path(path) for path in paths], query, fields, limit, stats if stats is not None else QueryStats())
+
+
+def _query(
+    paths: List[Path],
+    query: PicksLogQuery,
+    fields: Optional[Sequence[str]],
+    limit: Optional[int],
+    stats: QueryStats,
+) -> Iterator[Dict[str, Any]]:
+    if limit is not None and limit <= 0:
+        return
+    needles = query.needles()
+    remaining = limit
+    for path in (file for path in paths for file in picks_log_files(path)):
+        if not path.exists() or path.stat().st_size == 0:
+            continue
+        stats.files.append(str(path))
+        with _candidates(path, needles, stats) as lines:
+            rows = _project(_rows(_decoded(lines, stats), query), fields)
+            for row in rows:
+                stats.rows += 1
+                yield row
+                if remaining is not None:
+                    remaining -= 1
+                    if remaining <= 0:
+                        return
+    if stats.malformed:
+        logger.warning("Skipped %d malformed picks-log lines", stats.malformed)
+
+
+@contextmanager
+def _candidates(path: Path, needles: Sequence[Tuple[bytes, ...]], stats: QueryStats) -> Iterator[Iterator[bytes]]:
+    if path.suffix == ".gz":
+        lines = _candidate_segment_lines(path, needles, stats)
+        try:
+            yield lines
+        finally:
+            lines.close()
+        return
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield _candidate_lines(mm, needles, stats)
@@ -0,0 +1,461 @@
+"""Daily picks-log segments: closed days are block-compressed and indexed by ticker and author."""
+
+import bisect
+import gzip
+import json
+import os
+import re
+import threading
+import zlib
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from src.picks_log.writer import lock_file, unlock_file
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("picks_log_segments")
+
+COMPRESSIONS = ("gzip", "none")
+_SEGMENT_NAME = re.compile(r"^picks-(\d{4}-\d{2}-\d{2})\.jsonl(\.gz)?$")
+_INDEX_VERSION = 1
+
+
+def segment_date(entry: Mapping[str, Any], default: date) -> date:
+    """Day an entry belongs to, from its ISO `timestamp`."""
+    try:
+        return date.fromisoformat(str(entry.get("timestamp") or "")[:10])
+    except ValueError:
+        return default
+
+
+def entry_tickers(entry: Mapping[str, Any]) -> List[str]:
+    parsed = entry.get("ai_parsed_signals")
+    signals = parsed.get("signals") if isinstance(parsed, Mapping) else None
+    if not isinstance(signals, list):
+        return []
+    tickers = {str(s.get("ticker") or "").upper() for s in signals if isinstance(s, Mapping)}
+    return sorted(t for t in tickers if t)
+
+
+@dataclass(frozen=True)
+class SegmentIndex:
+    """
+    Sidecar for one closed segment.
+
+    `entries[i]` is the (offset, length) of line i in the uncompressed segment;
+    `tickers`/`authors` map to entry numbers. Compressed segments are a series of
+    independent gzip members, one per block, and `blocks` lists each block's
+    (uncompressed start, compressed start) so a line is read by inflating one block.
+    """
+
+    segment: str
+    day: date
+    size: int
+    entries: List[Tuple[int, int]]
+    tickers: Dict[str, List[int]]
+    authors: Dict[str, List[int]]
+    blocks: List[Tuple[int, int]]
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "version": _INDEX_VERSION,
+            "segment": self.segment,
+            "date": self.day.isoformat(),
+            "size": self.size,
+            "entries": self.entries,
+            "tickers": self.tickers,
+            "authors": self.authors,
+            "blocks": self.blocks,
+        }
+
+    @classmethod
+    def from_json(cls, payload: Mapping[str, Any]) -> "SegmentIndex":
+        if payload.get("version") != _INDEX_VERSION:
+            raise ValueError(f"Unsupported segment index version: {payload.get('version')}")
+        return cls(
+            segment=payload["segment"],
+            day=date.fromisoformat(payload["date"]),
+            size=int(payload["size"]),
+            entries=[tuple(entry) for entry in payload["entries"]],
+            tickers=payload["tickers"],
+            authors=payload["authors"],
+            blocks=[tuple(block) for block in payload["blocks"]],
+        )
+
+
+class SegmentedPicksLog:
+    """
+    Picks log stored as one JSONL segment per day under `directory`.
+
+    Appends go to today's open segment under the same file lock as the flat log,
+    so several processes can share it. Once a day has passed its segment is
+    closed on a background thread, started by the first append of the new day
+    so callers on the event loop never wait on it: rewritten as block-compressed gzip (any gzip reader still reads it
+    whole) with a `.idx.json` sidecar, and the plain file is removed. `find`
+    answers ticker/author/date-range lookups from the sidecars, inflating only
+    the blocks holding matches; open segments are scanned.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        *,
+        compression: str = "gzip",
+        block_size: int = 256 * 1024,
+        today: Callable[[], date] = date.today,
+    ):
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unsupported picks-log compression: {compression}")
+        self.directory = Path(directory)
+        self._compression = compression
+        self._block_size = max(1, int(block_size))
+        self._today = today
+        self._lock = threading.Lock()
+        self._open_day: Optional[date] = None
+        self._file: Optional[BinaryIO] = None
+        self._checked_day: Optional[date] = None
+        self._closer: Optional[threading.Thread] = None
+        self._close_lock = threading.Lock()
+
+    def segment_path(self, day: date) -> Path:
+        return self.directory / f"picks-{day.isoformat()}.jsonl"
+
+    def append(self, entries: Sequence[Mapping[str, Any]]) -> None:
+        today = self._today()
+        by_day: Dict[date, List[str]] = {}
+        for entry in entries:
+            by_day.setdefault(segment_date(entry, today), []).append(json.dumps(entry) + "\n")
+        with self._lock:
+            for day, lines in sorted(by_day.items()):
+                self._append_day(day, "".join(lines).encode("utf-8"))
+            if self._checked_day != today:
+                self._checked_day = today
+                self._start_closer()
+
+    def sync(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Wait for any segment close in progress, then close today's segment file."""
+        closer = self._closer
+        if closer is not None:
+            closer.join()
+        with self._lock:
+            self._close_file()
+
+    def close_due(self) -> List[Path]:
+        """Close every open segment older than today; returns the sidecars written."""
+        today = self._today()
+        written = []
+        with self._close_lock:
+            for day, (plain, _) in self._segments().items():
+                if day >= today or plain is None or self._indexed_plain(day, plain) is not None:
+                    continue
+                with self._lock:
+                    if self._open_day == day:
+                        self._close_file()
+                index_path = self._close_segment(day, plain)
+                if index_path is not None:
+                    written.append(index_path)
+        return written
+
+    def find(
+        self,
+        *,
+        ticker: Optional[str] = None,
+        author: Optional[str] = None,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Entries in day order matching every given filter (`start`/`end` inclusive)."""
+        ticker = ticker.upper() if ticker else None
+        for day, (plain, compressed) in self._segments().items():
+            if (start and day < start) or (end and day > end):
+                continue
+            if compressed is not None:
+                index = self._load_index(day)
+                if index is None:
+                    yield from self._scan(compressed, ticker, author)
+                else:
+                    yield from self._read_entries(compressed, index, _matching(index, ticker, author))
+            if plain is not None:
+                # Lines appended after the day was compressed, or a still-open segment.
+                index = self._indexed_plain(day, plain) if compressed is None else None
+                if index is None:
+                    yield from self._scan(plain, ticker, author)
+                else:
+                    yield from self._read_entries(plain, index, _matching(index, ticker, author))
+
+    def _start_closer(self) -> None:
+        self._closer = threading.Thread(target=self._close_due_logged, name="picks-log-segment-close", daemon=True)
+        self._closer.start()
+
+    def _close_due_logged(self) -> None:
+        try:
+            self.close_due()
+        except Exception:
+            logger.exception("Closing picks-log segments failed")
+
+    def _append_day(self, day: date, data: bytes) -> None:
+        f = self._open(day)
+        lock_file(f)
+        if os.fstat(f.fileno()).st_nlink == 0:
+            # Another process closed this day's segment under us; late lines go to a fresh file.
+            unlock_file(f)
+            self._close_file()
+            f = self._open(day)
+            lock_file(f)
+        try:
+            f.seek(0, os.SEEK_END)
+            f.write(data)
+            f.flush()
+        finally:
+            unlock_file(f)
+
+    def _open(self, day: date) -> BinaryIO:
+        if self._open_day != day or self._file is None:
+            self._close_file()
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._file = self.segment_path(day).open("ab")
+            self._open_day = day
+        return self._file
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        self._file = None
+        self._open_day = None
+
+    def _segments(self) -> Dict[date, Tuple[Optional[Path], Optional[Path]]]:
+        return list_segments(self.directory)
+
+    def _indexed_plain(self, day: date, plain: Path) -> Optional[SegmentIndex]:
+        """Sidecar of an uncompressed closed segment, if it still covers the whole file."""
+        if not self._index_path(day).exists():
+            return None
+        index = self._load_index(day)
+        if index is None or index.blocks or index.size != plain.stat().st_size:
+            return None
+        return index
+
+    def _index_path(self, day: date) -> Path:
+        return self.directory / f"picks-{day.isoformat()}.idx.json"
+
+    def _close_segment(self, day: date, path: Path) -> Optional[Path]:
+        # Lock the plain segment so a concurrent closer or late appender waits for us.
+        try:
+            f = path.open("r+b")
+        except FileNotFoundError:
+            return None  # another process closed it first
+        try:
+            lock_file(f)
+            try:
+                data = path.read_bytes()
+                compressed = path.with_name(path.name + ".gz")
+                if compressed.exists():
+                    # Late lines for a day that was already compressed are merged into it.
+                    data = gzip.decompress(compressed.read_bytes()) + data
+                index_path = self._write_closed(day, data)
+                if self._compression == "gzip":
+                    path.unlink()
+            finally:
+                unlock_file(f)
+        finally:
+            f.close()
+        logger.info("Closed picks-log segment %s (%d bytes)", path.name, len(data))
+        return index_path
+
+    def _write_closed(self, day: date, data: bytes) -> Path:
+        entries: List[Tuple[int, int]] = []
+        tickers: Dict[str, List[int]] = {}
+        authors: Dict[str, List[int]] = {}
+        offset = 0
+        for line in data.splitlines(keepends=True):
+            if line.strip():
+                number = len(entries)
+                entries.append((offset, len(line)))
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    entry = {}
+                for ticker in entry_tickers(entry):
+                    tickers.setdefault(ticker, []).append(number)
+                if entry.get("author"):
+                    authors.setdefault(str(entry["author"]), []).append(number)
+            offset += len(line)
+
+        segment_path = self.segment_path(day)
+        blocks: List[Tuple[int, int]] = []
+        if self._compression == "gzip":
+            segment_path = segment_path.with_name(segment_path.name + ".gz")
+            payload = bytearray()
+            for block_start, block in self._blocks(data, entries):
+                blocks.append((block_start, len(payload)))
+                payload += gzip.compress(block, mtime=0)
+            _write_atomic(segment_path, bytes(payload))
+        index = SegmentIndex(segment_path.name, day, len(data), entries, tickers, authors, blocks)
+        index_path = self._index_path(day)
+        _write_atomic(index_path, json.dumps(index.to_json(), separators=(",", ":")).encode("utf-8"))
+        return index_path
+
+    def _blocks(self, data: bytes, entries: List[Tuple[int, int]]) -> Iterator[Tuple[int, bytes]]:
+        """Split at line boundaries into blocks of about `block_size` bytes."""
+        start = 0
+        for offset, length in entries:
+            end = offset + length
+            if end - start >= self._block_size:
+                yield start, data[start:end]
+                start = end
+        if start < len(data):
+            yield start, data[start:]
+
+    def _load_index(self, day: date) -> Optional[SegmentIndex]:
+        try:
+            return SegmentIndex.from_json(json.loads(self._index_path(day).read_bytes()))
+        except (OSError, ValueError, KeyError) as exc:
+            logger.warning("Picks-log index for %s unusable, scanning instead: %s", day, exc)
+            return None
+
+    def _read_entries(self, path: Path, index: SegmentIndex, numbers: Iterable[int]) -> Iterator[Dict[str, Any]]:
+        numbers = list(numbers)
+        if not numbers:
+            return
+        with path.open("rb") as f:
+            if not index.blocks:
+                for number in numbers:
+                    offset, length = index.entries[number]
+                    f.seek(offset)
+                    yield json.loads(f.read(length))
+                return
+            starts = [block[0] for block in index.blocks]
+            cached: Tuple[int, bytes] = (-1, b"")
+            for number in numbers:
+                offset, length = index.entries[number]
+                block_number = bisect.bisect_right(starts, offset) - 1
+                if cached[0] != block_number:
+                    f.seek(index.blocks[block_number][1])
+                    cached = (block_number, _inflate_member(f))
+                relative = offset - index.blocks[block_number][0]
+                yield json.loads(cached[1][relative : relative + length])
+
+    def _scan(self, path: Path, ticker: Optional[str], author: Optional[str]) -> Iterator[Dict[str, Any]]:
+        with open_segment(path) as f:
+            for line in f:
+                if not line.endswith(b"\n") or not line.strip():
+                    continue  # blank, or a line still being appended
+                entry = json.loads(line)
+                if ticker and ticker not in entry_tickers(entry):
+                    continue
+                if author and str(entry.get("author")) != author:
+                    continue
+                yield entry
+
+
+def list_segments(directory: Union[str, Path]) -> Dict[date, Tuple[Optional[Path], Optional[Path]]]:
+    """(plain, compressed) segment paths per day under `directory`, in day order."""
+    directory = Path(directory)
+    if not directory.is_dir():
+        return {}
+    found: Dict[date, List[Optional[Path]]] = {}
+    for path in directory.iterdir():
+        match = _SEGMENT_NAME.match(path.name)
+        if match:
+            pair = found.setdefault(date.fromisoformat(match.group(1)), [None, None])
+            pair[1 if match.group(2) else 0] = path
+    return {day: (pair[0], pair[1]) for day, pair in sorted(found.items())}
+
+
+def picks_log_files(path: Union[str, Path], *, include_unmerged: bool = True) -> List[Path]:
+    """
+    Files holding the picks log at `path`: the path itself for a file, or each
+    segment of a segment directory in day order, a day's compressed segment
+    before its plain one. Without `include_unmerged`, a plain segment is skipped
+    while its day also has a compressed one (late lines not merged in yet).
+    """
+    path = Path(path)
+    if not path.is_dir():
+        return [path]
+    files = []
+    for plain, compressed in list_segments(path).values():
+        if compressed is not None:
+            files.append(compressed)
+        if plain is not None and (include_unmerged or compressed is None):
+            files.append(plain)
+    return files
+
+
+def open_segment(path: Union[str, Path]) -> BinaryIO:
+    """Open a picks-log file for reading uncompressed bytes, inflating `.gz` segments."""
+    path = Path(path)
+    return gzip.open(path, "rb") if path.suffix == ".gz" else path.open("rb")
+
+
+def segment_size(path: Union[str, Path]) -> int:
+    """Uncompressed size of a picks-log file; compressed segments use their sidecar when it matches."""
+    path = Path(path)
+    if path.suffix != ".gz":
+        return path.stat().st_size
+    match = _SEGMENT_NAME.match(path.name)
+    if match:
+        try:
+            payload = json.loads((path.parent / f"picks-{match.group(1)}.idx.json").read_bytes())
+            if payload.get("version") == _INDEX_VERSION and payload.get("segment") == path.name:
+                return int(payload["size"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+    with gzip.open(path, "rb") as f:
+        return f.seek(0, os.SEEK_END)
+
+
+def picks_log_location(config: Mapping[str, Any], default_directory: Path, flat_path: Path) -> Path:
+    """Where the service writes the picks log: its segment directory when segments are enabled, else the flat file."""
+    segments_config = dict(config.get("segments") or {})
+    if not segments_config.get("enabled"):
+        return Path(flat_path)
+    return Path(segments_config.get("directory") or default_directory)
+
+
+def _matching(index: SegmentIndex, ticker: Optional[str], author: Optional[str]) -> List[int]:
+    matches = set(range(len(index.entries)))
+    if ticker:
+        matches &= set(index.tickers.get(ticker, ()))
+    if author:
+        matches &= set(index.authors.get(author, ()))
+    return sorted(matches)
+
+
+def _inflate_member(f: BinaryIO, chunk_size: int = 64 * 1024) -> bytes:
+    """Inflate the single gzip member starting at the file's position."""
+    inflater = zlib.decompressobj(wbits=31)
+    out = bytearray()
+    while not inflater.eof:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        out += inflater.decompress(chunk)
+    return bytes(out)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with tmp_path.open("wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def build_segmented_picks_log(config: Mapping[str, Any], default_directory: Path) -> Optional[SegmentedPicksLog]:
+    segments_config = dict(config.get("segments") or {})
+    if not segments_config.get("enabled"):
+        return None
+    return SegmentedPicksLog(
+        segments_config.get("directory") or default_directory,
+        compression=str(segments_config.get("compression") or "gzip"),
+        block_size=int(segments_config.get("block_size_kb", 256)) * 1024,
+    )
@@ -0,0 +1,234 @@
+"""Picks-log appends: locked so several processes can share the file, batched on a background thread."""
+
+import json
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, List, Mapping, Optional, Protocol, Sequence, Union
+
+from src.observability.metrics import REGISTRY
+from src.utils.logger import setup_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+logger = setup_logger("picks_log_writer")
+
+QUEUE_DEPTH = REGISTRY.gauge("queue_depth", "Items waiting in an in-process queue", ["queue"])
+
+FSYNC_POLICIES = ("never", "batch", "interval")
+_STOP = object()
+
+
+def lock_file(f: BinaryIO) -> None:
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def unlock_file(f: BinaryIO) -> None:
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def append_locked(f: BinaryIO, data: bytes) -> None:
+    """Append `data` in one write under an exclusive lock, so concurrent writers never interleave lines."""
+    lock_file(f)
+    try:
+        f.seek(0, os.SEEK_END)
+        f.write(data)
+        f.flush()
+    finally:
+        unlock_file(f)
+
+
+def append_entries(path: Union[str, Path], entries: Sequence[Mapping[str, Any]]) -> None:
+    """Synchronous locked append of JSONL `entries`."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("ab") as f:
+        append_locked(f, _encode(entries))
+
+
+def _encode(entries: Sequence[Mapping[str, Any]]) -> bytes:
+    return "".join(json.dumps(entry) + "\n" for entry in entries).encode("utf-8")
+
+
+class PicksLogStore(Protocol):
+    def append(self, entries: Sequence[Mapping[str, Any]]) -> None: ...
+
+    def sync(self) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class JsonlPicksLog:
+    """The flat JSONL picks log, kept open between locked appends."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._file: Optional[BinaryIO] = None
+
+    def append(self, entries: Sequence[Mapping[str, Any]]) -> None:
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("ab")
+            append_locked(self._file, _encode(entries))
+
+    def sync(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+            self._file = None
+
+
+class PicksLogWriter:
+    """
+    Queue picks-log entries and append them to `store` from a daemon thread.
+
+    `write` only enqueues, so the event loop never touches the disk; JSON encoding
+    happens on the writer thread too. A batch is written once `batch_size` entries
+    are queued or `flush_interval_seconds` after its first entry, as one locked
+    append; a path `store` means the flat JSONL log. `fsync` controls durability:
+    `never` leaves it to the OS, `batch` fsyncs every batch, `interval` at most
+    every `fsync_interval_seconds`. `close` drains everything queued before returning.
+    """
+
+    def __init__(
+        self,
+        store: Union[str, Path, PicksLogStore],
+        *,
+        batch_size: int = 64,
+        flush_interval_seconds: float = 0.5,
+        fsync: str = "batch",
+        fsync_interval_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unsupported fsync policy: {fsync}")
+        self.store: PicksLogStore = JsonlPicksLog(store) if isinstance(store, (str, Path)) else store
+        self._batch_size = max(1, int(batch_size))
+        self._flush_interval_seconds = max(0.0, float(flush_interval_seconds))
+        self._fsync = fsync
+        self._fsync_interval_seconds = max(0.0, float(fsync_interval_seconds))
+        self._clock = clock
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        QUEUE_DEPTH.set_function(self._queue.qsize, queue="picks_log")
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._last_fsync = clock()
+        self._closed = False
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        with self._start_lock:
+            if self.running or self._closed:
+                return
+            self._thread = threading.Thread(target=self._run, name="picks-log-writer", daemon=True)
+            self._thread.start()
+
+    def write(self, entry: Mapping[str, Any]) -> None:
+        if self._closed:
+            logger.warning("Picks log writer is closed; appending synchronously")
+            self.store.append([entry])
+            return
+        self._queue.put(entry)
+        if not self.running:
+            self.start()
+
+    def flush(self) -> None:
+        """Block until every entry queued so far is on disk."""
+        if self.running:
+            self._queue.join()
+
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self.running:
+            self._queue.put(_STOP)
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch: List[Mapping[str, Any]] = []
+            first = self._queue.get()
+            if first is _STOP:
+                self._queue.task_done()
+                break
+            batch.append(first)
+            deadline = self._clock() + self._flush_interval_seconds
+            while len(batch) < self._batch_size:
+                remaining = deadline - self._clock()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    self._queue.task_done()
+                    stopping = True
+                    break
+                batch.append(item)
+            self._write_batch(batch)
+        self._close_store()
+
+    def _write_batch(self, batch: List[Mapping[str, Any]]) -> None:
+        try:
+            self.store.append(batch)
+            if self._fsync == "batch" or (
+                self._fsync == "interval" and self._clock() - self._last_fsync >= self._fsync_interval_seconds
+            ):
+                self.store.sync()
+                self._last_fsync = self._clock()
+        except Exception as exc:
+            logger.error("Failed to append %d picks-log entries: %s", len(batch), exc)
+            self.store.close()  # reopened on the next batch
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+    def _close_store(self) -> None:
+        try:
+            if self._fsync != "never":
+                self.store.sync()
+            self.store.close()
+        except OSError as exc:
+            logger.warning("Failed to close picks log: %s", exc)
+
+
+def build_picks_log_writer(
+    config: Mapping[str, Any], store: Union[str, Path, PicksLogStore]
+) -> Optional[PicksLogWriter]:
+    writer_config: Dict[str, Any] = dict(config.get("background_writer") or {})
+    if not writer_config.get("enabled"):
+        return None
+    return PicksLogWriter(
+        store,
+        batch_size=int(writer_config.get("batch_size", 64)),
+        flush_interval_seconds=float(writer_config.get("flush_interval_seconds", 0.5)),
+        fsync=str(writer_config.get("fsync") or "batch"),
+        fsync_interval_seconds=float(writer_config.get("fsync_interval_seconds", 5.0)),
+    )
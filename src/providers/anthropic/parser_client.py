@@ -1,19 +1,98 @@
 """Anthropic client wrapper for parser completions."""
 
-from typing import Any
+import json
+from typing import Any, Dict, Iterator, List, Union
+
+from src.providers.anthropic.parser_contract import FAST_PARSER_TOOL_NAME, fast_parser_tool, fast_parser_tool_choice
+from src.providers.fast_contract import FAST_PARSER_SYSTEM_INSTRUCTION
+from src.providers.prompt_layout import PromptInput, PromptParts
+from src.providers.usage import CompletionUsage, anthropic_usage, report_usage
 
 
 def request_parser_completion(
+    client: Any,
+    model: str,
+    prompt: PromptInput,
+    max_tokens: int,
+    temperature: float,
+) -> str:
+    response = client.messages.create(
+        model=model,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        messages=[{"role": "user", "content": user_content(prompt)}],
+    )
+    report_usage("anthropic", model, anthropic_usage(response))
+    return response.content[0].text.strip()
+
+
+def stream_parser_completion(
+    client: Any,
+    model: str,
+    prompt: PromptInput,
+    max_tokens: int,
+    temperature: float,
+) -> Iterator[str]:
+    """Yield text deltas from a streamed Messages API call."""
+    stream = client.messages.create(
+        model=model,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        messages=[{"role": "user", "content": user_content(prompt)}],
+        stream=True,
+    )
+    usage = None
+    for event in stream:
+        event_type = getattr(event, "type", None)
+        if event_type == "message_start":
+            usage = anthropic_usage(getattr(event, "message", None))
+        elif event_type == "message_delta" and usage is not None:
+            output_tokens = getattr(getattr(event, "usage", None), "output_tokens", None)
+            if output_tokens is not None:
+                usage = CompletionUsage(
+                    input_tokens=usage.input_tokens,
+                    output_tokens=int(output_tokens),
+                    cached_input_tokens=usage.cached_input_tokens,
+                    cache_write_tokens=usage.cache_write_tokens,
+                )
+        elif event_type == "content_block_delta":
+            text = getattr(getattr(event, "delta", None), "text", None)
+            if text:
+                yield text
+    report_usage("anthropic", model, usage)
+
+
+def request_fast_parser_completion(
     client: Any,
     model: str,
     prompt: str,
     max_tokens: int,
     temperature: float,
 ) -> str:
+    """Fast-stage triage through a forced tool call; returns the tool input as JSON text."""
     response = client.messages.create(
         model=model,
         max_tokens=max_tokens,
         temperature=temperature,
+        system=FAST_PARSER_SYSTEM_INSTRUCTION,
+        tools=[fast_parser_tool()],
+        tool_choice=fast_parser_tool_choice(),
         messages=[{"role": "user", "content": prompt}],
     )
-    return response.content[0].text.strip()
+    report_usage("anthropic", model, anthropic_usage(response))
+    for block in getattr(response, "content", None) or []:
+        if getattr(block, "type", None) == "tool_use" and getattr(block, "name", None) == FAST_PARSER_TOOL_NAME:
+            return json.dumps(block.input)
+    raise ValueError("Anthropic fast response contained no tool_use block")
+
+
+def user_content(prompt: PromptInput) -> Union[str, List[Dict[str, Any]]]:
+    """Plain prompts pass through; split prompts mark the static prefix as a cache breakpoint."""
+    if not isinstance(prompt, PromptParts) or not prompt.static_prefix:
+        return str(prompt)
+    blocks: List[Dict[str, Any]] = [
+        {"type": "text", "text": prompt.static_prefix, "cache_control": {"type": "ephemeral"}},
+    ]
+    if prompt.dynamic_suffix:
+        blocks.append({"type": "text", "text": prompt.dynamic_suffix})
+    return blocks
@@ -0,0 +1,20 @@
+"""Anthropic fast-stage contract: a single forced tool whose input is the fast parser schema."""
+
+from typing import Any, Dict
+
+from src.providers.fast_contract import FAST_PARSER_JSON_SCHEMA
+
+
+FAST_PARSER_TOOL_NAME = "record_fast_parse"
+
+
+def fast_parser_tool() -> Dict[str, Any]:
+    return {
+        "name": FAST_PARSER_TOOL_NAME,
+        "description": "Record the trading intent and primary ticker extracted from the message.",
+        "input_schema": FAST_PARSER_JSON_SCHEMA,
+    }
+
+
+def fast_parser_tool_choice() -> Dict[str, Any]:
+    return {"type": "tool", "name": FAST_PARSER_TOOL_NAME}
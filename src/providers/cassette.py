@@ -0,0 +1,207 @@
+"""Record provider completions with their timing, and replay them offline keyed by prompt hash."""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from src.providers.prompt_layout import PromptInput, prompt_text
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("provider_cassette")
+
+CASSETTE_MODES = ("off", "record", "replay")
+# Rendered prompts carry the wall-clock time; mask it so a replay run hashes to the recorded key.
+_VOLATILE_PROMPT_PATTERNS = (re.compile(r"\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?: [A-Z]{2,5})?"),)
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode when no recording matches the request."""
+
+
+@dataclass(frozen=True)
+class CassetteRecord:
+    """
+    One recorded completion. The prompt itself is not stored, only its hash; `chunks`
+    holds (seconds since request, text) pairs for streamed completions.
+    """
+
+    key: str
+    provider: str
+    model: str
+    stage: str
+    response: str
+    latency_seconds: float
+    first_chunk_seconds: Optional[float] = None
+    chunks: List[Tuple[float, str]] = field(default_factory=list)
+
+
+def cassette_key(provider: str, model: str, stage: str, prompt: PromptInput) -> str:
+    text = prompt_text(prompt)
+    for pattern in _VOLATILE_PROMPT_PATTERNS:
+        text = pattern.sub("<time>", text)
+    digest = hashlib.sha256("\0".join((provider, model, stage, text)).encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+class ProviderCassette:
+    """
+    Append-only JSONL cassette of provider completions.
+
+    `record` passes calls through to the provider and appends each response with its
+    latency (and per-chunk offsets when streamed). `replay` never calls the provider:
+    it answers from the recording with the same key, cycling through repeats in
+    recorded order, and waits out the recorded latency divided by `speed`
+    (`speed <= 0` replays instantly). Records are indexed by byte offset and read on
+    demand, so large cassettes are not held in memory.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        mode: str = "replay",
+        speed: float = 1.0,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unsupported cassette mode: {mode}")
+        self.path = Path(path)
+        self.mode = mode
+        self.speed = float(speed)
+        self._sleep = sleep
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._index: Dict[str, List[int]] = {}
+        self._cursors: Dict[str, int] = {}
+        if self.path.exists():
+            self._load_index()
+        elif mode == "replay":
+            raise FileNotFoundError(f"Cassette not found: {self.path}")
+
+    def __len__(self) -> int:
+        return sum(len(offsets) for offsets in self._index.values())
+
+    @property
+    def providers(self) -> List[str]:
+        """Providers present in the cassette, most-recorded first."""
+        counts: Dict[str, int] = {}
+        for offsets in self._index.values():
+            record = self._read(offsets[0])
+            counts[record.provider] = counts.get(record.provider, 0) + len(offsets)
+        return sorted(counts, key=lambda name: -counts[name])
+
+    def complete(
+        self,
+        provider: str,
+        model: str,
+        stage: str,
+        prompt: PromptInput,
+        call: Callable[[], str],
+    ) -> str:
+        key = cassette_key(provider, model, stage, prompt)
+        if self.mode == "replay":
+            record = self._next_record(key, provider, model, stage)
+            self._wait(record.latency_seconds)
+            return record.response
+
+        started = self._clock()
+        response = call()
+        self._append(CassetteRecord(key, provider, model, stage, response, self._clock() - started))
+        return response
+
+    def stream(
+        self,
+        provider: str,
+        model: str,
+        stage: str,
+        prompt: PromptInput,
+        call: Callable[[], Iterator[str]],
+    ) -> Iterator[str]:
+        key = cassette_key(provider, model, stage, prompt)
+        if self.mode == "replay":
+            return self._replay_stream(self._next_record(key, provider, model, stage))
+        return self._record_stream(key, provider, model, stage, call)
+
+    def _replay_stream(self, record: CassetteRecord) -> Iterator[str]:
+        chunks = record.chunks or [(record.latency_seconds, record.response)]
+        elapsed = 0.0
+        for offset, chunk in chunks:
+            self._wait(offset - elapsed)
+            elapsed = offset
+            yield chunk
+        self._wait(record.latency_seconds - elapsed)
+
+    def _record_stream(
+        self, key: str, provider: str, model: str, stage: str, call: Callable[[], Iterator[str]]
+    ) -> Iterator[str]:
+        started = self._clock()
+        chunks: List[Tuple[float, str]] = []
+        for chunk in call():
+            chunks.append((round(self._clock() - started, 4), chunk))
+            yield chunk
+        self._append(
+            CassetteRecord(
+                key,
+                provider,
+                model,
+                stage,
+                "".join(chunk for _, chunk in chunks),
+                self._clock() - started,
+                first_chunk_seconds=chunks[0][0] if chunks else None,
+                chunks=chunks,
+            )
+        )
+
+    def _next_record(self, key: str, provider: str, model: str, stage: str) -> CassetteRecord:
+        with self._lock:
+            offsets = self._index.get(key)
+            if not offsets:
+                raise CassetteMissError(f"No {provider}/{model} {stage} recording for prompt hash {key}")
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = cursor + 1
+        return self._read(offsets[cursor % len(offsets)])
+
+    def _wait(self, seconds: float) -> None:
+        if self.speed > 0 and seconds > 0:
+            self._sleep(seconds / self.speed)
+
+    def _append(self, record: CassetteRecord) -> None:
+        payload = asdict(record)
+        payload["latency_seconds"] = round(record.latency_seconds, 4)
+        if not record.chunks:
+            del payload["chunks"], payload["first_chunk_seconds"]
+        line = json.dumps(payload, separators=(",", ":")) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("ab") as f:
+                offset = f.tell()
+                f.write(line.encode("utf-8"))
+            self._index.setdefault(record.key, []).append(offset)
+        logger.debug("Recorded %s/%s %s completion (%.3fs)", record.provider, record.model, record.stage, record.latency_seconds)
+
+    def _read(self, offset: int) -> CassetteRecord:
+        with self.path.open("rb") as f:
+            f.seek(offset)
+            payload = json.loads(f.readline())
+        payload["chunks"] = [tuple(chunk) for chunk in payload.get("chunks", [])]
+        return CassetteRecord(**payload)
+
+    def _load_index(self) -> None:
+        with self.path.open("rb") as f:
+            offset = 0
+            for line in f:
+                if line.strip():
+                    try:
+                        key = json.loads(line)["key"]
+                    except (ValueError, KeyError):
+                        logger.warning("Skipping unreadable cassette line at byte %d in %s", offset, self.path)
+                    else:
+                        self._index.setdefault(key, []).append(offset)
+                offset += len(line)
+        logger.info("Loaded cassette %s (%d recordings, mode=%s)", self.path, len(self), self.mode)
@@ -10,20 +10,28 @@ def build_provider_client(
     anthropic_api_key: Optional[str] = None,
     openai_api_key: Optional[str] = None,
     google_api_key: Optional[str] = None,
+    model: Optional[str] = None,
+    timeout_seconds: Optional[float] = None,
 ) -> Optional[Any]:
+    """
+    Build the SDK client for `provider`; `model` binds Gemini clients to a non-default model.
+    `timeout_seconds` bounds each Anthropic/OpenAI request; the Gemini client takes
+    no client-wide timeout, so it keeps the SDK default.
+    """
     normalized_provider = (provider or "").lower().strip()
+    timeout_kwargs = {"timeout": float(timeout_seconds)} if timeout_seconds else {}
 
     if normalized_provider == "anthropic":
         if not anthropic_api_key:
             return None
         anthropic_module = _import_optional_dependency("anthropic")
-        return anthropic_module.Anthropic(api_key=anthropic_api_key)
+        return anthropic_module.Anthropic(api_key=anthropic_api_key, **timeout_kwargs)
 
     if normalized_provider == "openai":
         if not openai_api_key:
             return None
         openai_module = _import_optional_dependency("openai")
-        return openai_module.OpenAI(api_key=openai_api_key)
+        return openai_module.OpenAI(api_key=openai_api_key, **timeout_kwargs)
 
     if normalized_provider == "google":
         if not google_api_key:
@@ -31,7 +39,7 @@ def build_provider_client(
         genai = _import_optional_dependency("google.generativeai")
 
         genai.configure(api_key=google_api_key)
-        model_name = config["google"]["model"]
+        model_name = model or config["google"]["model"]
         return genai.GenerativeModel(model_name)
 
     return None
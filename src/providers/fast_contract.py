@@ -0,0 +1,24 @@
+"""Provider-neutral fast-stage (intent triage) contract shared by every provider's structured output."""
+
+from typing import Any, Dict
+
+
+FAST_PARSER_SYSTEM_INSTRUCTION = (
+    "You classify one trading message into actionable intent and primary ticker. "
+    "Return only JSON matching the provided schema exactly."
+)
+
+FAST_PARSER_JSON_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "additionalProperties": False,
+    "required": ["status", "confidence", "primary_ticker", "vehicle_hint", "action", "evidence_text", "sizing_text"],
+    "properties": {
+        "status": {"type": "string", "enum": ["actionable", "no_action", "ambiguous"]},
+        "confidence": {"type": "number", "minimum": 0.0, "maximum": 1.0},
+        "primary_ticker": {"type": ["string", "null"]},
+        "vehicle_hint": {"type": "string", "enum": ["stock", "option", "mixed", "unknown"]},
+        "action": {"type": "string", "enum": ["BUY", "SELL", "NONE"]},
+        "evidence_text": {"type": "string"},
+        "sizing_text": {"type": "string"},
+    },
+}
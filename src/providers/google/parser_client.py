@@ -1,8 +1,35 @@
 """Google client wrapper for parser completions."""
 
-from typing import Any
+from typing import Any, Iterator
 
+from src.providers.google.parser_contract import parser_fast_generation_config
+from src.providers.prompt_layout import PromptInput, prompt_text
+from src.providers.usage import google_usage, report_usage
 
-def request_parser_completion(client: Any, prompt: str) -> str:
-    response = client.generate_content(prompt)
+
+def request_parser_completion(client: Any, prompt: PromptInput) -> str:
+    response = client.generate_content(prompt_text(prompt))
+    report_usage("google", str(getattr(client, "model_name", "") or ""), google_usage(response))
+    return response.text.strip()
+
+
+def stream_parser_completion(client: Any, prompt: PromptInput) -> Iterator[str]:
+    """Yield text chunks from a streamed generate_content call."""
+    last_chunk = None
+    for chunk in client.generate_content(prompt_text(prompt), stream=True):
+        last_chunk = chunk
+        text = getattr(chunk, "text", None)
+        if text:
+            yield text
+    if last_chunk is not None:
+        report_usage("google", str(getattr(client, "model_name", "") or ""), google_usage(last_chunk))
+
+
+def request_fast_parser_completion(client: Any, prompt: str, max_tokens: int, temperature: float) -> str:
+    """Fast-stage triage constrained by `response_schema`; `client` is bound to the fast model."""
+    response = client.generate_content(
+        prompt,
+        generation_config=parser_fast_generation_config(max_tokens=max_tokens, temperature=temperature),
+    )
+    report_usage("google", str(getattr(client, "model_name", "") or ""), google_usage(response))
     return response.text.strip()
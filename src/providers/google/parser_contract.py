@@ -0,0 +1,40 @@
+"""Gemini fast-stage contract: the fast parser schema in the OpenAPI subset `response_schema` accepts."""
+
+from typing import Any, Dict
+
+from src.providers.fast_contract import FAST_PARSER_JSON_SCHEMA
+
+
+# JSON Schema keywords Gemini's response_schema rejects.
+_UNSUPPORTED_KEYWORDS = {"additionalProperties", "minLength", "minimum", "maximum"}
+
+
+def gemini_response_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Translate a JSON Schema: `["x", "null"]` types become `nullable`, unsupported keywords drop."""
+    converted: Dict[str, Any] = {}
+    for key, value in schema.items():
+        if key in _UNSUPPORTED_KEYWORDS:
+            continue
+        if key == "type" and isinstance(value, list):
+            non_null = [item for item in value if item != "null"]
+            converted["type"] = non_null[0]
+            if len(non_null) < len(value):
+                converted["nullable"] = True
+        elif key == "enum":
+            converted["enum"] = [item for item in value if item is not None]
+        elif key == "properties":
+            converted["properties"] = {name: gemini_response_schema(prop) for name, prop in value.items()}
+        elif key == "items":
+            converted["items"] = gemini_response_schema(value)
+        else:
+            converted[key] = value
+    return converted
+
+
+def parser_fast_generation_config(max_tokens: int, temperature: float) -> Dict[str, Any]:
+    return {
+        "response_mime_type": "application/json",
+        "response_schema": gemini_response_schema(FAST_PARSER_JSON_SCHEMA),
+        "max_output_tokens": max_tokens,
+        "temperature": temperature,
+    }
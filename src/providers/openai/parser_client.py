@@ -1,9 +1,19 @@
 """OpenAI client wrapper for parser completions."""
 
 import json
-from typing import Any, List
+from typing import Any, Iterator, List
 
+from src.providers.fast_contract import FAST_PARSER_SYSTEM_INSTRUCTION
 from src.providers.openai.parser_contract import parser_fast_response_format, parser_response_format
+from src.providers.prompt_layout import PromptInput, prompt_text
+from src.providers.usage import openai_usage, report_usage
+
+
+PARSER_SYSTEM_INSTRUCTION = (
+    "You are a strict trading-alert parser. "
+    "Return only JSON that matches the provided response schema exactly. "
+    "If no actionable trade exists in the message, return an empty signals array."
+)
 
 
 def extract_structured_message_content(response: Any) -> str:
@@ -39,28 +49,57 @@ def extract_structured_message_content(response: Any) -> str:
 def request_parser_completion(
     client: Any,
     model: str,
-    prompt: str,
+    prompt: PromptInput,
     max_tokens: int,
     temperature: float,
 ) -> str:
-    system_instruction = (
-        "You are a strict trading-alert parser. "
-        "Return only JSON that matches the provided response schema exactly. "
-        "If no actionable trade exists in the message, return an empty signals array."
-    )
     response = client.chat.completions.create(
         model=model,
         messages=[
-            {"role": "system", "content": system_instruction},
-            {"role": "user", "content": prompt},
+            {"role": "system", "content": PARSER_SYSTEM_INSTRUCTION},
+            # Static prefix first: OpenAI caches the longest repeated prompt prefix automatically.
+            {"role": "user", "content": prompt_text(prompt)},
         ],
         max_tokens=max_tokens,
         temperature=temperature,
         response_format=parser_response_format(),
     )
+    report_usage("openai", model, openai_usage(response))
     return extract_structured_message_content(response)
 
 
+def stream_parser_completion(
+    client: Any,
+    model: str,
+    prompt: PromptInput,
+    max_tokens: int,
+    temperature: float,
+) -> Iterator[str]:
+    """Yield content deltas of a structured full-parse completion as they arrive."""
+    stream = client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": PARSER_SYSTEM_INSTRUCTION},
+            {"role": "user", "content": prompt_text(prompt)},
+        ],
+        max_tokens=max_tokens,
+        temperature=temperature,
+        response_format=parser_response_format(),
+        stream=True,
+        stream_options={"include_usage": True},
+    )
+    for chunk in stream:
+        # The usage-only final chunk carries no choices.
+        if getattr(chunk, "usage", None) is not None:
+            report_usage("openai", model, openai_usage(chunk))
+        choices = getattr(chunk, "choices", None) or []
+        if not choices:
+            continue
+        content = getattr(choices[0].delta, "content", None)
+        if content:
+            yield content
+
+
 def request_fast_parser_completion(
     client: Any,
     model: str,
@@ -68,18 +107,15 @@ def request_fast_parser_completion(
     max_tokens: int,
     temperature: float,
 ) -> str:
-    system_instruction = (
-        "You classify one trading message into actionable intent and primary ticker. "
-        "Return only JSON matching the provided schema exactly."
-    )
     response = client.chat.completions.create(
         model=model,
         messages=[
-            {"role": "system", "content": system_instruction},
+            {"role": "system", "content": FAST_PARSER_SYSTEM_INSTRUCTION},
             {"role": "user", "content": prompt},
         ],
         max_tokens=max_tokens,
         temperature=temperature,
         response_format=parser_fast_response_format(),
     )
+    report_usage("openai", model, openai_usage(response))
     return extract_structured_message_content(response)
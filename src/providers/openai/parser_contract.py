@@ -2,6 +2,8 @@
 
 from typing import Any, Dict
 
+from src.providers.fast_contract import FAST_PARSER_JSON_SCHEMA
+
 
 OPENAI_PARSER_JSON_SCHEMA: Dict[str, Any] = {
     "type": "object",
@@ -67,20 +69,7 @@ OPENAI_PARSER_JSON_SCHEMA: Dict[str, Any] = {
 }
 
 
-OPENAI_FAST_PARSER_JSON_SCHEMA: Dict[str, Any] = {
-    "type": "object",
-    "additionalProperties": False,
-    "required": ["status", "confidence", "primary_ticker", "vehicle_hint", "action", "evidence_text", "sizing_text"],
-    "properties": {
-        "status": {"type": "string", "enum": ["actionable", "no_action", "ambiguous"]},
-        "confidence": {"type": "number", "minimum": 0.0, "maximum": 1.0},
-        "primary_ticker": {"type": ["string", "null"]},
-        "vehicle_hint": {"type": "string", "enum": ["stock", "option", "mixed", "unknown"]},
-        "action": {"type": "string", "enum": ["BUY", "SELL", "NONE"]},
-        "evidence_text": {"type": "string"},
-        "sizing_text": {"type": "string"},
-    },
-}
+OPENAI_FAST_PARSER_JSON_SCHEMA: Dict[str, Any] = FAST_PARSER_JSON_SCHEMA
 
 
 def parser_response_format() -> Dict[str, Any]:
@@ -1,16 +1,26 @@
 """Provider-agnostic parser completion dispatch."""
 
-from typing import Any, Dict, Optional
+from contextlib import nullcontext
+from typing import Any, ContextManager, Dict, Iterator, Optional, Tuple
 
 from src.providers.anthropic.parser_client import (
+    request_fast_parser_completion as request_anthropic_fast_parser_completion,
     request_parser_completion as request_anthropic_parser_completion,
+    stream_parser_completion as stream_anthropic_parser_completion,
 )
 from src.providers.google.parser_client import (
+    request_fast_parser_completion as request_google_fast_parser_completion,
     request_parser_completion as request_google_parser_completion,
+    stream_parser_completion as stream_google_parser_completion,
 )
 from src.providers.openai.parser_client import (
+    request_fast_parser_completion as request_openai_fast_parser_completion,
     request_parser_completion as request_openai_parser_completion,
+    stream_parser_completion as stream_openai_parser_completion,
 )
+from src.providers.prompt_layout import PromptInput, prompt_text
+from src.providers.rate_limits import PRIORITY_LIVE, ProviderRateLimiter
+from src.utils.token_estimate import estimate_tokens
 
 
 class UnsupportedProviderError(ValueError):
@@ -21,40 +31,165 @@ def request_provider_completion(
     provider: str,
     client: Any,
     config: Dict[str, Any],
-    prompt: str,
+    prompt: PromptInput,
     model_override: Optional[str] = None,
     max_tokens_override: Optional[int] = None,
     temperature_override: Optional[float] = None,
+    rate_limiter: Optional[ProviderRateLimiter] = None,
+    priority: int = PRIORITY_LIVE,
 ) -> str:
+    """
+    Send `prompt` to the provider's parser endpoint.
+
+    With a `rate_limiter`, the call first waits (by `priority`) for request, token,
+    and concurrency capacity; tokens are charged as prompt estimate + max output.
+    """
     normalized_provider = (provider or "").lower().strip()
+    model, max_tokens, temperature = _resolve_settings(
+        normalized_provider, provider, config, model_override, max_tokens_override, temperature_override
+    )
+
+    with _lease(rate_limiter, normalized_provider, model, prompt, max_tokens, priority):
+        if normalized_provider == "openai":
+            return request_openai_parser_completion(
+                client=client,
+                model=model,
+                prompt=prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+            )
+        if normalized_provider == "anthropic":
+            return request_anthropic_parser_completion(
+                client=client,
+                model=model,
+                prompt=prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+            )
+        return request_google_parser_completion(client=client, prompt=prompt)
+
 
+def request_provider_fast_completion(
+    provider: str,
+    client: Any,
+    model: str,
+    prompt: str,
+    max_tokens: int,
+    temperature: float = 0.0,
+) -> str:
+    """
+    Send the fast-stage triage prompt using each provider's structured output:
+    OpenAI `response_format`, an Anthropic forced tool call, Gemini `response_schema`.
+    Every path returns JSON text matching the fast parser schema.
+    """
+    normalized_provider = (provider or "").lower().strip()
     if normalized_provider == "openai":
-        openai_config = config["openai"]
-        model = model_override or openai_config["model"]
-        max_tokens = max_tokens_override if max_tokens_override is not None else openai_config["max_tokens"]
-        temperature = temperature_override if temperature_override is not None else openai_config["temperature"]
-        return request_openai_parser_completion(
+        return request_openai_fast_parser_completion(
             client=client,
             model=model,
             prompt=prompt,
             max_tokens=max_tokens,
             temperature=temperature,
         )
-
     if normalized_provider == "anthropic":
-        anthropic_config = config["anthropic"]
-        model = model_override or anthropic_config["model"]
-        max_tokens = max_tokens_override if max_tokens_override is not None else anthropic_config["max_tokens"]
-        temperature = temperature_override if temperature_override is not None else anthropic_config["temperature"]
-        return request_anthropic_parser_completion(
+        return request_anthropic_fast_parser_completion(
             client=client,
             model=model,
             prompt=prompt,
             max_tokens=max_tokens,
             temperature=temperature,
         )
+    if normalized_provider == "google":
+        return request_google_fast_parser_completion(
+            client=client,
+            prompt=prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+    raise UnsupportedProviderError(f"Unsupported provider: {provider}")
+
+
+def stream_provider_completion(
+    provider: str,
+    client: Any,
+    config: Dict[str, Any],
+    prompt: PromptInput,
+    model_override: Optional[str] = None,
+    max_tokens_override: Optional[int] = None,
+    temperature_override: Optional[float] = None,
+    rate_limiter: Optional[ProviderRateLimiter] = None,
+    priority: int = PRIORITY_LIVE,
+) -> Iterator[str]:
+    """Streaming twin of `request_provider_completion`; the rate-limit lease spans the whole stream."""
+    normalized_provider = (provider or "").lower().strip()
+    model, max_tokens, temperature = _resolve_settings(
+        normalized_provider, provider, config, model_override, max_tokens_override, temperature_override
+    )
+    return _stream(normalized_provider, client, prompt, model, max_tokens, temperature, rate_limiter, priority)
+
+
+def _stream(
+    provider: str,
+    client: Any,
+    prompt: PromptInput,
+    model: str,
+    max_tokens: int,
+    temperature: float,
+    rate_limiter: Optional[ProviderRateLimiter],
+    priority: int,
+) -> Iterator[str]:
+    with _lease(rate_limiter, provider, model, prompt, max_tokens, priority):
+        if provider == "openai":
+            yield from stream_openai_parser_completion(
+                client=client,
+                model=model,
+                prompt=prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+            )
+        elif provider == "anthropic":
+            yield from stream_anthropic_parser_completion(
+                client=client,
+                model=model,
+                prompt=prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+            )
+        else:
+            yield from stream_google_parser_completion(client=client, prompt=prompt)
+
+
+def _resolve_settings(
+    normalized_provider: str,
+    provider: str,
+    config: Dict[str, Any],
+    model_override: Optional[str],
+    max_tokens_override: Optional[int],
+    temperature_override: Optional[float],
+) -> Tuple[str, int, float]:
+    if normalized_provider in ("openai", "anthropic"):
+        provider_config = config[normalized_provider]
+        model = model_override or provider_config["model"]
+        max_tokens = max_tokens_override if max_tokens_override is not None else provider_config["max_tokens"]
+        temperature = temperature_override if temperature_override is not None else provider_config["temperature"]
+        return model, max_tokens, temperature
 
     if normalized_provider == "google":
-        return request_google_parser_completion(client=client, prompt=prompt)
+        # The Gemini client is bound to its model and generation settings at construction.
+        return config.get("google", {}).get("model", ""), 0, 0.0
 
     raise UnsupportedProviderError(f"Unsupported provider: {provider}")
+
+
+def _lease(
+    rate_limiter: Optional[ProviderRateLimiter],
+    provider: str,
+    model: str,
+    prompt: PromptInput,
+    max_tokens: int,
+    priority: int,
+) -> ContextManager[None]:
+    if rate_limiter is None:
+        return nullcontext()
+    tokens = estimate_tokens(prompt_text(prompt)) + int(max_tokens or 0)
+    return rate_limiter.lease(provider, model, tokens=tokens, priority=priority)
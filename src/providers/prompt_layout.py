@@ -0,0 +1,40 @@
+"""Cache-friendly prompt layout: a byte-stable prefix followed by per-message context."""
+
+from dataclasses import dataclass
+from typing import Union
+
+
+# Template marker separating static rules (cacheable) from per-message context.
+PROMPT_CACHE_BREAKPOINT = "{{CACHE_BREAKPOINT}}"
+
+
+@dataclass(frozen=True)
+class PromptParts:
+    """
+    Prompt split at its cache breakpoint.
+
+    `static_prefix` must be identical across requests for the same analyst so
+    OpenAI's automatic prefix cache and Anthropic `cache_control` can reuse it;
+    anything that changes per message (time, balances, chain, text) lives in
+    `dynamic_suffix`.
+    """
+
+    static_prefix: str
+    dynamic_suffix: str
+
+    @property
+    def text(self) -> str:
+        return f"{self.static_prefix}{self.dynamic_suffix}"
+
+    def strip(self) -> str:
+        return self.text.strip()
+
+    def __str__(self) -> str:
+        return self.text
+
+
+PromptInput = Union[str, PromptParts]
+
+
+def prompt_text(prompt: PromptInput) -> str:
+    return prompt.text if isinstance(prompt, PromptParts) else str(prompt)
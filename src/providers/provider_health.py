@@ -0,0 +1,99 @@
+"""Rolling latency and error-rate statistics per provider/model."""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+
+ProviderKey = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class ProviderHealthSnapshot:
+    """EWMA view of one provider/model; `latency_seconds` is None before the first success."""
+
+    provider: str
+    model: str
+    latency_seconds: Optional[float]
+    error_rate: float
+    samples: int
+    last_attempt_at: Optional[float]
+
+
+class ProviderHealth:
+    """
+    Thread-safe EWMA latency and error rate keyed by (provider, model).
+
+    A route is unhealthy while its error rate is at or above `max_error_rate`; after
+    `retry_after_seconds` without attempts it is offered again as a probe, so a
+    recovered provider is not starved by the routes ranked ahead of it.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.3,
+        max_error_rate: float = 0.5,
+        retry_after_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 0 < alpha <= 1:
+            raise ValueError(f"alpha must be in (0, 1], got {alpha}")
+        self._alpha = float(alpha)
+        self._max_error_rate = float(max_error_rate)
+        self._retry_after_seconds = float(retry_after_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stats: Dict[ProviderKey, ProviderHealthSnapshot] = {}
+
+    def record_success(self, provider: str, model: str, latency_seconds: float) -> None:
+        self._record(provider, model, latency_seconds=max(0.0, float(latency_seconds)), failed=False)
+
+    def record_failure(self, provider: str, model: str, latency_seconds: Optional[float] = None) -> None:
+        """Count an error or deadline miss; a timeout's elapsed time also feeds latency."""
+        self._record(provider, model, latency_seconds=latency_seconds, failed=True)
+
+    def snapshot(self, provider: str, model: str) -> ProviderHealthSnapshot:
+        with self._lock:
+            return self._stats.get((provider, model)) or ProviderHealthSnapshot(
+                provider=provider,
+                model=model,
+                latency_seconds=None,
+                error_rate=0.0,
+                samples=0,
+                last_attempt_at=None,
+            )
+
+    def is_healthy(self, provider: str, model: str) -> bool:
+        stats = self.snapshot(provider, model)
+        if stats.error_rate < self._max_error_rate:
+            return True
+        if stats.last_attempt_at is None:
+            return True
+        return self._clock() - stats.last_attempt_at >= self._retry_after_seconds
+
+    def _record(self, provider: str, model: str, latency_seconds: Optional[float], failed: bool) -> None:
+        now = self._clock()
+        with self._lock:
+            previous = self._stats.get((provider, model))
+            if previous is None:
+                latency = latency_seconds
+                error_rate = 1.0 if failed else 0.0
+                samples = 1
+            else:
+                latency = previous.latency_seconds
+                if latency_seconds is not None:
+                    latency = latency_seconds if latency is None else self._blend(latency, latency_seconds)
+                error_rate = self._blend(previous.error_rate, 1.0 if failed else 0.0)
+                samples = previous.samples + 1
+            self._stats[(provider, model)] = ProviderHealthSnapshot(
+                provider=provider,
+                model=model,
+                latency_seconds=latency,
+                error_rate=error_rate,
+                samples=samples,
+                last_attempt_at=now,
+            )
+
+    def _blend(self, previous: float, sample: float) -> float:
+        return (1.0 - self._alpha) * previous + self._alpha * sample
@@ -0,0 +1,181 @@
+"""Latency-aware routing and in-message failover across parser providers."""
+
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from src.observability.tracing import bind_context
+from src.providers.parser_dispatch import UnsupportedProviderError
+from src.providers.provider_health import ProviderHealth
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("provider_router")
+
+
+class ProviderRoutingError(RuntimeError):
+    """Raised when every candidate route failed or missed its deadline for one request."""
+
+    def __init__(self, message: str, attempts: Sequence["RouteAttempt"]):
+        super().__init__(message)
+        self.attempts = tuple(attempts)
+
+
+@dataclass(frozen=True)
+class ProviderRoute:
+    """One initialized client and the model the full parse will request from it."""
+
+    provider: str
+    model: str
+    client: Any
+
+
+@dataclass(frozen=True)
+class RouteAttempt:
+    provider: str
+    model: str
+    outcome: str
+    elapsed_seconds: float
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class RoutedCompletion:
+    text: str
+    route: ProviderRoute
+    attempts: Tuple[RouteAttempt, ...]
+
+
+class AttemptGuard:
+    """
+    Per-attempt switch the router flips when it stops waiting on that attempt.
+    Callbacks wrapped with `guard()` go quiet from then on, so a stream the router
+    abandoned cannot keep firing early signals into the message it gave up on.
+    """
+
+    def __init__(self):
+        self._abandoned = threading.Event()
+
+    @property
+    def abandoned(self) -> bool:
+        return self._abandoned.is_set()
+
+    def abandon(self) -> None:
+        self._abandoned.set()
+
+    def guard(self, callback: Optional[Callable[..., None]]) -> Optional[Callable[..., None]]:
+        if callback is None:
+            return None
+
+        def guarded(*args: Any, **kwargs: Any) -> None:
+            if not self._abandoned.is_set():
+                callback(*args, **kwargs)
+
+        return guarded
+
+
+class ProviderRouter:
+    """
+    Order routes by health, then EWMA latency, and fail over within one request.
+
+    Each attempt runs on its own daemon thread and is abandoned once
+    `deadline_seconds` passes; the next route is tried immediately. An abandoned
+    attempt cannot be interrupted, so it runs until its SDK call returns or times
+    out (route clients are built with the deadline as their request timeout), but
+    it never holds a slot later attempts wait on. Routes without samples rank as
+    fastest so a newly available provider gets measured. Configured order breaks ties.
+    """
+
+    def __init__(
+        self,
+        routes: Sequence[ProviderRoute],
+        health: Optional[ProviderHealth] = None,
+        deadline_seconds: Optional[float] = 20.0,
+    ):
+        if not routes:
+            raise ValueError("ProviderRouter requires at least one route")
+        self._routes: List[ProviderRoute] = list(routes)
+        self._health = health or ProviderHealth()
+        self._deadline_seconds = deadline_seconds if deadline_seconds and deadline_seconds > 0 else None
+
+    @property
+    def routes(self) -> Tuple[ProviderRoute, ...]:
+        return tuple(self._routes)
+
+    @property
+    def health(self) -> ProviderHealth:
+        return self._health
+
+    def ranked_routes(self) -> List[ProviderRoute]:
+        def sort_key(indexed: Tuple[int, ProviderRoute]):
+            index, route = indexed
+            stats = self._health.snapshot(route.provider, route.model)
+            healthy = self._health.is_healthy(route.provider, route.model)
+            latency = stats.latency_seconds if stats.latency_seconds is not None else 0.0
+            return (not healthy, latency, index)
+
+        return [route for _, route in sorted(enumerate(self._routes), key=sort_key)]
+
+    @property
+    def deadline_seconds(self) -> Optional[float]:
+        return self._deadline_seconds
+
+    def complete(self, request: Callable[[ProviderRoute], str]) -> RoutedCompletion:
+        """Run `request` against the best route, failing over on error or deadline."""
+        return self.complete_guarded(lambda route, _guard: request(route))
+
+    def complete_guarded(self, request: Callable[[ProviderRoute, AttemptGuard], str]) -> RoutedCompletion:
+        """Like `complete`, handing each attempt the guard the router abandons when it stops waiting."""
+        attempts: List[RouteAttempt] = []
+        for route in self.ranked_routes():
+            started = time.monotonic()
+            guard = AttemptGuard()
+            future = self._start_attempt(request, route, guard)
+            try:
+                text = future.result(timeout=self._deadline_seconds)
+            except FutureTimeoutError:
+                elapsed = time.monotonic() - started
+                guard.abandon()
+                self._health.record_failure(route.provider, route.model, latency_seconds=elapsed)
+                attempts.append(RouteAttempt(route.provider, route.model, "timeout", elapsed))
+                logger.warning(
+                    "Provider %s/%s missed %.1fs deadline; failing over",
+                    route.provider,
+                    route.model,
+                    self._deadline_seconds,
+                )
+                continue
+            except UnsupportedProviderError:
+                raise
+            except Exception as exc:
+                elapsed = time.monotonic() - started
+                self._health.record_failure(route.provider, route.model)
+                attempts.append(RouteAttempt(route.provider, route.model, "error", elapsed, str(exc)))
+                logger.warning("Provider %s/%s failed; failing over: %s", route.provider, route.model, exc)
+                continue
+
+            elapsed = time.monotonic() - started
+            self._health.record_success(route.provider, route.model, elapsed)
+            attempts.append(RouteAttempt(route.provider, route.model, "ok", elapsed))
+            return RoutedCompletion(text=text, route=route, attempts=tuple(attempts))
+
+        summary = ", ".join(f"{item.provider}/{item.model}={item.outcome}" for item in attempts)
+        raise ProviderRoutingError(f"All provider routes failed ({summary})", attempts)
+
+    def _start_attempt(
+        self, request: Callable[[ProviderRoute, AttemptGuard], str], route: ProviderRoute, guard: AttemptGuard
+    ) -> "Future[str]":
+        future: "Future[str]" = Future()
+        bound_request = bind_context(request)
+
+        def run() -> None:
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(bound_request(route, guard))
+            except BaseException as exc:
+                future.set_exception(exc)
+
+        threading.Thread(target=run, name=f"provider-route-{route.provider}", daemon=True).start()
+        return future
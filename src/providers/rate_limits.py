@@ -0,0 +1,186 @@
+"""Per-provider/model request and token budgets with priority-ordered waiting."""
+
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+
+
+# Lower runs first; live alerts must not queue behind replayed history.
+PRIORITY_LIVE = 0
+PRIORITY_BACKFILL = 10
+
+
+class RateLimitTimeoutError(TimeoutError):
+    """Raised when capacity for a provider request did not free up in time."""
+
+
+@dataclass(frozen=True)
+class RateLimits:
+    """Budget for one provider; each model under it gets its own buckets. None = unlimited."""
+
+    requests_per_minute: Optional[float] = None
+    tokens_per_minute: Optional[float] = None
+    max_concurrency: Optional[int] = None
+
+
+class TokenBucket:
+    """Classic token bucket: `capacity` burst, refilled continuously at `refill_per_second`."""
+
+    def __init__(self, capacity: float, refill_per_second: float, clock: Callable[[], float] = time.monotonic):
+        if capacity <= 0 or refill_per_second <= 0:
+            raise ValueError("capacity and refill_per_second must be positive")
+        self._capacity = float(capacity)
+        self._refill_per_second = float(refill_per_second)
+        self._clock = clock
+        self._level = float(capacity)
+        self._updated_at = clock()
+
+    @property
+    def level(self) -> float:
+        self._refill()
+        return self._level
+
+    def wait_seconds(self, amount: float) -> float:
+        """Seconds until `amount` is available; oversized requests only need a full bucket."""
+        self._refill()
+        needed = min(float(amount), self._capacity)
+        if self._level >= needed:
+            return 0.0
+        return (needed - self._level) / self._refill_per_second
+
+    def consume(self, amount: float) -> None:
+        # May go negative for oversized requests; the debt delays later callers.
+        self._refill()
+        self._level -= float(amount)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated_at)
+        self._updated_at = now
+        self._level = min(self._capacity, self._level + elapsed * self._refill_per_second)
+
+
+class _ModelLimiter:
+    def __init__(self, limits: RateLimits, clock: Callable[[], float]):
+        self.condition = threading.Condition()
+        self.waiters: List[Tuple[int, int]] = []
+        self.in_flight = 0
+        self.max_concurrency = limits.max_concurrency if limits.max_concurrency and limits.max_concurrency > 0 else None
+        self.requests = _per_minute_bucket(limits.requests_per_minute, clock)
+        self.tokens = _per_minute_bucket(limits.tokens_per_minute, clock)
+
+    def wait_seconds(self, tokens: float) -> Optional[float]:
+        """0 when a request can start now, seconds until it can, or None when only a release helps."""
+        if self.max_concurrency is not None and self.in_flight >= self.max_concurrency:
+            return None
+        waits = [0.0]
+        if self.requests is not None:
+            waits.append(self.requests.wait_seconds(1))
+        if self.tokens is not None:
+            waits.append(self.tokens.wait_seconds(tokens))
+        return max(waits)
+
+    def admit(self, tokens: float) -> None:
+        if self.requests is not None:
+            self.requests.consume(1)
+        if self.tokens is not None:
+            self.tokens.consume(tokens)
+        self.in_flight += 1
+
+
+class ProviderRateLimiter:
+    """
+    Gate provider calls on request rate, token rate, and in-flight concurrency.
+
+    Waiters for the same provider/model form a priority queue: only the head
+    (lowest priority value, then arrival order) may take capacity, so a burst of
+    backfill work cannot starve a live alert that arrives behind it.
+    """
+
+    def __init__(
+        self,
+        limits_by_provider: Mapping[str, RateLimits],
+        acquire_timeout_seconds: Optional[float] = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._limits = {str(name).lower(): limits for name, limits in limits_by_provider.items()}
+        self._acquire_timeout_seconds = acquire_timeout_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._models: Dict[Tuple[str, str], _ModelLimiter] = {}
+        self._sequence = itertools.count()
+
+    @contextmanager
+    def lease(self, provider: str, model: str, tokens: float = 0, priority: int = PRIORITY_LIVE) -> Iterator[None]:
+        limiter = self._limiter_for(provider, model)
+        if limiter is None:
+            yield
+            return
+        self._acquire(limiter, provider, model, max(0.0, float(tokens)), priority)
+        try:
+            yield
+        finally:
+            with limiter.condition:
+                limiter.in_flight -= 1
+                limiter.condition.notify_all()
+
+    def queued(self, provider: str, model: str) -> int:
+        limiter = self._limiter_for(provider, model)
+        if limiter is None:
+            return 0
+        with limiter.condition:
+            return len(limiter.waiters)
+
+    def _limiter_for(self, provider: str, model: str) -> Optional[_ModelLimiter]:
+        normalized = (provider or "").lower().strip()
+        limits = self._limits.get(normalized)
+        if limits is None:
+            return None
+        key = (normalized, str(model or ""))
+        with self._lock:
+            limiter = self._models.get(key)
+            if limiter is None:
+                limiter = _ModelLimiter(limits, self._clock)
+                self._models[key] = limiter
+            return limiter
+
+    def _acquire(self, limiter: _ModelLimiter, provider: str, model: str, tokens: float, priority: int) -> None:
+        ticket = (int(priority), next(self._sequence))
+        deadline = None
+        if self._acquire_timeout_seconds is not None:
+            deadline = time.monotonic() + self._acquire_timeout_seconds
+
+        with limiter.condition:
+            heapq.heappush(limiter.waiters, ticket)
+            try:
+                while True:
+                    wait = limiter.wait_seconds(tokens) if limiter.waiters[0] == ticket else None
+                    if wait == 0.0:
+                        heapq.heappop(limiter.waiters)
+                        limiter.admit(tokens)
+                        limiter.condition.notify_all()
+                        return
+
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise RateLimitTimeoutError(
+                            f"No {provider}/{model} capacity within {self._acquire_timeout_seconds:.1f}s"
+                        )
+                    timeouts = [value for value in (wait, remaining) if value is not None]
+                    limiter.condition.wait(timeout=min(timeouts) if timeouts else None)
+            except BaseException:
+                if ticket in limiter.waiters:
+                    limiter.waiters.remove(ticket)
+                    heapq.heapify(limiter.waiters)
+                    limiter.condition.notify_all()
+                raise
+
+
+def _per_minute_bucket(per_minute: Optional[float], clock: Callable[[], float]) -> Optional[TokenBucket]:
+    if per_minute is None or per_minute <= 0:
+        return None
+    return TokenBucket(capacity=per_minute, refill_per_second=per_minute / 60.0, clock=clock)
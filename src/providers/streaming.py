@@ -0,0 +1,147 @@
+"""Consume streamed parser completions and surface the first executable signal early."""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from src.utils.incremental_json import IncrementalJsonScanner, JsonPath
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("provider_streaming")
+
+_EXECUTABLE_SIDES = {"BUY", "SELL"}
+
+
+@dataclass(frozen=True)
+class EarlySignal:
+    """First signal's ticker/action and its STOCK vehicle side, known before the stream ends."""
+
+    ticker: str
+    action: str
+    side: str
+    elapsed_seconds: float
+
+
+@dataclass(frozen=True)
+class StreamedCompletion:
+    text: str
+    early_signal: Optional[EarlySignal]
+    first_chunk_seconds: Optional[float]
+    total_seconds: float
+
+
+@dataclass
+class _FirstSignalFields:
+    ticker: Optional[str] = None
+    action: Optional[str] = None
+    vehicle_types: Dict[int, str] = field(default_factory=dict)
+    vehicle_sides: Dict[int, str] = field(default_factory=dict)
+
+    def stock_side(self) -> Optional[str]:
+        for index, vehicle_type in self.vehicle_types.items():
+            side = self.vehicle_sides.get(index)
+            if vehicle_type == "STOCK" and side in _EXECUTABLE_SIDES:
+                return side
+        return None
+
+
+class EarlySignalDetector:
+    """
+    Watch scanner output for signals[0].ticker, .action and a STOCK vehicle's side.
+
+    Accepts the three shapes the parser normalizes: {"signals": [...]}, a bare
+    signal list, and a single signal object.
+    """
+
+    def __init__(self):
+        self._scanner = IncrementalJsonScanner()
+        self._fields = _FirstSignalFields()
+        self._emitted = False
+
+    def feed(self, chunk: str, elapsed_seconds: float = 0.0) -> Optional[EarlySignal]:
+        if self._emitted:
+            return None
+        for path, value in self._scanner.feed(chunk):
+            self._observe(path, value)
+        ticker = _normalize_ticker(self._fields.ticker)
+        action = str(self._fields.action or "").upper().strip()
+        side = self._fields.stock_side()
+        if not ticker or action not in _EXECUTABLE_SIDES or side is None:
+            return None
+        self._emitted = True
+        return EarlySignal(ticker=ticker, action=action, side=side, elapsed_seconds=elapsed_seconds)
+
+    def _observe(self, path: JsonPath, value: Any) -> None:
+        relative = _first_signal_path(path)
+        if relative is None or not isinstance(value, str):
+            return
+        if relative == ("ticker",):
+            self._fields.ticker = value
+        elif relative == ("action",):
+            self._fields.action = value
+        elif len(relative) == 3 and relative[0] == "vehicles" and isinstance(relative[1], int):
+            if relative[2] == "type":
+                self._fields.vehicle_types[relative[1]] = value.upper().strip()
+            elif relative[2] == "side":
+                self._fields.vehicle_sides[relative[1]] = value.upper().strip()
+
+
+def consume_stream(
+    chunks: Iterable[str],
+    on_early_signal: Optional[Callable[[EarlySignal], None]] = None,
+) -> StreamedCompletion:
+    """Join streamed text while firing `on_early_signal` once, as soon as it is known."""
+    started = time.monotonic()
+    detector = EarlySignalDetector()
+    parts = []
+    first_chunk_seconds = None
+    early_signal = None
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        elapsed = time.monotonic() - started
+        if first_chunk_seconds is None:
+            first_chunk_seconds = elapsed
+        parts.append(chunk)
+        detected = detector.feed(chunk, elapsed)
+        if detected is None:
+            continue
+        early_signal = detected
+        logger.info(
+            "Early signal %s %s (stock %s) after %.2fs",
+            detected.action,
+            detected.ticker,
+            detected.side,
+            detected.elapsed_seconds,
+        )
+        if on_early_signal is not None:
+            try:
+                on_early_signal(detected)
+            except Exception as exc:
+                logger.warning("Early signal handler failed: %s", exc)
+
+    return StreamedCompletion(
+        text="".join(parts).strip(),
+        early_signal=early_signal,
+        first_chunk_seconds=first_chunk_seconds,
+        total_seconds=time.monotonic() - started,
+    )
+
+
+def _first_signal_path(path: JsonPath) -> Optional[JsonPath]:
+    if not path:
+        return None
+    if path[0] == "signals":
+        if len(path) < 2 or path[1] != 0:
+            return None
+        return path[2:]
+    if isinstance(path[0], int):
+        return path[1:] if path[0] == 0 else None
+    return path
+
+
+def _normalize_ticker(value: Optional[str]) -> Optional[str]:
+    ticker = str(value or "").strip().upper().replace("$", "")
+    return ticker or None
@@ -0,0 +1,155 @@
+"""Provider token-usage extraction and prompt-cache hit accounting."""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from src.observability.metrics import REGISTRY
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("provider_usage")
+
+PROVIDER_TOKENS = REGISTRY.counter(
+    "provider_tokens_total",
+    "Provider tokens by kind: input, output, cached_input, cache_write",
+    ["provider", "model", "kind"],
+)
+PROMPT_CACHE_HIT_RATIO = REGISTRY.gauge(
+    "provider_prompt_cache_hit_ratio", "Cached share of input tokens since start", ["provider", "model"]
+)
+
+
+@dataclass(frozen=True)
+class CompletionUsage:
+    """
+    Normalized usage for one completion.
+
+    `input_tokens` includes cached tokens; `cached_input_tokens` were served from
+    the provider's prompt cache and `cache_write_tokens` were written to it.
+    """
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_input_tokens: int = 0
+    cache_write_tokens: int = 0
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        if self.input_tokens <= 0:
+            return 0.0
+        return self.cached_input_tokens / self.input_tokens
+
+
+@dataclass(frozen=True)
+class PromptCacheTotals:
+    requests: int
+    input_tokens: int
+    cached_input_tokens: int
+    cache_write_tokens: int
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        if self.input_tokens <= 0:
+            return 0.0
+        return self.cached_input_tokens / self.input_tokens
+
+
+class PromptCacheStats:
+    """Thread-safe running totals of cached vs uncached input tokens per provider/model."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals: Dict[Tuple[str, str], PromptCacheTotals] = {}
+
+    def record(self, provider: str, model: str, usage: CompletionUsage) -> None:
+        key = (provider, model)
+        with self._lock:
+            previous = self._totals.get(key) or PromptCacheTotals(0, 0, 0, 0)
+            self._totals[key] = PromptCacheTotals(
+                requests=previous.requests + 1,
+                input_tokens=previous.input_tokens + usage.input_tokens,
+                cached_input_tokens=previous.cached_input_tokens + usage.cached_input_tokens,
+                cache_write_tokens=previous.cache_write_tokens + usage.cache_write_tokens,
+            )
+
+    def totals(self) -> Dict[Tuple[str, str], PromptCacheTotals]:
+        with self._lock:
+            return dict(self._totals)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._totals.clear()
+
+
+prompt_cache_stats = PromptCacheStats()
+
+
+def openai_usage(response: Any) -> Optional[CompletionUsage]:
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return None
+    details = getattr(usage, "prompt_tokens_details", None)
+    return CompletionUsage(
+        input_tokens=_count(getattr(usage, "prompt_tokens", 0)),
+        output_tokens=_count(getattr(usage, "completion_tokens", 0)),
+        cached_input_tokens=_count(getattr(details, "cached_tokens", 0)),
+    )
+
+
+def anthropic_usage(response: Any) -> Optional[CompletionUsage]:
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return None
+    cache_read = _count(getattr(usage, "cache_read_input_tokens", 0))
+    cache_write = _count(getattr(usage, "cache_creation_input_tokens", 0))
+    # Anthropic reports uncached input separately from cache reads and writes.
+    return CompletionUsage(
+        input_tokens=_count(getattr(usage, "input_tokens", 0)) + cache_read + cache_write,
+        output_tokens=_count(getattr(usage, "output_tokens", 0)),
+        cached_input_tokens=cache_read,
+        cache_write_tokens=cache_write,
+    )
+
+
+def google_usage(response: Any) -> Optional[CompletionUsage]:
+    usage = getattr(response, "usage_metadata", None)
+    if usage is None:
+        return None
+    return CompletionUsage(
+        input_tokens=_count(getattr(usage, "prompt_token_count", 0)),
+        output_tokens=_count(getattr(usage, "candidates_token_count", 0)),
+        cached_input_tokens=_count(getattr(usage, "cached_content_token_count", 0)),
+    )
+
+
+def report_usage(provider: str, model: str, usage: Optional[CompletionUsage]) -> None:
+    if usage is None:
+        return
+    prompt_cache_stats.record(provider, model, usage)
+    for kind, count in (
+        ("input", usage.input_tokens),
+        ("output", usage.output_tokens),
+        ("cached_input", usage.cached_input_tokens),
+        ("cache_write", usage.cache_write_tokens),
+    ):
+        PROVIDER_TOKENS.inc(count, provider=provider, model=model, kind=kind)
+    totals = prompt_cache_stats.totals().get((provider, model))
+    if totals is not None:
+        PROMPT_CACHE_HIT_RATIO.set(totals.cache_hit_ratio, provider=provider, model=model)
+    logger.debug(
+        "%s/%s usage: input=%d cached=%d cache_write=%d output=%d",
+        provider,
+        model,
+        usage.input_tokens,
+        usage.cached_input_tokens,
+        usage.cache_write_tokens,
+        usage.output_tokens,
+    )
+
+
+def _count(value: Any) -> int:
+    try:
+        return max(0, int(value or 0))
+    except (TypeError, ValueError):
+        return 0
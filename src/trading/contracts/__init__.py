@@ -7,10 +7,11 @@ from src.trading.contracts.orders import (
     TimeInForce,
     TradingSession,
 )
-from src.trading.contracts.results import OrderError, OrderResult
+from src.trading.contracts.results import OrderError, OrderFill, OrderResult
 
 __all__ = [
     "OrderError",
+    "OrderFill",
     "OrderResult",
     "OrderSide",
     "OrderType",
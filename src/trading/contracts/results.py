@@ -17,3 +17,14 @@ class OrderResult(BaseModel):
     raw: Dict[str, Any] = Field(default_factory=dict)
     order_id: Optional[str] = None
     error: Optional[OrderError] = None
+
+
+class OrderFill(BaseModel):
+    """Cumulative fill state of one submitted order, as last reported by the broker."""
+
+    order_id: str
+    filled_quantity: float = 0.0
+    # No further fills will arrive: filled, cancelled, rejected or expired.
+    final: bool = False
+    # Epoch seconds of the latest fill, when the broker reports it; informational only.
+    filled_at: Optional[float] = None
@@ -1,8 +1,12 @@
 """Stock order executor that delegates broker calls after planning."""
 
-from typing import Any, Optional
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
 
-from src.brokerages.ports import TradingBrokerPort
+from src.brokerages.ports import MIN_SELLABLE_QUANTITY, PositionBookPort, TradingBrokerPort
+from src.observability.metrics import REGISTRY
+from src.observability.tracing import TRACER, current_span
 from src.trading.contracts import OrderResult, OrderType, StockOrder
 from src.trading.orders.planner import StockOrderExecutionPlan, StockOrderExecutionPlanner
 from src.trading.orders.pricing import compute_buffered_limit_price
@@ -11,13 +15,49 @@ from src.utils.logger import setup_logger
 
 logger = setup_logger("stock_order_executor")
 
+# A prefetched quote older than this is refetched at execution time.
+PREPARED_QUOTE_TTL_SECONDS = 5.0
+
+ORDERS = REGISTRY.counter(
+    "orders_total", "Stock orders by outcome: placed, failed (broker said no) or error (raised)",
+    ["side", "order_type", "outcome"],
+)
+ORDER_SUBMIT_SECONDS = REGISTRY.histogram(
+    "order_submit_seconds", "Broker round trip for placing a planned stock order", ["order_type"]
+)
+PREPARED_QUOTES = REGISTRY.counter(
+    "prepared_quote_total", "Prefetched quote lookups at execution: hit, miss or stale", ["result"]
+)
+
 
 class StockOrderExecutor:
     """Execute stock orders using a single pre-submit plan."""
 
-    def __init__(self, broker: TradingBrokerPort, planner: StockOrderExecutionPlanner):
+    def __init__(
+        self,
+        broker: TradingBrokerPort,
+        planner: StockOrderExecutionPlanner,
+        positions: Optional[PositionBookPort] = None,
+        prepared_quote_ttl_seconds: float = PREPARED_QUOTE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         self._broker = broker
         self._planner = planner
+        self._positions = positions
+        self._prepared_quote_ttl_seconds = float(prepared_quote_ttl_seconds)
+        self._clock = clock
+        self._prepared_quotes: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        self._prepared_lock = threading.Lock()
+
+    def prepare(self, symbol: str, side: str) -> Optional[float]:
+        """Prefetch the limit reference quote so a following execute() skips that round trip."""
+        key = (str(symbol).upper().strip(), _enum_value(side))
+        with TRACER.span("order.prepare", symbol=key[0], side=key[1]):
+            quote = self._broker.get_limit_reference_price(key[0], key[1])
+        if quote is not None:
+            with self._prepared_lock:
+                self._prepared_quotes[key] = (float(quote), self._clock())
+        return quote
 
     def execute(
         self,
@@ -30,8 +70,18 @@ class StockOrderExecutor:
 
         effective_weighting = weighting if weighting is not None else sizing_percent
         normalized_order = self._normalize_order(order)
-        plan = self._planner.plan()
-        final_order = self._build_order(normalized_order, plan)
+        with TRACER.span(
+            "order.execute", symbol=normalized_order.symbol, side=_enum_value(normalized_order.side)
+        ) as span:
+            self._reject_unheld_sell(normalized_order)
+            plan = self._planner.plan()
+            span.set_attribute("planner_reason", plan.reason)
+            final_order = self._build_order(normalized_order, plan)
+            return self._submit(final_order, plan, effective_weighting)
+
+    def _submit(
+        self, final_order: StockOrder, plan: StockOrderExecutionPlan, effective_weighting: Optional[float]
+    ) -> OrderResult:
         logger.info(
             "Executing %s %s qty=%s as %s (reason=%s, tif=%s, ext_hours=%s)",
             _enum_value(final_order.side),
@@ -42,7 +92,16 @@ class StockOrderExecutor:
             _enum_value(final_order.time_in_force),
             final_order.extended_hours_trading,
         )
-        return self._broker.place_stock_order(final_order, weighting=effective_weighting)
+        side, order_type = _enum_value(final_order.side), _enum_value(final_order.order_type)
+        outcome = "error"
+        try:
+            with ORDER_SUBMIT_SECONDS.time(order_type=order_type):
+                result = self._broker.place_stock_order(final_order, weighting=effective_weighting)
+            outcome = "placed" if getattr(result, "success", True) else "failed"
+            return result
+        finally:
+            current_span().set_attributes(order_type=order_type, limit_price=final_order.limit_price, outcome=outcome)
+            ORDERS.inc(side=side, order_type=order_type, outcome=outcome)
 
     def _build_order(self, order: StockOrder, plan: StockOrderExecutionPlan) -> StockOrder:
         if _enum_value(plan.order_type) == OrderType.MARKET.value:
@@ -57,7 +116,9 @@ class StockOrderExecutor:
             )
 
         side = _enum_value(order.side)
-        quote = self._broker.get_limit_reference_price(order.symbol, side)
+        quote = self._take_prepared_quote(order.symbol, side)
+        if quote is None:
+            quote = self._broker.get_limit_reference_price(order.symbol, side)
         if quote is None:
             fallback_limit_price = plan.buy_limit_price_without_quote
             if side == "BUY" and fallback_limit_price is not None:
@@ -90,6 +151,26 @@ class StockOrderExecutor:
             trading_session=order.trading_session,
         )
 
+    def _take_prepared_quote(self, symbol: str, side: str) -> Optional[float]:
+        with self._prepared_lock:
+            prepared = self._prepared_quotes.pop((str(symbol).upper().strip(), side), None)
+        if prepared is None:
+            PREPARED_QUOTES.inc(result="miss")
+            return None
+        quote, prepared_at = prepared
+        if self._clock() - prepared_at > self._prepared_quote_ttl_seconds:
+            PREPARED_QUOTES.inc(result="stale")
+            return None
+        PREPARED_QUOTES.inc(result="hit")
+        return quote
+
+    def _reject_unheld_sell(self, order: StockOrder) -> None:
+        if self._positions is None or _enum_value(order.side) != "SELL":
+            return
+        held = self._positions.quantity(order.symbol)
+        if held is not None and held < MIN_SELLABLE_QUANTITY:
+            raise ValueError(f"No {order.symbol} shares held; refusing SELL")
+
     def _normalize_order(self, order: Any) -> StockOrder:
         if isinstance(order, StockOrder):
             return order
@@ -0,0 +1,18 @@
+"""Held-position cache and its reconciliation runtime."""
+
+from typing import Any
+
+
+__all__ = ["PositionCache", "PositionDiff", "PositionRuntime", "build_position_runtime"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in {"PositionCache", "PositionDiff"}:
+        from src.trading.positions.cache import PositionCache, PositionDiff
+
+        return PositionCache if name == "PositionCache" else PositionDiff
+    if name in {"PositionRuntime", "build_position_runtime"}:
+        from src.trading.positions.runtime import PositionRuntime, build_position_runtime
+
+        return PositionRuntime if name == "PositionRuntime" else build_position_runtime
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
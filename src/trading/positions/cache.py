@@ -0,0 +1,223 @@
+"""In-memory stock position cache seeded from the broker and updated from confirmed fills."""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.trading.contracts import OrderFill
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("position_cache")
+
+_QUANTITY_EPSILON = 1e-9
+
+
+@dataclass(frozen=True)
+class PositionDiff:
+    """Symbols whose cached quantity disagreed with the broker: symbol -> (cached, broker)."""
+
+    changes: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+
+    @property
+    def empty(self) -> bool:
+        return not self.changes
+
+
+@dataclass
+class _PendingOrder:
+    symbol: str
+    signed_quantity: float
+    applied: float = 0.0
+    # False while a reconcile could not tell whether its snapshot held the latest fill.
+    settled: bool = True
+
+
+class PositionCache:
+    """
+    Answer "how many shares do I hold" from memory.
+
+    `load` seeds from the broker once. `record_order` tracks an order we submitted
+    as pending; its shares count only once `poll_orders` sees the broker report
+    them filled, so accepted-but-unfilled orders (queued off-hours limits) never
+    move the book. `reconcile` replaces the book with a fresh broker snapshot and
+    returns what drifted. Pending orders' fills are read before and after the
+    positions call: a fill that did not move across it is in the snapshot. One
+    that moved may or may not be, so the order stays unsettled and the next poll
+    reconciles again instead of guessing. Polls and reconciles never overlap.
+    """
+
+    def __init__(
+        self,
+        fetch_positions: Callable[[], Dict[str, float]],
+        fetch_order_fill: Optional[Callable[[str], Optional[OrderFill]]] = None,
+    ):
+        self._fetch_positions = fetch_positions
+        self._fetch_order_fill = fetch_order_fill
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._quantities: Optional[Dict[str, float]] = None
+        self._pending: Dict[str, _PendingOrder] = {}
+
+    @property
+    def loaded(self) -> bool:
+        with self._lock:
+            return self._quantities is not None
+
+    def load(self) -> None:
+        self.reconcile()
+
+    def quantity(self, symbol: str) -> Optional[float]:
+        """Held shares for `symbol`; None until the first successful load."""
+        normalized = _normalize_symbol(symbol)
+        with self._lock:
+            if self._quantities is None:
+                return None
+            return self._quantities.get(normalized, 0.0)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._quantities or {})
+
+    def pending_order_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._pending)
+
+    def record_order(self, order_id: str, symbol: str, side: str, quantity: float) -> None:
+        """
+        Track a submitted order; the book changes only as the broker reports it filled.
+        Without a fill source nothing could settle it, so the next reconcile picks it up instead.
+        """
+        normalized = _normalize_symbol(symbol)
+        signed = _signed_quantity(side, quantity)
+        if self._fetch_order_fill is None or not order_id or not normalized or signed == 0:
+            return
+        with self._lock:
+            self._pending.setdefault(str(order_id), _PendingOrder(normalized, signed))
+
+    def poll_orders(self) -> None:
+        """Apply newly reported fills of pending orders and forget the ones that are done."""
+        with self._lock:
+            unsettled = any(not order.settled for order in self._pending.values())
+        if unsettled:
+            self.reconcile()
+            return
+        with self._sync_lock:
+            for fill in self._fetch_pending_fills():
+                self._apply_fill(fill)
+
+    def reconcile(self) -> Optional[PositionDiff]:
+        """Replace the book with the broker view; None when the broker fetch fails."""
+        with self._sync_lock:
+            before = {fill.order_id: fill for fill in self._fetch_pending_fills()}
+            try:
+                fetched = self._fetch_positions()
+            except Exception as exc:
+                logger.warning("Position fetch failed; keeping cached positions: %s", exc)
+                return None
+            after = {fill.order_id: fill for fill in self._fetch_pending_fills()}
+
+            broker_view: Dict[str, float] = {}
+            for symbol, quantity in fetched.items():
+                _add_quantity(broker_view, _normalize_symbol(symbol), float(quantity))
+
+            with self._lock:
+                previous = self._quantities
+                self._quantities = dict(broker_view)
+                for order_id, order in list(self._pending.items()):
+                    self._adopt_snapshot(order_id, order, before.get(order_id), after.get(order_id))
+
+        if previous is None:
+            logger.info("Loaded %d stock position(s) from broker.", len(broker_view))
+            return PositionDiff()
+
+        diff = _diff(previous, broker_view)
+        for symbol, (cached, broker) in sorted(diff.changes.items()):
+            logger.warning("Position drift for %s: cached=%s broker=%s", symbol, cached, broker)
+        return diff
+
+    def _fetch_pending_fills(self) -> List[OrderFill]:
+        if self._fetch_order_fill is None:
+            return []
+        fills = []
+        for order_id in self.pending_order_ids():
+            try:
+                fill = self._fetch_order_fill(order_id)
+            except Exception as exc:
+                logger.warning("Order status fetch failed for %s: %s", order_id, exc)
+                continue
+            if fill is not None:
+                fills.append(fill)
+        return fills
+
+    def _apply_fill(self, fill: OrderFill) -> None:
+        """Move the book by the part of `fill` not applied yet."""
+        with self._lock:
+            order = self._pending.get(fill.order_id)
+            if order is None or not order.settled:
+                return
+            filled = _filled(order, fill)
+            delta = filled - order.applied
+            if delta > _QUANTITY_EPSILON:
+                order.applied = filled
+                if self._quantities is not None:
+                    direction = 1.0 if order.signed_quantity > 0 else -1.0
+                    _add_quantity(self._quantities, order.symbol, direction * delta)
+            if fill.final:
+                self._pending.pop(fill.order_id, None)
+
+    def _adopt_snapshot(
+        self, order_id: str, order: _PendingOrder, before: Optional[OrderFill], after: Optional[OrderFill]
+    ) -> None:
+        """Record how much of `order` the fresh snapshot holds; caller holds `_lock`."""
+        filled_before = _filled(order, before) if before is not None else 0.0
+        filled_after = _filled(order, after) if after is not None else 0.0
+        if (before is None) != (after is None) or abs(filled_before - filled_after) > _QUANTITY_EPSILON:
+            # Filled (or unreadable) while the positions call ran: the snapshot may hold either amount.
+            order.settled = False
+            return
+        order.applied = filled_after
+        order.settled = True
+        if after is not None and after.final:
+            self._pending.pop(order_id, None)
+
+
+def _filled(order: _PendingOrder, fill: OrderFill) -> float:
+    return min(abs(float(fill.filled_quantity)), abs(order.signed_quantity))
+
+
+def _diff(cached: Dict[str, float], broker: Dict[str, float]) -> PositionDiff:
+    changes = {}
+    for symbol in set(cached) | set(broker):
+        before = cached.get(symbol, 0.0)
+        after = broker.get(symbol, 0.0)
+        if abs(before - after) > _QUANTITY_EPSILON:
+            changes[symbol] = (before, after)
+    return PositionDiff(changes=changes)
+
+
+def _add_quantity(book: Dict[str, float], symbol: str, delta: float) -> None:
+    if not symbol:
+        return
+    updated = book.get(symbol, 0.0) + delta
+    if abs(updated) <= _QUANTITY_EPSILON:
+        book.pop(symbol, None)
+    else:
+        book[symbol] = updated
+
+
+def _signed_quantity(side: str, quantity: float) -> float:
+    side_value = str(getattr(side, "value", side or "")).upper().strip()
+    try:
+        amount = abs(float(quantity))
+    except (TypeError, ValueError):
+        return 0.0
+    if side_value == "BUY":
+        return amount
+    if side_value == "SELL":
+        return -amount
+    return 0.0
+
+
+def _normalize_symbol(symbol: str) -> str:
+    return str(symbol or "").strip().upper().replace("$", "")
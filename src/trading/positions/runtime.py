@@ -0,0 +1,66 @@
+"""Position-cache runtime wiring from config."""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from src.brokerages.ports import PositionSourcePort
+from src.trading.positions.cache import PositionCache
+from src.utils.logger import setup_logger
+from src.utils.periodic_task import PeriodicTask
+
+
+logger = setup_logger("position_runtime")
+
+
+@dataclass
+class PositionRuntime:
+    cache: PositionCache
+    reconciler: PeriodicTask
+    source: PositionSourcePort
+    fill_poller: Optional[PeriodicTask] = None
+
+    def start(self) -> None:
+        """Load positions once, track submitted orders in the cache, then poll fills and reconcile periodically."""
+        self.cache.load()
+        self.source.attach_position_book(self.cache)
+        self.reconciler.start()
+        if self.fill_poller is not None:
+            self.fill_poller.start()
+
+    def stop(self) -> None:
+        if self.fill_poller is not None:
+            self.fill_poller.stop()
+        self.reconciler.stop()
+        self.source.attach_position_book(None)
+
+
+def build_position_runtime(
+    position_cache_config: Dict[str, Any],
+    source: Optional[Any],
+) -> Optional[PositionRuntime]:
+    if not bool(position_cache_config.get("enabled", False)) or source is None:
+        return None
+    if not callable(getattr(source, "get_stock_positions", None)):
+        logger.info("Position cache disabled: broker does not expose stock positions.")
+        return None
+
+    fetch_order_fill = getattr(source, "get_order_fill", None)
+    cache = PositionCache(source.get_stock_positions, fetch_order_fill if callable(fetch_order_fill) else None)
+    reconciler = PeriodicTask(
+        name="position-reconcile",
+        interval_seconds=float(position_cache_config.get("reconcile_interval_seconds", 300.0)),
+        action=cache.reconcile,
+        run_immediately=False,
+    )
+    fill_poller = None
+    if callable(fetch_order_fill):
+        fill_poller = PeriodicTask(
+            name="position-fill-poll",
+            interval_seconds=float(position_cache_config.get("fill_poll_interval_seconds", 5.0)),
+            action=cache.poll_orders,
+            run_immediately=False,
+        )
+    else:
+        logger.info("Broker does not report order fills; submitted orders count after the next reconcile.")
+    logger.info("Position cache enabled.")
+    return PositionRuntime(cache=cache, reconciler=reconciler, source=source, fill_poller=fill_poller)
@@ -0,0 +1,125 @@
+"""Push-based JSON scanner that reports scalar values as soon as they are complete."""
+
+import json
+from typing import Any, List, Tuple, Union
+
+
+JsonPath = Tuple[Union[str, int], ...]
+
+_WHITESPACE = " \t\r\n"
+_LITERAL_END = ",]}" + _WHITESPACE
+
+
+class _Frame:
+    __slots__ = ("is_object", "key", "index", "expect_key")
+
+    def __init__(self, is_object: bool):
+        self.is_object = is_object
+        self.key: Any = None
+        self.index = 0
+        self.expect_key = is_object
+
+
+class IncrementalJsonScanner:
+    """
+    Feed arbitrary text chunks; get back `(path, value)` for every completed scalar.
+
+    Paths use object keys and array indexes, e.g. ("signals", 0, "ticker"). Text
+    before the first `{`/`[` (markdown fences) and after the root closes is ignored.
+    The scanner does not validate; the final `json.loads` of the whole text does.
+    """
+
+    def __init__(self):
+        self._stack: List[_Frame] = []
+        self._started = False
+        self._done = False
+        self._in_string = False
+        self._escape = False
+        self._string_is_key = False
+        self._string: List[str] = []
+        self._literal: List[str] = []
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    def feed(self, chunk: str) -> List[Tuple[JsonPath, Any]]:
+        completed: List[Tuple[JsonPath, Any]] = []
+        for char in chunk or "":
+            if self._done:
+                break
+            if self._in_string:
+                self._feed_string_char(char, completed)
+                continue
+            if self._literal and char in _LITERAL_END:
+                self._finish_literal(completed)
+            if char in _WHITESPACE:
+                continue
+            if not self._started:
+                if char in "{[":
+                    self._started = True
+                    self._stack.append(_Frame(is_object=char == "{"))
+                continue
+            self._feed_structural_char(char)
+        return completed
+
+    def _feed_string_char(self, char: str, completed: List[Tuple[JsonPath, Any]]) -> None:
+        if self._escape:
+            self._escape = False
+            self._string.append(char)
+            return
+        if char == "\\":
+            self._escape = True
+            self._string.append(char)
+            return
+        if char != '"':
+            self._string.append(char)
+            return
+
+        self._in_string = False
+        try:
+            value = json.loads('"' + "".join(self._string) + '"')
+        except ValueError:
+            value = "".join(self._string)
+        self._string = []
+        frame = self._stack[-1]
+        if self._string_is_key:
+            frame.key = value
+            frame.expect_key = False
+            return
+        completed.append((self._path(), value))
+
+    def _feed_structural_char(self, char: str) -> None:
+        frame = self._stack[-1] if self._stack else None
+        if char == '"':
+            self._in_string = True
+            self._string_is_key = bool(frame and frame.is_object and frame.expect_key)
+        elif char in "{[":
+            self._stack.append(_Frame(is_object=char == "{"))
+        elif char in "}]":
+            self._stack.pop()
+            if not self._stack:
+                self._done = True
+        elif char == ",":
+            if frame is None:
+                return
+            if frame.is_object:
+                frame.key = None
+                frame.expect_key = True
+            else:
+                frame.index += 1
+        elif char == ":":
+            return
+        else:
+            self._literal.append(char)
+
+    def _finish_literal(self, completed: List[Tuple[JsonPath, Any]]) -> None:
+        text = "".join(self._literal)
+        self._literal = []
+        try:
+            completed.append((self._path(), json.loads(text)))
+        except ValueError:
+            return
+
+    def _path(self) -> JsonPath:
+        return tuple(frame.key if frame.is_object else frame.index for frame in self._stack)
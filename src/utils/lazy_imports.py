@@ -0,0 +1,45 @@
+"""Deferred imports for broker, quote and options modules, timed for the startup report."""
+
+import importlib
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional
+
+
+_IMPORT_SECONDS: Dict[str, float] = {}
+_LOCK = threading.Lock()
+
+
+def import_lazily(module_path: str, attribute: Optional[str] = None) -> Any:
+    """
+    Import `module_path` on first use and return it, or its `attribute`.
+
+    The first import of each module records its wall time (including anything
+    it pulls in) for `lazy_import_seconds()`; later calls are a dict lookup.
+    """
+    module = sys.modules.get(module_path)
+    if module is None:
+        started = time.perf_counter()
+        module = importlib.import_module(module_path)
+        with _LOCK:
+            _IMPORT_SECONDS.setdefault(module_path, time.perf_counter() - started)
+    return getattr(module, attribute) if attribute else module
+
+
+def lazy_exports(package: str, exports: Mapping[str, str]) -> Callable[[str], Any]:
+    """A PEP 562 `__getattr__` resolving each exported name from its submodule on first access."""
+
+    def __getattr__(name: str) -> Any:
+        module_path = exports.get(name)
+        if module_path is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        return import_lazily(module_path, name)
+
+    return __getattr__
+
+
+def lazy_import_seconds() -> Dict[str, float]:
+    """First-import wall time per lazily imported module, in load order."""
+    with _LOCK:
+        return dict(_IMPORT_SECONDS)
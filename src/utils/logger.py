@@ -1,26 +1,151 @@
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+from datetime import datetime, timezone
+from typing import Any, Mapping, Optional
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+LOG_FORMATS = ("text", "json")
+
+# Attributes every LogRecord has; anything else came from `extra=`.
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueue records for the listener thread.
+
+    The message is rendered here, so later changes to mutable arguments cannot
+    alter it, but the traceback is kept apart in `exc_text` (the stock handler
+    folds it into the message) and `extra=` values are left for the formatter.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_lock = threading.Lock()
+_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_queue_handler = _RecordQueueHandler(_queue)
+_console_handler: Optional[logging.Handler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class LazyJson:
+    """Log argument that is only serialized if the record is actually emitted."""
+
+    __slots__ = ("value", "indent")
+
+    def __init__(self, value: Any, indent: Optional[int] = None):
+        self.value = value
+        self.indent = indent
+
+    def __str__(self) -> str:
+        return json.dumps(self.value, indent=self.indent, default=str)
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record; `extra=` fields are included, `LazyJson` values unwrapped."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and key not in payload:
+                payload[key] = value.value if isinstance(value, LazyJson) else value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc_info"] = record.exc_text
+        return json.dumps(payload, default=str)
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """Writes to whatever `sys.stdout` is at emit time, so redirected/captured stdout keeps working."""
+
+    def __init__(self):
+        super().__init__(sys.stdout)
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+def _build_formatter(log_format: str) -> logging.Formatter:
+    if log_format == "json":
+        return JsonFormatter()
+    return logging.Formatter(TEXT_FORMAT, datefmt=DATE_FORMAT)
+
+
+def _start_listener() -> None:
+    """Start the single thread that does all console I/O for `setup_logger` loggers."""
+    global _console_handler, _listener
+    with _lock:
+        if _listener is not None:
+            return
+        _console_handler = _StdoutHandler()
+        _console_handler.setFormatter(_build_formatter("text"))
+        _listener = logging.handlers.QueueListener(_queue, _console_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(stop_logging)
+
+
+def stop_logging() -> None:
+    """Drain queued records to the console and stop the listener thread."""
+    global _listener
+    with _lock:
+        listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+
+
+def configure_logging(config: Mapping[str, Any]) -> None:
+    """Apply the `logging` settings (console format) to every `setup_logger` logger."""
+    log_format = str(config.get("format") or "text").lower()
+    if log_format not in LOG_FORMATS:
+        raise ValueError(f"Unsupported log format: {log_format}")
+    _start_listener()
+    _console_handler.setFormatter(_build_formatter(log_format))
+
 
 def setup_logger(name, level=logging.INFO):
-    """Setup and return a logger instance"""
+    """
+    Setup and return a logger instance.
+
+    Records go through a shared QueueHandler; formatting for the console and the
+    write itself happen on one background listener thread, so logging never
+    blocks the caller on stdout. Arguments are still only rendered for records
+    that pass the level check, so wrap large payloads in `LazyJson`.
+    """
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    
+
     # Avoid adding handlers multiple times
     if logger.handlers:
         return logger
-    
-    # Create console handler
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(level)
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    handler.setFormatter(formatter)
-    
-    logger.addHandler(handler)
-    
+
+    _start_listener()
+    logger.addHandler(_queue_handler)
+
     return logger
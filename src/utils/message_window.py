@@ -0,0 +1,148 @@
+"""Relevance windowing that trims long analyst essays to their trade-bearing sentences."""
+
+import re
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+from src.utils.token_estimate import estimate_tokens
+
+
+DEFAULT_MESSAGE_MAX_TOKENS = 400
+GAP_MARKER = "[...]"
+
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+(?=[A-Z$*\"'(@<])")
+_RELEVANCE_PATTERNS: Tuple[Tuple[re.Pattern, int], ...] = (
+    (re.compile(r"\$[A-Za-z]{1,5}\b"), 2),
+    (re.compile(r"\$\d+(?:\.\d+)?\s?[CP]\b"), 3),
+    (re.compile(r"\d+(?:\.\d+)?\s?%\s*(?:weight|weighting|position|allocation)\b", re.IGNORECASE), 3),
+    (re.compile(r"(?:@\s*\$?|\$)\d+(?:\.\d+)?\s*(?:avg|average)\b", re.IGNORECASE), 2),
+    (re.compile(r"\bticker\b[:\s]*[A-Z](?:-[A-Z])+", re.IGNORECASE), 3),
+    (
+        re.compile(
+            r"(?<![-\w])(?:new position|initiat\w*|added|adding|add|opened|opening|buying|bought|starter|trim\w*|"
+            r"exit\w*|sold|selling|reduc\w*|clos(?:e|ed|ing)|scaling into|re-enter\w*|entry|entries)\b",
+            re.IGNORECASE,
+        ),
+        3,
+    ),
+    (re.compile(r"\b(?:position|positions|portfolio|basket|shares|common stock|calls|puts)\b", re.IGNORECASE), 1),
+    # Recap cues: the prompt needs these to recognize non-actionable portfolio updates.
+    (
+        re.compile(
+            r"portfolio update|listing format|for the sake of completeness|does not mean stock was",
+            re.IGNORECASE,
+        ),
+        3,
+    ),
+)
+_STRONG_SCORE = 3
+
+
+@dataclass(frozen=True)
+class MessageWindow:
+    """Windowed message text plus what it cost and what was dropped."""
+
+    text: str
+    original_tokens: int
+    windowed_tokens: int
+    kept_sentences: int
+    total_sentences: int
+
+    @property
+    def windowed(self) -> bool:
+        return self.kept_sentences < self.total_sentences
+
+    @property
+    def saved_tokens(self) -> int:
+        return self.original_tokens - self.windowed_tokens
+
+
+def split_sentences(text: str) -> List[str]:
+    sentences: List[str] = []
+    for line in (text or "").splitlines():
+        line = line.strip()
+        if line:
+            sentences.extend(part.strip() for part in _SENTENCE_BOUNDARY.split(line) if part.strip())
+    return sentences
+
+
+def relevance_score(sentence: str) -> int:
+    return sum(weight for pattern, weight in _RELEVANCE_PATTERNS if pattern.search(sentence))
+
+
+def window_message(
+    text: str,
+    max_tokens: int = DEFAULT_MESSAGE_MAX_TOKENS,
+    context_sentences: int = 1,
+) -> MessageWindow:
+    """
+    Keep the headline, every sentence with trade evidence, and `context_sentences`
+    neighbours of strong ones, admitted by relevance until `max_tokens` is spent.
+    Higher-scoring sentences go first; among equals, shorter ones.
+
+    Text already within budget is returned unchanged. Kept sentences stay in their
+    original order; gaps are marked so the model knows text was elided.
+    """
+    original_tokens = estimate_tokens(text)
+    sentences = split_sentences(text)
+    if original_tokens <= max_tokens or len(sentences) <= 1:
+        return MessageWindow(text, original_tokens, original_tokens, len(sentences), len(sentences))
+
+    scores = [relevance_score(sentence) for sentence in sentences]
+    # Every kept sentence can open at most one gap, plus one trailing marker; charging
+    # the marker up front keeps the joined text within budget.
+    marker_cost = estimate_tokens(GAP_MARKER)
+    costs = [estimate_tokens(sentence) + marker_cost for sentence in sentences]
+    candidates = _candidate_priorities(scores, costs, max(0, int(context_sentences)))
+
+    kept: List[int] = []
+    used = marker_cost
+    for index in sorted(candidates, key=lambda position: candidates[position]):
+        cost = costs[index]
+        if used + cost > max_tokens:
+            continue
+        kept.append(index)
+        used += cost
+
+    windowed_text = _join_with_gaps(sentences, sorted(kept))
+    return MessageWindow(
+        text=windowed_text,
+        original_tokens=original_tokens,
+        windowed_tokens=estimate_tokens(windowed_text),
+        kept_sentences=len(kept),
+        total_sentences=len(sentences),
+    )
+
+
+def _candidate_priorities(scores: Sequence[int], costs: Sequence[int], context: int) -> dict:
+    """Map sentence index -> sort key; lower keys are admitted first."""
+    priorities = {}
+    for index, score in enumerate(scores):
+        if score > 0:
+            # Ties favour short sentences, then later ones: essays put the actual trade at the end.
+            priorities[index] = (0, -score, costs[index], -index)
+    if 0 not in priorities:
+        priorities[0] = (1, 0, 0, 0)
+    for index, score in enumerate(scores):
+        if score < _STRONG_SCORE:
+            continue
+        for neighbour in range(index - context, index + context + 1):
+            if 0 <= neighbour < len(scores) and neighbour not in priorities:
+                priorities[neighbour] = (2, -score, abs(neighbour - index), costs[neighbour])
+    return priorities
+
+
+def _join_with_gaps(sentences: Sequence[str], kept: Sequence[int]) -> str:
+    parts: List[str] = []
+    previous = None
+    for index in kept:
+        if previous is None:
+            if index > 0:
+                parts.append(GAP_MARKER)
+        elif index != previous + 1:
+            parts.append(GAP_MARKER)
+        parts.append(sentences[index])
+        previous = index
+    if previous is not None and previous < len(sentences) - 1:
+        parts.append(GAP_MARKER)
+    return " ".join(parts)
@@ -0,0 +1,59 @@
+"""Background daemon thread that runs one action on a fixed interval."""
+
+import threading
+from typing import Callable, Optional
+
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("periodic_task")
+
+
+class PeriodicTask:
+    """Run `action` every `interval_seconds` on a daemon thread until stopped."""
+
+    def __init__(
+        self,
+        name: str,
+        interval_seconds: float,
+        action: Callable[[], object],
+        run_immediately: bool = True,
+    ):
+        if interval_seconds <= 0:
+            raise ValueError(f"interval_seconds must be positive, got {interval_seconds}")
+        self._name = name
+        self._interval_seconds = float(interval_seconds)
+        self._action = action
+        self._run_immediately = run_immediately
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def run_once(self) -> None:
+        try:
+            self._action()
+        except Exception as exc:
+            logger.warning("Periodic task %s failed: %s", self._name, exc)
+
+    def _run(self) -> None:
+        if not self._run_immediately and self._stop_event.wait(self._interval_seconds):
+            return
+        while not self._stop_event.is_set():
+            self.run_once()
+            self._stop_event.wait(self._interval_seconds)
@@ -0,0 +1,20 @@
+"""Lightweight ticker mention extraction from raw message text."""
+
+import re
+from typing import List
+
+
+_CASHTAG_PATTERN = re.compile(r"(?<![\w$])\$([A-Za-z]{1,6}(?:[.\-][A-Za-z])?)\b")
+
+
+def extract_cashtag_tickers(message_text: str) -> List[str]:
+    """Return unique uppercase `$TICKER` mentions in first-seen order."""
+    if not message_text:
+        return []
+
+    tickers: List[str] = []
+    for match in _CASHTAG_PATTERN.finditer(str(message_text)):
+        ticker = match.group(1).upper()
+        if ticker not in tickers:
+            tickers.append(ticker)
+    return tickers
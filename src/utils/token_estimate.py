@@ -0,0 +1,30 @@
+"""Local, dependency-free prompt token estimation."""
+
+import math
+import re
+
+
+_TOKEN_PIECE_PATTERN = re.compile(r"[A-Za-z]+|\d+|[^\w\s]")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Approximate BPE token count for English/numeric prompt text.
+
+    Letters cost about one token per four characters, digit runs one per three,
+    and every punctuation mark one token. This tracks provider tokenizers closely
+    enough for budget decisions without shipping a tokenizer dependency.
+    """
+    if not text:
+        return 0
+
+    tokens = 0
+    for piece in _TOKEN_PIECE_PATTERN.findall(text):
+        first = piece[0]
+        if first.isalpha():
+            tokens += math.ceil(len(piece) / 4)
+        elif first.isdigit():
+            tokens += math.ceil(len(piece) / 3)
+        else:
+            tokens += 1
+    return tokens
@@ -4,6 +4,7 @@ Production-Ready Webull OpenAPI Trading Integration
 Simplified, clean, and maintainable implementation.
 """
 
+import time
 import uuid
 from typing import Any, Dict, Optional, List
 
@@ -20,6 +21,9 @@ from webull.trade.trade.v2.account_info_v2 import AccountV2
 from webull.trade.trade.v2.order_operation_v2 import OrderOperationV2
 
 from src.utils.logger import setup_logger
+from src.observability.metrics import REGISTRY
+from src.observability.tracing import TRACER
+from src.brokerages.ports import PositionBookPort
 from src.brokerages.webull.stock_payload_builder import (
     WebullStockPayloadBuilder,
     normalize_stock_quantity,
@@ -37,6 +41,11 @@ from src.trading.orders.sizing import resolve_stock_sizing_decision
 from config.settings import TRADING_CONFIG, WEBULL_CONFIG
 logger = setup_logger("webull_trader")
 
+WEBULL_REQUEST_SECONDS = REGISTRY.histogram("webull_request_seconds", "Webull OpenAPI call latency", ["operation"])
+WEBULL_REQUEST_ERRORS = REGISTRY.counter(
+    "webull_request_errors_total", "Webull OpenAPI calls that raised or returned non-200", ["operation"]
+)
+
 
 class WebullTrader:
     """
@@ -68,6 +77,9 @@ class WebullTrader:
         'jp': {'production': 'api.webull.co.jp', 'uat': 'jp-openapi-alb.uat.webullbroker.com'},
     }
 
+    # Optional held-position book: caps SELL sizing and receives our own fills.
+    position_book: Optional[PositionBookPort] = None
+
     def __init__(
         self,
         app_key: str,
@@ -98,7 +110,7 @@ class WebullTrader:
         endpoint = self._get_endpoint()
         env = "UAT/PAPER" if self.paper_trade else "PRODUCTION/LIVE"
         
-        logger.info(f"Init Webull API: {env} mode, region: {self.region.upper()}, endpoint: {endpoint}")
+        logger.info("Init Webull API: %s mode, region: %s, endpoint: %s", env, self.region.upper(), endpoint)
         
         if not hasattr(webull, "__version__"):
             webull.__version__ = webull_core_version
@@ -129,11 +141,10 @@ class WebullTrader:
     def resolve_account_id(self) -> str:
         """Get account ID"""
         if self._account_id:
-            logger.info(f"Using provided account ID: {self._mask_id(self._account_id)}")
+            logger.info("Using provided account ID: %s", self._mask_id(self._account_id))
             return self._account_id
 
-        res = self.account_v2_api.get_account_list()
-        self._check_response(res, "get_account_list")
+        res = self._request("get_account_list", self.account_v2_api.get_account_list)
         
         data = res.json()
         accounts = self._extract_accounts(data)
@@ -146,7 +157,7 @@ class WebullTrader:
             raise RuntimeError(f"No account_id in: {accounts[0]}")
 
         self._account_id = str(account_id)
-        logger.info(f"Resolved account: {self._mask_id(self._account_id)}")
+        logger.info("Resolved account: %s", self._mask_id(self._account_id))
         return self._account_id
 
     def _extract_accounts(self, data: Any) -> List[Dict]:
@@ -161,15 +172,13 @@ class WebullTrader:
         """Get account balance"""
         account_id = self.resolve_account_id()
 
-        res = self.account_api.get_account_balance(account_id, currency)
-        self._check_response(res, "get_account_balance")
+        res = self._request("get_account_balance", self.account_api.get_account_balance, account_id, currency)
         return res.json()
 
     def get_account_positions(self) -> Dict[str, Any]:
         """Get current positions"""
         account_id = self.resolve_account_id()
-        res = self.account_v2_api.get_account_position(account_id)
-        self._check_response(res, "get_account_position")
+        res = self._request("get_account_position", self.account_v2_api.get_account_position, account_id)
         return res.json()
 
     def login(self) -> bool:
@@ -177,10 +186,10 @@ class WebullTrader:
         try:
             self.resolve_account_id()
             env = "UAT/PAPER" if self.paper_trade else "PRODUCTION/LIVE"
-            logger.info(f"Authenticated in {env} mode")
+            logger.info("Authenticated in %s mode", env)
             return True
         except Exception as exc:
-            logger.error(f"Login failed: {exc}")
+            logger.error("Login failed: %s", exc)
             return False
 
     # ============================================================================
@@ -224,15 +233,14 @@ class WebullTrader:
         
         # Convert Pydantic model to dict for API
         payload = order.model_dump(exclude_none=True)
-        logger.info(f"Formatted option payload: {payload}")
+        logger.info("Formatted option payload: %s", payload)
         
-        logger.info(f"Previewing option {order.side} {order.quantity} {order.legs[0].symbol}...")
+        logger.info("Previewing option %s %s %s...", order.side, order.quantity, order.legs[0].symbol)
         
-        res = self.order_v2_api.preview_option(account_id, [payload])
-        self._check_response(res, "preview_option")
+        res = self._request("preview_option", self.order_v2_api.preview_option, account_id, [payload])
         
         preview_data = res.json()
-        logger.info(f"Option preview response: {preview_data}")
+        logger.info("Option preview response: %s", preview_data)
         
         return OrderPreviewResponse.model_validate(preview_data)
 
@@ -305,7 +313,11 @@ class WebullTrader:
                 )
 
         qty = payload.get("qty", order.quantity)
-        return self._execute_order(payload, f"{order.side} {qty} {order.symbol}")
+        response = self._execute_order(payload, f"{order.side} {qty} {order.symbol}")
+        if self.position_book is not None:
+            # Accepted is not filled: the book moves only once the order status reports fills.
+            self.position_book.record_order(payload.get("client_order_id"), order.symbol, order.side, float(qty))
+        return response
 
     def _build_stock_payload(
         self,
@@ -329,6 +341,7 @@ class WebullTrader:
             get_buying_power=self._get_buying_power,
             get_current_stock_quote=self.get_current_stock_quote,
             enforce_margin_buffer=self._enforce_margin_buffer,
+            get_held_quantity=self.position_book.quantity if self.position_book is not None else None,
         )
 
     # ============================================================================
@@ -341,7 +354,7 @@ class WebullTrader:
             preview = self.preview_option_order(order)
             if not preview:
                 raise ValueError(f"Option preview failed: {preview.errors}")
-            logger.info(f"Preview: ${preview.estimated_cost} {preview.currency}")
+            logger.info("Preview: $%s %s", preview.estimated_cost, preview.currency)
         
         account_id = self.resolve_account_id()
         
@@ -350,13 +363,12 @@ class WebullTrader:
         
         env = "UAT/PAPER" if self.paper_trade else "PRODUCTION/LIVE"
         symbol = order.legs[0].symbol if order.legs else "unknown"
-        logger.info(f"Placing option {order.side} {order.quantity} {symbol} in {env}...")
+        logger.info("Placing option %s %s %s in %s...", order.side, order.quantity, symbol, env)
         
-        res = self.order_v2_api.place_option(account_id, [payload])
-        self._check_response(res, "place_option")
+        res = self._request("place_option", self.order_v2_api.place_option, account_id, [payload])
         
         response = res.json()
-        logger.info(f"Option order placed: {response}")
+        logger.info("Option order placed: %s", response)
         return response
 
     def _build_option_payload(self, order: OptionOrderRequest) -> Dict[str, Any]:
@@ -418,14 +430,13 @@ class WebullTrader:
             raise ValueError(f"Max 50 orders per batch, got {len(payloads)}")
         
         env = "UAT/PAPER" if self.paper_trade else "PRODUCTION/LIVE"
-        logger.info(f"Placing batch of {len(payloads)} orders in {env}...")
+        logger.info("Placing batch of %d orders in %s...", len(payloads), env)
         
         account_id = self.resolve_account_id()
-        res = self.order_api.place_order(account_id=account_id, new_orders=payloads)
-        self._check_response(res, "batch_place_order")
+        res = self._request("batch_place_order", self.order_api.place_order, account_id=account_id, new_orders=payloads)
         
         response = res.json()
-        logger.info(f"Batch complete: {response}")
+        logger.info("Batch complete: %s", response)
         return response
 
     def _build_batch_stock_orders(self, orders: List[StockOrderRequest], skip_preview: bool) -> List[Dict]:
@@ -435,7 +446,7 @@ class WebullTrader:
             if not skip_preview:
                 preview = self.preview_stock_order(order)
                 if not preview.valid:
-                    logger.error(f"Skipping {order.symbol}: {preview.errors}")
+                    logger.error("Skipping %s: %s", order.symbol, preview.errors)
                     continue
             payloads.append(self._build_stock_payload(order))
         return payloads
@@ -447,7 +458,7 @@ class WebullTrader:
             if not skip_preview:
                 preview = self.preview_option_order(order)
                 if not preview.valid:
-                    logger.error(f"Skipping {order.symbol} option: {preview.errors}")
+                    logger.error("Skipping %s option: %s", order.symbol, preview.errors)
                     continue
             payloads.append(self._build_option_payload(order))
         return payloads
@@ -456,22 +467,24 @@ class WebullTrader:
     # ============================================================================
 
     def get_instrument(self, symbols: str, category: str = "US_STOCK") -> List[Dict[str, Any]]:
-        response = self.instrument_api.get_instrument(symbols, category)
-        self._check_response(response, "get_instrument")
+        response = self._request("get_instrument", self.instrument_api.get_instrument, symbols, category)
         instruments = response.json()
-        logger.info(f"Fetched {len(instruments)} instruments for symbols: {symbols}")
+        logger.info("Fetched %d instruments for symbols: %s", len(instruments), symbols)
         return instruments
 
     def get_market_snapshot(self, symbols: str, category: str = "US_STOCK") -> List[Dict[str, Any]]:
-        response = self.market_data_api.get_snapshot(symbols, category)
-        self._check_response(response, "get_market_snapshot")
+        response = self._request("get_market_snapshot", self.market_data_api.get_snapshot, symbols, category)
         snapshots = response.json()
-        logger.info(f"Fetched {len(snapshots)} market snapshots for symbols: {symbols}")
+        logger.info("Fetched %d market snapshots for symbols: %s", len(snapshots), symbols)
         return snapshots
 
+    def get_order_detail(self, client_order_id: str) -> Dict[str, Any]:
+        account_id = self.resolve_account_id()
+        res = self._request("query_order_detail", self.order_api.query_order_detail, account_id, client_order_id)
+        return res.json()
+
     def get_stock_quotes(self, symbol: str, category: str = "US_STOCK") -> Any:
-        response = self.market_data_api.get_quotes(symbol, category)
-        self._check_response(response, "get_stock_quotes")
+        response = self._request("get_stock_quotes", self.market_data_api.get_quotes, symbol, category)
         quotes = response.json()
         logger.info("Fetched stock quotes for symbol: %s", symbol)
         return quotes
@@ -491,15 +504,28 @@ class WebullTrader:
         account_id = self.resolve_account_id()
         env = "UAT/PAPER" if self.paper_trade else "PRODUCTION/LIVE"
         
-        logger.info(f"Placing {description} in {env}...")
+        logger.info("Placing %s in %s...", description, env)
         
-        res = self.order_api.place_order(account_id=account_id, **payload)
-        self._check_response(res, "place_order")
+        res = self._request("place_order", self.order_api.place_order, account_id=account_id, **payload)
         
         response = res.json()
-        logger.info(f"Order placed: {response}")
+        logger.info("Order placed: %s", response)
         return response
 
+    def _request(self, operation: str, method: Any, *args: Any, **kwargs: Any) -> Any:
+        """Call an SDK method, recording its latency, and raise on a non-200 response."""
+        started = time.perf_counter()
+        try:
+            with TRACER.span(f"webull.{operation}", operation=operation, paper_trade=self.paper_trade):
+                response = method(*args, **kwargs)
+                self._check_response(response, operation)
+                return response
+        except Exception:
+            WEBULL_REQUEST_ERRORS.inc(operation=operation)
+            raise
+        finally:
+            WEBULL_REQUEST_SECONDS.observe(time.perf_counter() - started, operation=operation)
+
     def _check_response(self, response: Any, operation: str):
         """Check API response status"""
         if response.status_code != 200:
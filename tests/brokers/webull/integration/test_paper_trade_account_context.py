@@ -58,7 +58,7 @@ async def test_weighted_order_skips_submit_when_buying_power_is_unavailable(monk
     client = StockMonitorClient(broker=broker, trading_account=trader)
     type(client.client).user = SimpleNamespace(id=999)
     client.notifier.notify = MagicMock()
-    client.parser.parse = MagicMock(
+    client.parser.parse_message = MagicMock(
         return_value={
             "signals": [build_signal_payload("AAPL", "BUY", confidence=0.95, weight_percent=12.5)],
             "meta": {"status": "ok"},
@@ -102,7 +102,7 @@ async def test_order_skips_submit_when_margin_buffer_is_violated(monkeypatch, is
     client = StockMonitorClient(broker=broker, trading_account=trader)
     type(client.client).user = SimpleNamespace(id=999)
     client.notifier.notify = MagicMock()
-    client.parser.parse = MagicMock(
+    client.parser.parse_message = MagicMock(
         return_value={
             "signals": [build_signal_payload("AAPL", "BUY", confidence=0.95, weight_percent=None)],
             "meta": {"status": "ok"},
@@ -148,7 +148,7 @@ async def test_order_skips_submit_when_default_notional_cannot_buy_one_share(mon
     client = StockMonitorClient(broker=broker, trading_account=trader)
     type(client.client).user = SimpleNamespace(id=999)
     client.notifier.notify = MagicMock()
-    client.parser.parse = MagicMock(
+    client.parser.parse_message = MagicMock(
         return_value={
             "signals": [build_signal_payload("BRKA", "BUY", confidence=0.88, weight_percent=None)],
             "meta": {"status": "ok"},
@@ -196,7 +196,7 @@ async def test_order_submit_rejection_is_caught_and_handler_continues(monkeypatc
     client = StockMonitorClient(broker=broker, trading_account=trader)
     type(client.client).user = SimpleNamespace(id=999)
     client.notifier.notify = MagicMock()
-    client.parser.parse = MagicMock(
+    client.parser.parse_message = MagicMock(
         return_value={
             "signals": [build_signal_payload("AAPL", "BUY", confidence=0.9, weight_percent=None)],
             "meta": {"status": "ok"},
@@ -70,7 +70,7 @@ async def test_happy_path_common_shares_recommendation_submits_order_and_logs_pi
     client = StockMonitorClient(broker=broker, trading_account=trader)
     type(client.client).user = SimpleNamespace(id=999)
     client.notifier.notify = MagicMock()
-    client.parser.parse = MagicMock(
+    client.parser.parse_message = MagicMock(
         return_value={
             "signals": [build_signal_payload("AAPL", "BUY", confidence=0.95, weight_percent=None)],
             "meta": {"status": "ok"},
@@ -150,7 +150,7 @@ async def test_options_only_recommendation_does_not_submit_stock_order(monkeypat
     client = StockMonitorClient(broker=broker, trading_account=trader)
     type(client.client).user = SimpleNamespace(id=999)
     client.notifier.notify = MagicMock()
-    client.parser.parse = MagicMock(return_value={"signals": [signal], "meta": {"status": "ok"}})
+    client.parser.parse_message = MagicMock(return_value={"signals": [signal], "meta": {"status": "ok"}})
 
     await client.on_message(build_message(FROZEN_OPTIONS_MESSAGE, author_id=321, channel_id=TEST_CHANNEL_ID))
 
@@ -211,7 +211,7 @@ async def test_common_plus_options_recommendation_submits_stock_order(monkeypatc
     client = StockMonitorClient(broker=broker, trading_account=trader)
     type(client.client).user = SimpleNamespace(id=999)
     client.notifier.notify = MagicMock()
-    client.parser.parse = MagicMock(return_value={"signals": [signal], "meta": {"status": "ok"}})
+    client.parser.parse_message = MagicMock(return_value={"signals": [signal], "meta": {"status": "ok"}})
 
     await client.on_message(build_message(FROZEN_MIXED_MESSAGE, author_id=321, channel_id=TEST_CHANNEL_ID))
 
@@ -263,7 +263,7 @@ async def test_no_recommendation_payload_produces_no_order_and_no_pick_log(monke
     client = StockMonitorClient(broker=broker, trading_account=trader)
     type(client.client).user = SimpleNamespace(id=999)
     client.notifier.notify = MagicMock()
-    client.parser.parse = MagicMock(return_value={"signals": [], "meta": {"status": "ok"}})
+    client.parser.parse_message = MagicMock(return_value={"signals": [], "meta": {"status": "ok"}})
 
     await client.on_message(build_message(FROZEN_NO_ACTION_MESSAGE, author_id=321, channel_id=TEST_CHANNEL_ID))
 
@@ -311,7 +311,7 @@ async def test_weighted_recommendation_passes_weighting_to_webull_trader(monkeyp
     client = StockMonitorClient(broker=broker, trading_account=trader)
     type(client.client).user = SimpleNamespace(id=999)
     client.notifier.notify = MagicMock()
-    client.parser.parse = MagicMock(
+    client.parser.parse_message = MagicMock(
         return_value={
             "signals": [build_signal_payload("NVDA", "BUY", confidence=0.94, weight_percent=12.5)],
             "meta": {"status": "ok"},
@@ -371,7 +371,7 @@ async def test_dollar_amount_recommendation_uses_default_notional_path(monkeypat
     client = StockMonitorClient(broker=broker, trading_account=trader)
     type(client.client).user = SimpleNamespace(id=999)
     client.notifier.notify = MagicMock()
-    client.parser.parse = MagicMock(
+    client.parser.parse_message = MagicMock(
         return_value={
             "signals": [build_signal_payload("MSFT", "BUY", confidence=0.91, weight_percent=None)],
             "meta": {"status": "ok"},
@@ -9,6 +9,7 @@ import src.discord_client as discord_client_module
 import src.trading.orders.planner as order_planner_module
 from src.ai_parser import AIParser
 from src.discord_client import StockMonitorClient
+from src.observability import TRACER, FileSpanExporter
 from tests.data.stocktalk_real_messages import REAL_PIPELINE_CASES, MessageFixture
 from tests.support.cases.live_scope import select_live_cases
 from tests.support.factories.discord_messages import TEST_CHANNEL_ID, WRONG_CHANNEL_ID, build_message
@@ -34,20 +35,20 @@ def test_client_initializes():
 async def test_ignores_wrong_channel():
     client = StockMonitorClient(trader=None)
     type(client.client).user = SimpleNamespace(id=999)
-    client.parser.parse = MagicMock(return_value={"signals": [], "meta": {"status": "ok"}})
+    client.parser.parse_message = MagicMock(return_value={"signals": [], "meta": {"status": "ok"}})
 
     await client.on_message(build_message("Buy AAPL", author_id=123, channel_id=WRONG_CHANNEL_ID))
-    client.parser.parse.assert_not_called()
+    client.parser.parse_message.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_ignores_own_message():
     client = StockMonitorClient(trader=None)
     type(client.client).user = SimpleNamespace(id=123)
-    client.parser.parse = MagicMock(return_value={"signals": [], "meta": {"status": "ok"}})
+    client.parser.parse_message = MagicMock(return_value={"signals": [], "meta": {"status": "ok"}})
 
     await client.on_message(build_message("Buy AAPL", author_id=123, channel_id=TEST_CHANNEL_ID))
-    client.parser.parse.assert_not_called()
+    client.parser.parse_message.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -55,7 +56,7 @@ async def test_malformed_parser_response_does_not_notify_or_trade():
     trader = MagicMock()
     client = StockMonitorClient(trader=trader)
     type(client.client).user = SimpleNamespace(id=999)
-    client.parser.parse = MagicMock(return_value=["bad-shape"])
+    client.parser.parse_message = MagicMock(return_value=["bad-shape"])
     client.notifier.notify = MagicMock()
 
     await client.on_message(build_message("Buy AAPL", author_id=321, channel_id=TEST_CHANNEL_ID))
@@ -69,7 +70,7 @@ async def test_valid_signal_triggers_notify_and_trade():
     client = StockMonitorClient(trader=trader)
     type(client.client).user = SimpleNamespace(id=999)
     client.notifier.notify = MagicMock()
-    client.parser.parse = MagicMock(
+    client.parser.parse_message = MagicMock(
         return_value={"signals": [build_signal_payload("AAPL", "BUY")], "meta": {"status": "ok"}}
     )
 
@@ -93,7 +94,7 @@ async def test_off_hours_uses_queued_limit_without_retry(monkeypatch):
     client = StockMonitorClient(trader=trader)
     type(client.client).user = SimpleNamespace(id=999)
     client.notifier.notify = MagicMock()
-    client.parser.parse = MagicMock(
+    client.parser.parse_message = MagicMock(
         return_value={"signals": [build_signal_payload("AAPL", "BUY", weight_percent=None)], "meta": {"status": "ok"}}
     )
 
@@ -114,7 +115,7 @@ async def test_regular_hours_uses_market_order_without_retry(monkeypatch):
     client = StockMonitorClient(trader=trader)
     type(client.client).user = SimpleNamespace(id=999)
     client.notifier.notify = MagicMock()
-    client.parser.parse = MagicMock(
+    client.parser.parse_message = MagicMock(
         return_value={"signals": [build_signal_payload("AAPL", "BUY", weight_percent=None)], "meta": {"status": "ok"}}
     )
 
@@ -131,7 +132,7 @@ async def test_sell_signal_triggers_sell_order():
     client = StockMonitorClient(trader=trader)
     type(client.client).user = SimpleNamespace(id=999)
     client.notifier.notify = MagicMock()
-    client.parser.parse = MagicMock(
+    client.parser.parse_message = MagicMock(
         return_value={"signals": [build_signal_payload("AAPL", "SELL")], "meta": {"status": "ok"}}
     )
 
@@ -147,7 +148,7 @@ async def test_hold_signal_does_not_trade():
     client = StockMonitorClient(trader=trader)
     type(client.client).user = SimpleNamespace(id=999)
     client.notifier.notify = MagicMock()
-    client.parser.parse = MagicMock(
+    client.parser.parse_message = MagicMock(
         return_value={"signals": [build_signal_payload("AAPL", "HOLD")], "meta": {"status": "ok"}}
     )
 
@@ -162,7 +163,7 @@ async def test_low_confidence_signal_does_not_trade():
     client = StockMonitorClient(trader=trader)
     type(client.client).user = SimpleNamespace(id=999)
     client.notifier.notify = MagicMock()
-    client.parser.parse = MagicMock(
+    client.parser.parse_message = MagicMock(
         return_value={"signals": [build_signal_payload("AAPL", "BUY", confidence=0.0)], "meta": {"status": "ok"}}
     )
 
@@ -185,7 +186,7 @@ async def test_trade_failure_does_not_crash_message_handler():
     client = StockMonitorClient(trader=trader)
     type(client.client).user = SimpleNamespace(id=999)
     client.notifier.notify = MagicMock()
-    client.parser.parse = MagicMock(
+    client.parser.parse_message = MagicMock(
         return_value={"signals": [build_signal_payload("AAPL", "BUY")], "meta": {"status": "ok"}}
     )
 
@@ -228,6 +229,40 @@ async def test_real_message_pipeline_fake_ai_to_trader(case: MessageFixture):
         client.notifier.notify.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_message_trace_links_parse_provider_and_order_spans(tmp_path, monkeypatch):
+    exporter = FileSpanExporter(tmp_path / "traces.jsonl")
+    monkeypatch.setattr(TRACER, "exporter", exporter)
+    trader = TraderProbe()
+    client = StockMonitorClient(trader=trader)
+    type(client.client).user = SimpleNamespace(id=999)
+    client.notifier.notify = MagicMock()
+    client._log_signals = MagicMock()
+    client.parser = parser_with_fake_openai_response(
+        json.dumps({"signals": [build_signal_payload("AAPL", "BUY", confidence=0.95, weight_percent=None)]})
+    )
+
+    await client.on_message(build_message("Buying AAPL here", author_id=321, channel_id=TEST_CHANNEL_ID))
+    exporter.close()
+
+    lines = (tmp_path / "traces.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    spans = json.loads(lines[0])["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    by_name = {span["name"]: span for span in spans}
+    attributes = {
+        name: {item["key"]: next(iter(item["value"].values())) for item in span["attributes"]}
+        for name, span in by_name.items()
+    }
+    assert {"discord.message", "parser.parse", "provider.request", "order.execute", "message.notify"} <= set(by_name)
+    assert len({span["traceId"] for span in spans}) == 1
+    assert by_name["parser.parse"]["parentSpanId"] == by_name["discord.message"]["spanId"]
+    assert attributes["provider.request"]["provider"] == "openai"
+    assert attributes["provider.request"]["stage"] == "full"
+    assert attributes["order.execute"]["symbol"] == "AAPL"
+    assert attributes["order.execute"]["planner_reason"]
+    assert len(trader.orders) == 1
+
+
 @pytest.mark.smoke
 @pytest.mark.live
 @pytest.mark.asyncio
@@ -3,8 +3,11 @@ import json
 import pytest
 
 from src.ai_parser import AIParser
+from src.models.parser_models import ParsedMessage
 from tests.data.stocktalk_real_messages import REAL_PIPELINE_CASES, MessageFixture
+from src.providers.provider_router import ProviderRoute, ProviderRouter
 from tests.support.factories.parser import parser_with_fake_openai_response
+from tests.support.fakes.ai_clients import ErrorAnthropicClient, FakeGoogleClient
 
 
 pytestmark = [pytest.mark.contract, pytest.mark.parser]
@@ -51,6 +54,45 @@ def test_parse_normalizes_single_signal_dict_response():
     assert result["signals"][0]["ticker"] == "MSFT"
 
 
+def test_parse_message_returns_typed_contract_that_dumps_like_parse():
+    parser = parser_with_fake_openai_response(
+        '{"signals":[{"ticker":"$msft","action":"buy","confidence":0.7,"vehicles":[{"type":"STOCK","side":"BUY"}]}]}'
+    )
+
+    parsed = parser.parse_message("Buying MSFT now", "tester")
+
+    assert isinstance(parsed, ParsedMessage)
+    assert parsed.signals[0].ticker == "MSFT"
+    assert parsed.signals[0].action == "BUY"
+    assert parsed.signals[0].vehicles[0].intent == "EXECUTE"
+    assert parsed.source.author == "tester"
+    assert parsed.model_dump() == parser.parse("Buying MSFT now", "tester")
+    assert ParsedMessage.model_validate(parsed.model_dump()) == parsed
+
+
+def test_parse_fails_over_to_next_provider_route_within_one_message():
+    parser = AIParser()
+    parser.provider = "anthropic"
+    parser.client = ErrorAnthropicClient()
+    google_client = FakeGoogleClient(
+        '{"signals":[{"ticker":"NVDA","action":"BUY","confidence":0.9,"vehicles":[{"type":"STOCK","intent":"EXECUTE","side":"BUY"}]}]}'
+    )
+    parser.router = ProviderRouter(
+        [
+            ProviderRoute("anthropic", "claude-sonnet-4-5", parser.client),
+            ProviderRoute("google", "gemini-3-pro-preview", google_client),
+        ]
+    )
+
+    result = parser.parse("Buying NVDA now", "tester")
+
+    assert result["meta"]["status"] == "ok"
+    assert result["meta"]["provider"] == "google"
+    assert result["signals"][0]["ticker"] == "NVDA"
+    full_parse_calls = [call for call in parser.client.calls if "tools" not in call]
+    assert len(full_parse_calls) == 1
+
+
 @pytest.mark.parametrize("case", REAL_PIPELINE_CASES, ids=lambda case: case.scenario_id)
 def test_regression_real_messages_with_fixed_ai_contract(case: MessageFixture):
     if case.should_pick:
@@ -0,0 +1,59 @@
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.market_data.options.chain_store import OptionChainStore
+from src.market_data.options.contracts import OptionChainSide, OptionChainSnapshot
+
+
+def build_option_chain_side(
+    strikes: Sequence[float],
+    bids: Optional[Sequence[float]] = None,
+    asks: Optional[Sequence[float]] = None,
+    implied_volatility: Optional[Sequence[float]] = None,
+    prefix: str = "TEST",
+) -> OptionChainSide:
+    strike_array = np.asarray(strikes, dtype=float)
+    count = strike_array.shape[0]
+    bid_array = np.asarray(bids if bids is not None else [1.0] * count, dtype=float)
+    ask_array = np.asarray(asks if asks is not None else [1.2] * count, dtype=float)
+    iv_array = np.asarray(implied_volatility if implied_volatility is not None else [0.5] * count, dtype=float)
+    return OptionChainSide(
+        contract_symbols=np.asarray([f"{prefix}{int(strike * 1000):08d}" for strike in strike_array], dtype=object),
+        strikes=strike_array,
+        bids=bid_array,
+        asks=ask_array,
+        last_prices=(bid_array + ask_array) / 2.0,
+        volumes=np.full(count, 10.0),
+        open_interest=np.full(count, 100.0),
+        implied_volatility=iv_array,
+    )
+
+
+def build_option_chain_snapshot(
+    underlying: str = "PANL",
+    expiry: date = date(2026, 5, 15),
+    underlying_price: Optional[float] = 7.23,
+    call_strikes: Sequence[float] = (5.0, 7.5, 10.0),
+    put_strikes: Sequence[float] = (5.0, 7.5, 10.0),
+) -> OptionChainSnapshot:
+    return OptionChainSnapshot(
+        underlying=underlying,
+        expiry=expiry,
+        fetched_at=datetime(2026, 3, 2, 15, 0, tzinfo=timezone.utc),
+        underlying_price=underlying_price,
+        calls=build_option_chain_side(call_strikes, prefix=f"{underlying}C"),
+        puts=build_option_chain_side(put_strikes, prefix=f"{underlying}P"),
+    )
+
+
+def build_warm_option_chain_store(expiries_by_symbol: Dict[str, List[date]], today: date) -> OptionChainStore:
+    """Chain store with every listed expiry already fetched from the fake source."""
+    from tests.support.fakes.option_chain_source import FakeOptionChainSource  # fake builds snapshots from this module
+
+    store = OptionChainStore(FakeOptionChainSource(expiries_by_symbol), today_provider=lambda: today)
+    store.mark_seen(expiries_by_symbol)
+    total_fetches = sum(len(expiries) + 1 for expiries in expiries_by_symbol.values())
+    store.refresh_due(max_fetches=total_fetches)
+    return store
@@ -0,0 +1,24 @@
+from typing import Any, Dict, List, Mapping, Optional
+
+
+def build_picks_log_signal(ticker: str, action: str = "BUY", confidence: float = 0.9) -> Dict[str, Any]:
+    return {"ticker": ticker, "action": action, "confidence": confidence, "vehicles": []}
+
+
+def build_picks_log_entry(
+    day: str,
+    author: str,
+    *tickers: str,
+    note: str = "",
+    signals: Optional[List[Mapping[str, Any]]] = None,
+    meta: Optional[Mapping[str, Any]] = None,
+) -> Dict[str, Any]:
+    parsed: Dict[str, Any] = {"signals": list(signals) if signals is not None else [{"ticker": t} for t in tickers]}
+    if meta is not None:
+        parsed["meta"] = dict(meta)
+    return {
+        "timestamp": f"{day}T10:00:00",
+        "author": author,
+        "message": note or f"{author} on {','.join(tickers)}",
+        "ai_parsed_signals": parsed,
+    }
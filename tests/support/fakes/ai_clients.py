@@ -61,10 +61,81 @@ class FakeAnthropicClient:
 
 
 class FakeGoogleClient:
-    def __init__(self, response_text: str):
+    def __init__(self, response_text: str, model_name: str = "gemini-3-pro-preview"):
         self.calls = []
+        self.generation_configs = []
+        self.model_name = model_name
         self._response_text = response_text
 
-    def generate_content(self, prompt):
+    def generate_content(self, prompt, generation_config=None):
         self.calls.append(prompt)
+        self.generation_configs.append(generation_config)
         return SimpleNamespace(text=self._response_text)
+
+
+class ToolUseAnthropicClient:
+    """Answers every call with one tool_use block carrying `tool_input`."""
+
+    def __init__(self, tool_input: dict, tool_name: str = "record_fast_parse"):
+        self.calls = []
+        self._tool_input = tool_input
+        self._tool_name = tool_name
+        self.messages = SimpleNamespace(create=self._create)
+
+    def _create(self, **kwargs):
+        self.calls.append(kwargs)
+        block = SimpleNamespace(type="tool_use", name=self._tool_name, input=self._tool_input)
+        return SimpleNamespace(content=[block])
+
+
+class ErrorAnthropicClient:
+    def __init__(self, message: str = "overloaded_error"):
+        self.calls = []
+        self._message = message
+        self.messages = SimpleNamespace(create=self._create)
+
+    def _create(self, **kwargs):
+        self.calls.append(kwargs)
+        raise RuntimeError(self._message)
+
+
+class StreamingOpenAIClient:
+    """Streams `response_text` in `chunk_size` deltas, then a usage-only chunk."""
+
+    def __init__(self, response_text: str, chunk_size: int = 8):
+        self._chunks = [response_text[i : i + chunk_size] for i in range(0, len(response_text), chunk_size)]
+        self.calls = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, **kwargs):
+        self.calls.append(kwargs)
+        events = [
+            SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=chunk))], usage=None)
+            for chunk in self._chunks
+        ]
+        usage = SimpleNamespace(prompt_tokens=100, completion_tokens=20, prompt_tokens_details=None)
+        events.append(SimpleNamespace(choices=[], usage=usage))
+        return iter(events)
+
+
+class StreamingAnthropicClient:
+    """Streams `response_text` as content_block_delta events, recording when each is consumed."""
+
+    def __init__(self, response_text: str, chunk_size: int = 8):
+        self._chunks = [response_text[i : i + chunk_size] for i in range(0, len(response_text), chunk_size)]
+        self.calls = []
+        self.consumed = 0
+        self.messages = SimpleNamespace(create=self._create)
+
+    def _create(self, **kwargs):
+        self.calls.append(kwargs)
+        return self._events()
+
+    def _events(self):
+        usage = SimpleNamespace(input_tokens=50, cache_read_input_tokens=0, cache_creation_input_tokens=0, output_tokens=1)
+        yield SimpleNamespace(type="message_start", message=SimpleNamespace(usage=usage))
+        for chunk in self._chunks:
+            self.consumed += 1
+            yield SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(type="text_delta", text=chunk))
+        yield SimpleNamespace(type="message_delta", usage=SimpleNamespace(output_tokens=len(self._chunks)))
+        yield SimpleNamespace(type="message_stop")
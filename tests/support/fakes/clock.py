@@ -0,0 +1,11 @@
+class ManualClock:
+    """Monotonic clock stand-in advanced explicitly by tests."""
+
+    def __init__(self, start: float = 1000.0):
+        self.now = float(start)
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += float(seconds)
@@ -0,0 +1,23 @@
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from tests.support.factories.option_chains import build_option_chain_snapshot
+
+
+class FakeOptionChainSource:
+    """Option-chain source with canned expiries and per-call capture."""
+
+    def __init__(self, expiries: Dict[str, List[date]], chain_error: Optional[Exception] = None):
+        self.expiries = expiries
+        self.chain_error = chain_error
+        self.calls: List[Tuple[str, str, Optional[date]]] = []
+
+    def list_expiries(self, symbol: str) -> List[date]:
+        self.calls.append(("list_expiries", symbol, None))
+        return list(self.expiries.get(symbol, []))
+
+    def fetch_chain(self, symbol: str, expiry: date):
+        self.calls.append(("fetch_chain", symbol, expiry))
+        if self.chain_error is not None:
+            raise self.chain_error
+        return build_option_chain_snapshot(underlying=symbol, expiry=expiry)
@@ -0,0 +1,58 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List, Tuple
+
+
+class WebhookServer:
+    """Local HTTP stand-in for webhook endpoints: records JSON bodies, can fail or stall first."""
+
+    def __init__(self, *, fail_first: int = 0, fail_status: int = 503, delay_seconds: float = 0.0):
+        self.fail_first = fail_first
+        self.fail_status = fail_status
+        self.delay_seconds = delay_seconds
+        self.requests: List[Tuple[str, Any]] = []
+        self.attempts = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"null")
+                if server.delay_seconds:
+                    time.sleep(server.delay_seconds)
+                with server._lock:
+                    server.attempts += 1
+                    failing = server.attempts <= server.fail_first
+                    if not failing:
+                        server.requests.append((self.path, body))
+                self.send_response(server.fail_status if failing else 204)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def url(self, path: str = "/hook") -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{path}"
+
+    def wait_for(self, count: int, timeout: float = 5.0) -> bool:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self._lock:
+                if len(self.requests) >= count:
+                    return True
+            time.sleep(0.01)
+        return False
+
+    def __enter__(self) -> "WebhookServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
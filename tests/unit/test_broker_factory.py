@@ -38,7 +38,9 @@ def test_create_broker_runtime_composes_yahoo_quotes_with_webull_execution(monke
     yahoo_quote_provider = MagicMock(name="yahoo-quote-provider")
 
     monkeypatch.setattr(broker_factory_module, "_build_webull_runtime", MagicMock(return_value=execution_runtime))
-    monkeypatch.setattr(broker_factory_module, "YahooQuoteProvider", MagicMock(return_value=yahoo_quote_provider))
+    monkeypatch.setattr(
+        "src.market_data.yahoo.quote_provider.YahooQuoteProvider", MagicMock(return_value=yahoo_quote_provider)
+    )
 
     runtime = create_broker_runtime(
         trading_config={
@@ -85,8 +87,9 @@ def test_build_webull_runtime_uses_env_fallback_for_credentials(monkeypatch):
     monkeypatch.setenv("WEBULL_APP_KEY", "env-key")
     monkeypatch.setenv("WEBULL_APP_SECRET", "env-secret")
     monkeypatch.setenv("WEBULL_ACCOUNT_ID", "env-account")
-    monkeypatch.setattr(broker_factory_module, "WebullTrader", MagicMock(return_value=fake_trader))
-    monkeypatch.setattr(broker_factory_module, "WebullBroker", MagicMock(return_value=fake_webull_broker))
+    trader_class = MagicMock(return_value=fake_trader)
+    monkeypatch.setattr("src.webull_trader.WebullTrader", trader_class)
+    monkeypatch.setattr("src.brokerages.webull.broker.WebullBroker", MagicMock(return_value=fake_webull_broker))
 
     runtime = broker_factory_module._build_webull_runtime(
         trading_config={"paper_trade": False},
@@ -96,7 +99,7 @@ def test_build_webull_runtime_uses_env_fallback_for_credentials(monkeypatch):
     assert isinstance(runtime, BrokerRuntime)
     assert runtime.broker is fake_webull_broker
     assert runtime.trading_account is fake_trader
-    broker_factory_module.WebullTrader.assert_called_once_with(
+    trader_class.assert_called_once_with(
         app_key="env-key",
         app_secret="env-secret",
         paper_trade=False,
@@ -108,8 +111,9 @@ def test_build_webull_runtime_uses_env_fallback_for_credentials(monkeypatch):
 def test_build_webull_runtime_uses_test_credentials_in_paper_mode(monkeypatch):
     fake_trader = MagicMock()
     fake_trader.login.return_value = True
-    monkeypatch.setattr(broker_factory_module, "WebullTrader", MagicMock(return_value=fake_trader))
-    monkeypatch.setattr(broker_factory_module, "WebullBroker", MagicMock(return_value="broker"))
+    trader_class = MagicMock(return_value=fake_trader)
+    monkeypatch.setattr("src.webull_trader.WebullTrader", trader_class)
+    monkeypatch.setattr("src.brokerages.webull.broker.WebullBroker", MagicMock(return_value="broker"))
 
     runtime = broker_factory_module._build_webull_runtime(
         trading_config={"paper_trade": True},
@@ -122,7 +126,7 @@ def test_build_webull_runtime_uses_test_credentials_in_paper_mode(monkeypatch):
     )
 
     assert runtime is not None
-    broker_factory_module.WebullTrader.assert_called_once_with(
+    trader_class.assert_called_once_with(
         app_key="paper-key",
         app_secret="paper-secret",
         paper_trade=True,
@@ -134,8 +138,9 @@ def test_build_webull_runtime_uses_test_credentials_in_paper_mode(monkeypatch):
 def test_build_webull_runtime_returns_none_when_login_fails(monkeypatch):
     fake_trader = MagicMock()
     fake_trader.login.return_value = False
-    monkeypatch.setattr(broker_factory_module, "WebullTrader", MagicMock(return_value=fake_trader))
-    monkeypatch.setattr(broker_factory_module, "WebullBroker", MagicMock())
+    broker_class = MagicMock()
+    monkeypatch.setattr("src.webull_trader.WebullTrader", MagicMock(return_value=fake_trader))
+    monkeypatch.setattr("src.brokerages.webull.broker.WebullBroker", broker_class)
 
     runtime = broker_factory_module._build_webull_runtime(
         trading_config={"paper_trade": False},
@@ -143,7 +148,7 @@ def test_build_webull_runtime_returns_none_when_login_fails(monkeypatch):
     )
 
     assert runtime is None
-    broker_factory_module.WebullBroker.assert_not_called()
+    broker_class.assert_not_called()
 
 
 def test_build_webull_runtime_requires_credentials(monkeypatch):
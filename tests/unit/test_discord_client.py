@@ -167,6 +167,30 @@ def test_log_signals_writes_jsonl_entry(tmp_path, monkeypatch):
     assert '"ticker": "AAPL"' in lines[0]
 
 
+def test_log_signals_queues_to_background_writer_when_enabled(tmp_path, monkeypatch):
+    log_path = tmp_path / "picks_log.jsonl"
+    monkeypatch.setattr(discord_client_module, "PICKS_LOG_PATH", log_path)
+    monkeypatch.setattr(
+        discord_client_module,
+        "PICKS_LOG_CONFIG",
+        {"background_writer": {"enabled": True, "batch_size": 10, "flush_interval_seconds": 60, "fsync": "never"}},
+    )
+    client = StockMonitorClient(trader=None)
+    client.client.run = MagicMock()
+    monkeypatch.setattr(discord_client_module, "DISCORD_TOKEN", "test-token")
+    message = SimpleNamespace(author="author#1", content="Buy AAPL", jump_url="https://discord.com/mock/message")
+
+    client._log_signals(message, {"signals": [{"ticker": "AAPL"}], "meta": {"status": "ok"}})
+    client._log_signals(message, {"signals": [{"ticker": "MSFT"}], "meta": {"status": "ok"}})
+
+    assert not log_path.exists()  # still queued: batch not full, interval not reached
+    client.run()  # shutdown drains the writer
+    lines = log_path.read_text(encoding="utf-8").strip().splitlines()
+    assert len(lines) == 2
+    assert '"ticker": "AAPL"' in lines[0]
+    assert '"ticker": "MSFT"' in lines[1]
+
+
 def test_run_delegates_to_discord_client_run(monkeypatch):
     client = StockMonitorClient(trader=None)
     client.client.run = MagicMock()
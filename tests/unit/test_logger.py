@@ -1,8 +1,9 @@
+import json
 import logging
 
 import pytest
 
-from src.utils.logger import setup_logger
+from src.utils.logger import LazyJson, configure_logging, setup_logger, stop_logging
 
 
 pytestmark = [pytest.mark.unit]
@@ -21,3 +22,46 @@ def test_setup_logger_creates_stream_handler_once():
 def test_setup_logger_sets_requested_level():
     logger = setup_logger("test_logger_level", level=logging.WARNING)
     assert logger.level == logging.WARNING
+
+
+def test_lazy_payloads_render_only_when_emitted_and_output_goes_through_the_listener(capsys):
+    renders = []
+
+    class Probe:
+        def __str__(self):
+            renders.append(1)
+            return "probe"
+
+    logger = setup_logger("test_logger_lazy", level=logging.INFO)
+    logger.debug("payload: %s", LazyJson({"probe": Probe()}))
+    assert renders == []
+
+    logger.info("payload: %s", LazyJson({"probe": Probe()}))
+    stop_logging()  # drains the queue
+    configure_logging({"format": "text"})
+
+    assert renders  # pytest's own root handlers render it too
+    assert 'test_logger_lazy - INFO - payload: {"probe": "probe"}' in capsys.readouterr().out
+
+
+def test_json_format_includes_extra_fields_and_exception(capsys):
+    logger = setup_logger("test_logger_json")
+    configure_logging({"format": "json"})
+    try:
+        logger.info("placed %s", "AAPL", extra={"payload": LazyJson({"qty": 2}), "order_id": "A1"})
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            logger.exception("order failed")
+        stop_logging()
+    finally:
+        configure_logging({"format": "text"})
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines() if "test_logger_json" in line]
+    assert [line["message"] for line in lines] == ["placed AAPL", "order failed"]
+    assert lines[0]["payload"] == {"qty": 2}
+    assert lines[0]["order_id"] == "A1"
+    assert lines[1]["level"] == "ERROR"
+    assert "RuntimeError: boom" in lines[1]["exc_info"]
+    with pytest.raises(ValueError):
+        configure_logging({"format": "xml"})
@@ -0,0 +1,49 @@
+import pytest
+
+from src.ai_parser import AIParser
+from src.utils.message_window import GAP_MARKER, window_message
+from src.utils.token_estimate import estimate_tokens
+from tests.data.stocktalk_real_messages import MESSAGE_FIXTURES
+
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_window_leaves_messages_under_budget_unchanged():
+    text = "New position: Apple $AAPL - 3% weight @ $190 avg on shares"
+
+    window = window_message(text, max_tokens=100)
+
+    assert window.text == text
+    assert window.windowed is False
+    assert window.saved_tokens == 0
+
+
+def test_window_keeps_trade_sentence_and_spelled_ticker_within_budget():
+    text = MESSAGE_FIXTURES["real_itri_weighted_common"].text
+
+    window = window_message(text, max_tokens=250)
+
+    assert window.windowed is True
+    assert window.windowed_tokens <= 250 < window.original_tokens
+    assert estimate_tokens(window.text) == window.windowed_tokens
+    assert "I've opened a new position in Itron (ticker: I-T-R-I) this morning with a 5.5% weighting" in window.text
+    assert "Itron specializes in Advanced Metering Infrastructure (AMI)." not in window.text
+    assert GAP_MARKER in window.text
+
+
+def test_parser_windows_message_text_in_both_stages_only_when_enabled():
+    text = MESSAGE_FIXTURES["real_mitk_common_position"].text
+    filler = "Deepfakes, spoofs, voice-imitation"
+    parser = AIParser()
+
+    assert filler in parser._render_prompt(text, "tester").text
+
+    parser.config = {**parser.config, "message_window": {"enabled": True, "max_tokens": 250, "context_sentences": 1}}
+    full_prompt = parser._render_prompt(text, "tester").text
+    fast_prompt = parser._render_fast_prompt(text)
+
+    for prompt in (full_prompt, fast_prompt):
+        assert filler not in prompt
+        assert "That name is Mitek (ticker M-I-T-K)." in prompt
+        assert "initiate a position" in prompt
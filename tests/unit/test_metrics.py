@@ -0,0 +1,121 @@
+import asyncio
+import urllib.request
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.brokerages.webull.quote_service import resolve_limit_reference_price
+from src.market_data.yahoo.quote_provider import YahooQuoteProvider
+from src.models.webull_models import OrderSide, OrderType, StockOrderRequest, TimeInForce
+from src.observability import REGISTRY, MetricsRegistry, MetricsServer, build_metrics_server, monitor_event_loop_lag
+from src.observability.metrics_server import EVENT_LOOP_LAG
+from src.trading.orders.executor import ORDERS, PREPARED_QUOTES, StockOrderExecutor
+from src.trading.orders.planner import StockOrderExecutionPlan
+from tests.support.fakes.broker_probe import BrokerProbe
+
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_registry_renders_prometheus_text_and_validates_labels():
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests served", ["route"])
+    depth = registry.gauge("depth", "Queue depth")
+    latency = registry.histogram("latency_seconds", "Latency", ["route"], buckets=(0.1, 1.0))
+
+    requests.inc(route="/a")
+    requests.inc(2, route='/b"q')
+    depth.set_function(lambda: 7)
+    latency.observe(0.05, route="/a")
+    latency.observe(0.5, route="/a")
+    latency.observe(3.0, route="/a")
+
+    text = registry.render()
+    assert "# TYPE requests_total counter" in text
+    assert 'requests_total{route="/a"} 1' in text
+    assert 'requests_total{route="/b\\"q"} 2' in text
+    assert "depth 7" in text
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/a",le="1"} 2' in text
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in text
+    assert 'latency_seconds_count{route="/a"} 3' in text
+    assert registry.counter("requests_total", "Requests served", ["route"]) is requests
+
+    with pytest.raises(ValueError):
+        requests.inc(path="/a")
+    with pytest.raises(ValueError):
+        registry.gauge("requests_total", "Requests served", ["route"])
+
+
+def test_server_serves_metrics_and_event_loop_lag_is_sampled():
+    assert build_metrics_server({"enabled": False}) is None
+    registry = MetricsRegistry()
+    registry.counter("scraped_total", "Scrape marker").inc()
+    server = MetricsServer(registry, "127.0.0.1", 0)
+    server.start()
+    try:
+        with urllib.request.urlopen(server.address, timeout=5) as response:
+            body = response.read().decode("utf-8")
+            content_type = response.headers["Content-Type"]
+    finally:
+        server.stop()
+
+    assert "scraped_total 1" in body
+    assert content_type.startswith("text/plain; version=0.0.4")
+
+    before = EVENT_LOOP_LAG.count()
+
+    async def probe_briefly():
+        task = asyncio.ensure_future(monitor_event_loop_lag(0.01))
+        await asyncio.sleep(0.08)
+        task.cancel()
+
+    asyncio.run(probe_briefly())
+    assert EVENT_LOOP_LAG.count() > before
+
+
+def test_quote_sources_and_order_outcomes_are_counted():
+    quote_source = REGISTRY.counter("quote_source_total", "", ["provider", "source"])
+    yahoo_fast = quote_source.value(provider="yahoo", source="fast_info")
+    yahoo_info = quote_source.value(provider="yahoo", source="info")
+    webull_l1 = quote_source.value(provider="webull", source="l1")
+    webull_snapshot = quote_source.value(provider="webull", source="snapshot")
+
+    tickers = {
+        "AAPL": SimpleNamespace(fast_info={"ask": 101.0}, info={}),
+        "MSFT": SimpleNamespace(fast_info={}, info={"bid": 99.0}),
+    }
+    provider = YahooQuoteProvider(ticker_factory=tickers.__getitem__)
+    assert provider.get_limit_reference_price("AAPL", "BUY") == 101.0
+    assert provider.get_limit_reference_price("MSFT", "SELL") == 99.0
+
+    trader = MagicMock()
+    trader.get_stock_quotes.return_value = [{"asks": [{"price": "10.5"}]}]
+    assert resolve_limit_reference_price(trader, "AAPL", "BUY") == 10.5
+    trader.get_stock_quotes.return_value = []
+    trader.get_current_stock_quote.return_value = 11.0
+    assert resolve_limit_reference_price(trader, "AAPL", "BUY") == 11.0
+
+    assert quote_source.value(provider="yahoo", source="fast_info") == yahoo_fast + 1
+    assert quote_source.value(provider="yahoo", source="info") == yahoo_info + 1
+    assert quote_source.value(provider="webull", source="l1") == webull_l1 + 1
+    assert quote_source.value(provider="webull", source="snapshot") == webull_snapshot + 1
+
+    placed = ORDERS.value(side="BUY", order_type="LIMIT", outcome="placed")
+    hits = PREPARED_QUOTES.value(result="hit")
+    planner = MagicMock()
+    planner.plan.return_value = StockOrderExecutionPlan(
+        order_type=OrderType.LIMIT,
+        time_in_force=TimeInForce.DAY,
+        extended_hours_trading=False,
+        limit_buffer_bps=50.0,
+        reason="extended_hours_limit_order",
+    )
+    executor = StockOrderExecutor(BrokerProbe(quote=100.0), planner)
+    executor.prepare("AAPL", "BUY")
+    executor.execute(StockOrderRequest(symbol="AAPL", side=OrderSide.BUY, quantity=1))
+
+    assert ORDERS.value(side="BUY", order_type="LIMIT", outcome="placed") == placed + 1
+    assert PREPARED_QUOTES.value(result="hit") == hits + 1
+    assert "orders_total{" in REGISTRY.render()
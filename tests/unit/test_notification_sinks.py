@@ -0,0 +1,108 @@
+import json
+import threading
+import time
+
+import pytest
+
+from src.notifications import (
+    DiscordWebhookSink,
+    Notification,
+    SinkWorker,
+    WebhookSink,
+    build_notification_dispatcher,
+)
+from src.notifier import Notifier
+from tests.support.fakes.webhook_server import WebhookServer
+
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_slow_webhooks_never_block_publish_and_retry_then_deliver_coalesced(tmp_path):
+    with WebhookServer(fail_first=1, delay_seconds=0.2) as generic, WebhookServer() as discord_hook:
+        notifier = Notifier(
+            build_notification_dispatcher(
+                {
+                    "async_delivery": True,
+                    "retries": 2,
+                    "retry_backoff_seconds": 0.01,
+                    "sinks": {
+                        "console": False,
+                        "webhook_url": generic.url(),
+                        "discord_webhook_url": discord_hook.url(),
+                        "file_path": str(tmp_path / "notifications.jsonl"),
+                    },
+                }
+            )
+        )
+        payloads = [
+            {"signals": [{"ticker": "AAPL", "action": "BUY", "confidence": 0.9}]},
+            {"signals": [{"ticker": "MSFT", "action": "SELL", "confidence": 0.4}]},
+            {"signals": [{"ticker": "MSFT", "action": "SELL", "confidence": 0.4}]},
+        ]
+
+        started = time.perf_counter()
+        for payload in payloads:
+            notifier.notify(payload, "alice")
+        publish_seconds = time.perf_counter() - started
+
+        assert publish_seconds < 0.1  # the webhook takes 0.2s per attempt
+        assert notifier.dispatcher.flush(timeout=5.0)
+        notifier.close()
+
+    assert generic.attempts >= 2  # first attempt got a 503 and was retried
+    delivered = [n["signals"][0]["ticker"] for _, body in generic.requests for n in body["notifications"]]
+    assert delivered[0] == "AAPL"
+    assert sorted(set(delivered)) == ["AAPL", "MSFT"]
+    assert delivered.count("MSFT") <= 2  # the repeat coalesces when it queues behind the first
+    discord_text = "\n".join(body["content"] for _, body in discord_hook.requests)
+    assert "📊 alice: BUY AAPL (90%)" in discord_text
+    lines = (tmp_path / "notifications.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["signals"][0]["ticker"] for line in lines][0] == "AAPL"
+
+
+def test_worker_drops_oldest_when_full_and_does_not_retry_client_errors():
+    release = threading.Event()
+    delivered = []
+
+    class BlockingSink:
+        name = "blocking"
+
+        def deliver(self, notifications):
+            release.wait(5)
+            delivered.append([n.author for n in notifications])
+
+    worker = SinkWorker(BlockingSink(), queue_size=2, max_batch=10)
+    worker.submit(Notification("first", ()))
+    time.sleep(0.05)  # the worker is now blocked delivering "first"
+    for author in ("second", "third", "fourth"):
+        worker.submit(Notification(author, ()))
+    release.set()
+    assert worker.flush(timeout=5)
+    worker.close()
+
+    assert delivered == [["first"], ["third", "fourth"]]
+    assert worker.dropped == 1
+
+    with WebhookServer(fail_first=5, fail_status=404) as server:
+        rejecting = SinkWorker(WebhookSink(server.url(), timeout=1), retries=3, retry_backoff_seconds=0.01)
+        rejecting.submit(Notification("alice", ()))
+        assert rejecting.flush(timeout=5)
+        rejecting.close()
+
+    assert server.attempts == 1
+    assert rejecting.failed == 1
+
+
+def test_discord_sink_splits_long_batches_and_dispatcher_is_opt_in():
+    assert build_notification_dispatcher({"async_delivery": False}) is None
+    signals = ({"ticker": "AAPL", "action": "BUY"},)
+    notifications = [Notification(f"author-{i}-" + "x" * 300, signals) for i in range(12)]
+
+    with WebhookServer() as server:
+        DiscordWebhookSink(server.url(), timeout=1).deliver(notifications)
+
+    contents = [body["content"] for _, body in server.requests]
+    assert len(contents) > 1
+    assert all(len(content) <= 2000 for content in contents)
+    assert sum(content.count("BUY AAPL") for content in contents) == 12
@@ -26,9 +26,12 @@ def test_notify_prints_console_for_signal_payload():
     notifier._print_console_notification.assert_called_once()
 
 
-def test_signal_objs_handles_non_dict_payload():
-    notifier = Notifier()
-    assert notifier._signal_objs("bad") == []
+def test_print_console_notification_handles_non_dict_payload(capsys):
+    Notifier()._print_console_notification("bad", "author")
+
+    captured = capsys.readouterr()
+    assert "STOCK SIGNAL DETECTED from author" in captured.out
+    assert "Signal #" not in captured.out
 
 
 def test_print_console_notification_includes_signal_details(capsys):
@@ -0,0 +1,77 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from src.market_data.options.chain_format import EMPTY_OPTIONS_CHAIN_TEXT, render_option_chain_slices
+from src.market_data.options.chain_slicer import OptionChainSliceConfig, slice_option_chains
+from src.utils.token_estimate import estimate_tokens
+from tests.support.factories.option_chains import build_option_chain_snapshot
+
+
+pytestmark = [pytest.mark.unit]
+
+TODAY = date(2026, 3, 2)
+WIDE_STRIKES = tuple(float(strike) for strike in range(1, 41))
+
+
+def test_slice_keeps_dte_window_and_strikes_nearest_the_money():
+    snapshots = [
+        build_option_chain_snapshot(expiry=date(2026, 3, 20), call_strikes=WIDE_STRIKES, put_strikes=WIDE_STRIKES),
+        build_option_chain_snapshot(expiry=date(2027, 1, 15), call_strikes=WIDE_STRIKES, put_strikes=WIDE_STRIKES),
+    ]
+    config = OptionChainSliceConfig(max_dte=60, strikes_per_expiry=2)
+
+    chain_slice = slice_option_chains("PANL", snapshots, as_of=TODAY, config=config)
+
+    assert set(chain_slice.dte.tolist()) == {18}
+    assert chain_slice.strikes.tolist() == [7.0, 8.0, 7.0, 8.0]
+    assert chain_slice.option_codes.tolist() == ["C", "C", "P", "P"]
+    np.testing.assert_allclose(chain_slice.mids, 1.1)
+    np.testing.assert_allclose(chain_slice.spreads, 0.2)
+
+
+def test_slice_flags_nearest_atm_contract_under_lotto_dte_per_side():
+    snapshots = [
+        build_option_chain_snapshot(expiry=date(2026, 3, 13), call_strikes=(5.0, 7.0, 10.0), put_strikes=(7.0,)),
+        build_option_chain_snapshot(expiry=date(2026, 3, 20), call_strikes=(7.25,), put_strikes=()),
+        build_option_chain_snapshot(expiry=date(2026, 5, 15), call_strikes=(7.23,), put_strikes=(7.23,)),
+    ]
+
+    chain_slice = slice_option_chains("PANL", snapshots, as_of=TODAY)
+
+    lotto_rows = {
+        (str(chain_slice.expiries[row]), chain_slice.option_codes[row], float(chain_slice.strikes[row]))
+        for row in np.flatnonzero(chain_slice.lotto)
+    }
+    assert lotto_rows == {("2026-03-20", "C", 7.25), ("2026-03-13", "P", 7.0)}
+    assert set(chain_slice.priority[chain_slice.lotto].tolist()) == {0, 1}
+
+
+def test_render_stays_within_token_budget_for_large_chains():
+    strikes = tuple(float(strike) for strike in np.arange(0.5, 300.0, 0.5))
+    snapshots = [
+        build_option_chain_snapshot(expiry=date(2026, 3, 2 + 7 * week), call_strikes=strikes, put_strikes=strikes)
+        for week in range(1, 4)
+    ]
+    chain_slice = slice_option_chains(
+        "PANL", snapshots, as_of=TODAY, config=OptionChainSliceConfig(strikes_per_expiry=1000)
+    )
+
+    rendered = render_option_chain_slices([chain_slice], max_tokens=150)
+
+    assert estimate_tokens(rendered) <= 150
+    assert "PANL spot=7.23" in rendered
+    assert "|L" in rendered
+    assert "L=lotto: <30 DTE" in rendered
+
+    short_lotto = OptionChainSliceConfig(strikes_per_expiry=1000, lotto_max_dte=14)
+    chain_slice = slice_option_chains("PANL", snapshots, as_of=TODAY, config=short_lotto)
+    rendered = render_option_chain_slices([chain_slice], max_tokens=150, slice_config=short_lotto)
+    assert rendered.splitlines()[0].endswith("(L=lotto: <14 DTE nearest ATM)")
+
+
+def test_render_returns_placeholder_when_nothing_is_cached():
+    chain_slice = slice_option_chains("PANL", [], as_of=TODAY)
+
+    assert render_option_chain_slices([chain_slice]) == EMPTY_OPTIONS_CHAIN_TEXT
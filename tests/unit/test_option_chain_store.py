@@ -0,0 +1,88 @@
+from datetime import date
+
+import pytest
+
+from src.market_data.options.chain_store import OptionChainStore
+from tests.support.fakes.clock import ManualClock
+from tests.support.fakes.option_chain_source import FakeOptionChainSource
+
+
+pytestmark = [pytest.mark.unit]
+
+TODAY = date(2026, 3, 2)
+EXPIRIES = [date(2026, 3, 20), date(2026, 4, 17), date(2026, 5, 15)]
+
+
+def test_get_chains_reads_memory_without_fetching():
+    source = FakeOptionChainSource({"PANL": EXPIRIES})
+    store = OptionChainStore(source, clock=ManualClock(), today_provider=lambda: TODAY)
+    store.mark_seen(["PANL"])
+
+    assert store.get_chains("PANL") == []
+    assert source.calls == []
+
+
+def test_refresh_due_lists_expiries_then_fetches_one_chain_per_slot():
+    source = FakeOptionChainSource({"PANL": EXPIRIES})
+    store = OptionChainStore(source, clock=ManualClock(), today_provider=lambda: TODAY)
+    store.mark_seen(["$panl"])
+
+    fetched = store.refresh_due(max_fetches=2)
+
+    assert fetched == 2
+    assert source.calls == [
+        ("list_expiries", "PANL", None),
+        ("fetch_chain", "PANL", date(2026, 3, 20)),
+    ]
+    assert [snapshot.expiry for snapshot in store.get_chains("PANL")] == [date(2026, 3, 20)]
+
+
+def test_refresh_due_limits_tracked_expiries_and_skips_fresh_chains():
+    clock = ManualClock()
+    source = FakeOptionChainSource({"PANL": EXPIRIES})
+    store = OptionChainStore(
+        source,
+        refresh_interval_seconds=300,
+        max_expiries=2,
+        clock=clock,
+        today_provider=lambda: TODAY,
+    )
+    store.mark_seen(["PANL"])
+
+    assert store.refresh_due(max_fetches=10) == 3
+    assert store.refresh_due(max_fetches=10) == 0
+
+    clock.advance(301)
+    assert store.refresh_due(max_fetches=1) == 1
+    assert source.calls[-1] == ("fetch_chain", "PANL", date(2026, 3, 20))
+
+
+def test_refresh_due_stops_refreshing_and_evicts_inactive_tickers():
+    clock = ManualClock()
+    source = FakeOptionChainSource({"PANL": EXPIRIES})
+    store = OptionChainStore(
+        source,
+        recent_ticker_ttl_seconds=60,
+        max_expiries=1,
+        clock=clock,
+        today_provider=lambda: TODAY,
+    )
+    store.mark_seen(["PANL"])
+    store.refresh_due(max_fetches=5)
+
+    clock.advance(61)
+
+    assert store.refresh_due(max_fetches=5) == 0
+    assert store.get_chains("PANL") == []
+    assert store.recent_underlyings() == []
+
+
+def test_refresh_due_backs_off_failed_chain_fetch_until_next_interval():
+    clock = ManualClock()
+    source = FakeOptionChainSource({"PANL": EXPIRIES[:1]}, chain_error=RuntimeError("rate limited"))
+    store = OptionChainStore(source, refresh_interval_seconds=300, clock=clock, today_provider=lambda: TODAY)
+    store.mark_seen(["PANL"])
+
+    assert store.refresh_due(max_fetches=5) == 2
+    assert store.refresh_due(max_fetches=5) == 0
+    assert store.get_chains("PANL") == []
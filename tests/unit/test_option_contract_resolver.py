@@ -0,0 +1,70 @@
+from datetime import date
+
+import pytest
+
+from src.market_data.options.contract_resolver import OptionContractResolver
+from src.market_data.options.expiry_text import parse_expiry_text
+from src.market_data.options.symbols import format_option_symbol
+from src.models.parser_models import ParsedVehicle
+from src.models.webull_models import OptionType
+from tests.support.factories.option_chains import build_warm_option_chain_store
+
+
+pytestmark = [pytest.mark.unit]
+
+TODAY = date(2026, 3, 2)
+EXPIRIES = [date(2026, 3, 13), date(2026, 3, 20), date(2026, 4, 17), date(2026, 5, 8), date(2026, 5, 15)]
+
+
+@pytest.mark.parametrize(
+    ("text", "start", "end", "exact"),
+    [
+        ("May", date(2026, 5, 1), date(2026, 5, 31), False),
+        ("Jan '27", date(2027, 1, 1), date(2027, 1, 31), False),
+        ("Feb", date(2027, 2, 1), date(2027, 2, 28), False),
+        ("3/21", date(2026, 3, 21), date(2026, 3, 21), True),
+        ("March 20th 2026", date(2026, 3, 20), date(2026, 3, 20), True),
+        ("exp 2026-04-17", date(2026, 4, 17), date(2026, 4, 17), True),
+    ],
+)
+def test_parse_expiry_text_maps_loose_phrases_to_windows(text, start, end, exact):
+    window = parse_expiry_text(text, TODAY)
+
+    assert (window.start, window.end, window.exact) == (start, end, exact)
+
+
+def test_month_only_vehicle_resolves_to_standard_monthly_without_ambiguity():
+    vehicle = ParsedVehicle(type="OPTION", option_type="CALL", strike=7.5, expiry="May")
+
+    match = OptionContractResolver(build_warm_option_chain_store({"PANL": EXPIRIES}, TODAY)).resolve_vehicle("PANL", vehicle)
+
+    assert match.expiry == date(2026, 5, 15)
+    assert match.symbol == "PANL260515C00007500"
+    assert match.expiry_candidates == (date(2026, 5, 8), date(2026, 5, 15))
+    assert match.ambiguous is False
+
+
+def test_unlisted_day_and_strike_snap_to_nearest_contract_and_report_ambiguity():
+    match = OptionContractResolver(build_warm_option_chain_store({"PANL": EXPIRIES}, TODAY)).resolve("$panl", option_type="P", strike=8.0, expiry="3/21")
+
+    assert (match.expiry, match.strike, match.option_type) == (date(2026, 3, 20), 7.5, "PUT")
+    assert match.strike_distance == pytest.approx(0.5)
+    assert match.ambiguities == ("expiry_not_listed", "strike_not_listed")
+
+
+def test_missing_strike_uses_spot_and_unknown_expiry_returns_none():
+    resolver = OptionContractResolver(build_warm_option_chain_store({"PANL": EXPIRIES}, TODAY))
+
+    inferred = resolver.resolve("PANL", option_type="CALL", strike=None, expiry="April")
+    missing = resolver.resolve("PANL", option_type="CALL", strike=7.5, expiry="June")
+    from_enum = resolver.resolve("PANL", option_type=OptionType.PUT, strike=7.5, expiry="April")
+
+    assert (inferred.expiry, inferred.strike) == (date(2026, 4, 17), 7.5)
+    assert inferred.ambiguities == ("strike_inferred",)
+    assert missing is None
+    assert (from_enum.option_type, from_enum.symbol) == ("PUT", "PANL260417P00007500")
+
+
+def test_format_option_symbol_rounds_fractional_strikes():
+    assert format_option_symbol("gldd", date(2026, 3, 20), "CALL", 12.3) == "GLDD260320C00012300"
+    assert format_option_symbol("gldd", date(2026, 3, 20), OptionType.CALL, 12.3) == "GLDD260320C00012300"
@@ -0,0 +1,63 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from src.market_data.options.greeks import (
+    black_scholes_greeks,
+    black_scholes_price,
+    compute_chain_greeks,
+    implied_volatility,
+)
+from tests.support.factories.option_chains import build_option_chain_snapshot
+
+
+pytestmark = [pytest.mark.unit]
+
+STRIKES = np.array([80.0, 100.0, 120.0, 90.0, 110.0])
+IS_CALL = np.array([True, True, True, False, False])
+VOLS = np.array([0.3, 0.4, 0.5, 0.25, 0.6])
+
+
+def test_greeks_match_finite_differences_of_price():
+    greeks = black_scholes_greeks(100.0, STRIKES, 0.25, VOLS, IS_CALL, rate=0.04, dividend_yield=0.01)
+    bump = 1e-4
+
+    def price(spot=100.0, years=0.25, vols=VOLS):
+        return black_scholes_price(spot, STRIKES, years, vols, IS_CALL, rate=0.04, dividend_yield=0.01)
+
+    np.testing.assert_allclose(greeks.delta, (price(spot=100 + bump) - price(spot=100 - bump)) / (2 * bump), atol=1e-5)
+    np.testing.assert_allclose(greeks.vega, (price(vols=VOLS + bump) - price(vols=VOLS - bump)) / (2 * bump) / 100, atol=1e-5)
+    np.testing.assert_allclose(
+        greeks.theta, -(price(years=0.25 + bump) - price(years=0.25 - bump)) / (2 * bump) / 365, atol=1e-5
+    )
+    assert np.all(greeks.gamma > 0)
+
+
+def test_implied_volatility_recovers_inputs_and_flags_arbitrage_prices():
+    prices = black_scholes_price(100.0, STRIKES, np.array([0.1, 0.25, 1.0, 0.5, 0.1]), VOLS, IS_CALL, rate=0.03)
+    prices_with_bad_row = np.append(prices, 0.5)
+
+    solved = implied_volatility(
+        prices_with_bad_row,
+        100.0,
+        np.append(STRIKES, 60.0),
+        np.array([0.1, 0.25, 1.0, 0.5, 0.1, 0.5]),
+        np.append(IS_CALL, True),
+        rate=0.03,
+    )
+
+    np.testing.assert_allclose(solved[:-1], VOLS, atol=1e-4)
+    assert np.isnan(solved[-1])
+
+
+def test_compute_chain_greeks_solves_from_mids_and_falls_back_to_source_iv():
+    snapshot = build_option_chain_snapshot(underlying_price=7.23, call_strikes=(5.0, 7.5), put_strikes=(7.5,))
+
+    chain = compute_chain_greeks(snapshot, as_of=date(2026, 3, 2))
+
+    assert chain.option_codes.tolist() == ["C", "C", "P"]
+    # The 5 call's 1.1 mid is below intrinsic, so the source IV (0.5) is used.
+    assert chain.implied_volatility[0] == pytest.approx(0.5)
+    assert chain.implied_volatility[1] == pytest.approx(0.94, abs=0.01)
+    assert chain.greeks.delta[2] < 0
@@ -1,15 +1,21 @@
+from datetime import date
+
 import pytest
 
 import src.ai_parser as ai_parser_module
 from src.ai_parser import AIParser
+from src.market_data.options.chain_store import OptionChainStore
 from src.models.parser_models import ParsedMessage
 from tests.data.stocktalk_real_messages import MESSAGE_FIXTURES
 from tests.support.fakes.ai_clients import (
     CapturingOpenAIClient,
     ErrorOpenAIClient,
+    FakeGoogleClient,
     FakeOpenAIClient,
     SequencedOpenAIClient,
+    ToolUseAnthropicClient,
 )
+from tests.support.fakes.option_chain_source import FakeOptionChainSource
 
 
 pytestmark = pytest.mark.unit
@@ -307,6 +313,49 @@ def test_openai_fast_path_falls_back_to_full_parse_when_ambiguous(monkeypatch):
     assert parser.client.calls[1]["response_format"]["json_schema"]["name"] == "stocktalk_parser_contract"
 
 
+def test_anthropic_fast_path_accepts_confident_tool_use_result(monkeypatch):
+    parser = AIParser()
+    parser.provider = "anthropic"
+    parser.client = ToolUseAnthropicClient(
+        {
+            "status": "actionable",
+            "confidence": 0.91,
+            "primary_ticker": "PANL",
+            "vehicle_hint": "stock",
+            "action": "BUY",
+            "evidence_text": "New position: Pangea Logistics $PANL",
+            "sizing_text": "4% weight",
+        }
+    )
+    monkeypatch.setitem(parser.config["anthropic"], "fast_model", "claude-haiku-4-5")
+
+    result = parser.parse("New position: Pangea Logistics $PANL - 4% weight @ $7.23 avg on shares", "stocktalkweekly")
+    parsed = ParsedMessage.model_validate(result)
+
+    assert parsed.meta.status == "ok"
+    assert parsed.signals[0].ticker == "PANL"
+    assert parsed.signals[0].weight_percent == 4.0
+    assert len(parser.client.calls) == 1
+    assert parser.client.calls[0]["model"] == "claude-haiku-4-5"
+
+
+def test_google_fast_path_applies_same_confidence_gate_to_no_action(monkeypatch):
+    parser = AIParser()
+    parser.provider = "google"
+    parser.client = FakeGoogleClient(
+        '{"status":"no_action","confidence":0.95,"primary_ticker":null,"vehicle_hint":"unknown",'
+        '"action":"NONE","evidence_text":"","sizing_text":"unspecified"}',
+        model_name="gemini-2.5-flash",
+    )
+    monkeypatch.setitem(parser.config["google"], "fast_model", "gemini-2.5-flash")
+
+    result = parser.parse("PORTFOLIO UPDATE: weights only", "stocktalkweekly")
+
+    assert result["meta"]["status"] == "no_action"
+    assert len(parser.client.calls) == 1
+    assert parser.client.generation_configs[0]["response_mime_type"] == "application/json"
+
+
 def test_openai_fallback_parse_uses_configured_stronger_model(monkeypatch):
     parser = AIParser()
     parser.provider = "openai"
@@ -389,3 +438,36 @@ def test_openai_fast_path_includes_option_for_mixed_contract_tokens(monkeypatch)
     assert parsed.meta.status == "ok"
     assert parsed.signals[0].ticker == "GLDD"
     assert vehicle_types == {"STOCK", "OPTION"}
+
+
+def test_full_parse_prompt_includes_cached_options_chain_for_cashtag_tickers():
+    store = OptionChainStore(
+        FakeOptionChainSource({"PANL": [date(2026, 5, 15)]}),
+        today_provider=lambda: date(2026, 3, 2),
+    )
+    store.mark_seen(["PANL"])
+    store.refresh_due(max_fetches=2)
+    parser = AIParser(options_chain_store=store)
+    parser.provider = "openai"
+    parser.client = CapturingOpenAIClient('{"signals": []}')
+
+    parser.parse("New position: $PANL shares plus $7.5C for May", "stocktalkweekly")
+
+    full_prompt = parser.client.calls[1]["messages"][1]["content"]
+    assert "PANL spot=7.23\nexp 2026-05-15 dte=74" in full_prompt
+    assert "C|7.5|1|1.2|1.1|0.2|0.94|0.55|100|" in full_prompt
+
+
+def test_full_parse_prompt_marks_uncached_cashtag_tickers_for_refresh():
+    source = FakeOptionChainSource({"HII": [date(2026, 5, 15)]})
+    store = OptionChainStore(source)
+    parser = AIParser(options_chain_store=store)
+    parser.provider = "openai"
+    parser.client = CapturingOpenAIClient('{"signals": []}')
+
+    parser.parse("Trimming $HII here", "stocktalkweekly")
+
+    full_prompt = parser.client.calls[1]["messages"][1]["content"]
+    assert "Options Chain (may be empty):\nN/A" in full_prompt
+    assert store.recent_underlyings() == ["HII"]
+    assert source.calls == []
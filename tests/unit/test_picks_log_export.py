@@ -0,0 +1,111 @@
+import sqlite3
+from datetime import date
+
+import pytest
+
+from src.picks_log import PicksLogExporter, SegmentedPicksLog, append_entries, export_picks_log, picks_log_files
+from tests.support.factories.picks_log import build_picks_log_entry, build_picks_log_signal
+
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_export_flattens_signals_and_vehicles_and_resumes_from_last_offset(tmp_path):
+    log = tmp_path / "picks_log.jsonl"
+    database = tmp_path / "picks.sqlite"
+    option_buy = dict(
+        build_picks_log_signal("AAPL", "BUY", 0.9),
+        vehicles=[
+            {"type": "STOCK", "intent": "EXECUTE", "side": "BUY"},
+            {"type": "OPTION", "intent": "WATCH", "side": "BUY", "option_type": "call", "strike": "200"},
+        ],
+    )
+    append_entries(
+        log,
+        [
+            build_picks_log_entry(
+                "2026-03-02",
+                "alice",
+                signals=[option_buy, build_picks_log_signal("MSFT", "SELL", 0.4)],
+                meta={"status": "ok", "provider": "openai"},
+            ),
+            {"timestamp": "2026-03-02T11:00:00", "ai_parsed_signals": {"signals": [{"ticker": ""}]}},
+        ],
+    )
+    with log.open("ab") as f:
+        f.write(b'{"timestamp": "2026-03-02T12:00:00", "autho')  # mid-append
+
+    first = export_picks_log(log, database)
+    assert (first.messages, first.signals, first.vehicles, first.skipped) == (1, 2, 2, 1)
+    assert first.end_offset < log.stat().st_size  # partial line left for the next run
+
+    with log.open("ab") as f:
+        f.write(b'r": "bob", "ai_parsed_signals": {"signals": [{"ticker": "nvda", "action": "buy"}]}}\n')
+    second = export_picks_log(log, database)
+    assert (second.start_offset, second.messages, second.signals) == (first.end_offset, 1, 1)
+    assert export_picks_log(log, database).messages == 0
+
+    conn = sqlite3.connect(str(database))
+    assert conn.execute("SELECT ticker, action, confidence FROM signals ORDER BY id").fetchall() == [
+        ("AAPL", "BUY", 0.9),
+        ("MSFT", "SELL", 0.4),
+        ("NVDA", "BUY", 0.0),
+    ]
+    assert conn.execute("SELECT type, option_type, strike FROM vehicles WHERE intent = 'WATCH'").fetchall() == [
+        ("OPTION", "CALL", 200.0)
+    ]
+    facts = "SELECT author, ticker FROM signal_facts WHERE day = '2026-03-02' AND provider = 'openai'"
+    assert conn.execute(facts).fetchall() == [
+        ("alice", "AAPL"),
+        ("alice", "MSFT"),
+    ]
+    conn.close()
+
+
+def test_export_restarts_a_source_that_shrank(tmp_path):
+    log = tmp_path / "picks_log.jsonl"
+    database = tmp_path / "picks.sqlite"
+    append_entries(log, [build_picks_log_entry("2026-03-02", "alice", "AAPL", "MSFT")])
+    export_picks_log(log, database)
+
+    log.unlink()
+    append_entries(log, [build_picks_log_entry("2026-03-03", "bob", "TSLA")])
+    with PicksLogExporter(database) as exporter:
+        result = exporter.export(log)
+        assert exporter.offset(log) == log.stat().st_size
+
+    assert result.restarted is True
+    conn = sqlite3.connect(str(database))
+    assert conn.execute("SELECT ticker FROM signals").fetchall() == [("TSLA",)]
+    conn.close()
+
+
+def test_export_keeps_segment_offsets_across_compression_and_waits_for_late_lines(tmp_path):
+    directory = tmp_path / "segments"
+    database = tmp_path / "picks.sqlite"
+    today = {"value": date(2026, 3, 2)}
+    store = SegmentedPicksLog(directory, today=lambda: today["value"])
+    store.append([build_picks_log_entry("2026-03-02", "alice", "AAPL")])
+    with PicksLogExporter(database) as exporter:
+        assert [exporter.export(path).messages for path in picks_log_files(directory)] == [1]
+
+        today["value"] = date(2026, 3, 3)
+        store.append([build_picks_log_entry("2026-03-03", "bob", "TSLA")])
+        store.close()
+        store.append([build_picks_log_entry("2026-03-02", "carol", "NVDA")])  # late line, not merged yet
+        store.close()
+        files = picks_log_files(directory, include_unmerged=False)
+        assert [path.name for path in files] == ["picks-2026-03-02.jsonl.gz", "picks-2026-03-03.jsonl"]
+        assert [exporter.export(path).messages for path in files] == [0, 1]
+
+        store.close_due()
+        assert [exporter.export(path).messages for path in picks_log_files(directory, include_unmerged=False)] == [1, 0]
+
+    conn = sqlite3.connect(str(database))
+    assert conn.execute("SELECT author FROM messages ORDER BY timestamp, id").fetchall() == [
+        ("alice",),
+        ("carol",),
+        ("bob",),
+    ]
+    assert conn.execute("SELECT COUNT(DISTINCT source) FROM messages").fetchone() == (2,)
+    conn.close()
@@ -0,0 +1,114 @@
+import json
+import sys
+from datetime import date
+
+import pytest
+
+import scripts.picks_log.query_picks_log as query_cli
+from src.picks_log import (
+    PicksLogQuery,
+    QueryStats,
+    SegmentedPicksLog,
+    append_entries,
+    picks_log_location,
+    query_picks_log,
+)
+from tests.support.factories.picks_log import build_picks_log_entry, build_picks_log_signal
+
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_query_filters_per_signal_projects_fields_and_skips_lines_before_decoding(tmp_path):
+    path = tmp_path / "picks_log.jsonl"
+    openai_ok = {"status": "ok", "provider": "openai"}
+    append_entries(
+        path,
+        [
+            build_picks_log_entry(
+                "2026-03-02",
+                "alice",
+                signals=[build_picks_log_signal("AAPL", "BUY", 0.9), build_picks_log_signal("MSFT", "SELL", 0.4)],
+                meta=openai_ok,
+            ),
+            build_picks_log_entry("2026-03-02", "bob", signals=[build_picks_log_signal("TSLA")], meta=openai_ok),
+            build_picks_log_entry(
+                "2026-03-03",
+                "bob",
+                signals=[build_picks_log_signal("AAPL", "SELL", 0.7)],
+                meta={"status": "ok", "provider": "anthropic"},
+            ),
+            build_picks_log_entry(
+                "2026-03-03", "carol", signals=[build_picks_log_signal("AAPL", "BUY", 0.2)], meta=openai_ok
+            ),
+        ],
+    )
+    with path.open("ab") as f:
+        f.write(b'{"timestamp": "2026-03-04T09:00:00", "author": "dave", "ai_parsed_signals": {"sig')  # mid-append
+
+    stats = QueryStats()
+    rows = list(
+        query_picks_log(
+            path,
+            PicksLogQuery.build(tickers=["aapl"], min_confidence=0.5, providers=["OpenAI", "anthropic"]),
+            fields=["author", "ticker", "action", "provider"],
+            stats=stats,
+        )
+    )
+
+    assert rows == [
+        {"author": "alice", "ticker": "AAPL", "action": "BUY", "provider": "openai"},
+        {"author": "bob", "ticker": "AAPL", "action": "SELL", "provider": "anthropic"},
+    ]
+    assert (stats.lines, stats.prefiltered, stats.decoded, stats.malformed) == (4, 1, 3, 0)
+    # MSFT and SELL appear in alice's line but on different signals.
+    assert list(query_picks_log(path, PicksLogQuery.build(tickers=["MSFT"], actions=["BUY"]))) == []
+    assert len(list(query_picks_log(path, PicksLogQuery.build(statuses=["ok"]), limit=2))) == 2
+    assert list(query_picks_log(tmp_path / "missing.jsonl")) == []
+    with pytest.raises(ValueError):
+        query_picks_log(path, fields=["ticker", "no_such_field"])
+
+
+def test_query_reads_a_segment_directory_through_compressed_and_open_segments(tmp_path):
+    today = {"value": date(2026, 3, 2)}
+    store = SegmentedPicksLog(tmp_path / "segments", today=lambda: today["value"])
+    store.append([build_picks_log_entry("2026-03-02", "alice", signals=[build_picks_log_signal("AAPL")])])
+    today["value"] = date(2026, 3, 3)
+    store.append([build_picks_log_entry("2026-03-03", "bob", signals=[build_picks_log_signal("AAPL", "SELL")])])
+    store.close()
+    assert (tmp_path / "segments" / "picks-2026-03-02.jsonl.gz").exists()
+
+    stats = QueryStats()
+    query = PicksLogQuery.build(tickers=["AAPL"])
+    rows = list(query_picks_log(tmp_path / "segments", query, fields=["author"], stats=stats))
+    assert rows == [{"author": "alice"}, {"author": "bob"}]
+    assert [name.rsplit("/", 1)[-1] for name in stats.files] == ["picks-2026-03-02.jsonl.gz", "picks-2026-03-03.jsonl"]
+    assert list(query_picks_log(tmp_path / "segments", PicksLogQuery.build(actions=["SELL"]), fields=["author"])) == [
+        {"author": "bob"}
+    ]
+
+    flat = tmp_path / "picks_log.jsonl"
+    assert picks_log_location({"segments": {"enabled": False}}, tmp_path / "segments", flat) == flat
+    assert picks_log_location({"segments": {"enabled": True}}, tmp_path / "segments", flat) == tmp_path / "segments"
+
+
+def test_query_cli_prints_projected_json_lines_and_counts(tmp_path, monkeypatch, capsys):
+    path = tmp_path / "picks_log.jsonl"
+    ok = {"status": "ok"}
+    append_entries(
+        path,
+        [
+            build_picks_log_entry("2026-03-02", "alice", signals=[build_picks_log_signal("AAPL")], meta=ok),
+            build_picks_log_entry("2026-03-02", "bob", signals=[build_picks_log_signal("NVDA", "SELL")], meta=ok),
+        ],
+    )
+
+    argv = ["query_picks_log", str(path), "--ticker", "AAPL,NVDA", "--action", "SELL", "--fields", "author,ticker"]
+    monkeypatch.setattr(sys, "argv", argv)
+    assert query_cli.main() == 0
+    output = capsys.readouterr().out
+    assert [json.loads(line) for line in output.splitlines()] == [{"author": "bob", "ticker": "NVDA"}]
+
+    monkeypatch.setattr(sys, "argv", ["query_picks_log", str(path), "--status", "ok", "--count"])
+    assert query_cli.main() == 0
+    assert capsys.readouterr().out.strip() == "2"
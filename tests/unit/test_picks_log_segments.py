@@ -0,0 +1,100 @@
+import gzip
+import json
+import threading
+from datetime import date
+
+import pytest
+
+from src.picks_log import PicksLogWriter, SegmentedPicksLog, build_segmented_picks_log
+from tests.support.factories.picks_log import build_picks_log_entry
+
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_segments_roll_daily_compress_closed_days_and_answer_indexed_lookups(tmp_path):
+    today = {"value": date(2026, 3, 2)}
+    store = SegmentedPicksLog(tmp_path, block_size=256, today=lambda: today["value"])
+    padding = "x" * 120
+    day_one = [build_picks_log_entry("2026-03-02", "alice", "AAPL", note=padding + str(i)) for i in range(6)]
+    day_one.append(build_picks_log_entry("2026-03-02", "bob", "MSFT", "aapl"))
+    store.append(day_one)
+    assert store.segment_path(date(2026, 3, 2)).exists()
+
+    today["value"] = date(2026, 3, 3)
+    store.append([build_picks_log_entry("2026-03-03", "bob", "TSLA")])  # new day closes the previous segment
+    store.close()
+
+    closed = tmp_path / "picks-2026-03-02.jsonl.gz"
+    sidecar = json.loads((tmp_path / "picks-2026-03-02.idx.json").read_text(encoding="utf-8"))
+    assert not store.segment_path(date(2026, 3, 2)).exists()
+    assert len(sidecar["blocks"]) > 1
+    assert sidecar["tickers"]["MSFT"] == [6]
+    assert [json.loads(line) for line in gzip.decompress(closed.read_bytes()).splitlines()] == day_one
+
+    assert [e["author"] for e in store.find(ticker="aapl")] == ["alice"] * 6 + ["bob"]
+    assert [e["message"] for e in store.find(author="bob")] == ["bob on MSFT,aapl", "bob on TSLA"]
+    assert list(store.find(ticker="TSLA", end=date(2026, 3, 2))) == []
+    assert [e["timestamp"][:10] for e in store.find(author="bob", start=date(2026, 3, 3))] == ["2026-03-03"]
+
+
+def test_first_append_of_a_day_closes_past_segments_off_the_calling_thread(tmp_path):
+    today = {"value": date(2026, 3, 2)}
+    store = SegmentedPicksLog(tmp_path, today=lambda: today["value"])
+    store.append([build_picks_log_entry("2026-03-02", "alice", "AAPL")])
+    store.close()
+    closing = threading.Event()
+    release = threading.Event()
+    closed_on = []
+    close_due = store.close_due
+
+    def slow_close_due():
+        closed_on.append(threading.current_thread().name)
+        closing.set()
+        release.wait(5)
+        return close_due()
+
+    store.close_due = slow_close_due
+    today["value"] = date(2026, 3, 3)
+    store.append([build_picks_log_entry("2026-03-03", "bob", "TSLA")])  # returns while the close is blocked
+    assert closing.wait(5)
+    assert store.segment_path(date(2026, 3, 2)).exists()
+    release.set()
+    store.close()
+
+    assert closed_on == ["picks-log-segment-close"]
+    assert not store.segment_path(date(2026, 3, 2)).exists()
+    assert [e["author"] for e in store.find(ticker="AAPL")] == ["alice"]
+
+
+def test_late_lines_for_a_closed_day_are_merged_into_its_segment(tmp_path):
+    store = SegmentedPicksLog(tmp_path, today=lambda: date(2026, 3, 3))
+    store.append([build_picks_log_entry("2026-03-02", "alice", "AAPL")])
+    store.close_due()
+    store.append([build_picks_log_entry("2026-03-02", "bob", "NVDA")])  # e.g. another process, after the roll
+    store.close()
+
+    assert [e["author"] for e in store.find(start=date(2026, 3, 2), end=date(2026, 3, 2))] == ["alice", "bob"]
+    store.close_due()
+    assert not store.segment_path(date(2026, 3, 2)).exists()
+    assert [e["author"] for e in store.find(ticker="NVDA")] == ["bob"]
+
+    plain = SegmentedPicksLog(tmp_path / "plain", compression="none", today=lambda: date(2026, 3, 3))
+    plain.append([build_picks_log_entry("2026-03-02", "alice", "AAPL"), build_picks_log_entry("2026-03-02", "bob", "MSFT")])
+    plain.close_due()
+    assert plain.segment_path(date(2026, 3, 2)).exists()
+    assert [e["author"] for e in plain.find(ticker="MSFT")] == ["bob"]
+
+
+def test_background_writer_feeds_segmented_store_and_builder_is_opt_in(tmp_path):
+    assert build_segmented_picks_log({"segments": {"enabled": False}}, tmp_path) is None
+    with pytest.raises(ValueError):
+        SegmentedPicksLog(tmp_path, compression="lz4")
+    store = build_segmented_picks_log({"segments": {"enabled": True, "compression": "gzip"}}, tmp_path)
+    writer = PicksLogWriter(store, batch_size=2, flush_interval_seconds=60, fsync="batch")
+
+    for ticker in ("AAPL", "MSFT", "AAPL"):
+        writer.write(build_picks_log_entry(date.today().isoformat(), "alice", ticker))
+    writer.close()
+
+    assert len(list(store.find(ticker="AAPL"))) == 2
@@ -0,0 +1,66 @@
+import json
+import threading
+
+import pytest
+
+import src.picks_log.writer as writer_module
+from src.picks_log import PicksLogWriter, append_entries, build_picks_log_writer
+
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_writer_batches_entries_fsyncs_per_policy_and_drains_on_close(tmp_path, monkeypatch):
+    fsyncs = []
+    monkeypatch.setattr(writer_module.os, "fsync", fsyncs.append)
+    writes = []
+    real_append = writer_module.append_locked
+    monkeypatch.setattr(writer_module, "append_locked", lambda f, data: (writes.append(data), real_append(f, data)))
+    path = tmp_path / "picks_log.jsonl"
+    writer = PicksLogWriter(path, batch_size=3, flush_interval_seconds=60, fsync="batch")
+
+    for index in range(7):
+        writer.write({"index": index})
+    writer.close()
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["index"] for line in lines] == list(range(7))
+    assert [data.count(b"\n") for data in writes] == [3, 3, 1]
+    assert len(fsyncs) == len(writes) + 1  # every batch, plus once on close
+    assert writer.running is False
+
+    writer.write({"index": 7})  # after close: appended synchronously, not dropped
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 8
+
+
+def test_concurrent_appenders_never_interleave_lines(tmp_path):
+    path = tmp_path / "picks_log.jsonl"
+    message = "x" * 4096
+    writers = [PicksLogWriter(path, batch_size=5, flush_interval_seconds=0.01, fsync="never") for _ in range(3)]
+
+    def produce(worker_id, writer):
+        for index in range(40):
+            writer.write({"worker": worker_id, "index": index, "message": message})
+        writer.close()
+
+    threads = [threading.Thread(target=produce, args=(worker_id, writer)) for worker_id, writer in enumerate(writers)]
+    for thread in threads:
+        thread.start()
+    append_entries(path, [{"worker": "sync", "index": 0, "message": message}])
+    for thread in threads:
+        thread.join()
+
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert len(records) == 121
+    for worker_id in range(3):
+        assert [r["index"] for r in records if r["worker"] == worker_id] == list(range(40))
+
+
+def test_build_picks_log_writer_is_opt_in_and_rejects_unknown_fsync_policy(tmp_path):
+    path = tmp_path / "picks_log.jsonl"
+
+    assert build_picks_log_writer({"background_writer": {"enabled": False}}, path) is None
+    writer = build_picks_log_writer({"background_writer": {"enabled": True, "fsync": "interval"}}, path)
+    assert isinstance(writer, PicksLogWriter)
+    with pytest.raises(ValueError):
+        PicksLogWriter(path, fsync="sometimes")
@@ -0,0 +1,130 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.brokerages.composite.broker import CompositeTradingBroker
+from src.trading.contracts import OrderFill
+from src.trading.positions.cache import PositionCache
+from src.trading.positions.runtime import build_position_runtime
+
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_quantity_is_unknown_until_loaded_then_served_from_memory():
+    fetches = []
+    cache = PositionCache(lambda: fetches.append("fetch") or {"aapl": 10, "MSFT": "3"})
+
+    assert cache.quantity("AAPL") is None
+    cache.load()
+
+    assert cache.quantity("$aapl") == 10.0
+    assert cache.quantity("MSFT") == 3.0
+    assert cache.quantity("TSLA") == 0.0
+    assert fetches == ["fetch"]
+
+
+def test_submitted_orders_move_the_book_only_as_fills_are_reported():
+    reports = {}
+    cache = PositionCache(lambda: {"AAPL": 10}, fetch_order_fill=reports.get)
+    cache.load()
+
+    cache.record_order("sell-1", "AAPL", "SELL", 10)
+    cache.record_order("buy-1", "NVDA", "BUY", 2)
+    cache.poll_orders()
+    assert cache.snapshot() == {"AAPL": 10.0}
+
+    reports["sell-1"] = OrderFill(order_id="sell-1", filled_quantity=4)
+    reports["buy-1"] = OrderFill(order_id="buy-1", filled_quantity=0, final=True)
+    cache.poll_orders()
+    assert cache.snapshot() == {"AAPL": 6.0}
+    assert cache.pending_order_ids() == ["sell-1"]
+
+    reports["sell-1"] = OrderFill(order_id="sell-1", filled_quantity=10, final=True)
+    cache.poll_orders()
+    cache.poll_orders()
+    assert cache.snapshot() == {}
+    assert cache.pending_order_ids() == []
+
+
+def test_reconcile_reports_drift_and_adopts_broker_view():
+    broker_view = {"AAPL": 10}
+    reports = {}
+    cache = PositionCache(lambda: dict(broker_view), fetch_order_fill=reports.get)
+    cache.load()
+    cache.record_order("buy-1", "AAPL", "BUY", 5)
+    reports["buy-1"] = OrderFill(order_id="buy-1", filled_quantity=5, final=True)
+    cache.poll_orders()
+    broker_view.update({"AAPL": 12, "GLDD": 100})
+
+    diff = cache.reconcile()
+
+    assert diff.changes == {"AAPL": (15.0, 12.0), "GLDD": (0.0, 100.0)}
+    assert cache.snapshot() == {"AAPL": 12.0, "GLDD": 100.0}
+    assert cache.reconcile().empty
+
+
+def test_reconcile_counts_fills_stable_across_the_snapshot_and_rechecks_the_rest():
+    broker_view = {"AAPL": 10, "MSFT": 5}
+    reports = {}
+    cache = PositionCache(lambda: dict(broker_view), fetch_order_fill=lambda order_id: reports.get(order_id))
+    cache.load()
+    cache.record_order("in-snapshot", "AAPL", "SELL", 3)
+    cache.record_order("racing", "MSFT", "BUY", 2)
+    # The SELL filled before the snapshot; its fill time is slightly ahead of the local clock.
+    ahead = time.time() + 2.0
+    reports["in-snapshot"] = OrderFill(order_id="in-snapshot", filled_quantity=3, final=True, filled_at=ahead)
+    broker_view["AAPL"] = 7
+
+    def positions_while_the_buy_fills():
+        reports["racing"] = OrderFill(order_id="racing", filled_quantity=2, final=True, filled_at=ahead)
+        return dict(broker_view)  # taken before the BUY reached the broker's positions
+
+    cache._fetch_positions = positions_while_the_buy_fills
+    cache.reconcile()
+    assert cache.snapshot() == {"AAPL": 7.0, "MSFT": 5.0}
+    assert cache.pending_order_ids() == ["racing"]
+
+    broker_view["MSFT"] = 7
+    cache._fetch_positions = lambda: dict(broker_view)
+    cache.poll_orders()  # an unsettled order makes the poll reconcile again
+    cache.poll_orders()
+    assert cache.snapshot() == {"AAPL": 7.0, "MSFT": 7.0}
+    assert cache.pending_order_ids() == []
+
+
+def test_failed_reconcile_keeps_cached_positions():
+    responses = iter([{"AAPL": 10}])
+
+    def fetch():
+        try:
+            return next(responses)
+        except StopIteration:
+            raise RuntimeError("broker down")
+
+    cache = PositionCache(fetch)
+    cache.load()
+
+    assert cache.reconcile() is None
+    assert cache.quantity("AAPL") == 10.0
+
+
+def test_runtime_follows_the_capabilities_the_execution_broker_really_has():
+    quotes = SimpleNamespace(get_limit_reference_price=lambda symbol, side: None)
+    order_only = SimpleNamespace(place_stock_order=lambda order, weighting=None: None)
+    positions_only = SimpleNamespace(
+        place_stock_order=order_only.place_stock_order,
+        get_stock_positions=lambda: {"AAPL": 10},
+        attach_position_book=lambda book: None,
+    )
+
+    assert not hasattr(CompositeTradingBroker(order_only, quotes), "get_stock_positions")
+    assert build_position_runtime({"enabled": True}, CompositeTradingBroker(order_only, quotes)) is None
+
+    runtime = build_position_runtime({"enabled": True}, CompositeTradingBroker(positions_only, quotes))
+    assert runtime.fill_poller is None
+    runtime.cache.load()
+    runtime.cache.record_order("buy-1", "AAPL", "BUY", 5)
+    assert runtime.cache.pending_order_ids() == []
+    assert runtime.cache.quantity("AAPL") == 10.0
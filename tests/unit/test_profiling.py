@@ -0,0 +1,77 @@
+import json
+import os
+import signal
+import time
+
+import pytest
+
+from scripts.benchmarks import profile_recorded_message
+from src.observability import MessageProfiler, build_message_profiler, install_profiling_signal
+from tests.support.factories.picks_log import build_picks_log_entry, build_picks_log_signal
+
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_profiles_are_kept_only_for_slow_messages_and_toggle_at_runtime(tmp_path, monkeypatch):
+    ticks = iter([0.0, 0.2, 1.0, 3.5])
+    profiler = MessageProfiler(tmp_path, threshold_seconds=1.0, enabled=True, clock=lambda: next(ticks))
+
+    with profiler.profile("fast message"):
+        sum(range(100))
+    assert profiler.last_path is None
+
+    with profiler.profile("slow message"):
+        sorted(range(1000), reverse=True)
+    assert profiler.last_path.name.endswith("-slow_message-2500ms.prof")
+    assert "function calls" in profiler.last_path.with_suffix(".txt").read_text(encoding="utf-8")
+
+    profiler.toggle()
+    with profiler.profile("while off"):
+        pass
+    assert sorted(path.suffix for path in tmp_path.iterdir()) == [".prof", ".txt"]
+
+    monkeypatch.delenv("PROFILE_MESSAGES", raising=False)
+    assert build_message_profiler({"enabled": False}, tmp_path) is None
+    monkeypatch.setenv("PROFILE_MESSAGES", "1")
+    from_env = build_message_profiler({"enabled": False, "threshold_ms": 250}, tmp_path)
+    assert from_env.enabled and from_env.threshold_seconds == 0.25
+    monkeypatch.setenv("PROFILE_MESSAGES", "0")
+    assert build_message_profiler({"enabled": True}, tmp_path) is None
+
+    if not hasattr(signal, "SIGUSR2"):
+        return
+    previous = signal.getsignal(signal.SIGUSR2)
+    try:
+        assert install_profiling_signal(profiler)
+        os.kill(os.getpid(), signal.SIGUSR2)
+        deadline = time.monotonic() + 2
+        while not profiler.enabled and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert profiler.enabled
+    finally:
+        signal.signal(signal.SIGUSR2, previous)
+
+
+def test_replays_a_recorded_picks_log_message_under_the_profiler(tmp_path, capsys):
+    signal_payload = dict(
+        build_picks_log_signal("AAPL", confidence=0.8),
+        vehicles=[{"type": "STOCK", "enabled": True, "intent": "EXECUTE", "side": "BUY"}],
+    )
+    entries = [
+        build_picks_log_entry("2026-03-02", "alice", "MSFT", note="Trimming MSFT into strength"),
+        build_picks_log_entry("2026-03-03", "bob", "AAPL", note="Buying AAPL on the dip", signals=[signal_payload]),
+    ]
+    log_path = tmp_path / "picks_log.jsonl"
+    log_path.write_text("".join(json.dumps(entry) + "\n" for entry in entries), encoding="utf-8")
+
+    code = profile_recorded_message.main(
+        [str(log_path), "--ticker", "AAPL", "--iterations", "3", "--output-dir", str(tmp_path / "profiles")]
+    )
+
+    assert code == 0
+    output = capsys.readouterr().out
+    assert "by bob: 'Buying AAPL on the dip'" in output
+    assert "parse_message" in output
+    assert len(list((tmp_path / "profiles").glob("*-replay-bob-x3-*ms.prof"))) == 1
+    assert profile_recorded_message.main([str(log_path), "--author", "nobody"]) == 2
@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.ai_parser import IMMUTABLE_CONTRACT_INSTRUCTION, AIParser
+from src.providers.anthropic.parser_client import request_parser_completion as request_anthropic_parser_completion
+from src.providers.openai.parser_client import (
+    request_fast_parser_completion as request_openai_fast_parser_completion,
+)
+from src.providers.prompt_layout import PromptParts
+from src.providers.usage import CompletionUsage, openai_usage, prompt_cache_stats
+
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_full_parse_prompt_keeps_static_prefix_identical_across_messages():
+    parser = AIParser()
+
+    first = parser._render_prompt("Buying $AAPL now", "alice")
+    second = parser._render_prompt("Trimming $NVDA into strength", "bob")
+
+    assert first.static_prefix == second.static_prefix
+    assert IMMUTABLE_CONTRACT_INSTRUCTION in first.static_prefix
+    assert "{{" not in first.text
+    assert "Buying $AAPL now" in first.dynamic_suffix
+    assert "Current Time:" in first.dynamic_suffix
+    assert "alice" not in first.static_prefix
+
+
+def test_anthropic_completion_marks_prefix_as_cache_breakpoint_and_reports_cache_reads():
+    prompt_cache_stats.reset()
+    usage = SimpleNamespace(input_tokens=40, output_tokens=12, cache_read_input_tokens=1800, cache_creation_input_tokens=0)
+    create = MagicMock(return_value=SimpleNamespace(content=[SimpleNamespace(text='{"signals": []}')], usage=usage))
+    client = SimpleNamespace(messages=SimpleNamespace(create=create))
+
+    result = request_anthropic_parser_completion(
+        client=client,
+        model="claude",
+        prompt=PromptParts(static_prefix="rules\n\n", dynamic_suffix="message\n"),
+        max_tokens=200,
+        temperature=0.0,
+    )
+
+    assert result == '{"signals": []}'
+    content = create.call_args.kwargs["messages"][0]["content"]
+    assert content[0] == {"type": "text", "text": "rules\n\n", "cache_control": {"type": "ephemeral"}}
+    assert content[1] == {"type": "text", "text": "message\n"}
+    totals = prompt_cache_stats.totals()[("anthropic", "claude")]
+    assert (totals.requests, totals.input_tokens, totals.cached_input_tokens) == (1, 1840, 1800)
+    prompt_cache_stats.reset()
+
+
+def test_openai_usage_reads_cached_prompt_tokens():
+    response = SimpleNamespace(
+        usage=SimpleNamespace(
+            prompt_tokens=2000,
+            completion_tokens=90,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=1792),
+        )
+    )
+
+    usage = openai_usage(response)
+
+    assert usage == CompletionUsage(input_tokens=2000, output_tokens=90, cached_input_tokens=1792)
+    assert usage.cache_hit_ratio == pytest.approx(0.896)
+    assert openai_usage(SimpleNamespace()) is None
+
+    prompt_cache_stats.reset()
+    message = SimpleNamespace(content='{"status": "ambiguous"}')
+    create = MagicMock(return_value=SimpleNamespace(choices=[SimpleNamespace(message=message)], **vars(response)))
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    request_openai_fast_parser_completion(client, model="gpt-fast", prompt="Buy $AAPL", max_tokens=80, temperature=0.0)
+    totals = prompt_cache_stats.totals()[("openai", "gpt-fast")]
+    assert (totals.requests, totals.input_tokens, totals.cached_input_tokens) == (1, 2000, 1792)
+    prompt_cache_stats.reset()
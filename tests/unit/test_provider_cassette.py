@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+import src.ai_parser as ai_parser_module
+from src.providers.cassette import CassetteMissError, ProviderCassette, cassette_key
+from tests.support.fakes.ai_clients import SequencedOpenAIClient
+from tests.support.fakes.clock import ManualClock
+
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_cassette_replays_completions_and_streams_at_scaled_recorded_speed(tmp_path):
+    path = tmp_path / "parser.jsonl"
+    clock = ManualClock()
+    recorder = ProviderCassette(path, mode="record", clock=clock)
+
+    def slow_completion(text, seconds):
+        clock.advance(seconds)
+        return text
+
+    def slow_stream():
+        for chunk in ('{"signals"', ": []}"):
+            clock.advance(0.5)
+            yield chunk
+
+    assert recorder.complete("openai", "gpt-5-mini", "fast", "prompt", lambda: slow_completion("first", 2.0)) == "first"
+    assert recorder.complete("openai", "gpt-5-mini", "fast", "prompt", lambda: slow_completion("second", 1.0)) == "second"
+    assert "".join(recorder.stream("openai", "gpt-5.2", "full", "prompt", slow_stream)) == '{"signals": []}'
+
+    sleeps = []
+    replay = ProviderCassette(path, mode="replay", speed=4.0, sleep=sleeps.append)
+
+    def unreachable():
+        raise AssertionError("replay must not call the provider")
+
+    replies = [replay.complete("openai", "gpt-5-mini", "fast", "prompt", unreachable) for _ in range(3)]
+    chunks = list(replay.stream("openai", "gpt-5.2", "full", "prompt", unreachable))
+
+    assert replies == ["first", "second", "first"]
+    assert chunks == ['{"signals"', ": []}"]
+    assert sleeps == [0.5, 0.25, 0.5, 0.125, 0.125]
+    assert len(replay) == 3
+    assert all("prompt" not in json.loads(line) for line in path.read_text(encoding="utf-8").splitlines())
+
+
+def test_cassette_key_masks_prompt_timestamps_and_unrecorded_prompts_miss(tmp_path):
+    morning = "Current time: 2026-03-02 09:31:05 EST\nMessage: buy $AAPL"
+    afternoon = "Current time: 2026-03-02 15:02:44 EST\nMessage: buy $AAPL"
+
+    assert cassette_key("openai", "gpt-5.2", "full", morning) == cassette_key("openai", "gpt-5.2", "full", afternoon)
+    assert cassette_key("openai", "gpt-5.2", "full", morning) != cassette_key("openai", "gpt-5.2", "fast", morning)
+
+    path = tmp_path / "parser.jsonl"
+    ProviderCassette(path, mode="record").complete("openai", "gpt-5.2", "full", morning, lambda: "{}")
+    replay = ProviderCassette(path, mode="replay", speed=0)
+
+    assert replay.complete("openai", "gpt-5.2", "full", afternoon, lambda: "unused") == "{}"
+    with pytest.raises(CassetteMissError):
+        replay.complete("openai", "gpt-5.2", "full", "Message: sell $AAPL", lambda: "unused")
+    with pytest.raises(FileNotFoundError):
+        ProviderCassette(tmp_path / "missing.jsonl", mode="replay")
+
+
+def test_parser_replays_recorded_session_without_provider_client(tmp_path, monkeypatch):
+    path = tmp_path / "parser.jsonl"
+    message = "New position: Apple $AAPL - 3% weight @ $190 avg on shares"
+    recorder = ai_parser_module.AIParser()
+    recorder.provider = "openai"
+    recorder.client = SequencedOpenAIClient(
+        [
+            '{"status":"ambiguous","confidence":0.4,"primary_ticker":null,"vehicle_hint":"unknown",'
+            '"action":"NONE","evidence_text":"","sizing_text":"unspecified"}',
+            '{"signals":[{"ticker":"AAPL","action":"BUY","confidence":0.93,"reasoning":"new position",'
+            '"weight_percent":3.0,"urgency":"MEDIUM","sentiment":"BULLISH","is_actionable":true,'
+            '"vehicles":[{"type":"STOCK","enabled":true,"intent":"EXECUTE","side":"BUY"}]}]}',
+        ]
+    )
+    recorder.cassette = ProviderCassette(path, mode="record")
+    recorded = recorder.parse(message, "stocktalkweekly")
+
+    monkeypatch.setattr(ai_parser_module, "AI_PROVIDER", "auto")
+    monkeypatch.setitem(ai_parser_module.AI_CONFIG, "cassette", {"mode": "replay", "path": str(path), "speed": 0})
+    replayer = ai_parser_module.AIParser()
+    replayed = replayer.parse(message, "stocktalkweekly")
+
+    assert len(recorder.client.calls) == 2
+    assert replayer.provider == "openai"
+    assert replayer.client is replayer.cassette
+    assert replayed == recorded
+    assert replayed["signals"][0]["ticker"] == "AAPL"
@@ -32,6 +32,9 @@ def test_build_provider_client_creates_openai_client(monkeypatch):
     import_module.assert_called_once_with("openai")
     constructor.assert_called_once_with(api_key="key")
 
+    build_provider_client("openai", {}, openai_api_key="key", timeout_seconds=20)
+    assert constructor.call_args.kwargs == {"api_key": "key", "timeout": 20.0}
+
 
 @pytest.mark.skipif(not RUN_OPTIONAL_PROVIDER_TESTS, reason=OPTIONAL_PROVIDER_TESTS_REASON)
 def test_build_provider_client_creates_anthropic_client(monkeypatch):
@@ -1,16 +1,26 @@
+import json
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
 
-from src.providers.anthropic.parser_client import request_parser_completion as request_anthropic_parser_completion
-from src.providers.google.parser_client import request_parser_completion as request_google_parser_completion
+from src.providers.anthropic.parser_client import (
+    request_fast_parser_completion as request_anthropic_fast_parser_completion,
+    request_parser_completion as request_anthropic_parser_completion,
+)
+from src.providers.anthropic.parser_contract import FAST_PARSER_TOOL_NAME
+from src.providers.fast_contract import FAST_PARSER_JSON_SCHEMA
+from src.providers.google.parser_client import (
+    request_fast_parser_completion as request_google_fast_parser_completion,
+    request_parser_completion as request_google_parser_completion,
+)
 from src.providers.openai.parser_client import (
     extract_structured_message_content,
     request_fast_parser_completion as request_openai_fast_parser_completion,
     request_parser_completion as request_openai_parser_completion,
 )
 from src.providers.openai.parser_contract import parser_fast_response_format, parser_response_format
+from tests.support.fakes.ai_clients import FakeGoogleClient, ToolUseAnthropicClient
 
 
 pytestmark = [pytest.mark.unit]
@@ -159,3 +169,44 @@ def test_parser_fast_response_format_is_strict_json_schema():
     assert response_format["json_schema"]["strict"] is True
     assert response_format["json_schema"]["name"] == "stocktalk_parser_fast_contract"
     assert "status" in response_format["json_schema"]["schema"]["required"]
+
+
+def test_anthropic_fast_parser_completion_forces_tool_use_and_returns_tool_input_json():
+    client = ToolUseAnthropicClient(
+        {
+            "status": "actionable",
+            "confidence": 0.93,
+            "primary_ticker": "PANL",
+            "vehicle_hint": "stock",
+            "action": "BUY",
+            "evidence_text": "New position",
+            "sizing_text": "4%",
+        }
+    )
+
+    result = request_anthropic_fast_parser_completion(
+        client=client,
+        model="claude-haiku-4-5",
+        prompt="New position $PANL",
+        max_tokens=140,
+        temperature=0.0,
+    )
+
+    assert json.loads(result)["primary_ticker"] == "PANL"
+    call = client.calls[0]
+    assert call["tool_choice"] == {"type": "tool", "name": FAST_PARSER_TOOL_NAME}
+    assert call["tools"][0]["input_schema"] is FAST_PARSER_JSON_SCHEMA
+
+
+def test_google_fast_parser_completion_sends_nullable_response_schema():
+    client = FakeGoogleClient(' {"status":"no_action"} ', model_name="gemini-2.5-flash")
+
+    result = request_google_fast_parser_completion(client=client, prompt="hello", max_tokens=140, temperature=0.0)
+
+    assert result == '{"status":"no_action"}'
+    generation_config = client.generation_configs[0]
+    schema = generation_config["response_schema"]
+    assert generation_config["response_mime_type"] == "application/json"
+    assert schema["properties"]["primary_ticker"] == {"type": "string", "nullable": True}
+    assert "additionalProperties" not in schema
+    assert "minimum" not in schema["properties"]["confidence"]
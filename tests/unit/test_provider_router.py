@@ -0,0 +1,141 @@
+import threading
+import time
+
+import pytest
+
+from src.providers.parser_dispatch import UnsupportedProviderError
+from src.providers.provider_health import ProviderHealth
+from src.providers.provider_router import ProviderRoute, ProviderRouter, ProviderRoutingError
+from tests.support.fakes.clock import ManualClock
+
+
+pytestmark = [pytest.mark.unit]
+
+OPENAI = ProviderRoute("openai", "gpt-4.1-mini", client="openai-client")
+ANTHROPIC = ProviderRoute("anthropic", "claude-sonnet-4-5", client="anthropic-client")
+GOOGLE = ProviderRoute("google", "gemini-3-pro-preview", client="google-client")
+
+
+def test_provider_health_tracks_ewma_latency_and_error_rate():
+    health = ProviderHealth(alpha=0.5, clock=ManualClock())
+
+    health.record_success("openai", "m", 1.0)
+    health.record_success("openai", "m", 3.0)
+    health.record_failure("openai", "m")
+
+    stats = health.snapshot("openai", "m")
+    assert stats.latency_seconds == pytest.approx(2.0)
+    assert stats.error_rate == pytest.approx(0.5)
+    assert stats.samples == 3
+    assert health.snapshot("google", "m").latency_seconds is None
+
+
+def test_provider_health_marks_failing_route_unhealthy_until_retry_window():
+    clock = ManualClock()
+    health = ProviderHealth(alpha=0.5, max_error_rate=0.5, retry_after_seconds=30.0, clock=clock)
+
+    health.record_failure("openai", "m")
+    assert health.is_healthy("openai", "m") is False
+
+    clock.advance(31.0)
+    assert health.is_healthy("openai", "m") is True
+
+
+def test_router_prefers_fastest_healthy_route():
+    health = ProviderHealth(clock=ManualClock())
+    health.record_success("openai", OPENAI.model, 4.0)
+    health.record_success("anthropic", ANTHROPIC.model, 1.0)
+    health.record_success("google", GOOGLE.model, 2.0)
+    health.record_failure("anthropic", ANTHROPIC.model)
+    health.record_failure("anthropic", ANTHROPIC.model)
+    router = ProviderRouter([OPENAI, ANTHROPIC, GOOGLE], health=health)
+
+    ranked = router.ranked_routes()
+
+    assert [route.provider for route in ranked] == ["google", "openai", "anthropic"]
+
+
+def test_router_fails_over_on_error_within_one_request():
+    router = ProviderRouter([OPENAI, ANTHROPIC], health=ProviderHealth(clock=ManualClock()))
+    calls = []
+
+    def request(route):
+        calls.append(route.provider)
+        if route.provider == "openai":
+            raise RuntimeError("503 overloaded")
+        return '{"signals":[]}'
+
+    completed = router.complete(request)
+
+    assert completed.text == '{"signals":[]}'
+    assert completed.route.provider == "anthropic"
+    assert calls == ["openai", "anthropic"]
+    assert [attempt.outcome for attempt in completed.attempts] == ["error", "ok"]
+    assert router.health.snapshot("openai", OPENAI.model).error_rate == 1.0
+
+
+def test_router_fails_over_when_deadline_passes():
+    release = threading.Event()
+    router = ProviderRouter([OPENAI, GOOGLE], health=ProviderHealth(clock=ManualClock()), deadline_seconds=0.05)
+
+    def request(route):
+        if route.provider == "openai":
+            release.wait(2.0)
+            return "late"
+        return "fast"
+
+    completed = router.complete(request)
+    release.set()
+
+    assert completed.text == "fast"
+    assert [attempt.outcome for attempt in completed.attempts] == ["timeout", "ok"]
+    assert router.health.is_healthy("openai", OPENAI.model) is False
+
+
+def test_abandoned_attempts_go_quiet_and_never_starve_later_requests():
+    release = threading.Event()
+    router = ProviderRouter([OPENAI, GOOGLE], health=ProviderHealth(clock=ManualClock()), deadline_seconds=0.05)
+    heard = []
+    late_calls = []
+
+    def request(route, guard):
+        report = guard.guard(lambda signal: heard.append((route.provider, signal)))
+        if route.provider == "openai":
+            report("early")
+            release.wait(2.0)
+            late_calls.append(route.provider)
+            report("late")
+            return "late"
+        return "fast"
+
+    # More hung attempts than the old four-worker pool could hold.
+    results = []
+    for _ in range(6):
+        router.health.record_success("openai", OPENAI.model, 0.0)
+        router.health.record_success("google", GOOGLE.model, 1.0)
+        results.append(router.complete_guarded(request).text)
+    release.set()
+    deadline = time.monotonic() + 2.0
+    while len(late_calls) < 6 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert results == ["fast"] * 6
+    assert len(late_calls) == 6
+    assert heard == [("openai", "early")] * 6
+
+
+def test_router_raises_when_every_route_fails_and_keeps_config_errors_fatal():
+    router = ProviderRouter([OPENAI, ANTHROPIC], health=ProviderHealth(clock=ManualClock()))
+
+    def failing(route):
+        raise RuntimeError(f"{route.provider} down")
+
+    with pytest.raises(ProviderRoutingError) as excinfo:
+        router.complete(failing)
+    assert [attempt.provider for attempt in excinfo.value.attempts] == ["openai", "anthropic"]
+
+    def unsupported(route):
+        raise UnsupportedProviderError(route.provider)
+
+    with pytest.raises(UnsupportedProviderError):
+        router.complete(unsupported)
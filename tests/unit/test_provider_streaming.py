@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from src.ai_parser import AIParser
+from src.providers.parser_dispatch import stream_provider_completion
+from src.providers.streaming import EarlySignalDetector, consume_stream
+from src.utils.incremental_json import IncrementalJsonScanner
+from tests.support.fakes.ai_clients import StreamingAnthropicClient, StreamingOpenAIClient
+from tests.support.provider_configs import parser_provider_config
+
+
+pytestmark = [pytest.mark.unit]
+
+SIGNAL_JSON = json.dumps(
+    {
+        "signals": [
+            {
+                "ticker": "PANL",
+                "action": "BUY",
+                "vehicles": [
+                    {"type": "OPTION", "side": "BUY", "option_type": "CALL", "strike": 7.5},
+                    {"type": "STOCK", "side": "BUY", "intent": "EXECUTE"},
+                ],
+                "confidence": 0.9,
+                "reasoning": "New position \"Greenland basket\" — 4% weight",
+            }
+        ]
+    }
+)
+
+
+def test_incremental_scanner_reports_scalars_with_paths_across_arbitrary_chunks():
+    scanner = IncrementalJsonScanner()
+    text = "```json\n" + SIGNAL_JSON + "\n```"
+
+    completed = []
+    for char in text:
+        completed.extend(scanner.feed(char))
+
+    values = dict(completed)
+    assert values[("signals", 0, "ticker")] == "PANL"
+    assert values[("signals", 0, "vehicles", 0, "strike")] == 7.5
+    assert values[("signals", 0, "vehicles", 1, "type")] == "STOCK"
+    assert values[("signals", 0, "confidence")] == 0.9
+    assert values[("signals", 0, "reasoning")] == 'New position "Greenland basket" — 4% weight'
+    assert scanner.done is True
+
+
+def test_early_signal_fires_once_stock_side_is_known_before_stream_ends():
+    detector = EarlySignalDetector()
+    cut = SIGNAL_JSON.index('"intent"')
+
+    assert detector.feed(SIGNAL_JSON[: SIGNAL_JSON.index('"STOCK"')]) is None
+    early = detector.feed(SIGNAL_JSON[SIGNAL_JSON.index('"STOCK"') : cut])
+
+    assert (early.ticker, early.action, early.side) == ("PANL", "BUY", "BUY")
+    assert detector.feed(SIGNAL_JSON[cut:]) is None
+
+
+def test_stream_provider_completion_joins_openai_deltas_and_fires_early_signal():
+    client = StreamingOpenAIClient(SIGNAL_JSON, chunk_size=5)
+    fired = []
+
+    completed = consume_stream(
+        stream_provider_completion("openai", client, parser_provider_config(), "prompt"),
+        on_early_signal=fired.append,
+    )
+
+    assert completed.text == SIGNAL_JSON
+    assert [signal.ticker for signal in fired] == ["PANL"]
+    assert client.calls[0]["stream"] is True
+
+
+def test_parser_streams_full_parse_and_prepares_before_stream_completes():
+    parser = AIParser()
+    parser.provider = "anthropic"
+    parser.client = StreamingAnthropicClient(SIGNAL_JSON, chunk_size=6)
+    parser.config = {**parser.config, "streaming": {"enabled": True}}
+    consumed_at_early_signal = []
+
+    result = parser.parse(
+        "New position: Pangea Logistics $PANL",
+        "tester",
+        on_early_signal=lambda signal: consumed_at_early_signal.append(parser.client.consumed),
+    )
+
+    assert result["meta"]["status"] == "ok"
+    assert result["signals"][0]["ticker"] == "PANL"
+    assert result["meta"]["warnings"] == []
+    total_chunks = -(-len(SIGNAL_JSON) // 6)
+    assert consumed_at_early_signal and consumed_at_early_signal[0] < total_chunks
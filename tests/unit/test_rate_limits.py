@@ -0,0 +1,95 @@
+import threading
+import time
+
+import pytest
+
+from src.providers.parser_dispatch import request_provider_completion
+from src.providers.rate_limits import (
+    PRIORITY_BACKFILL,
+    PRIORITY_LIVE,
+    ProviderRateLimiter,
+    RateLimitTimeoutError,
+    RateLimits,
+    TokenBucket,
+)
+from src.utils.token_estimate import estimate_tokens
+from tests.support.fakes.ai_clients import CapturingOpenAIClient
+from tests.support.fakes.clock import ManualClock
+from tests.support.provider_configs import parser_provider_config
+
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_token_bucket_refills_continuously_and_caps_oversized_waits():
+    clock = ManualClock()
+    bucket = TokenBucket(capacity=60, refill_per_second=1.0, clock=clock)
+
+    bucket.consume(60)
+    assert bucket.wait_seconds(10) == pytest.approx(10.0)
+    clock.advance(4.0)
+    assert bucket.level == pytest.approx(4.0)
+    assert bucket.wait_seconds(500) == pytest.approx(56.0)
+
+
+def test_rate_limiter_times_out_when_request_budget_is_spent():
+    limiter = ProviderRateLimiter(
+        {"openai": RateLimits(requests_per_minute=1)},
+        acquire_timeout_seconds=0.05,
+        clock=ManualClock(),
+    )
+
+    with limiter.lease("openai", "gpt-4.1-mini"):
+        pass
+    with pytest.raises(RateLimitTimeoutError):
+        with limiter.lease("openai", "gpt-4.1-mini"):
+            pass
+    # Other models and unconfigured providers keep their own (or no) budget.
+    with limiter.lease("openai", "gpt-4.1-nano"):
+        pass
+    with limiter.lease("google", "gemini-3-pro-preview"):
+        pass
+    assert limiter.queued("openai", "gpt-4.1-mini") == 0
+
+
+def test_rate_limiter_admits_live_work_ahead_of_queued_backfill():
+    limiter = ProviderRateLimiter({"anthropic": RateLimits(max_concurrency=1)}, acquire_timeout_seconds=5.0)
+    admitted = []
+
+    def worker(name, priority):
+        with limiter.lease("anthropic", "claude-sonnet-4-5", priority=priority):
+            admitted.append(name)
+
+    def wait_for_queue(size):
+        deadline = time.monotonic() + 2.0
+        while limiter.queued("anthropic", "claude-sonnet-4-5") < size and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+    with limiter.lease("anthropic", "claude-sonnet-4-5"):
+        backfill = threading.Thread(target=worker, args=("backfill", PRIORITY_BACKFILL))
+        backfill.start()
+        wait_for_queue(1)
+        live = threading.Thread(target=worker, args=("live", PRIORITY_LIVE))
+        live.start()
+        wait_for_queue(2)
+
+    backfill.join(2.0)
+    live.join(2.0)
+    assert admitted == ["live", "backfill"]
+
+
+def test_request_provider_completion_charges_prompt_and_output_tokens():
+    limiter = ProviderRateLimiter({"openai": RateLimits(tokens_per_minute=1000)}, clock=ManualClock())
+    client = CapturingOpenAIClient('{"signals":[]}')
+
+    result = request_provider_completion(
+        "openai",
+        client,
+        parser_provider_config(),
+        "hello world",
+        rate_limiter=limiter,
+    )
+
+    assert result == '{"signals":[]}'
+    bucket = limiter._limiter_for("openai", "gpt-4o").tokens
+    assert bucket.level == pytest.approx(1000 - (128 + estimate_tokens("hello world")))
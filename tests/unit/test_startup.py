@@ -0,0 +1,63 @@
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from src.observability import StartupProfiler, group_import_time, parse_importtime
+from src.utils import lazy_imports
+from src.utils.lazy_imports import import_lazily, lazy_exports
+
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_entry_point_defers_discord_broker_and_market_data_imports_until_selected():
+    heavy = ["discord", "webull", "numpy", "pandas", "yfinance", "src.webull_trader", "src.brokerages.webull.broker"]
+    probe = f"import sys, src.main; print(sorted(m for m in {heavy!r} if m in sys.modules))"
+    completed = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    assert completed.stdout.strip().splitlines()[-1] == "[]"
+
+    trader_class = import_lazily("src.webull_trader", "WebullTrader")
+    assert trader_class is sys.modules["src.webull_trader"].WebullTrader
+    assert import_lazily("src.webull_trader") is sys.modules["src.webull_trader"]
+
+    package_getattr = lazy_exports("pkg", {"dumps": "json"})
+    assert package_getattr("dumps") is sys.modules["json"].dumps
+    with pytest.raises(AttributeError):
+        package_getattr("loads")
+
+
+def test_startup_report_lists_phases_lazy_imports_and_importtime_by_package(monkeypatch):
+    clock = SimpleNamespace(now=10.0)
+    profiler = StartupProfiler(started_at=10.0, clock=lambda: clock.now)
+    clock.now = 10.25
+    profiler.mark("imports + settings")
+    with profiler.phase("broker runtime"):
+        clock.now = 10.75
+    monkeypatch.setattr(lazy_imports, "_IMPORT_SECONDS", {"src.webull_trader": 0.125})
+
+    report = profiler.report()
+    assert report.splitlines()[0] == "Startup took 750 ms:"
+    assert "imports + settings          250.0 ms" in report
+    assert "broker runtime              500.0 ms" in report
+    assert "src.webull_trader" in report and "125.0 ms" in report
+
+    stderr = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       900 |        900 |     aiohttp.client",
+            "import time:       300 |       1200 |   aiohttp",
+            "import time:      2000 |       3200 | discord",
+            "import time:       500 |        500 |   src.trading.contracts.orders",
+            "import time:       250 |        750 | src.ai_parser",
+            "not an import line",
+        ]
+    )
+    timings = parse_importtime(stderr)
+    assert [(timing.module, timing.depth) for timing in timings][:3] == [
+        ("aiohttp.client", 2),
+        ("aiohttp", 1),
+        ("discord", 0),
+    ]
+    assert group_import_time(timings) == {"discord": 2000, "aiohttp": 1200, "src.trading": 500, "src.ai_parser": 250}
@@ -8,6 +8,7 @@ from src.trading.contracts import StockOrder
 from src.trading.orders.executor import StockOrderExecutor, _enum_value
 from src.trading.orders.planner import StockOrderExecutionPlan
 from tests.support.fakes.broker_probe import BrokerProbe
+from tests.support.fakes.clock import ManualClock
 
 pytestmark = [pytest.mark.unit]
 
@@ -202,3 +203,42 @@ def test_executor_accepts_already_normalized_stock_order():
 
 def test_enum_value_normalizes_input():
     assert _enum_value(" buy ") == "BUY"
+
+
+def test_executor_rejects_sell_of_unheld_symbol_without_broker_calls():
+    broker = BrokerProbe(quote=100.0)
+    planner = MagicMock()
+    positions = MagicMock()
+    positions.quantity.return_value = 0.5
+    executor = StockOrderExecutor(broker, planner, positions=positions)
+
+    with pytest.raises(ValueError, match="No AAPL shares held"):
+        executor.execute(StockOrder(symbol="AAPL", side="SELL", quantity=1), weighting=5.0)
+
+    assert broker.orders == []
+    planner.plan.assert_not_called()
+
+
+def test_executor_reuses_fresh_prepared_quote_and_refetches_stale_one():
+    broker = BrokerProbe(quote=100.0)
+    broker.get_limit_reference_price = MagicMock(side_effect=[100.0, 120.0, 130.0])
+    planner = MagicMock()
+    planner.plan.return_value = StockOrderExecutionPlan(
+        order_type=OrderType.LIMIT,
+        time_in_force=TimeInForce.DAY,
+        extended_hours_trading=False,
+        limit_buffer_bps=50.0,
+        reason="regular_hours_limit_order",
+    )
+    clock = ManualClock()
+    executor = StockOrderExecutor(broker, planner, prepared_quote_ttl_seconds=5.0, clock=clock)
+
+    assert executor.prepare("aapl", "BUY") == 100.0
+    executor.execute(StockOrderRequest(symbol="AAPL", side=OrderSide.BUY, quantity=1))
+    assert broker.orders[0][0].limit_price == 100.5
+    assert broker.get_limit_reference_price.call_count == 1
+
+    executor.prepare("AAPL", "BUY")
+    clock.advance(6.0)
+    executor.execute(StockOrderRequest(symbol="AAPL", side=OrderSide.BUY, quantity=1))
+    assert broker.orders[1][0].limit_price == pytest.approx(130.65)
@@ -0,0 +1,75 @@
+import pytest
+
+from src.ai_parser import AIParser
+from src.market_data.symbols import (
+    SymbolMaster,
+    SymbolRecord,
+    load_symbol_master,
+    read_symbol_listing,
+    write_symbol_master,
+)
+
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_symbol_master_canonicalizes_share_classes_and_rejects_unlisted(tmp_path):
+    path = tmp_path / "symbol_master.bin"
+    count = write_symbol_master(
+        [
+            SymbolRecord("MSFT", "913323997", 0.01),
+            SymbolRecord("BRK-B", "913255341", 0.01),
+            SymbolRecord("AAPL", "913256135", 0.01),
+            SymbolRecord("BRK.B", "duplicate", 0.05),
+            SymbolRecord("PANL", None, 0.0001),
+        ],
+        path,
+    )
+    master = SymbolMaster(path)
+
+    assert count == len(master) == 4
+    for spelling in ("BRK.B", "BRK-B", "brk/b", "$BRKB"):
+        assert master.canonicalize(spelling) == "BRK.B"
+    assert master.lookup("BRK.B") == SymbolRecord("BRK.B", "913255341", 0.01)
+    assert master.lookup("PANL") == SymbolRecord("PANL", None, 0.0001)
+    assert "AAPL" in master and "MSFT" in master
+    assert master.canonicalize("GREENLAND") is None
+    assert master.canonicalize("") is None
+    assert load_symbol_master({"enabled": False, "path": str(path)}) is None
+    assert load_symbol_master({"enabled": True, "path": str(tmp_path / "missing.bin")}) is None
+    master.close()
+
+
+def test_nasdaq_listings_skip_test_issues_and_footer(tmp_path):
+    listing = tmp_path / "otherlisted.txt"
+    listing.write_text(
+        "ACT Symbol|Security Name|Exchange|CQS Symbol|ETF|Round Lot Size|Test Issue|NASDAQ Symbol\n"
+        "BRK.B|Berkshire Hathaway Inc. Class B|N|BRK.B|N|100|N|BRK=B\n"
+        "ZXZZT|NASDAQ TEST STOCK|Q|ZXZZT|N|100|Y|ZXZZT\n"
+        "File Creation Time: 0302202618:00|||||||\n",
+        encoding="utf-8",
+    )
+    export = tmp_path / "instruments.csv"
+    export.write_text("symbol,instrument_id,tick_size\nPANL,913000001,0.0001\n", encoding="utf-8")
+
+    records = list(read_symbol_listing(listing)) + list(read_symbol_listing(export))
+
+    assert records == [SymbolRecord("BRK.B"), SymbolRecord("PANL", "913000001", 0.0001)]
+
+
+def test_parser_canonicalizes_listed_tickers_and_drops_hallucinated_ones(tmp_path):
+    path = tmp_path / "symbol_master.bin"
+    write_symbol_master([SymbolRecord("BRK.B"), SymbolRecord("AAPL")], path)
+    parser = AIParser(symbol_master=SymbolMaster(path))
+    payload = {
+        "signals": [
+            {"ticker": "BRK-B", "action": "BUY", "confidence": 0.9, "reasoning": "adding Berkshire"},
+            {"ticker": "GREENLAND", "action": "BUY", "confidence": 0.9, "reasoning": "not a listed symbol"},
+        ]
+    }
+
+    result = parser._coerce_result(payload, source={"author": "tester"})
+
+    assert [signal.ticker for signal in result.signals] == ["BRK.B"]
+    assert parser._normalize_ticker_candidate("$brkb") == "BRK.B"
+    assert parser._normalize_ticker_candidate("GREENLAND") is None
@@ -0,0 +1,60 @@
+import json
+import threading
+
+import pytest
+
+from src.observability import NOOP_SPAN, FileSpanExporter, Tracer, bind_context, configure_tracing
+from src.observability.tracing import _CURRENT_SPAN
+
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_spans_nest_into_one_otlp_line_per_trace_across_threads(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    tracer = Tracer(FileSpanExporter(path, service_name="test-service"))
+
+    with tracer.trace("discord.message", author="alice") as root:
+        with tracer.span("quote.resolve", provider="yahoo", symbol="AAPL") as quote:
+            quote.set_attribute("quote_source", "fast_info")
+        with tracer.span("provider.request", provider="openai", model="gpt", stage="full"):
+            worker_result = []
+
+            def call_in_thread():
+                with tracer.span("webull.place_order", operation="place_order"):
+                    worker_result.append(_CURRENT_SPAN.get().parent_span_id)
+
+            thread = threading.Thread(target=bind_context(call_in_thread))
+            thread.start()
+            thread.join()
+        with pytest.raises(RuntimeError):
+            with tracer.span("order.execute", symbol="AAPL"):
+                raise RuntimeError("rejected")
+    tracer.close()
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    request = json.loads(lines[0])
+    resource = request["resourceSpans"][0]
+    assert resource["resource"]["attributes"] == [{"key": "service.name", "value": {"stringValue": "test-service"}}]
+    spans = {span["name"]: span for span in resource["scopeSpans"][0]["spans"]}
+    assert set(spans) == {"discord.message", "quote.resolve", "provider.request", "webull.place_order", "order.execute"}
+    assert {span["traceId"] for span in spans.values()} == {root.trace_id}
+    assert "parentSpanId" not in spans["discord.message"]
+    assert spans["quote.resolve"]["parentSpanId"] == root.span_id
+    assert spans["webull.place_order"]["parentSpanId"] == spans["provider.request"]["spanId"]
+    assert worker_result == [spans["provider.request"]["spanId"]]
+    assert {"key": "quote_source", "value": {"stringValue": "fast_info"}} in spans["quote.resolve"]["attributes"]
+    assert spans["order.execute"]["status"] == {"code": 2, "message": "RuntimeError: rejected"}
+    assert int(spans["discord.message"]["endTimeUnixNano"]) >= int(spans["order.execute"]["endTimeUnixNano"])
+
+
+def test_tracing_is_a_noop_until_configured(tmp_path):
+    tracer = Tracer()
+    with tracer.span("parser.parse", provider="openai") as span:
+        span.set_attribute("status", "ok")
+    assert span is NOOP_SPAN
+    assert _CURRENT_SPAN.get() is None
+
+    assert configure_tracing({"enabled": False}, tmp_path / "traces.jsonl") is None
+    assert not (tmp_path / "traces.jsonl").exists()
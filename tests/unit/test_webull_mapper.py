@@ -1,6 +1,13 @@
 import pytest
 
-from src.brokerages.webull.mapper import _enum_value, _extract_order_id, to_order_result, to_webull_stock_order
+from src.brokerages.webull.mapper import (
+    _enum_value,
+    _extract_order_id,
+    to_order_fill,
+    to_order_result,
+    to_stock_positions,
+    to_webull_stock_order,
+)
 from src.trading.contracts import OrderType, StockOrder, TradingSession
 
 
@@ -64,3 +71,30 @@ def test_enum_value_normalizes_enums_strings_and_none():
     assert _enum_value(OrderType.MARKET) == "MARKET"
     assert _enum_value(" buy ") == "BUY"
     assert _enum_value(None) == ""
+
+
+def test_to_stock_positions_sums_equity_holdings_and_skips_options():
+    payload = {
+        "data": [
+            {"symbol": "aapl", "quantity": "10", "instrument_type": "EQUITY"},
+            {"symbol": "AAPL", "qty": 5},
+            {"symbol": "TSLA", "quantity": "2", "position_side": "SHORT"},
+            {"symbol": "AAPL260320C00200000", "quantity": "1", "instrument_type": "OPTION"},
+            {"symbol": "", "quantity": "4"},
+        ]
+    }
+
+    assert to_stock_positions(payload) == {"AAPL": 15.0, "TSLA": -2.0}
+
+
+def test_to_order_fill_reads_cumulative_fills_and_terminal_status():
+    partial_item = {"order_status": "PARTIAL_FILLED", "filled_qty": "3", "qty": "10", "update_time": 1767225600000}
+    partial = to_order_fill("cid-1", {"orders": [partial_item]})
+    assert (partial.filled_quantity, partial.final, partial.filled_at) == (3.0, False, None)
+
+    filled = to_order_fill("cid-1", {"order_status": "FILLED", "qty": "10", "filled_time": 1767225600000})
+    assert (filled.filled_quantity, filled.final, filled.filled_at) == (10.0, True, 1767225600.0)
+
+    queued = to_order_fill("cid-2", {"data": {"status": "SUBMITTED"}})
+    assert (queued.filled_quantity, queued.final) == (0.0, False)
+    assert to_order_fill("cid-3", {"orders": []}) is None
@@ -93,3 +93,22 @@ def test_resolve_notional_sizing_price_uses_order_limit_price_as_last_resort():
 def test_normalize_stock_quantity_rejects_sub_share():
     with pytest.raises(ValueError, match="must be >= 1 share"):
         normalize_stock_quantity(0.5)
+
+
+def test_builder_caps_weighted_sell_at_held_shares_and_rejects_when_flat():
+    held = {"AAPL": 3.0, "MSFT": 0.0}
+    builder = WebullStockPayloadBuilder(
+        client_order_id_factory=lambda: "cid-1",
+        get_instrument=lambda symbol: [{"instrument_id": f"{symbol}_ID"}],
+        get_account_balance_contract=lambda: AccountBalanceResponse(),
+        get_buying_power=lambda **_: 10000.0,
+        get_current_stock_quote=lambda _: 100.0,
+        enforce_margin_buffer=lambda balance, estimated_trade_notional: None,
+        get_held_quantity=held.get,
+    )
+
+    payload = builder.build(StockOrderRequest(symbol="AAPL", side=OrderSide.SELL, quantity=1), weighting=50.0)
+
+    assert payload["qty"] == 3
+    with pytest.raises(ValueError, match="No MSFT shares held"):
+        builder.build(StockOrderRequest(symbol="MSFT", side=OrderSide.SELL, quantity=1), weighting=50.0)
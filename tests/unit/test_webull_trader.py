@@ -13,6 +13,7 @@ from src.models.webull_models import (
     OrderType,
     StockOrderRequest,
 )
+from src.trading.positions.cache import PositionCache
 from src.webull_trader import WebullTrader
 
 
@@ -257,6 +258,22 @@ def test_place_stock_order_sell_does_not_force_or_fallback_default_amount(monkey
     trader._build_stock_payload.assert_called_once_with(order, weighting=10.0)
 
 
+def test_place_stock_order_records_accepted_order_as_pending_not_held(monkeypatch):
+    trader = WebullTrader.__new__(WebullTrader)
+    monkeypatch.setitem(TRADING_CONFIG, "force_default_amount_for_buys", False)
+    cache = PositionCache(lambda: {"AAPL": 2}, fetch_order_fill=lambda order_id: None)
+    cache.load()
+    trader.position_book = cache
+    trader._build_stock_payload = MagicMock(return_value={"qty": 5, "client_order_id": "cid-1"})
+    trader._execute_order = MagicMock(return_value={"client_order_id": "cid-1"})
+    order = StockOrderRequest(symbol="AAPL", side=OrderSide.BUY, quantity=5)
+
+    trader.place_stock_order(order)
+
+    assert cache.quantity("AAPL") == 2.0
+    assert cache.pending_order_ids() == ["cid-1"]
+
+
 def test_resolve_effective_buying_power_adds_cash_and_margin_components():
     trader = WebullTrader.__new__(WebullTrader)
     balance = AccountBalanceResponse(
@@ -0,0 +1,46 @@
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.market_data.yahoo.option_chain_provider import YahooOptionChainProvider
+
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_list_expiries_parses_and_sorts_yahoo_option_dates():
+    ticker = SimpleNamespace(options=("2026-05-15", "2026-03-20", "bad"))
+    provider = YahooOptionChainProvider(ticker_factory=lambda _: ticker)
+
+    assert provider.list_expiries("panl") == [date(2026, 3, 20), date(2026, 5, 15)]
+
+
+def test_fetch_chain_builds_strike_sorted_column_arrays():
+    calls = pd.DataFrame(
+        {
+            "contractSymbol": ["PANL260515C00010000", "PANL260515C00007500"],
+            "strike": [10.0, 7.5],
+            "bid": [0.1, 0.4],
+            "ask": [0.2, None],
+            "lastPrice": [0.15, 0.5],
+            "openInterest": [5, 120],
+            "impliedVolatility": [0.7, 0.6],
+        }
+    )
+    chain = SimpleNamespace(calls=calls, puts=pd.DataFrame(), underlying={"regularMarketPrice": 7.23})
+    ticker = SimpleNamespace(option_chain=lambda expiry: chain)
+    fetched_at = datetime(2026, 3, 2, tzinfo=timezone.utc)
+    provider = YahooOptionChainProvider(ticker_factory=lambda _: ticker, now_provider=lambda: fetched_at)
+
+    snapshot = provider.fetch_chain("PANL", date(2026, 5, 15))
+
+    assert snapshot.underlying_price == 7.23
+    assert snapshot.fetched_at == fetched_at
+    assert snapshot.calls.strikes.tolist() == [7.5, 10.0]
+    assert snapshot.calls.contract_symbols.tolist() == ["PANL260515C00007500", "PANL260515C00010000"]
+    assert np.isnan(snapshot.calls.asks[0])
+    assert np.isnan(snapshot.calls.volumes).all()
+    assert len(snapshot.puts) == 0